@@ -0,0 +1,112 @@
+"""
+Measures how much work `AVL()` saves by stopping the retracing after
+insertion and removal as soon as a subtree height stops changing.
+
+The same random insertions and removals are replayed on `AVL()` and on a
+baseline that retraces every ancestor up to the root, the way `AVL()` used to
+do. The benchmark reports the number of rotations, the number of nodes whose
+height was recomputed and the throughput of both. Run it from the root of the
+repository:
+
+.. code-block:: shell
+
+    $ python benchmarks/bench_avl.py --keys 1000 10000 100000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from extra.trees.avl import AVLNode, AVL  # noqa: E402
+
+
+class FullRetraceAVL(AVL):
+    """An `AVL()` that retraces all ancestors up to the root every time."""
+
+    def _insert_fixup(self, new_node):
+        self._remove_fixup(new_node.get_parent())
+
+    def _remove_fixup(self, start_node):
+        node = start_node
+        while node is not None:
+            parent = node.get_parent()
+            node._update_height()
+            if not node.is_balanced():
+                self._attach(parent, self._rebalance(node))
+            node = parent
+
+
+class CountingNode(AVLNode):
+    """An `AVLNode()` that counts how many times its height is recomputed."""
+
+    updates = 0
+
+    def _update_height(self):
+        CountingNode.updates += 1
+        super()._update_height()
+
+
+def counting(tree_class):
+    """Returns a subclass of the given tree that counts rotations."""
+
+    class CountingTree(tree_class):
+        _basic_node = CountingNode
+        rotations = 0
+
+        def _rebalance(self, start_node):
+            CountingTree.rotations += 1
+            return super()._rebalance(start_node)
+
+    return CountingTree
+
+
+def replay(tree, operations):
+    start = time.perf_counter()
+    for is_insertion, key in operations:
+        if is_insertion:
+            tree.insert(key)
+        else:
+            tree.remove(key)
+    return len(operations) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # removing missing keys only warns, silence it to keep timings clean
+    warnings.simplefilter("ignore", UserWarning)
+    rng = random.Random(args.seed)
+    print(
+        f"{'tree':>14} {'keys':>8} {'rotations':>10} {'updates':>10} "
+        f"{'throughput':>16}"
+    )
+    for num_keys in args.keys:
+        keys = list(range(num_keys))
+        rng.shuffle(keys)
+        # fill the tree, then mix insertions & removals
+        operations = [(True, key) for key in keys]
+        operations += [
+            (rng.random() < 0.5, rng.randrange(num_keys))
+            for _ in range(2 * num_keys)
+        ]
+        trees = [("AVL", AVL), ("FullRetrace", FullRetraceAVL)]
+        for name, tree_class in trees:
+            ops = replay(tree_class(), operations)
+            counting_class = counting(tree_class)
+            CountingNode.updates = 0
+            replay(counting_class(), operations)
+            print(
+                f"{name:>14} {num_keys:>8} {counting_class.rotations:>10} "
+                f"{CountingNode.updates:>10} {ops:>10.0f} ops/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Measures the throughput of a `ConcurrentSkipList()` shared between multiple
+threads against a `SkipList()` guarded by one global lock.
+
+Each thread runs a mix of lookups, range scans, insertions and removals over
+the same key space. Run it from the root of the repository:
+
+.. code-block:: shell
+
+    $ python benchmarks/bench_concurrent_skip_list.py --threads 1 2 4 8
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from extra.lists.skip_list import SkipList  # noqa: E402
+from extra.lists.concurrent_skip_list import ConcurrentSkipList  # noqa: E402
+
+
+class LockedSkipList:
+    """A `SkipList()` where every operation holds the same global lock."""
+
+    def __init__(self, iterable):
+        self._skip_list = SkipList.from_sorted(iterable)
+        self._lock = threading.Lock()
+
+    def __contains__(self, value):
+        with self._lock:
+            return value in self._skip_list
+
+    def irange(self, lo, hi):
+        with self._lock:
+            return list(self._skip_list.irange(lo, hi))
+
+    def insert(self, value):
+        with self._lock:
+            self._skip_list.insert(value)
+
+    def remove(self, value):
+        with self._lock:
+            self._skip_list.remove(value)
+
+
+def worker(skip_list, num_ops, key_space, write_ratio, seed):
+    rng = random.Random(seed)
+    for _ in range(num_ops):
+        key = rng.randrange(key_space)
+        coin = rng.random()
+        if coin < write_ratio / 2:
+            skip_list.insert(key)
+        elif coin < write_ratio:
+            skip_list.remove(key)
+        elif coin < 0.9:
+            key in skip_list
+        else:
+            for _ in skip_list.irange(key, key + 16):
+                pass
+
+
+def run(factory, num_threads, num_ops, key_space, write_ratio):
+    skip_list = factory(range(0, key_space, 2))
+    threads = [
+        threading.Thread(
+            target=worker,
+            args=(skip_list, num_ops, key_space, write_ratio, seed),
+        )
+        for seed in range(num_threads)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return num_threads * num_ops / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    factories = [
+        ("SkipList + global lock", LockedSkipList),
+        ("ConcurrentSkipList", ConcurrentSkipList.from_sorted),
+    ]
+    header = " ".join(f"{name:>24}" for name, _ in factories)
+    print(f"{'threads':>8} {header}")
+    for num_threads in args.threads:
+        results = [
+            run(factory, num_threads, args.ops, args.keys, args.write_ratio)
+            for _, factory in factories
+        ]
+        print(
+            f"{num_threads:>8} "
+            + " ".join(f"{ops:>18.0f} ops/s" for ops in results)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measures how fast the binary search trees provided by `extra` are scanned
+in in-order with and without threading (in-order predecessor & successor
+links kept at every node).
+
+Every tree is filled with the same shuffled keys, then it's scanned fully in
+both directions and through many short `irange()` windows. Threaded trees
+follow the links while the others walk an explicit stack. Run it from the
+root of the repository:
+
+.. code-block:: shell
+
+    $ python benchmarks/bench_threaded.py --keys 1000 10000 100000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from extra.trees.bst import BST  # noqa: E402
+from extra.trees.avl import AVL  # noqa: E402
+from extra.trees.treap import Treap  # noqa: E402
+from extra.trees.red_black_tree import RedBlackTree  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(tree, windows):
+    full = timed(lambda: sum(1 for _ in tree.iter_inorder()))
+    full += timed(lambda: sum(1 for _ in tree.iter_inorder(reverse=True)))
+    ranges = timed(
+        lambda: [sum(1 for _ in tree.irange(lo, hi)) for lo, hi in windows]
+    )
+    return 2 * len(tree) / full, len(windows) / ranges
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--windows", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'tree':>14} {'keys':>8} {'threaded':>9} {'scan':>18} "
+        f"{'irange':>18}"
+    )
+    for num_keys in args.keys:
+        keys = list(range(num_keys))
+        rng.shuffle(keys)
+        windows = []
+        for _ in range(args.windows):
+            lo = rng.randrange(num_keys)
+            windows.append((lo, lo + 20))
+        for tree_class in [BST, AVL, RedBlackTree, Treap]:
+            for threaded in [False, True]:
+                tree = tree_class(keys, threaded=threaded)
+                scan_ops, range_ops = run(tree, windows)
+                print(
+                    f"{tree_class.__name__:>14} {num_keys:>8} "
+                    f"{str(threaded):>9} {scan_ops:>10.0f} nodes/s "
+                    f"{range_ops:>10.0f} ops/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures the insertion and search throughput of the binary search trees
+provided by `extra`: `BST()`, `AVL()`, `RedBlackTree()`, `SplayTree()` and
+`Treap()`.
+
+Every tree is filled with the same shuffled keys and then queried with a mix
+of present and missing keys. Passing `--sorted` feeds the keys in ascending
+order instead, which degenerates `BST()` into a linked list. Run it from the
+root of the repository:
+
+.. code-block:: shell
+
+    $ python benchmarks/bench_trees.py --keys 1000 10000 100000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from extra.trees.bst import BST  # noqa: E402
+from extra.trees.avl import AVL  # noqa: E402
+from extra.trees.treap import Treap  # noqa: E402
+from extra.trees.splay_tree import SplayTree  # noqa: E402
+from extra.trees.red_black_tree import RedBlackTree  # noqa: E402
+
+
+def run(factory, keys, queries):
+    tree = factory()
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    insert_ops = len(keys) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in queries:
+        key in tree
+    search_ops = len(queries) / (time.perf_counter() - start)
+    return insert_ops, search_ops
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--sorted", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # inserting duplicates only warns, silence it to keep timings clean
+    warnings.simplefilter("ignore", UserWarning)
+    factories = [
+        ("BST", BST),
+        ("AVL", AVL),
+        ("RedBlackTree", RedBlackTree),
+        ("SplayTree", SplayTree),
+        ("Treap", lambda: Treap(seed=args.seed)),
+    ]
+    rng = random.Random(args.seed)
+    print(f"{'tree':>14} {'keys':>8} {'insert':>16} {'search':>16}")
+    for num_keys in args.keys:
+        keys = list(range(num_keys))
+        if not args.sorted:
+            rng.shuffle(keys)
+        queries = [rng.randrange(2 * num_keys) for _ in range(args.queries)]
+        for name, factory in factories:
+            insert_ops, search_ops = run(factory, keys, queries)
+            print(
+                f"{name:>14} {num_keys:>8} "
+                f"{insert_ops:>10.0f} ops/s {search_ops:>10.0f} ops/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
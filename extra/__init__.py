@@ -3,6 +3,9 @@ from extra.lists.linked_list import LinkedList as LinkedList
 from extra.lists.doubly_linked_list import DoublyLinkedList as DoublyLinkedList
 from extra.lists.circular_linked_list import CircularLinkedList as CircularLinkedList
 from extra.lists.skip_list import SkipList as SkipList
+from extra.lists.concurrent_skip_list import ConcurrentSkipList as ConcurrentSkipList
+from extra.lists.sorted_set import SortedSet as SortedSet
+from extra.lists.sorted_dict import SortedDict as SortedDict
 from extra.lists.stack import Stack as Stack
 from extra.lists.queue import Queue as Queue
 from extra.lists.deque import Deque as Deque
@@ -21,6 +24,8 @@ from extra.trees.red_black_tree import RedBlackTree as RedBlackTree
 from extra.trees.min_heap import MinHeap as MinHeap
 from extra.trees.max_heap import MaxHeap as MaxHeap
 from extra.trees.treap import Treap as Treap
+from extra.trees.implicit_treap import ImplicitTreap as ImplicitTreap
+from extra.trees.tree_map import TreeMap as TreeMap
 from extra.trees.trie import Trie as Trie
 from extra.trees.radix_trie import RadixTrie as RadixTrie
 from extra.trees.suffix_trie import SuffixTrie as SuffixTrie
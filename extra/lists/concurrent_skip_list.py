@@ -0,0 +1,806 @@
+"""
+A concurrent skip list is a `SkipList()` that can be shared between multiple
+threads where some of them are reading and others are inserting or removing
+values at the same time.
+
+Reading operations such as searching, iterating or querying a range of values
+never acquire any lock. They walk over the same towers of forward pointers used
+by the `SkipList()` and they ignore any node that is either not completely
+linked yet or logically removed.
+
+On the other hand, writing operations are optimistic. First, they search for
+the nodes that will be modified without acquiring any lock. Then, they lock
+only these nodes and validate that nothing has changed in the meantime before
+linking or unlinking the node. If the validation fails, the operation is
+retried. Instead of creating one lock for every node, the locks are "striped";
+a fixed pool of locks is shared by all nodes where each node is guarded by the
+lock that its hash maps to. Locks are always acquired in the same order which
+makes deadlocks impossible.
+
+The following is the same skip list shown in the `SkipList()` documentation:
+
+.. code-block:: text
+
+    ┌────┐ ┌───┐                         ┌───┐
+    | -∞ │⟶| 0 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 8 │⟶
+    ├────┤ ├───┤ ┌───┐                   ├───┤
+    | -∞ │⟶| 0 │⟶| 1 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 8 │⟶
+    ├────┤ ├───┤ ├───┤ ┌───┐ ┌───┐ ┌───┐ ├───┤
+    | -∞ │⟶| 0 │⟶| 1 │⟶| 2 │⟶| 3 │⟶| 5 │⟶| 8 │⟶
+    └────┘ └───┘ └───┘ └───┘ └───┘ └───┘ └───┘
+
+Inserting `4` into the above skip list with a height of `2` locks only the
+nodes `3` and `1` which means that other threads can still modify any other
+part of the skip list.
+
+Unlike `SkipList()`, the widths of the forward pointers aren't maintained. So,
+positional operations such as indexing and bisecting take linear time. Also,
+the levels of a `ConcurrentSkipList()` never shrink until it's cleared.
+"""
+import time
+import threading
+from extra.lists.skip_list import SkipNode, SkipList
+
+
+class ConcurrentSkipNode(SkipNode):
+    """
+    A concurrent skip node is the basic unit for building concurrent skip
+    lists. It's a `SkipNode()` with two extra flags; one shows whether the
+    node is linked at all of its levels and the other shows whether the node
+    is logically removed.
+    """
+
+    __name__ = "extra.ConcurrentSkipNode()"
+
+    def __init__(self, item, height=1, fully_linked=True):
+        """
+        Creates a `ConcurrentSkipNode()` object used mainly with
+        `ConcurrentSkipList()` objects!!
+
+        Parameters
+        ----------
+        item: object
+            The value to be saved within the `ConcurrentSkipNode()` instance
+        height: int
+            The number of levels this node belongs to, default `1`.
+        fully_linked: bool
+            A flag showing if the node is linked at all of its levels, default
+            `True`.
+
+        Raises
+        ------
+        ValueError:
+            If the given item is `None`.
+        TypeError:
+            If the given item isn't a number.
+        """
+        super().__init__(item, height)
+        self._fully_linked = fully_linked
+        self._marked = False
+
+    def is_alive(self):
+        """
+        Checks if the `ConcurrentSkipNode()` is visible to the readers. A node
+        is visible when it's linked at all of its levels and it isn't removed.
+
+        Returns
+        -------
+        bool:
+            `True` if the node is visible and `False` otherwise.
+        """
+        return self._fully_linked and not self._marked
+
+
+class ConcurrentSkipList(SkipList):
+    """
+    A concurrent skip list is a `SkipList()` that can be safely shared between
+    multiple threads. Searching it never blocks while inserting and removing
+    values lock only the nodes that are going to be modified.
+    """
+
+    _basic_node = ConcurrentSkipNode
+    __name__ = "extra.ConcurrentSkipList()"
+
+    def __init__(
+        self, iterable=None, p=0.5, max_level=None, seed=None, num_locks=64
+    ):
+        """
+        Initializes a `ConcurrentSkipList()` instance using an optional
+        iterable object in time-complexity of O(n) where **n** is the number
+        of elements inside the given `iterable`.
+
+        Parameters
+        ----------
+        iterable: iterable, optional
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+        p: float, optional
+            The probability of promoting a node to the next level, default
+            `0.5`.
+        max_level: int, optional
+            The maximum height of the `ConcurrentSkipList()` instance. If
+            `None`, the height is unbounded, default `None`.
+        seed: int, optional
+            The seed of the random generator used by this instance to choose
+            the height of the inserted nodes, default `None`.
+        num_locks: int, optional
+            The number of locks shared by all nodes, default `64`.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in six cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+                3. If one of the elements in the iterable is NOT a number.
+                4. If the given `p` isn't a number.
+                5. If the given `max_level` isn't an integer.
+                6. If the given `num_locks` isn't an integer.
+        ValueError:
+            It can be raised in four cases
+                1. If one of the iterable elements is `None`.
+                2. If the given `p` isn't between `0` and `1` exclusively.
+                3. If the given `max_level` is less than `1`.
+                4. If the given `num_locks` is less than `1`.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([10, -5, 7, 9], seed=1)
+        >>> csl
+        ┌────┐ ┌────┐ ┌───┐
+        | -∞ │⟶| -5 │⟶| 7 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├────┤ ├───┤
+        | -∞ │⟶| -5 │⟶| 7 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├────┤ ├───┤ ┌───┐ ┌────┐
+        | -∞ │⟶| -5 │⟶| 7 │⟶| 9 │⟶| 10 │⟶
+        └────┘ └────┘ └───┘ └───┘ └────┘
+        """
+        if type(num_locks) != int:
+            raise TypeError("The number of locks must be an integer!!")
+        elif num_locks < 1:
+            raise ValueError("The number of locks must be positive!!")
+        self._locks = [threading.Lock() for _ in range(num_locks)]
+        # guards the tower of the -∞ sentinel when adding new levels
+        self._level_lock = threading.Lock()
+        # guards the length counter shared between the writers
+        self._length_lock = threading.Lock()
+        # NOTE: `_version` changes only when the instance is cleared. Writers
+        # validate it after acquiring their locks.
+        self._version = 0
+        super().__init__(iterable, p, max_level, seed)
+
+    @classmethod
+    def from_sorted(cls, iterable, p=0.5, max_level=None, seed=None):
+        """
+        A class method which creates a `ConcurrentSkipList()` instance using a
+        sorted iterable object in time-complexity of O(n) where **n** is the
+        number of elements inside the given `iterable`. Check
+        `SkipList.from_sorted()` for more details.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method
+            whose elements are sorted in ascending order.
+        p: float, optional
+            The probability of promoting a node to the next level, default
+            `0.5`.
+        max_level: int, optional
+            The maximum height of the instance, default `None`.
+        seed: int, optional
+            The seed of the random generator used by the returned instance
+            for the later insertions, default `None`.
+
+        Returns
+        -------
+        ConcurrentSkipList()
+            It returns a `ConcurrentSkipList()` instance with input values
+            being inserted.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList.from_sorted([1, 2, 3, 4])
+        >>> csl.to_list()
+        [1, 2, 3, 4]
+        """
+        return super().from_sorted(iterable, p, max_level, seed)
+
+    # =============================    LOCKS     ==============================
+    def _lock_nodes(self, nodes):
+        """
+        Acquires the locks guarding the given nodes. The locks are acquired in
+        ascending order of their indices to avoid deadlocks.
+
+        Parameters
+        ----------
+        nodes: iterable
+            The `ConcurrentSkipNode()` objects to be locked.
+
+        Returns
+        -------
+        list:
+            The acquired locks which should be released using
+            `_unlock_nodes()`.
+        """
+        num_locks = len(self._locks)
+        indices = sorted({hash(node) % num_locks for node in nodes})
+        locks = [self._locks[idx] for idx in indices]
+        for lock in locks:
+            lock.acquire()
+        return locks
+
+    def _unlock_nodes(self, locks):
+        """
+        Releases the given locks in reverse order.
+
+        Parameters
+        ----------
+        locks: list
+            The locks returned by `_lock_nodes()`.
+        """
+        for lock in reversed(locks):
+            lock.release()
+
+    # =============================    LENGTH    ==============================
+    def _add_to_length(self, delta):
+        """
+        Updates the length of the `ConcurrentSkipList()` instance safely.
+
+        Parameters
+        ----------
+        delta: int
+            The value to be added to the length.
+        """
+        with self._length_lock:
+            self._length += delta
+
+    # =============================   ITERATOR   ==============================
+    def __iter__(self):
+        """
+        Iterates over the `ConcurrentSkipList()` instance and returns a
+        generator in time-complexity of O(n) where **n** is the number of
+        elements in the instance. The iteration doesn't block other threads;
+        it reflects the values that were present when each node was visited.
+
+        Returns
+        -------
+        generator:
+            The value of each node in the instance.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([3, 1, 2])
+        >>> for item in csl:
+        ...     print(item)
+        1
+        2
+        3
+        """
+        for node in self._iter_nodes_from(self._head._forwards[0]):
+            yield node._data
+
+    def _iter_nodes_from(self, start_node):
+        """
+        Iterates over the visible nodes of the lowest level starting from the
+        given node.
+
+        Parameters
+        ----------
+        start_node: ConcurrentSkipNode()
+            The node at which the iteration starts.
+
+        Returns
+        -------
+        generator:
+            The visible nodes starting from the given node.
+        """
+        curr_node = start_node
+        while curr_node is not None:
+            if curr_node.is_alive():
+                yield curr_node
+            curr_node = curr_node._forwards[0]
+
+    # =============================    SEARCH    ==============================
+    def _find(self, value):
+        """
+        Searches the `ConcurrentSkipList()` for a given value without
+        acquiring any lock.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for.
+
+        Returns
+        -------
+        int:
+            The highest level at which a node containing the given value was
+            found, or `-1` if it wasn't found.
+        list:
+            The last node whose value is less than the given value at each
+            level.
+        list:
+            The node following the last node at each level.
+        """
+        # NOTE: the sentinel's tower may grow while searching, so its height
+        # is read only once.
+        head = self._head
+        num_levels = len(head._forwards)
+        predecessors = [None] * num_levels
+        successors = [None] * num_levels
+        found_level = -1
+        curr_node = head
+        for level in range(num_levels - 1, -1, -1):
+            next_node = curr_node._forwards[level]
+            while next_node is not None and next_node._data < value:
+                curr_node = next_node
+                next_node = curr_node._forwards[level]
+            if (found_level == -1 and next_node is not None
+                    and next_node._data == value):
+                found_level = level
+            predecessors[level] = curr_node
+            successors[level] = next_node
+        return found_level, predecessors, successors
+
+    def _search(self, value):
+        """
+        Searches the `ConcurrentSkipList()` for a given value. It has the same
+        output as `SkipList._search()` except that the positions aren't
+        computed as the widths aren't maintained.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for.
+
+        Returns
+        -------
+        list:
+            The last node whose value is less than the given value at each
+            level.
+        None:
+            The positions aren't computed.
+        ConcurrentSkipNode():
+            The node following the last node at the lowest level.
+        """
+        _, predecessors, successors = self._find(value)
+        return predecessors, None, successors[0]
+
+    def __contains__(self, value):
+        """
+        Checks if the given value exists in the `ConcurrentSkipList()`
+        instance in time-complexity of O(log(n)) where **n** is the total
+        number of elements in the instance. It doesn't acquire any lock.
+
+        Parameters
+        ----------
+        value: Object
+            The value to be searched for in the `ConcurrentSkipList()`.
+
+        Returns
+        -------
+        bool
+            `True` if the given value exists in the instance, and `False`
+            otherwise.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([1, 3, 5])
+        >>> 1 in csl
+        True
+        >>> 0 in csl
+        False
+        """
+        if type(value) not in {int, float}:
+            return False
+        self._validate_item(value)
+        found_level, _, successors = self._find(value)
+        return found_level != -1 and successors[found_level].is_alive()
+
+    def _get_node(self, idx):
+        """
+        Retrieves the node at the given index by walking over the lowest level
+        of the `ConcurrentSkipList()` instance.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index of an element in the instance.
+
+        Returns
+        -------
+        ConcurrentSkipNode():
+            The node at the given index.
+
+        Raises
+        ------
+        IndexError:
+            If the instance was shrinked by other threads.
+        """
+        curr_node = self._head._forwards[0]
+        while curr_node is not None:
+            if curr_node.is_alive():
+                if idx == 0:
+                    return curr_node
+                idx -= 1
+            curr_node = curr_node._forwards[0]
+        raise IndexError("Can't find any element at the given index!!")
+
+    def __getitem__(self, idx):
+        """
+        Retrieves the element at the given index in time-complexity of O(k)
+        where **k** is the given index. The given index is a zero-based `int`.
+
+        Parameters
+        ----------
+        idx: int
+            The index to be used to retrieve the stored value.
+
+        Returns
+        -------
+        int or float:
+            The value at this index inside the `ConcurrentSkipList()`.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            This happens in one of the following cases:
+                1. If the given index is negative.
+                2. if the given index is a `slice` object.
+                3. If the given index is out of the boundaries.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([4, 3, 1, 5, 2])
+        >>> csl[0]
+        1
+        >>> csl[4]
+        5
+        """
+        return super().__getitem__(idx)
+
+    def floor(self, value):
+        """
+        Gets the biggest value in the `ConcurrentSkipList()` instance that is
+        less than or equal to the given value in time-complexity of O(log(n))
+        where **n** is the number of elements in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for.
+
+        Returns
+        -------
+        int or float:
+            The biggest value that is less than or equal to the given value,
+            or `None` if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([1, 3, 5])
+        >>> csl.floor(4)
+        3
+        """
+        self._validate_item(value)
+        found_level, predecessors, successors = self._find(value)
+        if found_level != -1 and successors[found_level].is_alive():
+            return value
+        # NOTE: the predecessor may be removed meanwhile, so search again for
+        # the values before it.
+        prev_node = predecessors[0]
+        while prev_node is not self._head and not prev_node.is_alive():
+            _, predecessors, _ = self._find(prev_node._data)
+            prev_node = predecessors[0]
+        return None if prev_node is self._head else prev_node._data
+
+    def ceiling(self, value):
+        """
+        Gets the smallest value in the `ConcurrentSkipList()` instance that is
+        greater than or equal to the given value in time-complexity of
+        O(log(n)) where **n** is the number of elements in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for.
+
+        Returns
+        -------
+        int or float:
+            The smallest value that is greater than or equal to the given
+            value, or `None` if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([1, 3, 5])
+        >>> csl.ceiling(4)
+        5
+        """
+        self._validate_item(value)
+        _, _, successors = self._find(value)
+        next_node = successors[0]
+        while next_node is not None and not next_node.is_alive():
+            next_node = next_node._forwards[0]
+        return None if next_node is None else next_node._data
+
+    def bisect_left(self, value):
+        """
+        Locates the insertion point of the given value in the
+        `ConcurrentSkipList()` to maintain sorted order in time-complexity of
+        O(k) where **k** is the returned index.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose insertion point is to be located.
+
+        Returns
+        -------
+        int:
+            The number of elements that are less than the given value.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([1, 3, 5])
+        >>> csl.bisect_left(3)
+        1
+        """
+        self._validate_item(value)
+        return sum(1 for _ in self.irange(hi=value, inclusive=(True, False)))
+
+    def bisect_right(self, value):
+        """
+        Locates the insertion point of the given value in the
+        `ConcurrentSkipList()` to maintain sorted order in time-complexity of
+        O(k) where **k** is the returned index.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose insertion point is to be located.
+
+        Returns
+        -------
+        int:
+            The number of elements that are less than or equal to the given
+            value.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([1, 3, 5])
+        >>> csl.bisect_right(3)
+        2
+        """
+        self._validate_item(value)
+        return sum(1 for _ in self.irange(hi=value))
+
+    # =============================    RANGE     ==============================
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Iterates over the values of the `ConcurrentSkipList()` instance that
+        lie between the given two values in time-complexity of O(log(n) + k)
+        where **n** is the number of elements in the instance and **k** is the
+        number of the generated values. It doesn't acquire any lock.
+
+        Parameters
+        ----------
+        lo: int or float, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum value in the instance.
+        hi: int or float, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum value in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
+
+        Returns
+        -------
+        generator:
+            The values within the given range in ascending order.
+
+        Raises
+        ------
+        TypeError:
+            If one of the given bounds is not a number.
+
+        Examples
+        --------
+        >>> csl = ConcurrentSkipList([1, 3, 5, 7, 9])
+        >>> list(csl.irange(3, 7))
+        [3, 5, 7]
+        """
+        if lo is not None:
+            self._validate_item(lo)
+        if hi is not None:
+            self._validate_item(hi)
+        include_lo, include_hi = inclusive
+        if lo is None:
+            start_node = self._head._forwards[0]
+        else:
+            _, _, successors = self._find(lo)
+            start_node = successors[0]
+        for node in self._iter_nodes_from(start_node):
+            value = node._data
+            if value == lo and not include_lo:
+                continue
+            if hi is not None and (value > hi
+                                   or (value == hi and not include_hi)):
+                return
+            yield value
+
+    # =============================    INSERT    ==============================
+    def _grow_levels(self, height):
+        """
+        Raises the tower of the -∞ sentinel node to the given height.
+
+        Parameters
+        ----------
+        height: int
+            The minimum height of the `ConcurrentSkipList()` instance.
+        """
+        with self._level_lock:
+            while self._num_levels < height:
+                self._add_extra_level()
+
+    def insert(self, value):
+        """
+        Inserts a value to the `ConcurrentSkipList()` instance in
+        time-complexity of O(log(n)) where **n** is the number of elements in
+        the instance. Only the nodes preceding the new node are locked.
+
+        Parameters
+        ----------
+        value: int or float
+            The number to be inserted in the `ConcurrentSkipList()` instance.
+
+        Raises
+        ------
+        TypeError: If the given `value` isn't a number.
+
+        Example
+        -------
+        >>> csl = ConcurrentSkipList()
+        >>> csl.insert(10)
+        >>> csl.insert(5)
+        >>> csl.to_list()
+        [5, 10]
+        """
+        self._validate_item(value)
+        height = self._get_random_height()
+        while True:
+            version = self._version
+            found_level, predecessors, successors = self._find(value)
+            if found_level != -1:
+                found_node = successors[found_level]
+                if not found_node._marked:
+                    # another thread is inserting the same value
+                    while not found_node._fully_linked:
+                        time.sleep(0)
+                    return
+                # the found node is being removed, so try again
+                continue
+            if len(predecessors) < height:
+                self._grow_levels(height)
+                continue
+            locks = self._lock_nodes(predecessors[:height])
+            try:
+                is_valid = version == self._version and all(
+                    not predecessors[level]._marked
+                    and (successors[level] is None
+                         or not successors[level]._marked)
+                    and predecessors[level]._forwards[level]
+                    is successors[level]
+                    for level in range(height)
+                )
+                if not is_valid:
+                    continue
+                new_node = self._basic_node(value, height, False)
+                for level in range(height):
+                    new_node._forwards[level] = successors[level]
+                for level in range(height):
+                    predecessors[level]._forwards[level] = new_node
+                new_node._fully_linked = True
+                self._add_to_length(1)
+                return
+            finally:
+                self._unlock_nodes(locks)
+
+    # =============================    REMOVE    ==============================
+    def remove(self, value):
+        """
+        Removes the node whose value equal to the given value in
+        time-complexity of O(log(n)) where **n** is the number of elements in
+        the instance. Only the removed node and the nodes preceding it are
+        locked.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be removed from the `ConcurrentSkipList()` instance.
+
+        Example
+        -------
+        >>> csl = ConcurrentSkipList([4, 3, 1, 5])
+        >>> csl.remove(10) #does nothing
+        >>> csl.remove(4)
+        >>> csl.to_list()
+        [1, 3, 5]
+        """
+        if type(value) not in {int, float}:
+            return
+        while True:
+            version = self._version
+            found_level, predecessors, successors = self._find(value)
+            if found_level == -1:
+                return
+            victim = successors[found_level]
+            if victim._marked:
+                return
+            elif (not victim._fully_linked
+                    or victim.get_height() != found_level + 1):
+                # the victim is still being inserted, so try again
+                time.sleep(0)
+                continue
+            height = victim.get_height()
+            locks = self._lock_nodes(predecessors[:height] + [victim])
+            try:
+                if victim._marked:
+                    return
+                is_valid = version == self._version and all(
+                    not predecessors[level]._marked
+                    and predecessors[level]._forwards[level] is victim
+                    for level in range(height)
+                )
+                if not is_valid:
+                    continue
+                # NOTE: marking the node first hides it from the readers while
+                # the victim's forward pointers are kept intact for readers
+                # which are standing on it.
+                victim._marked = True
+                for level in range(height - 1, -1, -1):
+                    predecessors[level]._forwards[level] = \
+                        victim._forwards[level]
+                self._add_to_length(-1)
+                return
+            finally:
+                self._unlock_nodes(locks)
+
+    def clear(self):
+        """
+        Removes all nodes within the `ConcurrentSkipList()` in time-complexity
+        of O(1). It waits for all running writers to finish.
+
+        Example
+        -------
+        >>> csl = ConcurrentSkipList([4, 3, 1, 5])
+        >>> csl.clear()
+        >>> csl.is_empty()
+        True
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            with self._level_lock, self._length_lock:
+                self._version += 1
+                super().clear()
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
@@ -36,82 +36,76 @@ chosen randomly with probability 1/2. That is, like, we "**flip a coin**"
 for each item in the skip list. Thus, we expect the lowest linked list, at
 `height=0` to have **n** items. And the linked list at `height=2` to have about
 **n/2** items, and the one above it to have about **n/4** items. In other
-words, we expect the height of the skip list to be about **log(n)**.
+words, we expect the height of the skip list to be about **log(n)**. This
+probability can be changed using the `p` parameter; a smaller probability
+means less memory and a slower search. The height of the skip list can also be
+bounded using the `max_level` parameter.
 
 The -∞ setntinel value is put in the SkipList() as a convention. So, it doesn't
 count as an element in the SkipList(). In other words, the zeroths element in
 the above skip list is `0` not `-∞`.
+
+Even though the levels are drawn as separate linked lists, each value is stored
+only once inside a single `SkipNode()` that holds an array of forward pointers;
+one pointer per level. So, the value `8` in the above skip list is stored in
+one node whose height is `3`.
 """
+import math
 import random
 from extra.interface import Extra
-from extra.lists.linked_list import Node, LinkedList
+from extra.lists.linked_list import Node
 
 
 # helper functions
-# random.seed(1)
-def flip_coin():
+def search_sorted(start_node, value, level=0, rank=0):
     """
-    A helper function to mimic the action of flipping a coin. The result is
-    totally random,
-
-    Returns
-    -------
-    str:
-        Either "head" or "tail".
-
-    Example
-    -------
-    >>> flip_coin()
-    'tail'
-    >>> flip_coin()
-    'head'
-    >>> flip_coin()
-    'head'
-    """
-    return random.choice(["head", "tail"])
-
-
-def search_sorted(prev_node, start_node, value):
-    """
-    A helper function to search the `SkipList()` instance starting from a
-    given node declared as `start_node` and searching for the given `value`.
+    A helper function to search one level of the `SkipList()` instance
+    starting from a given node declared as `start_node` and searching for the
+    given `value`.
 
     Parameters
     ----------
-    prev_node: SkipNode()
-        A reference to the node that is previous to the `start_node`.
     start_node: SkipNode()
         A reference to the node at which the searching starts.
     value: int or float
         The number for which we started searching.
+    level: int
+        The level at which the searching happens, default `0`.
+    rank: int
+        The position of the `start_node` in the lowest level where the -∞
+        sentinel is at position `0`, default `0`.
 
     Returns
     -------
     SkipNode()
-        A reference to the node previus to the node containing the value if the
-        value was found. If the value wasn't found, then this will be either
-        `None` or the second last node in the skiplist.
-    SkipNode()
-        A reference to the node containg the value if the value was found. If
-        the value wasn't found, then this will be the last node in the
-        skiplist.
+        A reference to the last node at the given level whose value is less
+        than the given `value`. The node following it, if any, is either the
+        node containing the value or the first node bigger than it.
+    int
+        The position of the returned node in the lowest level.
     """
-    # search a sorted linked list and return the last accessed node.
+    # NOTE: this is the hot loop of the SkipList(), so it accesses the
+    # forward pointers directly instead of calling `get_next()`.
     curr_node = start_node
-    next_node = curr_node.get_next()
-    while next_node is not None and next_node.get_data() <= value:
-        prev_node = curr_node
+    next_node = curr_node._forwards[level]
+    while next_node is not None and next_node._data < value:
+        rank += curr_node._widths[level]
         curr_node = next_node
-        next_node = curr_node.get_next()
-    return prev_node, curr_node
+        next_node = curr_node._forwards[level]
+    return curr_node, rank
 
 
 class SkipNode(Node):
-    """A skip node is the basic unit for building skip lists."""
+    """
+    A skip node is the basic unit for building skip lists. Each skip node
+    stores its value only once along with a tower of forward pointers; one
+    pointer for each level the node belongs to. Each forward pointer has a
+    width which is the number of nodes it skips in the lowest level.
+    """
 
     __name__ = "extra.SkipNode()"
 
-    def __init__(self, item):
+    def __init__(self, item, height=1):
         """
         Creates a `SkipNode()` object used mainly with SkipList() objects!!
 
@@ -119,6 +113,8 @@ class SkipNode(Node):
         ----------
         item: object
             The value to be saved within the `SkipNode()` instance
+        height: int
+            The number of levels this node belongs to, default `1`.
 
         Raises
         ------
@@ -130,38 +126,68 @@ class SkipNode(Node):
         super()._validate_item(item)
         if type(item) not in {int, float}:
             raise TypeError(f"`{self.__name__}` contains numbers only!!")
-        super().__init__(item)
-        self._down = None
+        assert type(height) == int and height >= 1
+        self._data = item
+        self._forwards = [None] * height
+        self._widths = [1] * height
 
-    def get_down(self):
+    def get_height(self):
         """
-        Returns the down `SkipNode()` instance of the current one.
+        Returns the height of the `SkipNode()` instance which is the number of
+        levels this node belongs to.
 
         Returns
         -------
-        Node():
-            The `SkipNode()` instance that is below the current `SkipNode()`
-            or `None` if there weren't any.
+        int:
+            A positive integer representing the height of the node.
         """
-        return self._down
+        return len(self._forwards)
 
-    def set_down(self, other_node):
+    def get_next(self, level=0):
         """
-        Sets the down pointer of the current `SkipNode()` to the given node.
+        Returns the next `SkipNode()` instance of the current one at the given
+        level.
 
         Parameters
         ----------
-        other_node: SkipNode()
+        level: int
+            The level at which the next node is retrieved, default `0`.
+
+        Returns
+        -------
+        SkipNode():
+            The `SkipNode()` instance that follows the current `SkipNode()` at
+            the given level or `None` if there weren't any.
+
+        Raises
+        ------
+        IndexError:
+            If the given level is higher than the node's height.
+        """
+        return self._forwards[level]
+
+    def set_next(self, next_node, level=0):
+        """
+        Sets the next pointer of the current `SkipNode()` at the given level to
+        the given node.
+
+        Parameters
+        ----------
+        next_node: SkipNode()
             The `SkipNode()` that will follow the current `SkipNode()`.
+        level: int
+            The level at which the next node is set, default `0`.
 
         Raises
         ------
         TypeError:
             If the given item is not an `SkipNode()` object.
+        IndexError:
+            If the given level is higher than the node's height.
         """
-        if not isinstance(other_node, SkipNode):
+        if next_node is not None and not isinstance(next_node, SkipNode):
             raise TypeError(f"Given object has to be `{self.__name__}`!!")
-        self._down = other_node
+        self._forwards[level] = next_node
 
     def __repr__(self):
         """
@@ -184,7 +210,8 @@ class SkipNode(Node):
             data = "∞"
         else:
             data = self._data
-        nxt = self._next.get_data() if self._next is not None else None
+        nxt = self._forwards[0]
+        nxt = nxt.get_data() if nxt is not None else None
         return f"SkipNode(data: {data}, next: {nxt})"
 
     def _represent(self):
@@ -227,7 +254,7 @@ class SkipList(Extra):
     _basic_node = SkipNode
     __name__ = "extra.SkipList()"
 
-    def __init__(self, iterable=None):
+    def __init__(self, iterable=None, p=0.5, max_level=None, seed=None):
         """
         Initializes a `SkipList()` instance using an optional iterable object
         in time-complexity of O(n) where **n** is the number of elements inside
@@ -238,35 +265,48 @@ class SkipList(Extra):
         iterable: iterable, optional
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        p: float, optional
+            The probability of promoting a node to the next level, default
+            `0.5`.
+        max_level: int, optional
+            The maximum height of the `SkipList()` instance. If `None`, the
+            height is unbounded, default `None`.
+        seed: int, optional
+            The seed of the random generator used by this instance to choose
+            the height of the inserted nodes. If `None`, the generator is
+            seeded from the current system's randomness, default `None`.
 
         Raises
         ------
         TypeError:
-            It can be raised in three cases
+            It can be raised in five cases
                 1. In case the given object isn't iterable.
                 2. If one of the elements in the iterable is an `Extra` object.
                 3. If one of the elements in the iterable is NOT a number.
+                4. If the given `p` isn't a number.
+                5. If the given `max_level` isn't an integer.
         ValueError:
-            If one of the iterable elements is `None`.
+            It can be raised in three cases
+                1. If one of the iterable elements is `None`.
+                2. If the given `p` isn't between `0` and `1` exclusively.
+                3. If the given `max_level` is less than `1`.
 
         Note
         -----
         Inserting values into different levels in the skip list is completely
-        random. So, running the following example will return different values
-        each time you run it. So, in order to obtain the same result as before
-        you need to set `random.seed(1)` before running any of the previous
-        example.
+        random. So, running the following example without a `seed` will return
+        different values each time you run it. So, in order to obtain the same
+        result as before you need to use the same `seed`.
 
         Examples
         --------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([10, -5, 7, 9])
+        >>> sl = SkipList([10, -5, 7, 9], seed=1)
         >>> sl
-        ┌────┐                    ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ┌────┐             ├────┤
-        | -∞ │⟶| -5 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ├────┤ ┌───┐ ┌───┐ ├────┤
+        ┌────┐ ┌────┐ ┌───┐
+        | -∞ │⟶| -5 │⟶| 7 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├────┤ ├───┤
+        | -∞ │⟶| -5 │⟶| 7 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├────┤ ├───┤ ┌───┐ ┌────┐
         | -∞ │⟶| -5 │⟶| 7 │⟶| 9 │⟶| 10 │⟶
         └────┘ └────┘ └───┘ └───┘ └────┘
 
@@ -287,39 +327,173 @@ class SkipList(Extra):
         >>> sl_2 = SkipList([1, sl_1])
         TypeError: Can't create `extra.SkipList()` using `extra.SkipList()`!!
         """
-        # NOTE: `_level_lists` is an array of LinkedList() objects
+        if type(p) not in {int, float}:
+            raise TypeError("The promotion probability must be a number!!")
+        elif not 0 < p < 1:
+            raise ValueError("The promotion probability must be in (0, 1)!!")
+        if max_level is not None:
+            if type(max_level) != int:
+                raise TypeError("The maximum level must be an integer!!")
+            elif max_level < 1:
+                raise ValueError("The maximum level must be positive!!")
+        self._p = p
+        self._log_p = math.log(p)
+        self._max_level = max_level
+        self._rng = random.Random(seed)
+        self.clear()
         if iterable is None:
-            ll = LinkedList()
-            ll._insert_node(ll._head, self._basic_node(float("-inf")))
-            self._level_lists = [ll]
-            self._num_levels = 1
+            return
         elif not hasattr(iterable, "__iter__"):
             raise TypeError("The given object isn't iterable!!")
-        elif isinstance(iterable, self.__class__):
-            self._level_lists = iterable._level_lists
-            self._num_levels = iterable._num_levels
-        else:
-            ll = LinkedList()
-            ll._insert_node(ll._head, self._basic_node(float("-inf")))
-            self._level_lists = [ll]
-            self._num_levels = 1
-            for item in iterable:
-                self.insert(item)
+        for item in iterable:
+            self.insert(item)
+
+    @classmethod
+    def from_sorted(cls, iterable, p=0.5, max_level=None, seed=None):
+        """
+        A class method which creates a `SkipList()` instance using a sorted
+        iterable object in time-complexity of O(n) where **n** is the number
+        of elements inside the given `iterable`. Unlike the constructor, the
+        values aren't inserted one by one. Instead, all levels are linked in
+        one pass where the height of each node is assigned deterministically;
+        the i-th node (one-indexed) is promoted once for each time
+        `max(2, round(1/p))` divides `i`. The result is a perfectly-balanced
+        `SkipList()`.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method
+            whose elements are sorted in ascending order. Repeated values are
+            stored only once.
+        p: float, optional
+            The probability of promoting a node to the next level, default
+            `0.5`. Any `p` greater than `2/3` links the given values as if
+            `p` were `0.5` since `round(1/p)` would be `1` there, which
+            divides every position forever. The returned instance still uses
+            the given `p` for the later insertions.
+        max_level: int, optional
+            The maximum height of the `SkipList()` instance. If `None`, the
+            height is unbounded, default `None`.
+        seed: int, optional
+            The seed of the random generator used by the returned instance
+            for the later insertions, default `None`.
+
+        Returns
+        -------
+        SkipList()
+            It returns a `SkipList()` instance with input values being
+            inserted.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in five cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+                3. If one of the elements in the iterable is NOT a number.
+                4. If the given `p` isn't a number.
+                5. If the given `max_level` isn't an integer.
+        ValueError:
+            It can be raised in four cases
+                1. If one of the iterable elements is `None`.
+                2. If the given iterable isn't sorted.
+                3. If the given `p` isn't between `0` and `1` exclusively.
+                4. If the given `max_level` is less than `1`.
+
+        Examples
+        --------
+        >>> sl = SkipList.from_sorted([1, 2, 3, 4, 5, 6])
+        >>> sl
+        ┌────┐                   ┌───┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤       ┌───┐       ├───┤       ┌───┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶| 2 │⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶| 6 │⟶
+        ├────┤ ┌───┐ ├───┤ ┌───┐ ├───┤ ┌───┐ ├───┤
+        | -∞ │⟶| 1 │⟶| 2 │⟶| 3 │⟶| 4 │⟶| 5 │⟶| 6 │⟶
+        └────┘ └───┘ └───┘ └───┘ └───┘ └───┘ └───┘
+
+        Using an unsorted iterable object will raise `ValueError`
+
+        >>> SkipList.from_sorted([2, 1])
+        ValueError: The given iterable isn't sorted!!
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        sl = cls(p=p, max_level=max_level, seed=seed)
+        sl._link_sorted(iterable)
+        return sl
+
+    def _link_sorted(self, iterable):
+        """
+        Links the values of the given sorted iterable at all levels of the
+        empty `SkipList()` instance in one pass.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object whose elements are sorted in ascending
+            order.
+
+        Raises
+        ------
+        TypeError:
+            If one of the elements in the iterable is NOT a number.
+        ValueError:
+            It can be raised in two cases
+                1. If one of the iterable elements is `None`.
+                2. If the given iterable isn't sorted.
+        """
+        assert self.is_empty()
+
+        # the last linked node at each level along with its position
+        tails = [self._head]
+        tails_positions = [0]
+        base = max(2, round(1 / self._p))
+        max_level = self._max_level
+        prev_key = None
+        length = 0
+        for item in iterable:
+            self._validate_item(item)
+            key = self._get_key(item)
+            if length and key <= prev_key:
+                if key == prev_key:
+                    continue
+                raise ValueError("The given iterable isn't sorted!!")
+            length += 1
+            # one plus the number of times `base` divides `length`
+            height, quotient = 1, length
+            while quotient % base == 0 and height != max_level:
+                quotient //= base
+                height += 1
+            while self._num_levels < height:
+                self._add_extra_level()
+                tails.append(self._head)
+                tails_positions.append(0)
+            new_node = self._create_node(item, height)
+            for level in range(height):
+                tail = tails[level]
+                tail._forwards[level] = new_node
+                tail._widths[level] = length - tails_positions[level]
+                tails[level] = new_node
+                tails_positions[level] = length
+            prev_key = key
+        self._length = length
+        for level in range(self._num_levels):
+            tails[level]._widths[level] = length + 1 - tails_positions[level]
 
     # =============================    PRINT     ==============================
-    def __print_node(self, node, zeroth_node, lower_node):
+    def __print_node(self, node, level):
         """
-        Prints the given node of the `SkipList()` instance.
+        Prints the given node of the `SkipList()` instance at the given level.
 
         Parameters
         ----------
         node: SkipNode()
             The SkipNode() to be printed.
-        zeroth_node: SkipNode()
-            The SkipNode() of the lowest LinkedList (zeorth level) attached to
-            the given `node`.
-        lower_node: SkipNode()
-            The SkipNode() which is directly below the `node`.
+        level: int
+            A positive zero-indexed integer representing the level rank at
+            which the node is printed.
 
         Returns
         -------
@@ -331,32 +505,23 @@ class SkipList(Extra):
         Raises
         ------
         AssertionError:
-            This can be raised in the following cases:
-                1. The `node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-                2. The `zeroth_node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-                3. The `lower_node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-        """
-        assert node is None or isinstance(node, self._basic_node)
-        assert zeroth_node is None or isinstance(zeroth_node, self._basic_node)
-        assert lower_node is None or isinstance(lower_node, self._basic_node)
+            If the `node` is not an instance of `SkipNode()`.
+        """
+        assert isinstance(node, self._basic_node)
         middle = []
         bottom_border = []
-        item = zeroth_node._represent()
+        item = node._represent()
         width = len(item) + 2  # 2: for a space before & after an item
-        if node is not None and zeroth_node.get_data() == node.get_data():
-            bottom_border += ["└"] if lower_node is None else ["├"]
+        height = node.get_height()
+        if height > level:
+            bottom_border += ["└"] if level == 0 else ["├"]
             bottom_border += ["─"] * width
-            bottom_border += ["┘ "] if lower_node is None else ["┤ "]
+            bottom_border += ["┘ "] if level == 0 else ["┤ "]
             middle += [f"| {item} │⟶"]
         else:
             middle += [f"⟶{'⟶'*width}⟶⟶"]
-            if (
-                lower_node is not None
-                and lower_node.get_data() == zeroth_node.get_data()
-            ):
+            # the node exists at the level directly below
+            if height == level:
                 bottom_border += ["┌"] + (["─"] * width) + ["┐ "]
             else:
                 bottom_border += [" "] + ([" "] * width) + ["  "]
@@ -389,30 +554,15 @@ class SkipList(Extra):
         assert type(level) == int
         assert level < self._num_levels
 
-        zeroth_list = self._level_lists[0]
-        curr_list = self._level_lists[level]
         # the following two lists will represent the output of this function
         bottom_border = []
         middle = []
-        # iterate over two lists in parallel
-        zeroth_node = zeroth_list._head
-        curr_node = curr_list._head
-        lower_node = self._level_lists[level - 1]._head if level > 0 else None
-        while zeroth_node is not None:
-            middle_part, bottom_part = self.__print_node(
-                curr_node, zeroth_node, lower_node
-            )
+        curr_node = self._head
+        while curr_node is not None:
+            middle_part, bottom_part = self.__print_node(curr_node, level)
             middle += middle_part
             bottom_border += bottom_part
-            if (curr_node is not None
-                    and zeroth_node.get_data() == curr_node.get_data()):
-                curr_node = curr_node.get_next()
-            if (
-                lower_node is not None
-                and zeroth_node.get_data() == lower_node.get_data()
-            ):
-                lower_node = lower_node.get_next()
-            zeroth_node = zeroth_node.get_next()
+            curr_node = curr_node.get_next()
         return "{}\n{}".format("".join(middle), "".join(bottom_border))
 
     def __print_top_border(self):
@@ -423,23 +573,17 @@ class SkipList(Extra):
         str:
             A one-line string representing the top-border of the `SkipList()`
         """
-        lower_list = self._level_lists[0]
-        top_list = self._level_lists[self._num_levels - 1]
-        # the following two lists will represent the output of this function
+        # the following list will represent the output of this function
         top_border = []
-        # iterate over two lists in parallel
-        lower_node = lower_list._head
-        curr_node = top_list._head
-        while (lower_node is not None):
-            item = lower_node._represent()
+        curr_node = self._head
+        while curr_node is not None:
+            item = curr_node._represent()
             width = len(item) + 2  # 2: for a space before & after an item
-            if (curr_node is not None
-                    and lower_node.get_data() == curr_node.get_data()):
+            if curr_node.get_height() >= self._num_levels:
                 top_border += ["┌"] + (["─"] * width) + ["┐ "]
-                curr_node = curr_node.get_next()
             else:
                 top_border += [" "] + ([" "] * width) + ["  "]
-            lower_node = lower_node.get_next()
+            curr_node = curr_node.get_next()
         return "{}".format("".join(top_border))
 
     def __repr__(self):
@@ -455,14 +599,13 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([20, 77, 10, 6, 2])
+        >>> sl = SkipList([20, 77, 10, 6, 2], seed=1)
         >>> sl
-        ┌────┐                    ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 20 │⟶⟶⟶⟶⟶⟶⟶⟶
-        ├────┤                    ├────┤ ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 20 │⟶| 77 │⟶
-        ├────┤ ┌───┐ ┌───┐ ┌────┐ ├────┤ ├────┤
+        ┌────┐             ┌────┐        ┌────┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶⟶⟶⟶⟶⟶⟶⟶| 77 │⟶
+        ├────┤             ├────┤        ├────┤
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶⟶⟶⟶⟶⟶⟶⟶| 77 │⟶
+        ├────┤ ┌───┐ ┌───┐ ├────┤ ┌────┐ ├────┤
         | -∞ │⟶| 2 │⟶| 6 │⟶| 10 │⟶| 20 │⟶| 77 │⟶
         └────┘ └───┘ └───┘ └────┘ └────┘ └────┘
         """
@@ -493,8 +636,7 @@ class SkipList(Extra):
         >>> len(sl)
         3
         """
-        n = len(self._level_lists[0])
-        return n - 1 if n > 0 else 0
+        return self._length
 
     def is_empty(self):
         """
@@ -521,9 +663,9 @@ class SkipList(Extra):
     # =============================    HEIGHT    ==============================
     def get_height(self):
         """
-        Gets the height of the `SkipNode()` instance. `SkipNode()` height is
-        the number of levels where each level is a standalone `LinkedList()`
-        object.
+        Gets the height of the `SkipList()` instance. `SkipList()` height is
+        the number of levels which is the height of the tallest `SkipNode()`
+        in the instance.
 
         Returns
         -------
@@ -532,8 +674,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([20, 77, 10, 6, 2])
+        >>> sl = SkipList([20, 77, 10, 6, 2], seed=1)
         >>> sl.get_height()
         3
         """
@@ -560,8 +701,10 @@ class SkipList(Extra):
         2
         3
         """
-        for item in self._level_lists[0][1:]:
-            yield item
+        curr_node = self._head.get_next()
+        while curr_node is not None:
+            yield curr_node.get_data()
+            curr_node = curr_node.get_next()
 
     # =============================    SEARCH    ==============================
     def _validate_item(self, item):
@@ -642,12 +785,31 @@ class SkipList(Extra):
         elif idx < -len(self) or idx >= len(self):
             raise IndexError("Can't find any element at the given index!!")
 
+    def _get_key(self, value):
+        """
+        Returns the key by which the given value is ordered inside the
+        `SkipList()` instance. The key of a value is stored in the `_data`
+        attribute of its node and it is the one compared while searching.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose key is needed.
+
+        Returns
+        -------
+        int or float:
+            The key of the given value which is the value itself.
+        """
+        return value
+
     def _search(self, value):
         """
-        Searches the `SkipList()` for a given value and returns the first node
-        containing that value if found and some other necessary info. If not
-        found, it returns the node whose value is less that the given value and
-        yet bigger than other values.
+        Searches the `SkipList()` for a given value by descending from the top
+        level to the lowest one. It returns the last accessed node at every
+        level along with the node that contains the given value if found. If
+        not found, it returns the first node whose value is bigger than the
+        given value.
 
         Parameters
         ----------
@@ -656,60 +818,47 @@ class SkipList(Extra):
 
         Returns
         -------
-        SkipNode():
-            If the value is found, this object represents the previous node to
-            the found node. If the value isn't found, this object represents
-            the previous node to the last accessed node.
+        list:
+            A list of the last accessed `SkipNode()` objects; one per level
+            where the i-th item is the last node at the i-th level whose value
+            is less than the given value.
+        list:
+            A list of the positions of the last accessed `SkipNode()` objects
+            in the lowest level where the -∞ sentinel is at position `0`.
         SkipNode():
             If the value is found, this object is the found node. If the value
-            is not found, this object is the last accessed node.
-        list:
-            A list of all accessed `SkipNode()` objects sorted in descending
-            manner.
-
-        Raises:
-        -------
-        AssertionError:
-            If the given value isn't a number
+            is not found, this object is the first node whose value is bigger
+            than the given value or `None` if there weren't any.
 
         Examples
         --------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([10, -2, 3])
+        >>> sl = SkipList([10, -2, 3], seed=5)
         >>> sl
-        ┌────┐              ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ┌────┐       ├────┤
-        | -∞ │⟶| -2 │⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ├────┤ ┌───┐ ├────┤
+        ┌────┐        ┌───┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶| 3 │⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ┌────┐ ├───┤ ┌────┐
+        | -∞ │⟶| -2 │⟶| 3 │⟶| 10 │⟶
+        ├────┤ ├────┤ ├───┤ ├────┤
         | -∞ │⟶| -2 │⟶| 3 │⟶| 10 │⟶
         └────┘ └────┘ └───┘ └────┘
-        >>> prev_node, node, last_accessed_nodes = sl._search(3)
-        >>> prev_node
-        SkipNode(data: -2, next: 3)
+        >>> last_accessed_nodes, positions, node = sl._search(3)
         >>> node
-        Node(data: 3, next: 10)
+        SkipNode(data: 3, next: 10)
         >>> last_accessed_nodes
-        [SkipNode(data: -2, next: 10), SkipNode(data: -∞, next: 10)]
-        """
-        # returns the last accessed node when searching a certain value.
-        assert type(value) in {int, float}
-
-        last_accessed_nodes = []
-        top_list = self._level_lists[self._num_levels - 1]
-        prev_node = None
-        start_node = top_list._head
-        while (start_node.get_down() is not None):
-            prev_node, found_node = search_sorted(prev_node, start_node, value)
-            if found_node.get_data() == value:
-                return prev_node, found_node, last_accessed_nodes
-            last_accessed_nodes.append(found_node)
-            start_node = found_node.get_down()
-            if prev_node is not None:
-                prev_node = prev_node.get_down()
-        prev_node, found_node = search_sorted(prev_node, start_node, value)
-        assert len(last_accessed_nodes) == self._num_levels - 1
-        return prev_node, found_node, last_accessed_nodes[::-1]
+        [SkipNode(data: -2, next: 3), SkipNode(data: -2, next: 3),
+        SkipNode(data: -∞, next: -2)]
+        >>> positions
+        [1, 1, 0]
+        """
+        last_accessed_nodes = [None] * self._num_levels
+        positions = [0] * self._num_levels
+        curr_node = self._head
+        rank = 0
+        for level in range(self._num_levels - 1, -1, -1):
+            curr_node, rank = search_sorted(curr_node, value, level, rank)
+            last_accessed_nodes[level] = curr_node
+            positions[level] = rank
+        return last_accessed_nodes, positions, curr_node._forwards[0]
 
     def __contains__(self, value):
         """
@@ -746,13 +895,43 @@ class SkipList(Extra):
         if type(value) not in {int, float}:
             return False
         self._validate_item(value)
-        _, found_node, _ = self._search(value)
-        return found_node.get_data() == value
+        key = self._get_key(value)
+        _, _, found_node = self._search(key)
+        return found_node is not None and found_node._data == key
+
+    def _get_node(self, idx):
+        """
+        Retrieves the node at the given index by descending from the top level
+        of the `SkipList()` instance while summing up the widths of the
+        followed forward pointers.
+
+        Parameters
+        ----------
+        idx: int
+            A zero-based index of a valid element in the `SkipList()`.
+
+        Returns
+        -------
+        SkipNode():
+            The node at the given index.
+        """
+        position = idx + 1  # NOTE: +1 to skip -∞
+        curr_node = self._head
+        rank = 0
+        for level in range(self._num_levels - 1, -1, -1):
+            next_node = curr_node._forwards[level]
+            while (next_node is not None
+                    and rank + curr_node._widths[level] <= position):
+                rank += curr_node._widths[level]
+                curr_node = next_node
+                next_node = curr_node._forwards[level]
+        return curr_node
 
     def __getitem__(self, idx):
         """
-        Retrieves the element at the given index in time-complexity of O(k)
-        where **k** is the given index. The given index is a zero-based `int`.
+        Retrieves the element at the given index in time-complexity of
+        O(log(n)) where **n** is the number of elements in the `SkipList()`
+        instance. The given index is a zero-based `int`.
         This method doesn't support negative indexing and doesn't support
         `slice` objects either.
 
@@ -798,65 +977,334 @@ class SkipList(Extra):
         zeroths element in the above skip list is `0` not `-∞`.
         """
         self._validate_index(idx)
-        # NOTE: idx+1 to skip -∞
-        node = self._level_lists[0].__getitem__(idx + 1)
-        return node
+        return self._get_node(idx).get_data()
+
+    def floor(self, value):
+        """
+        Gets the biggest value in the `SkipList()` instance that is less than
+        or equal to the given value in time-complexity of O(log(n)) where
+        **n** is the number of elements in the `SkipList()` instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for in the `SkipList()` instance.
+
+        Returns
+        -------
+        int or float:
+            The biggest value that is less than or equal to the given value,
+            or `None` if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> sl = SkipList([1, 3, 5])
+        >>> sl.floor(3)
+        3
+        >>> sl.floor(4)
+        3
+        >>> sl.floor(0) is None
+        True
+        """
+        self._validate_item(value)
+        key = self._get_key(value)
+        last_accessed_nodes, _, found_node = self._search(key)
+        if found_node is not None and found_node._data == key:
+            return found_node.get_data()
+        prev_node = last_accessed_nodes[0]
+        return None if prev_node is self._head else prev_node.get_data()
+
+    def ceiling(self, value):
+        """
+        Gets the smallest value in the `SkipList()` instance that is greater
+        than or equal to the given value in time-complexity of O(log(n)) where
+        **n** is the number of elements in the `SkipList()` instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for in the `SkipList()` instance.
+
+        Returns
+        -------
+        int or float:
+            The smallest value that is greater than or equal to the given
+            value, or `None` if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> sl = SkipList([1, 3, 5])
+        >>> sl.ceiling(3)
+        3
+        >>> sl.ceiling(4)
+        5
+        >>> sl.ceiling(6) is None
+        True
+        """
+        self._validate_item(value)
+        _, _, found_node = self._search(self._get_key(value))
+        return None if found_node is None else found_node.get_data()
+
+    def bisect_left(self, value):
+        """
+        Locates the insertion point of the given value in the `SkipList()`
+        instance to maintain sorted order in time-complexity of O(log(n)) where
+        **n** is the number of elements in the `SkipList()` instance. If the
+        value already exists, the insertion point will be before it.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose insertion point is to be located.
+
+        Returns
+        -------
+        int:
+            The number of elements in the `SkipList()` instance that are less
+            than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> sl = SkipList([1, 3, 5])
+        >>> sl.bisect_left(3)
+        1
+        >>> sl.bisect_left(4)
+        2
+        """
+        self._validate_item(value)
+        _, positions, _ = self._search(self._get_key(value))
+        return positions[0]
+
+    def bisect_right(self, value):
+        """
+        Locates the insertion point of the given value in the `SkipList()`
+        instance to maintain sorted order in time-complexity of O(log(n)) where
+        **n** is the number of elements in the `SkipList()` instance. If the
+        value already exists, the insertion point will be after it.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose insertion point is to be located.
+
+        Returns
+        -------
+        int:
+            The number of elements in the `SkipList()` instance that are less
+            than or equal to the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> sl = SkipList([1, 3, 5])
+        >>> sl.bisect_right(3)
+        2
+        >>> sl.bisect_right(4)
+        2
+        """
+        self._validate_item(value)
+        key = self._get_key(value)
+        _, positions, found_node = self._search(key)
+        if found_node is not None and found_node._data == key:
+            return positions[0] + 1
+        return positions[0]
+
+    # =============================    RANGE     ==============================
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Iterates over the values of the `SkipList()` instance that lie between
+        the given two values and returns a generator. The search for the
+        first value descends the `SkipList()` only once then the lowest level
+        is streamed lazily. So, the time-complexity is O(log(n) + k) where
+        **n** is the number of elements in the `SkipList()` instance and **k**
+        is the number of the generated values.
+
+        Parameters
+        ----------
+        lo: int or float, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum value in the instance.
+        hi: int or float, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum value in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
+
+        Returns
+        -------
+        generator:
+            The values within the given range in ascending order.
+
+        Raises
+        ------
+        TypeError:
+            If one of the given bounds is not a number.
+
+        Examples
+        --------
+        >>> sl = SkipList([1, 3, 5, 7, 9])
+        >>> list(sl.irange(3, 7))
+        [3, 5, 7]
+        >>> list(sl.irange(3, 7, inclusive=(False, True)))
+        [5, 7]
+        >>> list(sl.irange(hi=5))
+        [1, 3, 5]
+        """
+        for node in self._irange_nodes(lo, hi, inclusive):
+            yield node.get_data()
+
+    def _irange_nodes(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Iterates over the nodes of the `SkipList()` instance whose values lie
+        between the given two values. It's the backbone of the `irange()`
+        method.
+
+        Parameters
+        ----------
+        lo: int or float, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum value in the instance.
+        hi: int or float, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum value in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
+
+        Returns
+        -------
+        generator:
+            The `SkipNode()` objects within the given range in ascending order.
+        """
+        if lo is not None:
+            self._validate_item(lo)
+            lo = self._get_key(lo)
+        if hi is not None:
+            self._validate_item(hi)
+            hi = self._get_key(hi)
+        include_lo, include_hi = inclusive
+        if lo is None:
+            curr_node = self._head.get_next()
+        else:
+            _, _, curr_node = self._search(lo)
+            if (not include_lo and curr_node is not None
+                    and curr_node._data == lo):
+                curr_node = curr_node.get_next()
+        while curr_node is not None:
+            key = curr_node._data
+            if hi is not None and (key > hi or (key == hi and not include_hi)):
+                return
+            yield curr_node
+            curr_node = curr_node.get_next()
 
     # =============================    INSERT    ==============================
     def _add_extra_level(self):
         """
-        Creates a new level at the top of the `SkipList()`, a new level is a
-        new `LinkedList()` instance attached to the `SkipList()`.
+        Creates a new level at the top of the `SkipList()`. A new level is
+        created by raising the tower of the -∞ sentinel node by one.
+        """
+        self._head._forwards.append(None)
+        self._head._widths.append(self._length + 1)
+        self._num_levels += 1
+
+    def _get_random_height(self):
+        """
+        Draws the height of a new node from a geometric distribution where the
+        node is promoted one level higher with probability `p`. Instead of
+        flipping a coin for each level, the height is drawn using only one
+        random number by inverting the geometric distribution's CDF.
 
         Returns
         -------
-        LinkedList():
-            The newly-created `LinkedList()` instance after being attached to
-            the other `LinkedList()` object in the lower level.
-        """
-        top_list = self._level_lists[self._num_levels - 1]
-        new_llist = LinkedList()
-        new_llist._insert_node(new_llist._head,
-                               self._basic_node(float("-inf")))
-        # connect the head of the new linked list to the lower linked list
-        new_llist._head.set_down(top_list._head)
-        # add new linked list to the SkipList
-        self._level_lists.append(new_llist)
-        self._num_levels += 1
-        return new_llist
+        int:
+            A positive integer representing the height of the new node which
+            never exceeds the maximum level of the `SkipList()`.
+        """
+        # NOTE: 1 - random() lies in (0, 1] which avoids log(0)
+        height = int(math.log(1.0 - self._rng.random()) / self._log_p) + 1
+        if self._max_level is not None and height > self._max_level:
+            return self._max_level
+        return height
 
-    def _promote(self, upper_prev_node, curr_node, curr_level):
+    def _create_node(self, value, height):
         """
-        Promotes a node to the higher level. Promoting is done by copying the
-        node from (i)th level to the (i+1)th level.
+        Creates a new node holding the given value to be linked inside the
+        `SkipList()` instance.
 
         Parameters
         ----------
-        upper_prev_node: SkipNode()
-            The tail of the `LinkedList()` object in the above level.
-        curr_node: SkipNode()
-            The node to be promoted.
-        curr_level: int
-            The current level rank (level of the node before promoting).
+        value: int or float
+            The value to be stored in the new node.
+        height: int
+            The number of levels the new node belongs to.
 
         Returns
         -------
         SkipNode():
-            The `SkipNode()` object after being promoted in the higher level.
-        """
-        assert isinstance(upper_prev_node, self._basic_node)
-        assert isinstance(curr_node, self._basic_node)
-        assert curr_level < self._num_levels
-
-        # create new node with the same data as curr_data
-        upper_node = self._basic_node(curr_node.get_data())
-        # connect the upper list to the new node
-        upper_node = self._level_lists[curr_level + 1]._insert_node(
-            upper_prev_node, upper_node
-        )
-        # connect the current list with the upper one
-        upper_node.set_down(curr_node)
-        return upper_node
+            The newly-created node.
+        """
+        return self._basic_node(value, height)
+
+    def _link_node(self, last_accessed_nodes, positions, new_node):
+        """
+        Links the given new node at every level it belongs to right after the
+        last accessed nodes returned by the `_search()` method. The missing
+        levels are created first.
+
+        Parameters
+        ----------
+        last_accessed_nodes: list
+            The last accessed `SkipNode()` objects; one per level.
+        positions: list
+            The positions of the last accessed nodes in the lowest level.
+        new_node: SkipNode()
+            The node to be linked.
+        """
+        height = new_node.get_height()
+        while self._num_levels < height:
+            self._add_extra_level()
+            last_accessed_nodes.append(self._head)
+            positions.append(0)
+        new_position = positions[0] + 1
+        for level in range(height):
+            prev_node = last_accessed_nodes[level]
+            skipped = new_position - positions[level]
+            new_node._forwards[level] = prev_node._forwards[level]
+            new_node._widths[level] = prev_node._widths[level] - skipped + 1
+            prev_node._forwards[level] = new_node
+            prev_node._widths[level] = skipped
+        # the higher levels skip over the new node
+        for level in range(height, self._num_levels):
+            last_accessed_nodes[level]._widths[level] += 1
+        self._length += 1
 
     def insert(self, value):
         """
@@ -874,15 +1322,14 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([2, 1, 3, 4, 5])
+        >>> sl = SkipList([2, 1, 3, 4, 5], seed=1)
         >>> sl.insert(10)
         >>> sl
-        ┌────┐       ┌───┐                   ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶| 2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ┌───┐ ├───┤                   ├────┤
-        | -∞ │⟶| 1 │⟶| 2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ├───┤ ├───┤ ┌───┐ ┌───┐ ┌───┐ ├────┤
+        ┌────┐ ┌───┐       ┌───┐
+        | -∞ │⟶| 1 │⟶⟶⟶⟶⟶⟶⟶| 3 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├───┤       ├───┤
+        | -∞ │⟶| 1 │⟶⟶⟶⟶⟶⟶⟶| 3 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├───┤ ┌───┐ ├───┤ ┌───┐ ┌───┐ ┌────┐
         | -∞ │⟶| 1 │⟶| 2 │⟶| 3 │⟶| 4 │⟶| 5 │⟶| 10 │⟶
         └────┘ └───┘ └───┘ └───┘ └───┘ └───┘ └────┘
         >>> sl.insert("hi")
@@ -891,59 +1338,65 @@ class SkipList(Extra):
         Note
         -----
         Inserting values into different levels in the skip list is completely
-        random. So, running the previous example will return different values
-        each time you run it. So, in order to obtain the same result as before
-        you need to set `random.seed(1)` before running any of the previous
-        example.
+        random. So, running the previous example without a `seed` will return
+        different values each time you run it. So, in order to obtain the same
+        result as before you need to use the same `seed`.
         """
         self._validate_item(value)
+        key = self._get_key(value)
         # search for that value
-        _, found_node, last_accessed_nodes = self._search(value)
+        last_accessed_nodes, positions, found_node = self._search(key)
         # `value` already exists in our SkipList
-        if found_node.get_data() == value:
+        if found_node is not None and found_node._data == key:
             return
-        # create new_node with the new value
-        new_node = self._basic_node(value)
-        # insert new_node to the 0th linkedlist
-        curr_node = self._level_lists[0]._insert_node(found_node, new_node)
-
-        # promote the new_node if flipping the coin results `Head`
-        curr_level = 0
-        while flip_coin() == "head":
-            if curr_level >= self._num_levels - 1:
-                top_list = self._add_extra_level()
-                upper_prev_node = top_list._head
-            else:
-                upper_prev_node = last_accessed_nodes[curr_level]
-            # promote new_node
-            curr_node = self._promote(upper_prev_node, curr_node, curr_level)
-            curr_level += 1
+        # link the new node at each level it belongs to
+        new_node = self._create_node(value, self._get_random_height())
+        self._link_node(last_accessed_nodes, positions, new_node)
 
     # =============================    REMOVE    ==============================
-    def _remove_level(self, level):
+    def _remove_level(self):
         """
-        Removes a level from the `SkipList()` instance. We need to do so when
-        deleting a value from the `SkipList()` instance which results in a a
-        whole level being empty, so we will need to get rid of this level.
-
-        Parameters
-        ----------
-        level: int
-            The level rank which we want to remove.
+        Removes the top level from the `SkipList()` instance. We need to do so
+        when deleting a value from the `SkipList()` instance which results in
+        a whole level being empty, so we will need to get rid of this level.
 
         Raises
         ------
         AssertionError:
-            This can happen in two cases:
-                1. If the type of the given `level` isn't `int`.
-                2. If the level is less than 1 and greater than the total \
-                    number of levels.
+            If the `SkipList()` has only one level.
         """
-        assert type(level) == int and 1 <= level < self._num_levels
+        assert self._num_levels > 1
 
-        del self._level_lists[level]
+        self._head._forwards.pop()
+        self._head._widths.pop()
         self._num_levels -= 1
 
+    def _unlink_node(self, last_accessed_nodes, found_node):
+        """
+        Unlinks the given node from every level it belongs to. The empty levels
+        at the top of the `SkipList()` instance are removed afterwards.
+
+        Parameters
+        ----------
+        last_accessed_nodes: list
+            The last accessed `SkipNode()` objects returned by the `_search()`
+            method; one per level.
+        found_node: SkipNode()
+            The node to be unlinked.
+        """
+        height = found_node.get_height()
+        for level in range(height):
+            prev_node = last_accessed_nodes[level]
+            prev_node._forwards[level] = found_node._forwards[level]
+            prev_node._widths[level] += found_node._widths[level] - 1
+        # the higher levels skip one node less
+        for level in range(height, self._num_levels):
+            last_accessed_nodes[level]._widths[level] -= 1
+        self._length -= 1
+        # get rid of the empty levels at the top
+        while self._num_levels > 1 and self._head._forwards[-1] is None:
+            self._remove_level()
+
     def remove(self, value):
         """
         Removes node whose value equal to the given value.
@@ -955,8 +1408,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=74)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -981,27 +1433,12 @@ class SkipList(Extra):
         """
         if type(value) not in {int, float}:
             return
+        key = self._get_key(value)
         # search for that value
-        prev_node, found_node, last_accessed_nodes = self._search(value)
-        # NOTE: len(last_accessed_nodes) can be used to get the level where
-        #  this value was found
-        if found_node.get_data() == value:
-            level = self._num_levels - 1 - len(last_accessed_nodes)
-            while level >= 0:
-                curr_level_list = self._level_lists[level]
-                curr_level_list._remove_node(prev_node, found_node)
-                # check if curr_level_list is empty()
-                if level != 0 and len(curr_level_list) == 1:
-                    self._remove_level(level)
-                level -= 1
-                found_node = found_node.get_down()
-                # update value of prev_node
-                if prev_node is not None and found_node is not None:
-                    prev_node = prev_node.get_down()
-                    next_node = prev_node.get_next()
-                    while next_node.get_data() != found_node.get_data():
-                        prev_node = next_node
-                        next_node = prev_node.get_next()
+        last_accessed_nodes, _, found_node = self._search(key)
+        if found_node is None or found_node._data != key:
+            return
+        self._unlink_node(last_accessed_nodes, found_node)
 
     def __delitem__(self, idx):
         """
@@ -1025,8 +1462,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=74)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -1051,9 +1487,7 @@ class SkipList(Extra):
         since it was empty after removal.
         """
         self._validate_index(idx)
-        # NOTE: idx+1 to skip -∞
-        _, node = self._level_lists[0]._get_node(idx + 1)
-        self.remove(node.get_data())
+        self.remove(self._get_node(idx).get_data())
 
     def clear(self):
         """
@@ -1061,8 +1495,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=74)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -1079,7 +1512,12 @@ class SkipList(Extra):
         | -∞ │⟶
         └────┘
         """
-        self.__init__()
+        # NOTE: `_head` is the -∞ sentinel whose tower spans all levels. The
+        # width of a forward pointer that points to nothing is the distance
+        # to the position right after the last node.
+        self._head = self._basic_node(float("-inf"))
+        self._num_levels = 1
+        self._length = 0
 
     # =============================     MISC     ==============================
     def to_list(self):
@@ -1095,17 +1533,16 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList()
+        >>> sl = SkipList(seed=1)
         >>> sl.insert(20)
         >>> sl.insert(10)
         >>> sl.insert(30)
         >>> sl
-        ┌────┐        ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶| 20 │⟶⟶⟶⟶⟶⟶⟶⟶
-        ├────┤ ┌────┐ ├────┤
-        | -∞ │⟶| 10 │⟶| 20 │⟶⟶⟶⟶⟶⟶⟶⟶
-        ├────┤ ├────┤ ├────┤ ┌────┐
+        ┌────┐ ┌────┐        ┌────┐
+        | -∞ │⟶| 10 │⟶⟶⟶⟶⟶⟶⟶⟶| 30 │⟶
+        ├────┤ ├────┤        ├────┤
+        | -∞ │⟶| 10 │⟶⟶⟶⟶⟶⟶⟶⟶| 30 │⟶
+        ├────┤ ├────┤ ┌────┐ ├────┤
         | -∞ │⟶| 10 │⟶| 20 │⟶| 30 │⟶
         └────┘ └────┘ └────┘ └────┘
         >>> sl.to_list()
@@ -0,0 +1,710 @@
+"""
+A sorted dictionary is a mapping that keeps its keys sorted in ascending
+order. Each key is associated with a value and the keys can be any objects
+that can be compared with each other such as numbers, strings and tuples. The
+sorted dictionary is built on top of the `SortedSet()` whose nodes hold both
+the key and its value. So, getting, setting and removing keys are done in
+time-complexity of **O(log(n))** and iterating over the keys always follows
+their order.
+
+The following is a simple sorted dictionary mapping a few fruits to their
+prices:
+
+.. code-block:: text
+
+    ┌────┐ ┌─────────┐ ┌──────────┐
+    | -∞ │⟶| apple:3 │⟶| banana:1 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+    ├────┤ ├─────────┤ ├──────────┤
+    | -∞ │⟶| apple:3 │⟶| banana:1 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+    ├────┤ ├─────────┤ ├──────────┤ ┌────────┐
+    | -∞ │⟶| apple:3 │⟶| banana:1 │⟶| kiwi:5 │⟶
+    └────┘ └─────────┘ └──────────┘ └────────┘
+
+Similar to `SortedSet()`, the order of the keys can be customized using a
+`key` function which is called on every key to get the value by which the key
+is sorted.
+"""
+from extra.interface import Extra
+from extra.lists.sorted_set import SortedNode, SortedSet
+
+# the default of `pop()` telling that no default value was given
+_MISSING = object()
+
+
+class SortedDictNode(SortedNode):
+    """
+    A sorted dictionary node is a `SortedNode()` that holds a value along with
+    the stored key.
+    """
+
+    __name__ = "extra.SortedDictNode()"
+
+    def __init__(self, item, value, height=1, key=None):
+        """
+        Creates a `SortedDictNode()` object used mainly with SortedDict()
+        objects!!
+
+        Parameters
+        ----------
+        item: object
+            The key to be saved within the `SortedDictNode()` instance.
+        value: object
+            The value associated with the given key.
+        height: int
+            The number of levels this node belongs to, default `1`.
+        key: object, optional
+            The value by which the item is sorted. If `None`, the item itself
+            is used, default `None`.
+
+        Raises
+        ------
+        ValueError:
+            If the given item or value is `None`.
+        TypeError:
+            If the given item or value is an `Extra` object.
+        """
+        super().__init__(item, height, key)
+        self._validate_item(value)
+        self._value = value
+
+    def get_value(self):
+        """
+        Returns the value stored in the `SortedDictNode()` instance.
+
+        Returns
+        -------
+        object:
+            The value associated with the node's key.
+
+        Example
+        -------
+        >>> x = SortedDictNode("apple", 3)
+        >>> x.get_value()
+        3
+        """
+        return self._value
+
+    def set_value(self, value):
+        """
+        Sets the value of the `SortedDictNode()` instance.
+
+        Parameters
+        ----------
+        value: object
+            The new value to be associated with the node's key.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is an `Extra` object.
+
+        Example
+        -------
+        >>> x = SortedDictNode("apple", 3)
+        >>> x.set_value(4)
+        >>> x.get_value()
+        4
+        """
+        self._validate_item(value)
+        self._value = value
+
+    def _represent(self):
+        """
+        A helpful function used to represent the `SortedDictNode()` when
+        printing!!
+
+        Returns
+        -------
+        str:
+            A string representing the `SortedDictNode()` is a very simple way.
+
+        Example
+        -------
+        >>> x = SortedDictNode("apple", 3)
+        >>> x._represent()
+        'apple:3'
+        """
+        return f"{self._item}:{self._value}"
+
+
+class SortedDict(Extra):
+    """
+    A sorted dictionary is a mapping that keeps its keys sorted in ascending
+    order. Each key is associated with a value and the keys can be any objects
+    that can be compared with each other such as numbers, strings and tuples.
+    Getting, setting and removing keys are done in time-complexity of
+    **O(log(n))** and iterating over the keys always follows their order.
+    """
+
+    __name__ = "extra.SortedDict()"
+
+    def __init__(
+        self, iterable=None, key=None, p=0.5, max_level=None, seed=None
+    ):
+        """
+        Initializes a `SortedDict()` instance using an optional mapping or
+        iterable of key-value pairs in time-complexity of O(n*log(n)) where
+        **n** is the number of pairs inside the given `iterable`.
+
+        Parameters
+        ----------
+        iterable: dict or iterable, optional
+            A python `dict` or an iterable of `(key, value)` pairs.
+        key: callable, optional
+            A function of one argument that is used to extract the value by
+            which each key is sorted. If `None`, the keys are compared
+            directly, default `None`.
+        p: float, optional
+            The probability of promoting a node to the next level, default
+            `0.5`.
+        max_level: int, optional
+            The maximum height of the underlying skip list. If `None`, the
+            height is unbounded, default `None`.
+        seed: int, optional
+            The seed of the random generator used by this instance to choose
+            the height of the inserted nodes. If `None`, the generator is
+            seeded from the current system's randomness, default `None`.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in four cases
+                1. In case the given object isn't iterable.
+                2. If one of the keys or values is an `Extra` object.
+                3. If the keys can't be compared with each other.
+                4. If the given `key` isn't callable.
+        ValueError:
+            If one of the keys or values is `None`.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"kiwi": 5, "apple": 3, "banana": 1}, seed=1)
+        >>> sd
+        ┌────┐ ┌─────────┐ ┌──────────┐
+        | -∞ │⟶| apple:3 │⟶| banana:1 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├─────────┤ ├──────────┤
+        | -∞ │⟶| apple:3 │⟶| banana:1 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├─────────┤ ├──────────┤ ┌────────┐
+        | -∞ │⟶| apple:3 │⟶| banana:1 │⟶| kiwi:5 │⟶
+        └────┘ └─────────┘ └──────────┘ └────────┘
+
+        Using a non-iterable object will raise `TypeError`
+
+        >>> sd = SortedDict(2)
+        TypeError: The given object isn't iterable!!
+        """
+        self._container = SortedSet(
+            key=key, p=p, max_level=max_level, seed=seed
+        )
+        if iterable is None:
+            return
+        elif isinstance(iterable, dict):
+            iterable = iterable.items()
+        elif not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        for item, value in iterable:
+            self[item] = value
+
+    # =============================    PRINT     ==============================
+    def __repr__(self):
+        """
+        Represents the `SortedDict()` instance as a string.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `SortedDict()` instance.
+
+        Example
+        -------
+        >>> sd = SortedDict(seed=1)
+        >>> sd["b"] = 2
+        >>> sd["a"] = 1
+        >>> sd
+        ┌────┐ ┌─────┐
+        | -∞ │⟶| a:1 │⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├─────┤
+        | -∞ │⟶| a:1 │⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├─────┤ ┌─────┐
+        | -∞ │⟶| a:1 │⟶| b:2 │⟶
+        └────┘ └─────┘ └─────┘
+        """
+        return repr(self._container)
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `SortedDict()` in constant time.
+
+        Returns
+        -------
+        int:
+            The number of keys inside the `SortedDict()` instance.
+
+        Example
+        -------
+        >>> sd = SortedDict({"a": 1, "b": 2})
+        >>> len(sd)
+        2
+        """
+        return len(self._container)
+
+    def is_empty(self):
+        """
+        Checks if the `SortedDict()` instance is empty or not in constant time.
+
+        Returns
+        -------
+        bool:
+            A boolean flag showing if the `SortedDict()` instance is empty or
+            not. `True` shows that this instance is empty and `False` shows
+            it's not empty.
+
+        Example
+        --------
+        >>> sd = SortedDict()
+        >>> sd.is_empty()
+        True
+        >>> sd["a"] = 1
+        >>> sd.is_empty()
+        False
+        """
+        return self._container.is_empty()
+
+    # =============================   ITERATOR   ==============================
+    def __iter__(self):
+        """
+        Iterates over the keys of the `SortedDict()` instance in ascending
+        order in time-complexity of O(n) where **n** is the number of keys in
+        the `SortedDict()` instance.
+
+        Returns
+        -------
+        generator:
+            The keys of the instance in ascending order.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"b": 2, "a": 1})
+        >>> for key in sd:
+        ...     print(key)
+        a
+        b
+        """
+        return iter(self._container)
+
+    def keys(self):
+        """
+        Iterates over the keys of the `SortedDict()` instance in ascending
+        order in time-complexity of O(n) where **n** is the number of keys.
+
+        Returns
+        -------
+        generator:
+            The keys of the instance in ascending order.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"b": 2, "a": 1})
+        >>> list(sd.keys())
+        ['a', 'b']
+        """
+        return iter(self._container)
+
+    def values(self):
+        """
+        Iterates over the values of the `SortedDict()` instance ordered by
+        their keys in time-complexity of O(n) where **n** is the number of
+        keys.
+
+        Returns
+        -------
+        generator:
+            The values of the instance ordered by their keys.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"b": 2, "a": 1})
+        >>> list(sd.values())
+        [1, 2]
+        """
+        for node in self._container._irange_nodes():
+            yield node.get_value()
+
+    def items(self):
+        """
+        Iterates over the `(key, value)` pairs of the `SortedDict()` instance
+        ordered by their keys in time-complexity of O(n) where **n** is the
+        number of keys.
+
+        Returns
+        -------
+        generator:
+            The `(key, value)` pairs of the instance ordered by their keys.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"b": 2, "a": 1})
+        >>> list(sd.items())
+        [('a', 1), ('b', 2)]
+        """
+        for node in self._container._irange_nodes():
+            yield node.get_data(), node.get_value()
+
+    # =============================    SEARCH    ==============================
+    def _search(self, key):
+        """
+        Searches the underlying `SortedSet()` for the given key.
+
+        Parameters
+        ----------
+        key: object
+            The key to be searched for.
+
+        Returns
+        -------
+        list:
+            A list of the last accessed nodes; one per level. Check
+            `SkipList._search()` for more details.
+        list:
+            A list of the positions of the last accessed nodes.
+        SortedDictNode():
+            The node holding the given key or `None` if the key doesn't exist.
+
+        Raises
+        ------
+        ValueError:
+            If the given key is `None`.
+        TypeError:
+            If the given key is an `Extra` object.
+        """
+        self._validate_item(key)
+        container = self._container
+        sort_key = container._get_key(key)
+        prev_nodes, positions, found_node = container._search(sort_key)
+        if found_node is None or found_node._data != sort_key:
+            found_node = None
+        return prev_nodes, positions, found_node
+
+    def __contains__(self, key):
+        """
+        Checks if the given key exists in the `SortedDict()` instance in time-
+        complexity of O(log(n)) where **n** is the number of keys in the
+        `SortedDict()` instance.
+
+        Parameters
+        ----------
+        key: object
+            The key to be searched for in the `SortedDict()` instance.
+
+        Returns
+        -------
+        bool
+            `True` if the given key exists in the `SortedDict()` instance, and
+            `False` otherwise.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"a": 1, "b": 2})
+        >>> "a" in sd
+        True
+        >>> "c" in sd
+        False
+        >>> 1 in sd
+        False
+        """
+        return key in self._container
+
+    def __getitem__(self, key):
+        """
+        Retrieves the value associated with the given key in time-complexity
+        of O(log(n)) where **n** is the number of keys in the `SortedDict()`
+        instance.
+
+        Parameters
+        ----------
+        key: object
+            The key whose value is retrieved.
+
+        Returns
+        -------
+        object:
+            The value associated with the given key.
+
+        Raises
+        ------
+        KeyError:
+            If the given key doesn't exist in the `SortedDict()` instance.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"a": 1, "b": 2})
+        >>> sd["a"]
+        1
+        >>> sd["c"]
+        KeyError: "Can't find `c` in the `extra.SortedDict()`!!"
+        """
+        _, _, found_node = self._search(key)
+        if found_node is None:
+            raise KeyError(f"Can't find `{key}` in the `{self.__name__}`!!")
+        return found_node.get_value()
+
+    def get(self, key, default=None):
+        """
+        Retrieves the value associated with the given key in time-complexity
+        of O(log(n)) where **n** is the number of keys in the `SortedDict()`
+        instance. If the key doesn't exist, the given default is returned.
+
+        Parameters
+        ----------
+        key: object
+            The key whose value is retrieved.
+        default: object, optional
+            The value to be returned if the key doesn't exist, default `None`.
+
+        Returns
+        -------
+        object:
+            The value associated with the given key or `default` if the key
+            doesn't exist.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"a": 1, "b": 2})
+        >>> sd.get("a")
+        1
+        >>> sd.get("c", 0)
+        0
+        """
+        _, _, found_node = self._search(key)
+        return default if found_node is None else found_node.get_value()
+
+    # =============================    RANGE     ==============================
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Iterates over the keys of the `SortedDict()` instance that lie between
+        the given two keys in time-complexity of O(log(n) + k) where **n** is
+        the number of keys in the `SortedDict()` instance and **k** is the
+        number of the generated keys.
+
+        Parameters
+        ----------
+        lo: object, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum key in the instance.
+        hi: object, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum key in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
+
+        Returns
+        -------
+        generator:
+            The keys within the given range in ascending order.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"a": 1, "b": 2, "c": 3, "d": 4})
+        >>> list(sd.irange("b", "c"))
+        ['b', 'c']
+        >>> list(sd.irange("b", inclusive=(False, True)))
+        ['c', 'd']
+        """
+        return self._container.irange(lo, hi, inclusive)
+
+    def irange_items(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Iterates over the `(key, value)` pairs of the `SortedDict()` instance
+        whose keys lie between the given two keys in time-complexity of
+        O(log(n) + k) where **n** is the number of keys in the `SortedDict()`
+        instance and **k** is the number of the generated pairs.
+
+        Parameters
+        ----------
+        lo: object, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum key in the instance.
+        hi: object, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum key in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
+
+        Returns
+        -------
+        generator:
+            The `(key, value)` pairs within the given range ordered by their
+            keys.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"a": 1, "b": 2, "c": 3, "d": 4})
+        >>> list(sd.irange_items("b", "c"))
+        [('b', 2), ('c', 3)]
+        """
+        for node in self._container._irange_nodes(lo, hi, inclusive):
+            yield node.get_data(), node.get_value()
+
+    # =============================    INSERT    ==============================
+    def __setitem__(self, key, value):
+        """
+        Associates the given value with the given key in time-complexity of
+        O(log(n)) where **n** is the number of keys in the `SortedDict()`
+        instance. If the key already exists, its value is replaced.
+
+        Parameters
+        ----------
+        key: object
+            The key to be set.
+        value: object
+            The value to be associated with the given key.
+
+        Raises
+        ------
+        ValueError:
+            If the given key or value is `None`.
+        TypeError:
+            It can be raised in two cases
+                1. If the given key or value is an `Extra` object.
+                2. If the given key can't be compared with the stored keys.
+
+        Examples
+        --------
+        >>> sd = SortedDict()
+        >>> sd["b"] = 2
+        >>> sd["a"] = 1
+        >>> sd["b"] = 20
+        >>> list(sd.items())
+        [('a', 1), ('b', 20)]
+        """
+        self._validate_item(value)
+        last_accessed_nodes, positions, found_node = self._search(key)
+        if found_node is not None:
+            found_node.set_value(value)
+            return
+        container = self._container
+        new_node = SortedDictNode(
+            key,
+            value,
+            container._get_random_height(),
+            container._get_key(key),
+        )
+        container._link_node(last_accessed_nodes, positions, new_node)
+
+    # =============================    REMOVE    ==============================
+    def __delitem__(self, key):
+        """
+        Removes the given key along with its value from the `SortedDict()`
+        instance in time-complexity of O(log(n)) where **n** is the number of
+        keys in the `SortedDict()` instance.
+
+        Parameters
+        ----------
+        key: object
+            The key to be removed.
+
+        Raises
+        ------
+        KeyError:
+            If the given key doesn't exist in the `SortedDict()` instance.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"a": 1, "b": 2})
+        >>> del sd["a"]
+        >>> list(sd.items())
+        [('b', 2)]
+        >>> del sd["a"]
+        KeyError: "Can't find `a` in the `extra.SortedDict()`!!"
+        """
+        last_accessed_nodes, _, found_node = self._search(key)
+        if found_node is None:
+            raise KeyError(f"Can't find `{key}` in the `{self.__name__}`!!")
+        self._container._unlink_node(last_accessed_nodes, found_node)
+
+    def pop(self, key, default=_MISSING):
+        """
+        Removes the given key from the `SortedDict()` instance and returns its
+        value in time-complexity of O(log(n)) where **n** is the number of keys
+        in the `SortedDict()` instance.
+
+        Parameters
+        ----------
+        key: object
+            The key to be removed.
+        default: object, optional
+            The value to be returned if the key doesn't exist. If not given,
+            a `KeyError` is raised instead.
+
+        Returns
+        -------
+        object:
+            The value associated with the removed key or `default` if the key
+            doesn't exist.
+
+        Raises
+        ------
+        KeyError:
+            If the given key doesn't exist in the `SortedDict()` instance and
+            no `default` is given.
+
+        Examples
+        --------
+        >>> sd = SortedDict({"a": 1, "b": 2})
+        >>> sd.pop("a")
+        1
+        >>> sd.pop("a", 0)
+        0
+        >>> sd.pop("a")
+        KeyError: "Can't find `a` in the `extra.SortedDict()`!!"
+        >>> list(sd.items())
+        [('b', 2)]
+        """
+        last_accessed_nodes, _, found_node = self._search(key)
+        if found_node is None:
+            if default is _MISSING:
+                raise KeyError(
+                    f"Can't find `{key}` in the `{self.__name__}`!!"
+                )
+            return default
+        self._container._unlink_node(last_accessed_nodes, found_node)
+        return found_node.get_value()
+
+    def clear(self):
+        """
+        Removes all keys within the `SortedDict()` in constant time.
+
+        Example
+        -------
+        >>> sd = SortedDict({"a": 1, "b": 2})
+        >>> sd.clear()
+        >>> sd.is_empty()
+        True
+        """
+        self._container.clear()
+
+    # =============================     MISC     ==============================
+    def to_dict(self):
+        """
+        Converts the `SortedDict()` instance to a python `dict` in
+        time-complexity of O(n) where **n** is the number of keys in the
+        instance. The returned `dict` preserves the order of the keys.
+
+        Returns
+        -------
+        dict:
+            A `dict` object containing the same key-value pairs as the
+            `SortedDict()` instance.
+
+        Example
+        -------
+        >>> sd = SortedDict([("b", 2), ("a", 1)])
+        >>> sd.to_dict()
+        {'a': 1, 'b': 2}
+        """
+        return dict(self.items())
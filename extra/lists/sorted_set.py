@@ -0,0 +1,443 @@
+"""
+A sorted set is a collection of unique items that are always kept in ascending
+order. Unlike the `SkipList()` which supports only numbers, the sorted set is
+able to store any items that can be compared with each other such as strings,
+tuples and dates. The sorted set is built on top of the skip list. So, it
+supports adding, removing and searching for items in time-complexity of
+**O(log(n))**.
+
+The following is a simple sorted set containing a few fruits:
+
+.. code-block:: text
+
+    ┌────┐ ┌───────┐            ┌────────┐
+    | -∞ │⟶| apple │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| cherry │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+    ├────┤ ├───────┤            ├────────┤
+    | -∞ │⟶| apple │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| cherry │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+    ├────┤ ├───────┤ ┌────────┐ ├────────┤ ┌──────┐
+    | -∞ │⟶| apple │⟶| banana │⟶| cherry │⟶| kiwi │⟶
+    └────┘ └───────┘ └────────┘ └────────┘ └──────┘
+
+The order of the items can be customized using a `key` function which is
+called once on every item to get the value by which the item is sorted, just
+like the `key` parameter of python's `sorted()` function. Two items whose keys
+are equal are considered the same item. So, only one of them is stored.
+"""
+from extra.interface import Extra
+from extra.lists.skip_list import SkipNode, SkipList
+
+
+class SortedNode(SkipNode):
+    """
+    A sorted node is the basic unit for building sorted sets. Besides the tower
+    of forward pointers, each sorted node stores the item along with the key
+    by which this item is sorted.
+    """
+
+    __name__ = "extra.SortedNode()"
+
+    def __init__(self, item, height=1, key=None):
+        """
+        Creates a `SortedNode()` object used mainly with SortedSet() objects!!
+
+        Parameters
+        ----------
+        item: object
+            The value to be saved within the `SortedNode()` instance.
+        height: int
+            The number of levels this node belongs to, default `1`.
+        key: object, optional
+            The value by which the item is sorted. If `None`, the item itself
+            is used, default `None`.
+
+        Raises
+        ------
+        ValueError:
+            If the given item is `None`.
+        TypeError:
+            If the given item is an `Extra` object.
+        """
+        self._validate_item(item)
+        assert type(height) == int and height >= 1
+        self._item = item
+        self._data = item if key is None else key
+        self._forwards = [None] * height
+        self._widths = [1] * height
+
+    def get_data(self):
+        """
+        Returns the item stored in the `SortedNode()` instance.
+
+        Returns
+        -------
+        object:
+            The item stored in the `SortedNode()`.
+
+        Example
+        -------
+        >>> x = SortedNode("hello", key=5)
+        >>> x.get_data()
+        'hello'
+        """
+        return self._item
+
+    def get_key(self):
+        """
+        Returns the key by which the item of the `SortedNode()` instance is
+        sorted.
+
+        Returns
+        -------
+        object:
+            The key of the stored item.
+
+        Example
+        -------
+        >>> x = SortedNode("hello", key=5)
+        >>> x.get_key()
+        5
+        """
+        return self._data
+
+    def __repr__(self):
+        """
+        Represents `SortedNode()` object as a string.
+
+        Returns
+        -------
+        str:
+            A string representing the `SortedNode()` instance.
+
+        Example
+        -------
+        >>> x = SortedNode("hello")
+        >>> x
+        SortedNode(data: hello, next: None)
+        """
+        nxt = self._forwards[0]
+        nxt = nxt.get_data() if nxt is not None else None
+        return f"SortedNode(data: {self._represent()}, next: {nxt})"
+
+    def _represent(self):
+        """
+        A helpful function used to represent the `SortedNode()` when printing!!
+
+        Returns
+        -------
+        str:
+            A string representing the `SortedNode()` is a very simple way.
+
+        Example
+        -------
+        >>> x = SortedNode("hello", key=5)
+        >>> x._represent()
+        'hello'
+        """
+        if self._data == float("-inf"):
+            return "-∞"
+        return str(self._item)
+
+
+class SortedSet(SkipList):
+    """
+    A sorted set is a collection of unique items that are always kept in
+    ascending order. Unlike the `SkipList()` which supports only numbers, the
+    sorted set is able to store any items that can be compared with each other
+    such as strings, tuples and dates. The sorted set is built on top of the
+    skip list. So, it supports adding, removing and searching for items in
+    time-complexity of **O(log(n))**.
+    """
+
+    _basic_node = SortedNode
+    __name__ = "extra.SortedSet()"
+
+    def __init__(
+        self, iterable=None, key=None, p=0.5, max_level=None, seed=None
+    ):
+        """
+        Initializes a `SortedSet()` instance using an optional iterable object
+        in time-complexity of O(n*log(n)) where **n** is the number of
+        elements inside the given `iterable`.
+
+        Parameters
+        ----------
+        iterable: iterable, optional
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+        key: callable, optional
+            A function of one argument that is used to extract the key by
+            which each item is sorted. If `None`, the items are compared
+            directly, default `None`.
+        p: float, optional
+            The probability of promoting a node to the next level, default
+            `0.5`.
+        max_level: int, optional
+            The maximum height of the underlying skip list. If `None`, the
+            height is unbounded, default `None`.
+        seed: int, optional
+            The seed of the random generator used by this instance to choose
+            the height of the inserted nodes. If `None`, the generator is
+            seeded from the current system's randomness, default `None`.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in four cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+                3. If the elements of the iterable can't be compared.
+                4. If the given `key` isn't callable.
+        ValueError:
+            If one of the iterable elements is `None`.
+
+        Examples
+        --------
+        >>> ss = SortedSet(["kiwi", "apple", "cherry", "banana"], seed=1)
+        >>> ss
+        ┌────┐ ┌───────┐            ┌────────┐
+        | -∞ │⟶| apple │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| cherry │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├───────┤            ├────────┤
+        | -∞ │⟶| apple │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| cherry │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ├───────┤ ┌────────┐ ├────────┤ ┌──────┐
+        | -∞ │⟶| apple │⟶| banana │⟶| cherry │⟶| kiwi │⟶
+        └────┘ └───────┘ └────────┘ └────────┘ └──────┘
+
+        Using a `key` function changes the order of the items
+
+        >>> ss = SortedSet(["kiwi", "apple", "fig"], key=len)
+        >>> ss.to_list()
+        ['fig', 'kiwi', 'apple']
+
+        Using items that can't be compared will raise `TypeError`
+
+        >>> ss = SortedSet([1, "one"])
+        TypeError: '<' not supported between instances of 'int' and 'str'
+        """
+        if key is not None and not callable(key):
+            raise TypeError("The given key must be callable!!")
+        self._key = key
+        super().__init__(iterable, p, max_level, seed)
+
+    @classmethod
+    def from_sorted(cls, iterable, key=None, p=0.5, max_level=None, seed=None):
+        """
+        A class method which creates a `SortedSet()` instance using a sorted
+        iterable object in time-complexity of O(n) where **n** is the number
+        of elements inside the given `iterable`. All levels are linked in one
+        pass the same way as `SkipList.from_sorted()`.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method
+            whose elements are sorted in ascending order of their keys.
+            Repeated items are stored only once.
+        key: callable, optional
+            A function of one argument that is used to extract the key by
+            which each item is sorted, default `None`.
+        p: float, optional
+            The probability of promoting a node to the next level, default
+            `0.5`.
+        max_level: int, optional
+            The maximum height of the underlying skip list. If `None`, the
+            height is unbounded, default `None`.
+        seed: int, optional
+            The seed of the random generator used by the returned instance
+            for the later insertions, default `None`.
+
+        Returns
+        -------
+        SortedSet()
+            It returns a `SortedSet()` instance with input values being
+            inserted.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in three cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+                3. If the given `key` isn't callable.
+        ValueError:
+            It can be raised in two cases
+                1. If one of the iterable elements is `None`.
+                2. If the given iterable isn't sorted.
+
+        Examples
+        --------
+        >>> ss = SortedSet.from_sorted(["a", "b", "c", "d"])
+        >>> ss
+        ┌────┐                   ┌───┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| d │⟶
+        ├────┤       ┌───┐       ├───┤
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶| b │⟶⟶⟶⟶⟶⟶⟶| d │⟶
+        ├────┤ ┌───┐ ├───┤ ┌───┐ ├───┤
+        | -∞ │⟶| a │⟶| b │⟶| c │⟶| d │⟶
+        └────┘ └───┘ └───┘ └───┘ └───┘
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        ss = cls(key=key, p=p, max_level=max_level, seed=seed)
+        ss._link_sorted(iterable)
+        return ss
+
+    # =============================    SEARCH    ==============================
+    def _validate_item(self, item):
+        """
+        Checks the validity of the given item. It raises the appropriate error
+        when the item isn't valid and it returns nothing if the item is valid.
+        Unlike `SkipList()`, any item is accepted as long as it isn't `None`
+        or an `Extra` object.
+
+        Parameters
+        ----------
+        item: object
+            The object that should be verified.
+
+        Raises
+        ------
+        ValueError:
+            If the given item is `None`.
+        TypeError:
+            If the given item is an `Extra` object.
+        """
+        # NOTE: skip the `SkipList()` check which accepts only numbers
+        super(SkipList, self)._validate_item(item)
+
+    def _get_key(self, value):
+        """
+        Returns the key by which the given item is ordered inside the
+        `SortedSet()` instance.
+
+        Parameters
+        ----------
+        value: object
+            The item whose key is needed.
+
+        Returns
+        -------
+        object:
+            The result of calling the `key` function on the given item or the
+            item itself if no `key` function was given.
+        """
+        return value if self._key is None else self._key(value)
+
+    def __contains__(self, value):
+        """
+        Checks if the given item exists in the `SortedSet()` instance in time-
+        complexity of O(log(n)) where **n** is the total number of elements in
+        the `SortedSet()` instance.
+
+        Parameters
+        ----------
+        value: Object
+            The item to be searched for in the `SortedSet()` instance.
+
+        Returns
+        -------
+        bool
+            `True` if the given item exists in the `SortedSet()` instance, and
+            `False` otherwise.
+
+        Examples
+        --------
+        >>> ss = SortedSet(["a", "b", "c"])
+        >>> "a" in ss
+        True
+        >>> "d" in ss
+        False
+        >>> 1 in ss
+        False
+        """
+        if value is None or isinstance(value, Extra):
+            return False
+        key = self._get_key(value)
+        try:
+            _, _, found_node = self._search(key)
+        except TypeError:
+            # the given item can't be compared with the stored ones
+            return False
+        return found_node is not None and found_node._data == key
+
+    # =============================    INSERT    ==============================
+    def _create_node(self, value, height):
+        """
+        Creates a new node holding the given item along with its key.
+
+        Parameters
+        ----------
+        value: object
+            The item to be stored in the new node.
+        height: int
+            The number of levels the new node belongs to.
+
+        Returns
+        -------
+        SortedNode():
+            The newly-created node.
+        """
+        return self._basic_node(value, height, self._get_key(value))
+
+    def insert(self, value):
+        """
+        Inserts an item to the `SortedSet()` instance in time-complexity of
+        O(log(n)) where **n** is the number of elements in the `SortedSet()`.
+        If an item with the same key already exists, nothing happens.
+
+        Parameters
+        ----------
+        value: object
+            The item to be inserted in the `SortedSet()` instance.
+
+        Raises
+        ------
+        ValueError:
+            If the given item is `None`.
+        TypeError:
+            It can be raised in two cases
+                1. If the given item is an `Extra` object.
+                2. If the given item can't be compared with the stored items.
+
+        Example
+        -------
+        >>> ss = SortedSet(["b", "d"], seed=1)
+        >>> ss.insert("c")
+        >>> ss.insert("a")
+        >>> ss.to_list()
+        ['a', 'b', 'c', 'd']
+        >>> ss.insert(1)
+        TypeError: '<' not supported between instances of 'str' and 'int'
+        """
+        super().insert(value)
+
+    # =============================    REMOVE    ==============================
+    def remove(self, value):
+        """
+        Removes the given item from the `SortedSet()` instance in
+        time-complexity of O(log(n)) where **n** is the number of elements in
+        the `SortedSet()`. If the item doesn't exist, nothing happens.
+
+        Parameters
+        ----------
+        value: object
+            The item to be removed from the `SortedSet()` instance.
+
+        Example
+        -------
+        >>> ss = SortedSet(["a", "b", "c"])
+        >>> ss.remove("z") #does nothing
+        >>> ss.remove(10) #does nothing
+        >>> ss.remove("b")
+        >>> ss.to_list()
+        ['a', 'c']
+        """
+        if value is None or isinstance(value, Extra):
+            return
+        key = self._get_key(value)
+        try:
+            last_accessed_nodes, _, found_node = self._search(key)
+        except TypeError:
+            return
+        if found_node is None or found_node._data != key:
+            return
+        self._unlink_node(last_accessed_nodes, found_node)
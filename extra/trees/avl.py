@@ -14,13 +14,13 @@ class AVLNode(BSTNode):
     contain a  number. Each AVL node has either zero, one or two children AVL
     nodes. The node that has no children is called a **leaf node**. The only
     difference between `AVLNode()` and `BSTNode()` is that the former dedicates
-    a variable for the `height` which makes balancing `AVL()` objects done in
-    a constant time.
+    a variable for the `height` and another for the balance factor which makes
+    balancing `AVL()` objects done in a constant time.
     """
 
     __name__ = "extra.AVLNode()"
 
-    def __init__(self, value):
+    def __init__(self, value, numeric_only=True):
         """
         Creates a `AVLNode()` object which is the basic unit for building
         AVL() objects!!
@@ -29,16 +29,30 @@ class AVLNode(BSTNode):
         ----------
         value: int or float
             The value to be saved within the `AVLNode()` instance
+        numeric_only: bool (default: True)
+            If `False`, the value can be any object accepted by `TreeNode()`.
 
         Raises
         ------
         ValueError:
             If the given item is `None`.
         TypeError:
-            If the given item isn't a number.
+            If the given item isn't a number while `numeric_only` is `True`.
         """
-        super().__init__(value)
+        super().__init__(value, numeric_only)
         self._height = 0
+        self._balance = 0
+
+    def _update_height(self):
+        """
+        Recomputes the height and the balance factor of the current
+        `AVLNode()` using the cached heights of its two children.
+        """
+        left, right = self._left, self._right
+        left_height = left._height + 1 if left is not None else 0
+        right_height = right._height + 1 if right is not None else 0
+        self._height = max(left_height, right_height)
+        self._balance = right_height - left_height
 
     def set_left(self, new_node):
         """
@@ -55,7 +69,7 @@ class AVLNode(BSTNode):
             If the given item is not an `AVLNode()` object.
         """
         super().set_left(new_node)
-        self._height = max(self.get_children_heights())
+        self._update_height()
 
     def set_right(self, new_node):
         """
@@ -73,7 +87,7 @@ class AVLNode(BSTNode):
             If the given item is not an `AVLNode()` object.
         """
         super().set_right(new_node)
-        self._height = max(self.get_children_heights())
+        self._update_height()
 
     def get_height(self):
         """
@@ -149,6 +163,19 @@ class AVLNode(BSTNode):
             raise ValueError("Height has to be an integer number >= 0!!")
         self._height = new_height
 
+    def get_balance(self):
+        """
+        Returns the balance factor of the `AVLNode()` which is the height of
+        the right child minus the height of the left child.
+
+        Returns
+        -------
+        int:
+            The balance factor of the current `AVLNode()`. It's either `-1`,
+            `0` or `1` when the node is balanced.
+        """
+        return self._balance
+
     def is_balanced(self):
         """
         Checks the balance of the `AVLNode()`. An `AVLNode()` is balanced when
@@ -162,8 +189,7 @@ class AVLNode(BSTNode):
             means the node is balanced and `False` means it's not.
 
         """
-        left_height, right_height = self.get_children_heights()
-        return abs(right_height - left_height) <= 1
+        return -1 <= self._balance <= 1
 
     def __repr__(self):
         """
@@ -197,7 +223,9 @@ class AVL(BST):
     _basic_node = AVLNode
     __name__ = "extra.AVL()"
 
-    def __init__(self, iterable=None):
+    def __init__(
+        self, iterable=None, aggregate=None, threaded=False, numeric_only=True
+    ):
         """
         Initializes an `AVL()` instance using an optional iterable object in
         time-complexity of O(n) where **n** is the number of elements inside
@@ -208,14 +236,27 @@ class AVL(BST):
         iterable: iterable (default: None)
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        aggregate: str or tuple (default: None)
+            An associative aggregate cached on every subtree to answer
+            `aggregate()` queries. It's either one of "sum", "min", "max" and
+            "count"; or a `(function, identity)` pair.
+        threaded: bool (default: False)
+            If `True`, every node keeps links to its in-order predecessor and
+            successor, so in-order traversals walk them without any stack.
+        numeric_only: bool (default: True)
+            If `False`, any values that can be compared with each other are
+            accepted instead of numbers only, like the entries stored by
+            `extra.TreeMap()`.
 
         Raises
         ------
         TypeError:
-            It can be raised in two cases
+            It can be raised in four cases
                 1. In case the given object isn't iterable.
                 2. If one of the elements in the iterable is an `Extra` object.
                 3. If one of the elements in the iterable is NOT a number.
+                4. If the given `threaded` or `numeric_only` isn't a \
+                    boolean.
 
         ValueError: If one of the iterable elements is `None`.
 
@@ -246,7 +287,7 @@ class AVL(BST):
         >>> avl_2 = AVL([1, avl_1])
         TypeError: Can't create `extra.AVL()` using `extra.AVL()`!!
         """
-        super().__init__(iterable)
+        super().__init__(iterable, aggregate, threaded, numeric_only)
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -411,7 +452,7 @@ class AVL(BST):
             `AVLNode()`.
         """
         assert (
-            type(value) in {int, float}
+            self._is_valid_value(value)
             or isinstance(value, self._basic_node)
         )
 
@@ -419,17 +460,33 @@ class AVL(BST):
             inserted_node = super()._insert_node(self._root, value)
         else:
             inserted_node = super()._insert_value(self._root, value)
-        # update heights & rebalance when needed
-        parent = inserted_node.get_parent()
-        while parent is not None:
-            grand_parent = parent.get_parent()
-            parent.set_height(max(parent.get_children_heights()))
-            if not parent.is_balanced():
-                parent = self._rebalance(parent)
-                self._attach(grand_parent, parent)
-            parent = grand_parent
+        self._insert_fixup(inserted_node)
         return inserted_node
 
+    def _insert_fixup(self, new_node):
+        """
+        Updates the heights of the ancestors of the given new node and
+        rebalances the `AVL()` instance when needed. Retracing stops at the
+        first ancestor whose height hasn't changed or right after the only
+        rotation needed, as the rotated subtree gets its old height back.
+
+        Parameters
+        ----------
+        new_node: AVLNode()
+            A reference to the newly-linked node.
+        """
+        parent = new_node.get_parent()
+        while parent is not None:
+            parent._update_height()
+            balance = parent.get_balance()
+            if balance == 0:
+                # the shorter side has grown, so the height is unchanged
+                break
+            elif balance not in {-1, 1}:
+                self._attach(parent.get_parent(), self._rebalance(parent))
+                break
+            parent = parent.get_parent()
+
     def insert(self, value):
         """
         Inserts a numeric value in the AVL()` instance according to the
@@ -518,22 +575,42 @@ class AVL(BST):
          / \\      \\
         1   3       7
         """
-        assert type(del_value) in {int, float}
+        assert self._is_valid_value(del_value)
         assert isinstance(start_node, self._basic_node)
 
         length_before = self._length
         last_accessed_node = super()._remove(del_value, start_node)
         if self._length != length_before:
-            parent = last_accessed_node
-            while parent is not None:
-                grand_parent = parent.get_parent()
-                parent.set_height(max(parent.get_children_heights()))
-                if not parent.is_balanced():
-                    parent = self._rebalance(parent)
-                    self._attach(grand_parent, parent)
-                parent = grand_parent
+            self._remove_fixup(last_accessed_node)
         return last_accessed_node
 
+    def _remove_fixup(self, start_node):
+        """
+        Updates the heights of the given node and its ancestors after a node
+        has been unlinked from the subtree of the given node, rebalancing the
+        `AVL()` instance when needed. Retracing stops at the first subtree
+        whose height hasn't changed.
+
+        Parameters
+        ----------
+        start_node: AVLNode() or None
+            A reference to the parent of the unlinked node.
+        """
+        # the start node got its new height once the leaf was unlinked, so
+        # its old height is unknown
+        node, old_height = start_node, None
+        while node is not None:
+            parent = node.get_parent()
+            # attaching a rotated subtree updates the parent's height
+            parent_height = parent.get_height() if parent is not None else None
+            node._update_height()
+            if not node.is_balanced():
+                node = self._rebalance(node)
+                self._attach(parent, node)
+            if node.get_height() == old_height:
+                break
+            node, old_height = parent, parent_height
+
     def remove(self, del_value):
         """
         Removes the `del_value` from the `AVL()` instance.
@@ -636,7 +713,10 @@ class AVL(BST):
         >>> avl.get_height()
         22
         """
-        return super().get_height()
+        if self.is_empty():
+            return 0
+        # every node caches its own height
+        return self._get_height(self._root)
 
     def get_depth(self):
         """
@@ -714,7 +794,8 @@ class AVL(BST):
         parent = start_node.get_parent()
         grand_parent = start_node.get_grand_parent()
         while grand_parent is not None and grand_parent.is_balanced():
-            return self._get_unbalanced_node(parent)
+            child, parent = parent, grand_parent
+            grand_parent = grand_parent.get_parent()
         return grand_parent, parent, child
 
     def _rebalance(self, start_node):
@@ -738,36 +819,21 @@ class AVL(BST):
         """
         assert isinstance(start_node, self._basic_node)
 
-        # get the heavy parent
-        grand_parent = start_node
-        left_height, right_height = grand_parent.get_children_heights()
-        parent = (
-            grand_parent.get_left()
-            if left_height > right_height
-            else grand_parent.get_right()
-        )
-        # get the heavy child
-        left_height, right_height = parent.get_children_heights()
-        node = (
-            parent.get_left()
-            if left_height > right_height else parent.get_right()
-        )
-
-        # determine the direction
-        if parent.is_left_child():
-            if node.is_left_child():
+        # determine the direction using the balance factors
+        if start_node.get_balance() < 0:
+            if start_node.get_left().get_balance() <= 0:
                 # left-left
-                middle = self._rotate_right(grand_parent)
+                middle = self._rotate_right(start_node)
             else:
                 # left-right
-                middle = self._rotate_left_right(grand_parent)
+                middle = self._rotate_left_right(start_node)
         else:
-            if node.is_left_child():
+            if start_node.get_right().get_balance() < 0:
                 # right-left
-                middle = self._rotate_right_left(grand_parent)
+                middle = self._rotate_right_left(start_node)
             else:
                 # right-right
-                middle = self._rotate_left(grand_parent)
+                middle = self._rotate_left(start_node)
         return middle
 
     def is_balanced(self):
@@ -85,6 +85,7 @@ Now, let's try to use the previous binary tree to explain a few terms:
             GrandFather ⟶ Father ⟶ Uncle ⟶ Me ⟶ Sibling ⟶ Cousin1 ⟶ Cousin2
 """
 import warnings
+from collections import deque
 from extra.trees.tree import TreeNode, Tree
 
 
@@ -223,7 +224,9 @@ class BinaryTreeNode(TreeNode):
     def set_left(self, new_node):
         """
         Sets the given `BinaryTreeNode()` as a left child for the current
-        `BinaryTreeNode()`.
+        `BinaryTreeNode()`. The old left child, if any, gets unlinked and the
+        subtree sizes of all ancestors are updated in time-complexity of O(d)
+        where **d** is the depth of the current node.
 
         Parameters
         ----------
@@ -254,12 +257,18 @@ class BinaryTreeNode(TreeNode):
                 f"You can't set a child unless it's an `{self.__name__}` "
                 + "object!!"
             )
+        if self._left is not None:
+            self._disown(self._left)
+            self._left = None
+        self._adopt(new_node)
         self._left = new_node
 
     def set_right(self, new_node):
         """
         Sets the given `BinaryTreeNode()` as a right child for the current
-        `BinaryTreeNode()`.
+        `BinaryTreeNode()`. The old right child, if any, gets unlinked and the
+        subtree sizes of all ancestors are updated in time-complexity of O(d)
+        where **d** is the depth of the current node.
 
         Parameters
         ----------
@@ -290,6 +299,10 @@ class BinaryTreeNode(TreeNode):
                 f"You can't set a child unless it's an `{self.__name__}` "
                 + "object!!"
             )
+        if self._right is not None:
+            self._disown(self._right)
+            self._right = None
+        self._adopt(new_node)
         self._right = new_node
 
     def is_leaf(self):
@@ -382,6 +395,11 @@ class BinaryTree(Tree):
         <class 'extra.trees.binary_tree.BinaryTree'>
         """
         super().__init__()
+        # bumped by every method modifying the tree, so the cached metrics
+        # can tell whether they are outdated
+        self._version = 0
+        # (root, version, root mutations, metrics) of the last `stats()`
+        self._stats = None
 
     @staticmethod
     def __create_subtree(lst):
@@ -465,9 +483,9 @@ class BinaryTree(Tree):
     # =============================    LENGTH    ==============================
     def __len__(self):
         """
-        Gets the length of the `BinaryTree()` instance in time-complexity of
-        O(n) where **n** is the number of nodes in the tree. Length is the
-        number of nodes in the instance.
+        Gets the length of the `BinaryTree()` instance in constant time as
+        every node keeps the size of its subtree. Length is the number of
+        nodes in the instance.
 
         Returns
         -------
@@ -632,6 +650,133 @@ class BinaryTree(Tree):
         lines, _, _, _ = self._print_subtree(self._root, 0)
         return "\n".join((line.rstrip() for line in lines[:-1]))
 
+    # =============================     STATS    ==============================
+    def _compute_stats(self):
+        """
+        Computes all structural metrics of the `BinaryTree()` instance in one
+        breadth-first pass over its nodes. A list holding the current level is
+        used instead of recursion, so deep trees can't exceed the recursion
+        limit.
+
+        Returns
+        -------
+        dict:
+            The metrics of the instance as described in `stats()`, where the
+            nodes per level are saved as tuples so they can't be modified.
+        """
+        nodes_per_level = []
+        leaf_nodes = 0
+        is_strict = True
+        # the heights of the left & right subtrees of the root, -1 if missing
+        side_heights = [-1, -1]
+        level = [] if self._root is None else [(self._root, None)]
+        while level:
+            depth = len(nodes_per_level)
+            nodes_per_level.append(tuple(node.get_data() for node, _ in level))
+            next_level = []
+            for node, side in level:
+                if side is not None:
+                    # levels are visited in order, so the last one is deepest
+                    side_heights[side] = depth - 1
+                left, right = node.get_left(), node.get_right()
+                if left is None and right is None:
+                    leaf_nodes += 1
+                elif left is None or right is None:
+                    is_strict = False
+                if left is not None:
+                    next_level.append((left, 0 if side is None else side))
+                if right is not None:
+                    next_level.append((right, 1 if side is None else side))
+            level = next_level
+        height = max(len(nodes_per_level) - 1, 0)
+        # the depth of each side as the tree has always measured it
+        left_depth, right_depth = (
+            0 if side_height == -1 else 1 + height - side_height
+            for side_height in side_heights
+        )
+        return {
+            "length": sum(len(nodes) for nodes in nodes_per_level),
+            "height": height,
+            "depth": 0,
+            "leaf_nodes": leaf_nodes,
+            "nodes_per_level": tuple(nodes_per_level),
+            "is_balanced": abs(left_depth - right_depth) <= 1,
+            "is_perfect": all(
+                len(nodes) == 2 ** depth
+                for depth, nodes in enumerate(nodes_per_level)
+            ),
+            "is_strict": is_strict,
+        }
+
+    def stats(self):
+        """
+        Computes the structural metrics of the `BinaryTree()` instance in one
+        pass of O(n) time-complexity where **n** is the number of nodes. The
+        result is cached and reused till the tree gets modified, either by one
+        of its methods or by linking/unlinking its nodes directly, or its root
+        gets replaced. So, calling it again on an unchanged tree takes
+        constant time. All other metric methods such as `get_height()` and
+        `is_perfect()` are based on it.
+
+        Returns
+        -------
+        dict:
+            A dictionary having the following keys:
+                - "length": the number of nodes.
+                - "height": the number of edges between the root and the \
+                    furthest leaf node.
+                - "depth": the depth of the root.
+                - "leaf_nodes": the number of leaf nodes.
+                - "nodes_per_level": a tuple of tuples of the values at each \
+                    level.
+                - "is_balanced", "is_perfect" & "is_strict": the same as \
+                    the methods with the same names.
+
+        Example
+        -------
+        >>> btree = BinaryTree.parse([1, [2, 4, 5], [3]])
+        >>> btree
+            __1__
+           /     \\
+          2       3
+         / \\
+        4   5
+        >>> stats = btree.stats()
+        >>> stats["height"], stats["leaf_nodes"], stats["is_perfect"]
+        (2, 3, False)
+        >>> stats["nodes_per_level"]
+        ((1,), (2, 3), (4, 5))
+        """
+        root = self._root
+        mutations = None if root is None else root._mutations
+        cached = self._stats
+        if (
+            cached is None
+            or cached[0] is not root
+            or cached[1] != self._version
+            or cached[2] != mutations
+        ):
+            cached = (root, self._version, mutations, self._compute_stats())
+            self._stats = cached
+        return dict(cached[3])
+
+    def invalidate(self):
+        """
+        Marks the cached metrics of the `BinaryTree()` instance as outdated,
+        so the next call to `stats()` recomputes them. Modifying the tree,
+        whether by its methods or by linking its nodes, does that on its own.
+
+        Example
+        -------
+        >>> btree = BinaryTree.parse([1, [2], [3]])
+        >>> btree.get_height()
+        1
+        >>> btree.invalidate()
+        >>> btree.get_height()
+        1
+        """
+        self._version += 1
+
     # ============================= HEIGHT/DEPTH ==============================
     def get_height(self):
         """
@@ -655,7 +800,7 @@ class BinaryTree(Tree):
         >>> btree.get_height()
         2
         """
-        return super().get_height()
+        return self.stats()["height"]
 
     def get_depth(self):
         """
@@ -678,7 +823,7 @@ class BinaryTree(Tree):
         >>> btree.get_depth()
         0
         """
-        return super().get_depth()
+        return self.stats()["depth"]
 
     # =============================  LEAF NODES  ==============================
     def count_leaf_nodes(self):
@@ -704,7 +849,7 @@ class BinaryTree(Tree):
         >>> btree.count_leaf_nodes()
         4
         """
-        return super().count_leaf_nodes()
+        return self.stats()["leaf_nodes"]
 
     # =============================    BALANCE   ==============================
     def is_balanced(self):
@@ -742,17 +887,7 @@ class BinaryTree(Tree):
                 UserWarning,
             )
             return True
-        left_depth = (
-            0
-            if self._root.get_left() is None
-            else 1 + super()._get_depth(self._root.get_left())
-        )
-        right_depth = (
-            0
-            if self._root.get_right() is None
-            else 1 + super()._get_depth(self._root.get_right())
-        )
-        return abs(left_depth - right_depth) <= 1
+        return self.stats()["is_balanced"]
 
     # =============================    PERFECT   ==============================
     def is_perfect(self):
@@ -798,46 +933,9 @@ class BinaryTree(Tree):
               UserWarning,
             )
             return True
-        for level, nodes in enumerate(self.get_nodes_per_level()):
-            if 2 ** level != len(nodes):
-                return False
-        return True
+        return self.stats()["is_perfect"]
 
     # =============================    STRICT    ==============================
-    def __is_subtree_strict(self, start_node):
-        """
-        Checks if the given binary subtree defined by the given `start_node` is
-        strict. A binary tree is strict if all its non-leaf nodes has two
-        children (left and right).
-
-        Returns
-        -------
-        bool:
-            `True` if the `BinaryTree()` instance is perfect and `False` if it
-            is not perfect.
-
-        Raises
-        ------
-        AssertionError:
-            If the given `start_node` is not `None` and it's not an instance of
-            `BinaryTreeNode()` either.
-        """
-        assert start_node is None or isinstance(start_node, self._basic_node)
-
-        left_node = start_node.get_left()
-        right_node = start_node.get_right()
-
-        if left_node is None and right_node is None:
-            return True
-        elif left_node is not None and right_node is None:
-            return False
-        elif left_node is None and right_node is not None:
-            return False
-        else:
-            return self.__is_subtree_strict(
-                start_node.get_left()
-            ) and self.__is_subtree_strict(start_node.get_right())
-
     def is_strict(self):
         """
         Checks if the `BinaryTree()` instance is strict. A binary tree is
@@ -873,7 +971,7 @@ class BinaryTree(Tree):
               UserWarning,
             )
             return True
-        return self.__is_subtree_strict(self._root)
+        return self.stats()["is_strict"]
 
     # =============================     ITER     ==============================
     def __iter__(self):
@@ -899,7 +997,7 @@ class BinaryTree(Tree):
         ...     print(value, end=',')
         1,2,3,4,5,6,7,
         """
-        return super().__iter__()
+        return self.iter_level_order()
 
     def to_list(self):
         """
@@ -924,7 +1022,7 @@ class BinaryTree(Tree):
         >>> btree.to_list()
         [1, 2, 3, 4, 5, 6, 7]
         """
-        return super().to_list()
+        return list(self.iter_level_order())
 
     # =============================    NODES     ==============================
     def get_nodes_per_level(self):
@@ -952,22 +1050,340 @@ class BinaryTree(Tree):
         >>> btree.get_nodes_per_level()
         [[1], [2, 3], [4, 5, 6, 7]]
         """
-        return super().get_nodes_per_level()
+        return [list(nodes) for nodes in self.stats()["nodes_per_level"]]
 
-    # =============================   PRE-ORDER  ==============================
-    def __preorder_traverse(self, start_node):
-        """"""
+    # =============================  LAZY ITER   ==============================
+    @staticmethod
+    def _validate_reverse(reverse):
+        """
+        Checks the type of the `reverse` flag used by the lazy traversals.
+
+        Parameters
+        ----------
+        reverse: object
+            The value of the `reverse` flag.
+
+        Raises
+        ------
+        TypeError:
+            If `reverse` isn't a boolean.
+        """
+        if type(reverse) != bool:
+            raise TypeError("`reverse` has to be a boolean value!!")
+
+    def _iter_preorder_nodes(self, start_node, reverse=False):
+        """
+        Generates the nodes of the subtree whose root is `start_node` in
+        pre-order manner using an explicit stack of O(h) nodes.
+
+        Parameters
+        ----------
+        start_node: BinaryTreeNode() or None
+            A reference to the root of the subtree.
+        reverse: bool (default=False)
+            If `True`, the right child is visited before the left child.
+
+        Yields
+        ------
+        BinaryTreeNode():
+            The visited nodes.
+        """
         assert start_node is None or isinstance(start_node, self._basic_node)
 
-        nodes = []
-        if start_node is not None:
-            nodes.append(start_node.get_data())
-            if start_node.get_left():
-                nodes.extend(self.__preorder_traverse(start_node.get_left()))
-            if start_node.get_right():
-                nodes.extend(self.__preorder_traverse(start_node.get_right()))
-        return nodes
+        stack = [] if start_node is None else [start_node]
+        while stack:
+            node = stack.pop()
+            yield node
+            # push the child to be visited last first
+            if reverse:
+                first, second = node.get_right(), node.get_left()
+            else:
+                first, second = node.get_left(), node.get_right()
+            if second is not None:
+                stack.append(second)
+            if first is not None:
+                stack.append(first)
+
+    def _iter_inorder_nodes(self, start_node, reverse=False):
+        """
+        Generates the nodes of the subtree whose root is `start_node` in
+        in-order manner using an explicit stack of O(h) nodes.
+
+        Parameters
+        ----------
+        start_node: BinaryTreeNode() or None
+            A reference to the root of the subtree.
+        reverse: bool (default=False)
+            If `True`, the right subtree is visited before the left one.
+
+        Yields
+        ------
+        BinaryTreeNode():
+            The visited nodes.
+        """
+        assert start_node is None or isinstance(start_node, self._basic_node)
+
+        stack = []
+        node = start_node
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.get_right() if reverse else node.get_left()
+            else:
+                node = stack.pop()
+                yield node
+                node = node.get_left() if reverse else node.get_right()
+
+    def _iter_postorder_nodes(self, start_node, reverse=False):
+        """
+        Generates the nodes of the subtree whose root is `start_node` in
+        post-order manner using an explicit stack of O(h) nodes.
+
+        Parameters
+        ----------
+        start_node: BinaryTreeNode() or None
+            A reference to the root of the subtree.
+        reverse: bool (default=False)
+            If `True`, the right subtree is visited before the left one.
+
+        Yields
+        ------
+        BinaryTreeNode():
+            The visited nodes.
+        """
+        assert start_node is None or isinstance(start_node, self._basic_node)
+
+        stack = []
+        last_visited = None
+        node = start_node
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.get_right() if reverse else node.get_left()
+            else:
+                top = stack[-1]
+                far_child = top.get_left() if reverse else top.get_right()
+                if far_child is not None and far_child is not last_visited:
+                    node = far_child
+                else:
+                    last_visited = stack.pop()
+                    yield last_visited
+
+    def _iter_level_order_nodes(self, start_node, reverse=False):
+        """
+        Generates the nodes of the subtree whose root is `start_node` level by
+        level using a queue.
+
+        Parameters
+        ----------
+        start_node: BinaryTreeNode() or None
+            A reference to the root of the subtree.
+        reverse: bool (default=False)
+            If `True`, each level is visited from right to left.
+
+        Yields
+        ------
+        BinaryTreeNode():
+            The visited nodes.
+        """
+        assert start_node is None or isinstance(start_node, self._basic_node)
+
+        queue = deque() if start_node is None else deque([start_node])
+        while queue:
+            node = queue.popleft()
+            yield node
+            if reverse:
+                first, second = node.get_right(), node.get_left()
+            else:
+                first, second = node.get_left(), node.get_right()
+            if first is not None:
+                queue.append(first)
+            if second is not None:
+                queue.append(second)
+
+    def iter_preorder(self, reverse=False):
+        """
+        Lazily traverses the `BinaryTree()` instance in pre-order manner.
+        Which means that the **parent** is visited first. Then, the **left
+        subtree** (if found), then the **right subtree** (if found).
+
+        Unlike `preorder_traverse()`, values are generated lazily using an
+        explicit stack, so no intermediate lists are built and the caller can
+        stop at any point.
+
+        Parameters
+        ----------
+        reverse: bool (default=False)
+            If `True`, the **right subtree** is visited before the **left
+            subtree**.
+
+        Yields
+        ------
+        object:
+            The value stored at each visited node.
+
+        Raises
+        ------
+        TypeError:
+            If `reverse` isn't a boolean.
+
+        Example
+        -------
+        >>> btree = BinaryTree.parse([1, [2, 4, 5], [3, 6, 7]])
+        >>> btree
+            __1__
+           /     \\
+          2       3
+         / \\    / \\
+        4   5    6  7
+        >>> list(btree.iter_preorder())
+        [1, 2, 4, 5, 3, 6, 7]
+        >>> list(btree.iter_preorder(reverse=True))
+        [1, 3, 7, 6, 2, 5, 4]
+        """
+        self._validate_reverse(reverse)
+        return (
+            node.get_data()
+            for node in self._iter_preorder_nodes(self._root, reverse)
+        )
+
+    def iter_inorder(self, reverse=False):
+        """
+        Lazily traverses the `BinaryTree()` instance in in-order manner.
+        Which means that the **left subtree** (if found) is visited first.
+        Then, the **parent** then the **right subtree** (if found).
+
+        Unlike `inorder_traverse()`, values are generated lazily using an
+        explicit stack, so no intermediate lists are built and the caller can
+        stop at any point.
+
+        Parameters
+        ----------
+        reverse: bool (default=False)
+            If `True`, the **right subtree** is visited before the **left
+            subtree**.
+
+        Yields
+        ------
+        object:
+            The value stored at each visited node.
+
+        Raises
+        ------
+        TypeError:
+            If `reverse` isn't a boolean.
+
+        Example
+        -------
+        >>> btree = BinaryTree.parse([1, [2, 4, 5], [3, 6, 7]])
+        >>> btree
+            __1__
+           /     \\
+          2       3
+         / \\    / \\
+        4   5    6  7
+        >>> list(btree.iter_inorder())
+        [4, 2, 5, 1, 6, 3, 7]
+        >>> list(btree.iter_inorder(reverse=True))
+        [7, 3, 6, 1, 5, 2, 4]
+        """
+        self._validate_reverse(reverse)
+        return (
+            node.get_data()
+            for node in self._iter_inorder_nodes(self._root, reverse)
+        )
+
+    def iter_postorder(self, reverse=False):
+        """
+        Lazily traverses the `BinaryTree()` instance in post-order manner.
+        Which means that the **left subtree** (if found) is visited first.
+        Then, the **right subtree** (if found) then the **parent**.
+
+        Unlike `postorder_traverse()`, values are generated lazily using an
+        explicit stack, so no intermediate lists are built and the caller can
+        stop at any point.
+
+        Parameters
+        ----------
+        reverse: bool (default=False)
+            If `True`, the **right subtree** is visited before the **left
+            subtree**.
 
+        Yields
+        ------
+        object:
+            The value stored at each visited node.
+
+        Raises
+        ------
+        TypeError:
+            If `reverse` isn't a boolean.
+
+        Example
+        -------
+        >>> btree = BinaryTree.parse([1, [2, 4, 5], [3, 6, 7]])
+        >>> btree
+            __1__
+           /     \\
+          2       3
+         / \\    / \\
+        4   5    6  7
+        >>> list(btree.iter_postorder())
+        [4, 5, 2, 6, 7, 3, 1]
+        >>> list(btree.iter_postorder(reverse=True))
+        [7, 6, 3, 5, 4, 2, 1]
+        """
+        self._validate_reverse(reverse)
+        return (
+            node.get_data()
+            for node in self._iter_postorder_nodes(self._root, reverse)
+        )
+
+    def iter_level_order(self, reverse=False):
+        """
+        Lazily traverses the `BinaryTree()` instance in breadth-first manner.
+        Which means that the tree nodes will be visited level by level.
+
+        Unlike `breadth_first_traverse()`, values are generated lazily using
+        a queue, so no intermediate lists are built and the caller can stop
+        at any point.
+
+        Parameters
+        ----------
+        reverse: bool (default=False)
+            If `True`, each level is visited from right to left.
+
+        Yields
+        ------
+        object:
+            The value stored at each visited node.
+
+        Raises
+        ------
+        TypeError:
+            If `reverse` isn't a boolean.
+
+        Example
+        -------
+        >>> btree = BinaryTree.parse([1, [2, 4, 5], [3, 6, 7]])
+        >>> btree
+            __1__
+           /     \\
+          2       3
+         / \\    / \\
+        4   5    6  7
+        >>> list(btree.iter_level_order())
+        [1, 2, 3, 4, 5, 6, 7]
+        >>> list(btree.iter_level_order(reverse=True))
+        [1, 3, 2, 7, 6, 5, 4]
+        """
+        self._validate_reverse(reverse)
+        return (
+            node.get_data()
+            for node in self._iter_level_order_nodes(self._root, reverse)
+        )
+
+    # =============================   PRE-ORDER  ==============================
     def preorder_traverse(self):
         """
         Traverses the `BinaryTree()` instance in pre-order manner. Which means
@@ -995,7 +1411,7 @@ class BinaryTree(Tree):
         >>> btree.preorder_traverse()
         [1, 2, 4, 5, 3, 6, 7]
         """
-        return self.__preorder_traverse(self._root)
+        return list(self.iter_preorder())
 
     def depth_first_traverse(self):
         """
@@ -1024,22 +1440,9 @@ class BinaryTree(Tree):
         >>> btree.depth_first_traverse()
         [1, 2, 4, 5, 3, 6, 7]
         """
-        return self.__preorder_traverse(self._root)
+        return list(self.iter_preorder())
 
     # =============================  POST-ORDER  ==============================
-    def __postorder_traverse(self, start_node):
-        """"""
-        assert start_node is None or isinstance(start_node, self._basic_node)
-
-        nodes = []
-        if start_node is not None:
-            if start_node.get_left():
-                nodes.extend(self.__postorder_traverse(start_node.get_left()))
-            if start_node.get_right():
-                nodes.extend(self.__postorder_traverse(start_node.get_right()))
-            nodes.append(start_node.get_data())
-        return nodes
-
     def postorder_traverse(self):
         """
         Traverses the `BinaryTree()` instance in post-order manner. Which means
@@ -1063,22 +1466,9 @@ class BinaryTree(Tree):
         >>> btree.postorder_traverse()
         [4, 5, 2, 6, 7, 3, 1]
         """
-        return self.__postorder_traverse(self._root)
+        return list(self.iter_postorder())
 
     # =============================   IN-ORDER   ==============================
-    def __inorder_traverse(self, start_node):
-        """"""
-        assert start_node is None or isinstance(start_node, self._basic_node)
-
-        nodes = []
-        if start_node is not None:
-            if start_node.get_left():
-                nodes.extend(self.__inorder_traverse(start_node.get_left()))
-            nodes.append(start_node.get_data())
-            if start_node.get_right():
-                nodes.extend(self.__inorder_traverse(start_node.get_right()))
-        return nodes
-
     def inorder_traverse(self):
         """
         Traverses the `BinaryTree()` instance in in-order manner. Which means
@@ -1102,7 +1492,7 @@ class BinaryTree(Tree):
         >>> btree.inorder_traverse()
         [4, 2, 5, 1, 6, 3, 7]
         """
-        return self.__inorder_traverse(self._root)
+        return list(self.iter_inorder())
 
     # ============================= BREADTH-FIRST==============================
     def breadth_first_traverse(self):
@@ -1127,7 +1517,7 @@ class BinaryTree(Tree):
         >>> btree.breadth_first_traverse()
         [1, 2, 3, 4, 5, 6, 7]
         """
-        return super().to_list()
+        return list(self.iter_level_order())
 
     # =============================   TRAVERSE   ==============================
     def traverse(self, method="inorder"):
@@ -87,6 +87,8 @@ Now, let's try to use the previous BST to explain a few terms:
 
             8 ⟶ 5 ⟶ 15 ⟶ 2 ⟶ 7 ⟶ 10 ⟶ 3
 """
+import heapq
+import operator
 import warnings
 from extra.trees.binary_tree import BinaryTreeNode, BinaryTree
 
@@ -100,7 +102,7 @@ class BSTNode(BinaryTreeNode):
 
     __name__ = "extra.BSTNode()"
 
-    def __init__(self, value):
+    def __init__(self, value, numeric_only=True):
         """
         Creates a `BSTNode()` object which is the basic unit for building
         `BST()` objects!!
@@ -109,18 +111,73 @@ class BSTNode(BinaryTreeNode):
         ----------
         value: int or float
             The value to be saved within the `BSTNode()` instance
+        numeric_only: bool (default: True)
+            If `False`, the value can be any object accepted by `TreeNode()`
+            as trees storing comparable objects, like the container of
+            `extra.TreeMap()`, validate their values on their own.
 
         Raises
         ------
         ValueError:
             If the given item is `None`.
         TypeError:
-            If the given item isn't a number.
+            If the given item isn't a number while `numeric_only` is `True`.
         """
-        if type(value) not in {int, float}:
+        if numeric_only and type(value) not in {int, float}:
             raise TypeError(f"`{self.__name__}` contains only numbers!!")
         super().__init__(value)
         self._parent = None
+        self._size = 1
+        # (function, identity, key) of the tree's aggregate, if any
+        self._monoid = None
+        self._aggregate = None
+        # in-order neighbors, only maintained by threaded trees
+        self._pred = self._succ = None
+
+    def get_size(self):
+        """
+        Returns the number of nodes in the subtree whose root is the current
+        `BSTNode()` instance including the node itself.
+
+        Returns
+        -------
+        int:
+            The size of the subtree rooted at the current `BSTNode()`.
+        """
+        return self._size
+
+    def get_aggregate(self):
+        """
+        Returns the cached aggregate of all values in the subtree whose root
+        is the current `BSTNode()` instance.
+
+        Returns
+        -------
+        object:
+            The aggregate of the subtree rooted at the current `BSTNode()`, or
+            `None` if the tree has no aggregate function.
+        """
+        return self._aggregate
+
+    def _update_augmented_data(self):
+        """
+        Recomputes the size and the aggregate of the subtree rooted at the
+        current `BSTNode()` using the cached values of its two children.
+        """
+        left, right = self._left, self._right
+        self._size = (
+            1
+            + (left._size if left is not None else 0)
+            + (right._size if right is not None else 0)
+        )
+        if self._monoid is not None:
+            function, _, key = self._monoid
+            aggregate = self._data if key is None else key(self._data)
+            if left is not None:
+                aggregate = function(left._aggregate, aggregate)
+            if right is not None:
+                aggregate = function(aggregate, right._aggregate)
+            self._aggregate = aggregate
 
     def get_parent(self):
         """
@@ -211,6 +268,7 @@ class BSTNode(BinaryTreeNode):
         self._left = new_node
         if new_node is not None:
             self._left._parent = self
+        self._update_augmented_data()
 
     def set_right(self, new_node):
         """
@@ -232,6 +290,7 @@ class BSTNode(BinaryTreeNode):
         self._right = new_node
         if new_node is not None:
             self._right._parent = self
+        self._update_augmented_data()
 
     def set_parent(self, new_node):
         """
@@ -295,8 +354,17 @@ class BST(BinaryTree):
 
     _basic_node = BSTNode
     __name__ = "extra.BST()"
-
-    def __init__(self, iterable=None):
+    # the named aggregates as (function, identity, key) triples
+    _named_aggregates = {
+        "sum": (operator.add, 0, None),
+        "min": (min, float("inf"), None),
+        "max": (max, float("-inf"), None),
+        "count": (operator.add, 0, lambda value: 1),
+    }
+
+    def __init__(
+        self, iterable=None, aggregate=None, threaded=False, numeric_only=True
+    ):
         """
         Initializes a `BST()` instance using an optiona iterable object in
         time-complexity of O(n) where **n** is the number of elements inside
@@ -307,16 +375,37 @@ class BST(BinaryTree):
         iterable: iterable (default: None)
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        aggregate: str or tuple (default: None)
+            An associative aggregate whose value over every subtree is cached
+            at the subtree's root to answer `aggregate()` queries. It's either
+            one of "sum", "min", "max" and "count"; or a `(function, identity)`
+            pair where `function` combines two values and `identity` is its
+            neutral element.
+        threaded: bool (default: False)
+            If `True`, every node keeps links to its in-order predecessor and
+            successor. These links are maintained while inserting, removing
+            and rotating, so in-order traversals and `irange()` walk them in
+            O(1) per step without any stack.
+        numeric_only: bool (default: True)
+            If `False`, any values that can be compared with each other are
+            accepted instead of numbers only, like the entries stored by
+            `extra.TreeMap()`.
 
         Raises
         ------
         TypeError:
-            It can be raised in three cases
+            It can be raised in five cases
                 1. In case the given object isn't iterable.
                 2. If one of the elements in the iterable is an `Extra` object.
                 3. If one of the elements in the iterable is NOT a number.
+                4. If the given `aggregate` is neither a `str` nor a \
+                    `(function, identity)` pair.
+                5. If the given `threaded` or `numeric_only` isn't a \
+                    boolean.
         ValueError:
-            If one of the iterable elements is `None`.
+            It can be raised in two cases
+                1. If one of the iterable elements is `None`.
+                2. If the given `aggregate` is an unknown name.
 
         Examples
         --------
@@ -347,8 +436,18 @@ class BST(BinaryTree):
         >>> bst_2 = BST([1, bst_1])
         TypeError: Can't create `extra.BST()` using `extra.BST()`!!
         """
+        if type(threaded) != bool:
+            raise TypeError("`threaded` has to be a boolean value!!")
+        elif type(numeric_only) != bool:
+            raise TypeError("`numeric_only` has to be a boolean value!!")
         super().__init__()
         self._length = 0
+        # `extra.TreeMap()` turns this off to store any comparable objects
+        self._numeric_only = numeric_only
+        self._monoid = self._parse_aggregate(aggregate)
+        # nodes holding the minimum & maximum values, `None` when unknown
+        self._min_node = self._max_node = None
+        self._threaded = threaded
 
         if iterable is None:
             return
@@ -377,9 +476,322 @@ class BST(BinaryTree):
             If `item` is not a numeric value.
         """
         super()._validate_item(item)
-        if type(item) not in {int, float}:
+        if not self._is_valid_value(item):
             raise TypeError(f"`{self.__name__}` accepts only numbers!!")
 
+    def _is_valid_value(self, value):
+        """
+        Checks if the given value can be stored in (or searched for inside)
+        the `BST()` instance. Only numbers are valid unless the instance is
+        used as the container of an `extra.TreeMap()`, where any object that
+        can be compared with the stored keys is valid.
+
+        Parameters
+        ----------
+        value: object
+            The value to be checked.
+
+        Returns
+        -------
+        bool:
+            `True` if the given value is valid, `False` otherwise.
+        """
+        return not self._numeric_only or type(value) in {int, float}
+
+    def _parse_aggregate(self, aggregate):
+        """
+        Converts the given aggregate into a `(function, identity, key)` triple
+        where `key` maps each stored value before aggregating it, or `None`
+        if values are aggregated as they are.
+
+        Parameters
+        ----------
+        aggregate: str or tuple or None
+            The aggregate passed to the constructor.
+
+        Returns
+        -------
+        tuple or None:
+            The `(function, identity, key)` triple, or `None` if no aggregate
+            was given.
+
+        Raises
+        ------
+        TypeError:
+            If the given `aggregate` is neither a `str` nor a
+            `(function, identity)` pair.
+        ValueError:
+            If the given `aggregate` is an unknown name.
+        """
+        if aggregate is None:
+            return None
+        elif type(aggregate) == str:
+            if aggregate not in self._named_aggregates:
+                raise ValueError(
+                    "The given aggregate has to be one of these:\n"
+                    + str(set(self._named_aggregates))
+                )
+            return self._named_aggregates[aggregate]
+        elif (
+            type(aggregate) == tuple
+            and len(aggregate) == 2
+            and callable(aggregate[0])
+        ):
+            function, identity = aggregate
+            return function, identity, None
+        else:
+            raise TypeError(
+                "The given aggregate has to be a name or a "
+                + "`(function, identity)` pair!!"
+            )
+
+    def _create_node(self, value, *args):
+        """
+        Creates a new node holding the given value to be inserted into the
+        `BST()` instance. The node caches the tree's aggregate when there is
+        one.
+
+        Parameters
+        ----------
+        value: int or float
+            The value of the new node.
+        *args:
+            Any extra arguments needed by the node's constructor.
+
+        Returns
+        -------
+        BSTNode():
+            The new node.
+        """
+        new_node = self._basic_node(
+            value, *args, numeric_only=self._numeric_only
+        )
+        if self._monoid is not None:
+            new_node._monoid = self._monoid
+            new_node._update_augmented_data()
+        return new_node
+
+    @classmethod
+    def from_sorted(cls, iterable, aggregate=None):
+        """
+        A class method which creates a perfectly-balanced `BST()` instance
+        using a sorted iterable object in time-complexity of O(n) where **n**
+        is the number of elements inside the given `iterable`. Unlike the
+        constructor, the values aren't inserted one by one. Instead, the middle
+        value of each range becomes the root of the subtree built from that
+        range.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method
+            whose elements are sorted in ascending order. Repeated values are
+            stored only once.
+        aggregate: str or tuple (default: None)
+            An associative aggregate cached on every subtree to answer
+            `aggregate()` queries.
+
+        Returns
+        -------
+        BST():
+            It returns a `BST()` instance with input values being inserted.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in three cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+                3. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            It can be raised in two cases
+                1. If one of the iterable elements is `None`.
+                2. If the given iterable isn't sorted.
+
+        Examples
+        --------
+        >>> bst = BST.from_sorted([1, 2, 3, 4, 5, 6, 7])
+        >>> bst
+            __4__
+           /     \\
+          2       6
+         / \\     / \\
+        1   3   5   7
+
+        Using an unsorted iterable object will raise `ValueError`
+
+        >>> BST.from_sorted([2, 1])
+        ValueError: The given iterable isn't sorted!!
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        bst = cls(aggregate=aggregate)
+        bst._build_sorted(iterable)
+        return bst
+
+    @classmethod
+    def from_iterable(cls, iterable, aggregate=None):
+        """
+        A class method which creates a perfectly-balanced `BST()` instance
+        using any iterable object by sorting its values first then building
+        the tree the same way as `from_sorted()` does. So, the time-complexity
+        is O(n*log(n)) where **n** is the number of elements inside the given
+        `iterable`. If the given iterable is an instance of the BST family,
+        its values are already sorted and the time-complexity is O(n). This is
+        the way to convert between the different BST types.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            Repeated values are stored only once.
+        aggregate: str or tuple (default: None)
+            An associative aggregate cached on every subtree to answer
+            `aggregate()` queries.
+
+        Returns
+        -------
+        BST():
+            It returns a `BST()` instance with input values being inserted.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in three cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+                3. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+
+        Examples
+        --------
+        >>> bst = BST.from_iterable([7, 1, 6, 2, 5, 3, 4])
+        >>> bst
+            __4__
+           /     \\
+          2       6
+         / \\     / \\
+        1   3   5   7
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        bst = cls(aggregate=aggregate)
+        bst._build_unsorted(iterable)
+        return bst
+
+    def _build_unsorted(self, iterable):
+        """
+        Sorts the values of the given iterable then builds the empty `BST()`
+        instance out of them using `_build_sorted()`.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object.
+
+        Raises
+        ------
+        TypeError:
+            If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+        """
+        if isinstance(iterable, BST):
+            # the BST family is already validated and sorted
+            values = iterable.iter_inorder()
+        else:
+            values = list(iterable)
+            for item in values:
+                self._validate_item(item)
+            values.sort()
+        self._build_sorted(values)
+
+    def _build_sorted(self, iterable):
+        """
+        Validates the values of the given sorted iterable, drops the repeated
+        ones, then builds the empty `BST()` instance out of them using
+        `_build_balanced()`.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object whose elements are sorted in ascending
+            order.
+
+        Raises
+        ------
+        TypeError:
+            If one of the elements in the iterable is NOT a number.
+        ValueError:
+            It can be raised in two cases
+                1. If one of the iterable elements is `None`.
+                2. If the given iterable isn't sorted.
+        """
+        assert self.is_empty()
+
+        values = []
+        for item in iterable:
+            self._validate_item(item)
+            if values and item <= values[-1]:
+                if item == values[-1]:
+                    continue
+                raise ValueError("The given iterable isn't sorted!!")
+            values.append(item)
+        self._build_balanced(values)
+
+    def _build_balanced(self, values):
+        """
+        Builds the empty `BST()` instance out of the given values as a
+        perfectly-balanced tree. All nodes are created first, then they are
+        linked bottom-up so the cached sizes and aggregates are computed once
+        per node.
+
+        Parameters
+        ----------
+        values: list
+            A list of valid numeric values sorted in strictly ascending order.
+        """
+        assert self.is_empty()
+
+        nodes = [self._create_node(value) for value in values]
+        self._root = self._link_balanced(nodes, 0, len(nodes) - 1)
+        if self._root is not None:
+            self._root.set_parent(None)
+            self._min_node, self._max_node = nodes[0], nodes[-1]
+        if self._threaded:
+            self._thread_nodes(nodes)
+        self._length = len(nodes)
+        self._version += 1
+
+    def _link_balanced(self, nodes, start, end):
+        """
+        Links the given sorted nodes within the `[start, end]` range into a
+        perfectly-balanced subtree. The recursion depth is O(log(n)) as the
+        range is halved at each level.
+
+        Parameters
+        ----------
+        nodes: list
+            A list of unlinked nodes sorted by their values.
+        start: int
+            The index of the first node in the range.
+        end: int
+            The index of the last node in the range.
+
+        Returns
+        -------
+        BSTNode() or None:
+            The root of the built subtree, or `None` if the range is empty.
+        """
+        if start > end:
+            return None
+        mid = (start + end) // 2
+        root = nodes[mid]
+        root.set_left(self._link_balanced(nodes, start, mid - 1))
+        root.set_right(self._link_balanced(nodes, mid + 1, end))
+        return root
+
     # =============================    LENGTH    ==============================
     def __len__(self):
         """
@@ -452,15 +864,16 @@ class BST(BinaryTree):
         assert isinstance(start_node, self._basic_node)
 
         # get the right-most node
-        if start_node.get_right() is None:
-            return start_node
-        else:
-            return self._get_max_node(start_node.get_right())
+        curr_node = start_node
+        while curr_node._right is not None:
+            curr_node = curr_node._right
+        return curr_node
 
     def get_max(self):
         """
-        Gets the maximum value in the `BST()` isntance. The maximum value can
-        be found at the right-most tree node in the `BST()` instance.
+        Gets the maximum value in the `BST()` isntance in constant time. The
+        maximum value can be found at the right-most tree node in the `BST()`
+        instance which is cached once it's found.
 
         Returns
         -------
@@ -490,8 +903,9 @@ class BST(BinaryTree):
             raise IndexError(
                 f"Can't get the maximum value of an empty `{self.__name__}`"
             )
-        max_node = self._get_max_node(self._root)
-        return max_node.get_data()
+        if self._max_node is None:
+            self._max_node = self._get_max_node(self._root)
+        return self._max_node.get_data()
 
     # =============================      MIN     ==============================
     def _get_min_node(self, start_node):
@@ -514,27 +928,870 @@ class BST(BinaryTree):
 
         Raises
         ------
-        AssertionError:
-            If the given `start_node` isn't an instance of `BSTNode()`
-        """
-
-        assert isinstance(start_node, self._basic_node)
+        AssertionError:
+            If the given `start_node` isn't an instance of `BSTNode()`
+        """
+
+        assert isinstance(start_node, self._basic_node)
+
+        # get the left-most node
+        curr_node = start_node
+        while curr_node._left is not None:
+            curr_node = curr_node._left
+        return curr_node
+
+    def get_min(self):
+        """
+        Gets the minimum value in the `BST()` isntance in constant time. The
+        minimum value can be found at the left-most tree node in the `BST()`
+        instance which is cached once it's found.
+
+        Returns
+        -------
+        int or float:
+            The minimum numeric value in the `BST()` instance.
+
+        Raises
+        ------
+        IndexError:
+            In case the `BST()` instance is empty.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.get_min()
+        2
+        """
+        if self.is_empty():
+            raise IndexError(
+                f"Can't get the minimum value of an empty `{self.__name__}`"
+            )
+        if self._min_node is None:
+            self._min_node = self._get_min_node(self._root)
+        return self._min_node.get_data()
+
+    def _update_fingers(self, new_node):
+        """
+        Updates the cached nodes holding the minimum & maximum values after
+        linking the given new node to the `BST()` instance. Rotations don't
+        change which nodes hold these values, so they need no updates.
+
+        Parameters
+        ----------
+        new_node: BSTNode()
+            A reference to the newly-linked node.
+        """
+        value = new_node.get_data()
+        if self._min_node is not None and value < self._min_node.get_data():
+            self._min_node = new_node
+        if self._max_node is not None and value > self._max_node.get_data():
+            self._max_node = new_node
+
+    def _refresh_fingers(self):
+        """
+        Finds the nodes holding the minimum & maximum values again in
+        time-complexity of O(h) where **h** is the height of the `BST()`. It's
+        called after removing values as removal may move values between
+        nodes, so `get_min()` and `get_max()` stay in constant time.
+        """
+        if self._root is None:
+            self._min_node = self._max_node = None
+        else:
+            self._min_node = self._get_min_node(self._root)
+            self._max_node = self._get_max_node(self._root)
+
+    # =============================    THREADS   ==============================
+    @staticmethod
+    def _link_threads(pred_node, succ_node):
+        """
+        Links the two given nodes as in-order neighbors in a threaded `BST()`.
+
+        Parameters
+        ----------
+        pred_node: BSTNode() or None
+            The node that comes first in in-order, `None` if `succ_node` holds
+            the minimum value.
+        succ_node: BSTNode() or None
+            The node that comes next in in-order, `None` if `pred_node` holds
+            the maximum value.
+        """
+        if pred_node is not None:
+            pred_node._succ = succ_node
+        if succ_node is not None:
+            succ_node._pred = pred_node
+
+    def _thread_node(self, new_node):
+        """
+        Links the given newly-linked leaf node to its in-order neighbors in
+        constant time. A left child comes right before its parent while a
+        right child comes right after it.
+
+        Parameters
+        ----------
+        new_node: BSTNode()
+            A reference to the newly-linked leaf node.
+        """
+        assert self._threaded and new_node.get_parent() is not None
+
+        parent = new_node.get_parent()
+        if parent.get_left() is new_node:
+            pred_node, succ_node = parent._pred, parent
+        else:
+            pred_node, succ_node = parent, parent._succ
+        self._link_threads(pred_node, new_node)
+        self._link_threads(new_node, succ_node)
+
+    def _unthread_node(self, node):
+        """
+        Links the in-order neighbors of the given node to each other before
+        the node gets unlinked from the threaded `BST()`. Rotations don't
+        change the in-order of the nodes, so only the unlinked node needs
+        this.
+
+        Parameters
+        ----------
+        node: BSTNode()
+            A reference to the node that will be unlinked.
+        """
+        assert self._threaded
+
+        self._link_threads(node._pred, node._succ)
+        node._pred = node._succ = None
+
+    def _thread_nodes(self, nodes):
+        """
+        Links the given nodes to each other in the given order in O(n) where
+        **n** is the number of nodes. It's used when the whole tree is built
+        or re-linked at once.
+
+        Parameters
+        ----------
+        nodes: iterable
+            An iterable of `BSTNode()` objects sorted by their values.
+        """
+        prev_node = None
+        for node in nodes:
+            node._pred = prev_node
+            if prev_node is not None:
+                prev_node._succ = node
+            prev_node = node
+        if prev_node is not None:
+            prev_node._succ = None
+
+    def _rethread(self):
+        """
+        Links all nodes of the threaded `BST()` instance again in
+        time-complexity of O(n) using a stack-based in-order traversal. It's
+        used after operations that move whole subtrees around.
+        """
+        if self._threaded:
+            self._thread_nodes(super()._iter_inorder_nodes(self._root))
+
+    # =============================    SEARCH    ==============================
+    def _search(self, find_val, start_node):
+        """
+        Searches the `BST()` for a given value (`find_val`) starting from the
+        subtree whose root is the given `start_node` and returns the node
+        containing that value if found. If not found, it returns the last
+        accessed node.
+
+        Parameters
+        ----------
+        find_val: int or float
+            The value to be searched for in the `BST()` instance.
+        start_node: BSTNode()
+            The root of the subtree where the search will begin.
+
+        Returns
+        -------
+        BSTNode():
+            If the value is found, this object represents the found node. If
+            the value isn't found, this object will be the last accessed node.
+
+        Raises
+        ------
+        AssertionError:
+            This can be raised in one of the following cases:
+                1. If `find_val` is NOT a numeric value.
+                2. If the given `start_node` isn't an instance of `BSTNode()`.
+
+        Examples
+        --------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst._search(5, bst._root)
+        BSTNode(5)
+        >>> bst._search(5, bst._root._right)
+        BSTNode(10)
+        """
+        assert isinstance(start_node, self._basic_node)
+        assert self._is_valid_value(find_val)
+
+        # NOTE: this is the hot loop of the whole BST family, so it accesses
+        # the node's attributes directly instead of calling the getters.
+        curr_node = start_node
+        while True:
+            curr_val = curr_node._data
+            if find_val == curr_val:
+                return curr_node
+            next_node = (
+                curr_node._left if find_val < curr_val else curr_node._right
+            )
+            if next_node is None:
+                return curr_node
+            curr_node = next_node
+
+    def __contains__(self, find_val):
+        """
+        Searches the `BST()` for the given value and returns `True` if the
+        value exists and `False` if not.
+
+        Parameters
+        ----------
+        find_val: int or float
+            The value to be searched for in the `BST()` instance.
+
+        Returns
+        -------
+        bool:
+            Returns `True` if the value exists in the `BST()` instance and
+            `False` if not.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> 5 in bst
+        True
+        >> 50 in bst
+        False
+        """
+        if self.is_empty() or not self._is_valid_value(find_val):
+            return False
+        found_node = self._search(find_val, self._root)
+        return found_node.get_data() == find_val
+
+    # =============================   NEIGHBORS  ==============================
+    def _floor_node(self, value, strict=False):
+        """
+        Searches the `BST()` instance for the node holding the biggest value
+        that is less than (or equal to) the given value.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be compared against.
+        strict: bool (default=False)
+            If `True`, the node holding `value` itself is skipped.
+
+        Returns
+        -------
+        BSTNode() or None:
+            The found node, or `None` if all values are bigger than `value`.
+        """
+        assert self._is_valid_value(value)
+
+        floor_node = None
+        curr_node = self._root
+        while curr_node is not None:
+            curr_val = curr_node._data
+            if curr_val == value and not strict:
+                return curr_node
+            elif curr_val < value:
+                floor_node = curr_node
+                curr_node = curr_node._right
+            else:
+                curr_node = curr_node._left
+        return floor_node
+
+    def _ceiling_node(self, value, strict=False):
+        """
+        Searches the `BST()` instance for the node holding the smallest value
+        that is greater than (or equal to) the given value.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be compared against.
+        strict: bool (default=False)
+            If `True`, the node holding `value` itself is skipped.
+
+        Returns
+        -------
+        BSTNode() or None:
+            The found node, or `None` if all values are smaller than `value`.
+        """
+        assert self._is_valid_value(value)
+
+        ceiling_node = None
+        curr_node = self._root
+        while curr_node is not None:
+            curr_val = curr_node._data
+            if curr_val == value and not strict:
+                return curr_node
+            elif curr_val > value:
+                ceiling_node = curr_node
+                curr_node = curr_node._left
+            else:
+                curr_node = curr_node._right
+        return ceiling_node
+
+    def floor(self, value):
+        """
+        Gets the biggest value in the `BST()` instance that is less than or
+        equal to the given value in time-complexity of O(h) where **h** is the
+        height of the `BST()` instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for in the `BST()` instance.
+
+        Returns
+        -------
+        int or float:
+            The biggest value that is less than or equal to the given value,
+            or `None` if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.floor(7)
+        7
+        >>> bst.floor(9)
+        8
+        >>> bst.floor(1) is None
+        True
+        """
+        self._validate_item(value)
+        node = self._floor_node(value)
+        return None if node is None else node.get_data()
+
+    def ceiling(self, value):
+        """
+        Gets the smallest value in the `BST()` instance that is greater than or
+        equal to the given value in time-complexity of O(h) where **h** is the
+        height of the `BST()` instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for in the `BST()` instance.
+
+        Returns
+        -------
+        int or float:
+            The smallest value that is greater than or equal to the given
+            value, or `None` if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.ceiling(7)
+        7
+        >>> bst.ceiling(9)
+        10
+        >>> bst.ceiling(20) is None
+        True
+        """
+        self._validate_item(value)
+        node = self._ceiling_node(value)
+        return None if node is None else node.get_data()
+
+    def predecessor(self, value):
+        """
+        Gets the biggest value in the `BST()` instance that is strictly less
+        than the given value in time-complexity of O(h) where **h** is the
+        height of the `BST()` instance. The given value doesn't have to exist
+        in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose predecessor is to be found.
+
+        Returns
+        -------
+        int or float:
+            The biggest value that is less than the given value, or `None` if
+            there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.predecessor(7)
+        5
+        >>> bst.predecessor(9)
+        8
+        >>> bst.predecessor(2) is None
+        True
+        """
+        self._validate_item(value)
+        node = self._floor_node(value, strict=True)
+        return None if node is None else node.get_data()
+
+    def successor(self, value):
+        """
+        Gets the smallest value in the `BST()` instance that is strictly
+        greater than the given value in time-complexity of O(h) where **h** is
+        the height of the `BST()` instance. The given value doesn't have to
+        exist in the instance.
+
+        Parameters
+        ----------
+        value: int or float
+            The value whose successor is to be found.
+
+        Returns
+        -------
+        int or float:
+            The smallest value that is greater than the given value, or `None`
+            if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Examples
+        --------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.successor(7)
+        8
+        >>> bst.successor(9)
+        10
+        >>> bst.successor(15) is None
+        True
+        """
+        self._validate_item(value)
+        node = self._ceiling_node(value, strict=True)
+        return None if node is None else node.get_data()
+
+    # =============================     RANGE    ==============================
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        """
+        Iterates over the values of the `BST()` instance that lie between the
+        given two values and returns a generator. The path to the first value
+        is pushed to an explicit stack once, then the values are generated
+        lazily. In a threaded `BST()`, the first value is found the same way
+        and the in-order links are followed afterwards without any stack.
+        So, the time-complexity is O(h + k) where **h** is the height of the
+        `BST()` instance and **k** is the number of the generated values.
+
+        Parameters
+        ----------
+        lo: int or float, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum value in the instance.
+        hi: int or float, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum value in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
+        reverse: bool (default=False)
+            If `True`, the values are generated in descending order starting
+            from the upper bound.
+
+        Returns
+        -------
+        generator:
+            The values within the given range in ascending order, or in
+            descending order if `reverse` is `True`.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases:
+                1. If one of the given bounds is not a number.
+                2. If `reverse` isn't a boolean.
+
+        Examples
+        --------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> list(bst.irange(3, 8))
+        [3, 5, 7, 8]
+        >>> list(bst.irange(3, 8, inclusive=(False, True)))
+        [5, 7, 8]
+        >>> list(bst.irange(hi=5))
+        [2, 3, 5]
+        >>> list(bst.irange(3, 8, reverse=True))
+        [8, 7, 5, 3]
+        """
+        for node in self._irange_nodes(lo, hi, inclusive, reverse):
+            yield node.get_data()
+
+    def _irange_nodes(
+        self, lo=None, hi=None, inclusive=(True, True), reverse=False
+    ):
+        """
+        Iterates over the nodes of the `BST()` instance whose values lie
+        between the given two values. It's the backbone of the `irange()`
+        method.
+
+        Parameters
+        ----------
+        lo: int or float, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum value in the instance.
+        hi: int or float, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum value in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
+        reverse: bool (default=False)
+            If `True`, the nodes are generated in descending order.
+
+        Returns
+        -------
+        generator:
+            The `BSTNode()` objects within the given range in ascending
+            order, or in descending order if `reverse` is `True`.
+        """
+        if lo is not None:
+            self._validate_item(lo)
+        if hi is not None:
+            self._validate_item(hi)
+        self._validate_reverse(reverse)
+        include_lo, include_hi = inclusive
+
+        def above_lo(value):
+            return lo is None or value > lo or (value == lo and include_lo)
+
+        def below_hi(value):
+            return hi is None or value < hi or (value == hi and include_hi)
+
+        # the bound where the walk starts & the one where it ends
+        if reverse:
+            in_start, in_end = below_hi, above_lo
+        else:
+            in_start, in_end = above_lo, below_hi
+        if self._threaded:
+            if self.is_empty():
+                return
+            elif reverse:
+                node = (
+                    self._get_max_node(self._root)
+                    if hi is None
+                    else self._floor_node(hi, strict=not include_hi)
+                )
+            else:
+                node = (
+                    self._get_min_node(self._root)
+                    if lo is None
+                    else self._ceiling_node(lo, strict=not include_lo)
+                )
+            # follow the in-order links till passing the other bound
+            while node is not None and in_end(node._data):
+                yield node
+                node = node._pred if reverse else node._succ
+            return
+        # push the path leading to the first node within the range
+        stack = []
+        curr_node = self._root
+        while curr_node is not None:
+            if in_start(curr_node._data):
+                stack.append(curr_node)
+                curr_node = curr_node._right if reverse else curr_node._left
+            else:
+                curr_node = curr_node._left if reverse else curr_node._right
+        # in-order walk till passing the other bound
+        while stack:
+            node = stack.pop()
+            if not in_end(node._data):
+                return
+            yield node
+            curr_node = node._left if reverse else node._right
+            while curr_node is not None:
+                stack.append(curr_node)
+                curr_node = curr_node._right if reverse else curr_node._left
+
+    # =============================   INDEXING   ==============================
+    def _update_ancestors(self, start_node):
+        """
+        Recomputes the cached subtree size and aggregate of the given
+        `start_node` and all of its ancestors. It must be called after linking
+        or unlinking a node as every subtree containing that node changes.
+
+        Parameters
+        ----------
+        start_node: BSTNode() or None
+            A reference to the lowest node whose subtree has changed.
+
+        Raises
+        ------
+        AssertionError:
+            If the given `start_node` is neither a `BSTNode()` nor `None`.
+        """
+        assert start_node is None or isinstance(start_node, self._basic_node)
+
+        curr_node = start_node
+        while curr_node is not None:
+            curr_node._update_augmented_data()
+            curr_node = curr_node._parent
+
+    def _validate_index(self, idx, accept_negative=False):
+        """
+        Checks the validity of the given index. It raises the appropriate error
+        when the index isn't valid and it returns nothing if the index is
+        valid.
+
+        Parameters
+        ----------
+        idx: int
+            The index value.
+        accept_negative: bool (default: False)
+            A flag to enable accepting negative indices.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            This happens in one of the following cases:
+                1. If the given index is negative and `accept_negative` flag \
+                    is `False`.
+                2. if the given index is a `slice` object.
+                3. If the given index is out of the `BST()` boundaries.
+        """
+        if isinstance(idx, slice):
+            raise IndexError(
+                "Slice indexing isn't supported with this functinoality!!"
+            )
+        elif type(idx) != int:
+            raise TypeError("Given index must be an integer!!")
+        elif idx <= -1 and not accept_negative:
+            raise IndexError(
+                "Negative indexing isn't supported with this functinoality!!"
+            )
+        elif idx < -len(self) or idx >= len(self):
+            raise IndexError("Can't find any element at the given index!!")
+
+    def _select_node(self, idx):
+        """
+        Finds the node holding the `idx`-th smallest value in the `BST()`
+        instance by using the subtree sizes to decide which child to descend
+        to.
+
+        Parameters
+        ----------
+        idx: int
+            A valid zero-based index.
+
+        Returns
+        -------
+        BSTNode():
+            The node at the given in-order position.
+        """
+        assert type(idx) == int and 0 <= idx < len(self)
+
+        curr_node = self._root
+        while True:
+            left_node = curr_node._left
+            left_size = left_node._size if left_node is not None else 0
+            if idx < left_size:
+                curr_node = left_node
+            elif idx == left_size:
+                return curr_node
+            else:
+                idx -= left_size + 1
+                curr_node = curr_node._right
+
+    def select(self, k):
+        """
+        Gets the `k`-th smallest value in the `BST()` instance in
+        time-complexity of O(h) where **h** is the height of the `BST()`
+        instance. `k` is zero-based, so `select(0)` returns the minimum value.
+
+        Parameters
+        ----------
+        k: int
+            The zero-based position of the value in the sorted order.
+
+        Returns
+        -------
+        int or float:
+            The `k`-th smallest value in the `BST()` instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given `k` isn't `int`.
+        IndexError:
+            If the given `k` is negative or out of the `BST()` boundaries.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.select(0)
+        2
+        >>> bst.select(3)
+        7
+        >>> bst.select(10)
+        IndexError: Can't find any element at the given index!!
+        """
+        self._validate_index(k)
+        return self._select_node(k).get_data()
+
+    def rank(self, value):
+        """
+        Counts the values in the `BST()` instance that are strictly less than
+        the given value in time-complexity of O(h) where **h** is the height
+        of the `BST()` instance. The given value doesn't have to exist in the
+        instance and if it does, its rank is its zero-based position in the
+        sorted order.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be ranked.
+
+        Returns
+        -------
+        int:
+            The number of values that are less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
 
-        # get the left-most node
-        if start_node.get_left() is None:
-            return start_node
-        else:
-            return self._get_min_node(start_node.get_left())
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.rank(7)
+        3
+        >>> bst.rank(9)
+        5
+        >>> bst.rank(1)
+        0
+        """
+        self._validate_item(value)
+        rank = 0
+        curr_node = self._root
+        while curr_node is not None:
+            if value <= curr_node._data:
+                curr_node = curr_node._left
+            else:
+                left_node = curr_node._left
+                rank += 1 + (left_node._size if left_node is not None else 0)
+                curr_node = curr_node._right
+        return rank
 
-    def get_min(self):
+    def median(self):
         """
-        Gets the minimum value in the `BST()` isntance. The minimum value can
-        be found at the left-most tree node in the `BST()` instance.
+        Gets the median value of the `BST()` instance in time-complexity of
+        O(h) where **h** is the height of the `BST()` instance. When the number
+        of values is even, the median is the mean of the two middle values.
 
         Returns
         -------
         int or float:
-            The minimum numeric value in the `BST()` instance.
+            The median value of the `BST()` instance.
 
         Raises
         ------
@@ -552,46 +1809,50 @@ class BST(BinaryTree):
         2     7   10
          \\
           3
-        >>> bst.get_min()
-        2
+        >>> bst.median()
+        7
+        >>> bst.insert(20)
+        >>> bst.median()
+        7.5
         """
         if self.is_empty():
             raise IndexError(
-                f"Can't get the minimum value of an empty `{self.__name__}`"
+                f"Can't get the median value of an empty `{self.__name__}`"
             )
-        min_node = self._get_min_node(self._root)
-        return min_node.get_data()
+        length = len(self)
+        mid_value = self._select_node(length // 2).get_data()
+        if length % 2 == 1:
+            return mid_value
+        return (self._select_node(length // 2 - 1).get_data() + mid_value) / 2
 
-    # =============================    SEARCH    ==============================
-    def _search(self, find_val, start_node):
+    def __getitem__(self, idx):
         """
-        Searches the `BST()` for a given value (`find_val`) starting from the
-        subtree whose root is the given `start_node` and returns the node
-        containing that value if found. If not found, it returns the last
-        accessed node.
+        Retrieves the value at the given position of the sorted order of the
+        `BST()` instance in time-complexity of O(h) where **h** is the height
+        of the `BST()` instance. The given index is a zero-based `int` which
+        could be negative to count from the end. It doesn't support `slice`
+        objects.
 
         Parameters
         ----------
-        find_val: int or float
-            The value to be searched for in the `BST()` instance.
-        start_node: BSTNode()
-            The root of the subtree where the search will begin.
+        idx: int
+            The index of the value in the sorted order.
 
         Returns
         -------
-        BSTNode():
-            If the value is found, this object represents the found node. If
-            the value isn't found, this object will be the last accessed node.
+        int or float:
+            The value at this position inside the `BST()` instance.
 
         Raises
         ------
-        AssertionError:
-            This can be raised in one of the following cases:
-                1. If `find_val` is NOT a numeric value.
-                2. If the given `start_node` isn't an instance of `BSTNode()`.
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is a `slice` object or it's out of the `BST()`
+            boundaries.
 
-        Examples
-        --------
+        Example
+        -------
         >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
         >>> bst
               __8___
@@ -601,46 +1862,57 @@ class BST(BinaryTree):
         2     7   10
          \\
           3
-        >>> bst._search(5, bst._root)
-        BSTNode(5)
-        >>> bst._search(5, bst._root._right)
-        BSTNode(10)
+        >>> bst[0]
+        2
+        >>> bst[-1]
+        15
+        >>> bst[10]
+        IndexError: Can't find any element at the given index!!
         """
-        assert isinstance(start_node, self._basic_node)
-        assert type(find_val) in {float, int}
-
-        if find_val == start_node.get_data():
-            return start_node
-        elif find_val < start_node.get_data():
-            if start_node.get_left():
-                return self._search(find_val, start_node.get_left())
-            else:
-                return start_node
-        else:
-            if start_node.get_right():
-                return self._search(find_val, start_node.get_right())
-            else:
-                return start_node
+        self._validate_index(idx, accept_negative=True)
+        if idx < 0:
+            idx += len(self)
+        return self._select_node(idx).get_data()
 
-    def __contains__(self, find_val):
+    # =============================   AGGREGATE  ==============================
+    def aggregate(self, lo=None, hi=None, inclusive=(True, True)):
         """
-        Searches the `BST()` for the given value and returns `True` if the
-        value exists and `False` if not.
+        Aggregates the values of the `BST()` instance that lie between the
+        given two values using the aggregate passed to the constructor. Only
+        the two paths bounding the range are visited as every subtree inside
+        the range contributes its cached aggregate at once. So, the
+        time-complexity is O(h) where **h** is the height of the `BST()`
+        instance. Values are combined in ascending order, so the aggregate
+        function doesn't have to be commutative.
 
         Parameters
         ----------
-        find_val: int or float
-            The value to be searched for in the `BST()` instance.
+        lo: int or float, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum value in the instance.
+        hi: int or float, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum value in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
 
         Returns
         -------
-        bool:
-            Returns `True` if the value exists in the `BST()` instance and
-            `False` if not.
+        object:
+            The aggregate of the values within the given range, or the
+            aggregate's identity if the range is empty.
+
+        Raises
+        ------
+        ValueError:
+            If the `BST()` instance was created without an aggregate.
+        TypeError:
+            If one of the given bounds is not a number.
 
         Example
         -------
-        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3], aggregate="sum")
         >>> bst
               __8___
              /      \\
@@ -649,15 +1921,68 @@ class BST(BinaryTree):
         2     7   10
          \\
           3
-        >>> 5 in bst
-        True
-        >> 50 in bst
-        False
-        """
-        if self.is_empty() or type(find_val) not in {int, float}:
-            return False
-        found_node = self._search(find_val, self._root)
-        return found_node.get_data() == find_val
+        >>> bst.aggregate()
+        50
+        >>> bst.aggregate(3, 8)
+        23
+        >>> bst.aggregate(3, 8, inclusive=(False, False))
+        12
+        >>> BST([1, 2, 3]).aggregate()
+        ValueError: `extra.BST()` was created without an aggregate!!
+        """
+        if self._monoid is None:
+            raise ValueError(
+                f"`{self.__name__}` was created without an aggregate!!"
+            )
+        if lo is not None:
+            self._validate_item(lo)
+        if hi is not None:
+            self._validate_item(hi)
+        include_lo, include_hi = inclusive
+        function, identity, key = self._monoid
+        # find the highest node within the range
+        split_node = self._root
+        while split_node is not None:
+            curr_val = split_node._data
+            if lo is not None and (
+                curr_val < lo or (curr_val == lo and not include_lo)
+            ):
+                split_node = split_node._right
+            elif hi is not None and (
+                curr_val > hi or (curr_val == hi and not include_hi)
+            ):
+                split_node = split_node._left
+            else:
+                break
+        if split_node is None:
+            return identity
+        curr_val = split_node._data
+        result = curr_val if key is None else key(curr_val)
+        # values between `lo` and the split node (only `lo` can be passed)
+        curr_node = split_node._left
+        while curr_node is not None:
+            curr_val = curr_node._data
+            if lo is None or curr_val > lo or (curr_val == lo and include_lo):
+                if curr_node._right is not None:
+                    result = function(curr_node._right._aggregate, result)
+                curr_val = curr_val if key is None else key(curr_val)
+                result = function(curr_val, result)
+                curr_node = curr_node._left
+            else:
+                curr_node = curr_node._right
+        # values between the split node and `hi` (only `hi` can be passed)
+        curr_node = split_node._right
+        while curr_node is not None:
+            curr_val = curr_node._data
+            if hi is None or curr_val < hi or (curr_val == hi and include_hi):
+                if curr_node._left is not None:
+                    result = function(result, curr_node._left._aggregate)
+                curr_val = curr_val if key is None else key(curr_val)
+                result = function(result, curr_val)
+                curr_node = curr_node._right
+            else:
+                curr_node = curr_node._left
+        return result
 
     # =============================    INSERT    ==============================
     def _insert_node(self, start_node, inserted_node):
@@ -692,25 +2017,23 @@ class BST(BinaryTree):
         )
 
         value = inserted_node.get_data()
-        if value == start_node.get_data():
+        # search for the parent of the new node
+        parent = self._search(value, start_node)
+        if value == parent.get_data():
             warnings.warn(
                 f"`{value}` already exists in `{self.__name__}`", UserWarning
             )
-            return start_node
-        elif value < start_node.get_data():
-            if start_node.get_left():
-                return self._insert_node(start_node.get_left(), inserted_node)
-            else:
-                start_node.set_left(inserted_node)
-                self._length += 1
-                return inserted_node
+            return parent
+        elif value < parent.get_data():
+            parent.set_left(inserted_node)
         else:
-            if start_node.get_right():
-                return self._insert_node(start_node.get_right(), inserted_node)
-            else:
-                start_node.set_right(inserted_node)
-                self._length += 1
-                return inserted_node
+            parent.set_right(inserted_node)
+        if self._threaded:
+            self._thread_node(inserted_node)
+        self._update_ancestors(parent)
+        self._length += 1
+        self._update_fingers(inserted_node)
+        return inserted_node
 
     def _insert_value(self, start_node, value):
         """
@@ -738,9 +2061,9 @@ class BST(BinaryTree):
 
         """
         assert isinstance(start_node, self._basic_node)
-        assert type(value) in {float, int}
+        assert self._is_valid_value(value)
 
-        inserted_node = self._basic_node(value)
+        inserted_node = self._create_node(value)
         return self._insert_node(start_node, inserted_node)
 
     def _insert(self, value):
@@ -764,7 +2087,7 @@ class BST(BinaryTree):
             If the given `value` is not a numeric value.
         """
         assert (
-            type(value) in {int, float}
+            self._is_valid_value(value)
             or isinstance(value, self._basic_node)
         )
 
@@ -773,6 +2096,19 @@ class BST(BinaryTree):
         else:
             return self._insert_value(self._root, value)
 
+    def _insert_fixup(self, new_node):
+        """
+        Restores the properties of the tree after linking the given new node.
+        A plain `BST()` has nothing to restore, but balanced subclasses
+        override this method to rebalance the tree.
+
+        Parameters
+        ----------
+        new_node: BSTNode()
+            A reference to the newly-linked node.
+        """
+        pass
+
     def insert(self, value):
         """
         Inserts a numeric value in the `BST()` instance according to the rules
@@ -804,8 +2140,9 @@ class BST(BinaryTree):
         TypeError: `extra.BST()` accepts only numbers!!
         """
         self._validate_item(value)
+        self._version += 1
         if self.is_empty():
-            self._root = self._basic_node(value)
+            self._root = self._create_node(value)
             self._length += 1
         else:
             self._insert(value)
@@ -863,7 +2200,9 @@ class BST(BinaryTree):
 
     def _transplant(self, node, replacement):
         """
-        Exchanges the given `node` with the given `replacement`.
+        Exchanges the given `node` with the given `replacement`. The value of
+        the `replacement` is moved to the `node`, then the `replacement` itself
+        gets replaced the same way till a leaf node is reached and unlinked.
 
         Parameters
         ----------
@@ -883,23 +2222,21 @@ class BST(BinaryTree):
         assert isinstance(node, self._basic_node)
         assert replacement is None or isinstance(replacement, self._basic_node)
 
-        # replace 'node' with 'replacement'
-        if replacement is None:
-            parent = node.get_parent()
-            if parent.get_left() == node:
-                parent.set_left(replacement)
-            else:
-                parent.set_right(replacement)
-        else:
-            if replacement.is_leaf():
-                new_replacement = None
-            elif replacement.get_left():
-                new_replacement = replacement.get_left()
-            else:
-                new_replacement = replacement.get_right()
+        # move the replacement's value up till reaching a leaf node
+        while replacement is not None:
+            new_replacement = self._find_replacement(replacement)
             # swap data
             self._basic_node.swap(node, replacement)
-            self._transplant(replacement, new_replacement)
+            node, replacement = replacement, new_replacement
+        # unlink the leaf node
+        if self._threaded:
+            self._unthread_node(node)
+        parent = node.get_parent()
+        if parent.get_left() == node:
+            parent.set_left(None)
+        else:
+            parent.set_right(None)
+        self._update_ancestors(parent)
 
     def _remove(self, del_value, start_node):
         """
@@ -950,7 +2287,7 @@ class BST(BinaryTree):
          \\
           3
         """
-        assert type(del_value) in {int, float}
+        assert self._is_valid_value(del_value)
         assert isinstance(start_node, self._basic_node)
 
         # search for the del_value node
@@ -1019,7 +2356,7 @@ class BST(BinaryTree):
         if self.is_empty():
             warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
             return
-        elif type(del_value) not in {int, float}:
+        elif not self._is_valid_value(del_value):
             warnings.warn(
                 f"Couldn't find `{del_value}` in `{self.__name__}`!!",
                 UserWarning
@@ -1031,6 +2368,140 @@ class BST(BinaryTree):
             self._length -= 1
         else:
             self._remove(del_value, self._root)
+        self._refresh_fingers()
+        self._version += 1
+
+    def pop_min(self):
+        """
+        Removes the minimum value from the `BST()` instance and returns it in
+        time-complexity of O(h) where **h** is the height of the instance.
+        Along with `pop_max()`, it lets balanced trees serve as double-ended
+        priority queues.
+
+        Returns
+        -------
+        int or float:
+            The minimum value that has been removed.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BST()` instance is empty.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.pop_min()
+        2
+        >>> bst.pop_min()
+        3
+        >>> bst.to_list()
+        [8, 5, 15, 7, 10]
+        >>> BST().pop_min()
+        UserWarning: Popping from empty `extra.BST()`!!
+        """
+        if self.is_empty():
+            warnings.warn(
+                f"Popping from empty `{self.__name__}`!!", UserWarning
+            )
+            return
+        min_value = self.get_min()
+        self.remove(min_value)
+        return min_value
+
+    def pop_max(self):
+        """
+        Removes the maximum value from the `BST()` instance and returns it in
+        time-complexity of O(h) where **h** is the height of the instance.
+        Along with `pop_min()`, it lets balanced trees serve as double-ended
+        priority queues.
+
+        Returns
+        -------
+        int or float:
+            The maximum value that has been removed.
+
+        Raises
+        ------
+        UserWarning:
+            If the `BST()` instance is empty.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.pop_max()
+        15
+        >>> bst.pop_max()
+        10
+        >>> bst.to_list()
+        [8, 5, 2, 7, 3]
+        >>> BST().pop_max()
+        UserWarning: Popping from empty `extra.BST()`!!
+        """
+        if self.is_empty():
+            warnings.warn(
+                f"Popping from empty `{self.__name__}`!!", UserWarning
+            )
+            return
+        max_value = self.get_max()
+        self.remove(max_value)
+        return max_value
+
+    def remove_range(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Removes all values of the `BST()` instance that lie between the given
+        two values. The values are located in O(h + k) using `irange()`, then
+        each one of them is removed the same way as `remove()` does to keep
+        the rules of the tree. So, the time-complexity is O(k*h) where **h** is
+        the height of the `BST()` instance and **k** is the number of the
+        removed values.
+
+        Parameters
+        ----------
+        lo: int or float, optional
+            The lower bound of the range. If `None`, the range starts from the
+            minimum value in the instance.
+        hi: int or float, optional
+            The upper bound of the range. If `None`, the range ends at the
+            maximum value in the instance.
+        inclusive: tuple, optional
+            A pair of booleans showing whether the lower and the upper bounds
+            are included in the range respectively, default `(True, True)`.
+
+        Returns
+        -------
+        int:
+            The number of the removed values.
+
+        Raises
+        ------
+        TypeError:
+            If one of the given bounds is not a number.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst
+              __8___
+             /      \\
+          __5       _15
+         /   \\    /
+        2     7   10
+         \\
+          3
+        >>> bst.remove_range(3, 7)
+        3
+        >>> bst.inorder_traverse()
+        [2, 8, 10, 15]
+        """
+        # NOTE: the values are collected first as removing nodes while
+        # iterating over them would invalidate the iterator's stack.
+        values = [
+            node.get_data() for node in self._irange_nodes(lo, hi, inclusive)
+        ]
+        for value in values:
+            self.remove(value)
+        return len(values)
 
     def clear(self):
         """
@@ -1053,7 +2524,192 @@ class BST(BinaryTree):
         >>> bst.is_empty()
         True
         """
+        threaded, monoid = self._threaded, self._monoid
+        numeric_only = self._numeric_only
         super().clear()
+        self._threaded, self._monoid = threaded, monoid
+        self._numeric_only = numeric_only
+
+    # =============================  BULK UPDATE ==============================
+    def _validate_batch(self, values):
+        """
+        Makes sure all values of the given batch can be processed by scanning
+        their types once instead of calling `_validate_item()` per value. The
+        per-value validation is used only when an invalid value is found to
+        raise the same error as `insert()`.
+
+        Parameters
+        ----------
+        values: list
+            A list of the values to be inserted.
+
+        Raises
+        ------
+        ValueError:
+            If one of the values is `None`.
+        TypeError:
+            If one of the values is not a numeric value.
+        """
+        numbers = {int, float}
+        if not self._numeric_only or not set(map(type, values)) <= numbers:
+            for value in values:
+                self._validate_item(value)
+
+    def _prefers_rebuild(self, batch_size):
+        """
+        Decides whether updating the `BST()` instance with a batch of the
+        given size is cheaper by rebuilding the whole tree in O(n+k) than by
+        updating it one value at a time in O(k*log(n)) where **n** is the
+        length of the instance and **k** is the size of the batch.
+
+        Parameters
+        ----------
+        batch_size: int
+            The number of unique values in the batch.
+
+        Returns
+        -------
+        bool:
+            `True` if rebuilding the instance is cheaper, `False` otherwise.
+        """
+        length = self._length
+        return batch_size * max(1, length.bit_length()) >= length
+
+    def _rebuild(self, values):
+        """
+        Drops all nodes of the `BST()` instance and builds it again out of
+        the given values. Unlike `clear()`, the aggregate of the instance is
+        kept.
+
+        Parameters
+        ----------
+        values: list
+            A list of valid numeric values sorted in strictly ascending order.
+        """
+        self._root = None
+        self._length = 0
+        self._refresh_fingers()
+        self._build_balanced(values)
+
+    def insert_many(self, iterable):
+        """
+        Inserts all values of the given iterable in the `BST()` instance. The
+        values are validated, sorted and deduplicated once. Then, based on the
+        size of the batch, they are either merged with the values of the
+        instance which gets rebuilt in O(n+k), or inserted one by one in
+        O(k*log(n)) where each search starts from the last inserted node
+        instead of the root. Unlike `insert()`, values that already exist in
+        the instance are skipped silently.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable object of numeric values.
+
+        Returns
+        -------
+        int:
+            The number of the inserted values.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't iterable or one of its values isn't a
+            number.
+        ValueError:
+            If one of the values of the given iterable is `None`.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.insert_many([1, 4, 5, 20])
+        3
+        >>> bst.inorder_traverse()
+        [1, 2, 3, 4, 5, 7, 8, 10, 15, 20]
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        values = list(iterable)
+        self._validate_batch(values)
+        self._version += 1
+        values = sorted(set(values))
+        old_length = self._length
+        if self._prefers_rebuild(len(values)):
+            merged = []
+            for value in heapq.merge(self.iter_inorder(), values):
+                if not merged or merged[-1] != value:
+                    merged.append(value)
+            self._rebuild(merged)
+            return self._length - old_length
+
+        finger = None
+        for value in values:
+            # climb up from the finger till reaching a subtree whose range
+            # covers the value. Values are sorted, so the lower bound of any
+            # subtree holding the finger is already less than the value.
+            start_node = self._root if finger is None else finger
+            while start_node.get_parent() is not None:
+                parent = start_node.get_parent()
+                if (
+                    parent.get_left() is start_node
+                    and value < parent.get_data()
+                ):
+                    break
+                start_node = parent
+            parent = self._search(value, start_node)
+            if parent.get_data() == value:
+                continue
+            finger = self._insert_node(parent, self._create_node(value))
+            self._insert_fixup(finger)
+        return self._length - old_length
+
+    def remove_many(self, iterable):
+        """
+        Removes all values of the given iterable from the `BST()` instance.
+        Based on the size of the batch, the instance is either rebuilt out of
+        the values that are kept in O(n+k), or the values are removed one by
+        one in O(k*log(n)). Unlike `remove()`, values that don't exist in the
+        instance are skipped silently.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable object of values.
+
+        Returns
+        -------
+        int:
+            The number of the removed values.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't iterable.
+
+        Example
+        -------
+        >>> bst = BST([8, 5, 2, 7, 15, 10, 3])
+        >>> bst.remove_many([2, 3, 50])
+        2
+        >>> bst.inorder_traverse()
+        [5, 7, 8, 10, 15]
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        values = {item for item in iterable if self._is_valid_value(item)}
+        old_length = self._length
+        if self.is_empty() or not values:
+            return 0
+        elif self._prefers_rebuild(len(values)):
+            self._rebuild(
+                [value for value in self.iter_inorder() if value not in values]
+            )
+        else:
+            for value in sorted(values):
+                node = self._search(value, self._root)
+                if node.get_data() == value:
+                    self.remove(value)
+        return old_length - self._length
 
     # =============================   ROTATION   ==============================
     def _rotate_left(self, start_node):
@@ -1630,6 +3286,38 @@ class BST(BinaryTree):
         return super().postorder_traverse()
 
     # =============================   IN-ORDER   ==============================
+    def _iter_inorder_nodes(self, start_node, reverse=False):
+        """
+        Generates the nodes of the subtree whose root is `start_node` in
+        in-order manner. In a threaded `BST()`, the first node is found in
+        O(h), then the in-order links are followed in O(1) per node without
+        any stack. Otherwise, an explicit stack of O(h) nodes is used.
+
+        Parameters
+        ----------
+        start_node: BSTNode() or None
+            A reference to the root of the subtree.
+        reverse: bool (default=False)
+            If `True`, the nodes are generated in descending order.
+
+        Yields
+        ------
+        BSTNode():
+            The visited nodes.
+        """
+        if not self._threaded or start_node is None:
+            yield from super()._iter_inorder_nodes(start_node, reverse)
+            return
+        if reverse:
+            node = self._get_max_node(start_node)
+        else:
+            node = self._get_min_node(start_node)
+        # the subtree's size tells when to stop as the links continue beyond
+        # the subtree
+        for _ in range(start_node.get_size()):
+            yield node
+            node = node._pred if reverse else node._succ
+
     def inorder_traverse(self):
         """
         Traverses the `BST()` instance in in-order manner. Which means that the
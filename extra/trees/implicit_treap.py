@@ -0,0 +1,866 @@
+"""
+An implicit treap is a treap that stores a sequence of objects instead of a
+sorted collection of numbers. Each node in the implicit treap contains two
+main values:
+
+- **data**: The object stored at a certain position in the sequence.
+- **priority**: A random number used to keep the tree balanced, just like \
+    the priorities of the `Treap()`.
+
+The difference between the "Treap" and the "Implicit Treap" is that the nodes
+of the latter aren't ordered by the values they store. Instead, each node is
+ordered by its position in the sequence which is never stored explicitly.
+The position of any node is computed on the fly while walking down from the
+root using the sizes of the subtrees. That's why it's called "implicit".
+
+Since the positions aren't stored, an implicit treap can be split at any
+position or concatenated with another one by relinking only the nodes along
+one path. This makes positional insertion, deletion, slicing and
+concatenation take O(log(n)) on average, compared to O(n) with `LinkedList()`
+or the built-in `list`.
+
+The following implicit treap stores the sequence `["a", "b", "c", "d", "e"]`
+and the position of each item is the number of nodes visited before it in an
+in-order traversal:
+
+.. code-block:: text
+
+      __c__
+     /     \\
+    a       e
+     \\     /
+      b   d
+
+Note
+----
+Just like `Treap()`, the priority values are hidden. If you want to see the
+priorty of each node, you can set the static variable `SHOW_PRIORITY` of the
+`Treap()` class to `True`.
+"""
+import random
+from extra.trees.bst import BSTNode
+from extra.trees.binary_tree import BinaryTree
+from extra.trees.treap import TreapNode, Treap
+
+
+class ImplicitTreapNode(TreapNode):
+    """
+    An implicit treap node is the basic unit for building ImplicitTreap
+    instances. Unlike the treap node, an implicit treap node can contain any
+    object. Each implicit treap node has either zero, one or two children
+    implicit treap nodes. The node that has no children is called a **leaf
+    node**.
+    """
+
+    __name__ = "extra.ImplicitTreapNode()"
+
+    def __init__(self, data, priority=None):
+        """
+        Creates an `ImplicitTreapNode()` object which is the basic unit for
+        building `ImplicitTreap()` objects!!
+
+        Parameters
+        ----------
+        data: object
+            The value to be saved within the `ImplicitTreapNode()` instance.
+        priority: int or float (default: None)
+            A numeric value indicating the priority of the node. If `None`, a
+            random float between 0 and 1 is used.
+
+        Raises
+        ------
+        ValueError:
+            If the given data is `None`.
+        TypeError:
+            It can be raised in the following two cases:
+                1. If the given data is an `Extra` object.
+                2. If the given priority isn't a number.
+        """
+        if priority is not None and type(priority) not in {int, float}:
+            raise TypeError("Given priority has to be a number!!")
+        # skip the numeric check of `BSTNode()` as any object can be stored
+        super(BSTNode, self).__init__(data)
+        self._parent = None
+        self._size = 1
+        self._monoid = None
+        self._aggregate = None
+        self._priority = random.random() if priority is None else priority
+
+    def __repr__(self):
+        """
+        Represents `ImplicitTreapNode()` object as a string.
+
+        Returns
+        -------
+        str:
+            A string representing the `ImplicitTreapNode()` instance.
+
+        Example
+        -------
+        >>> x = ImplicitTreapNode("a", priority=0.5)
+        >>> x
+        ImplicitTreapNode(data: a, Priority: 0.5)
+        """
+        return (
+            f"ImplicitTreapNode(data: {self._data}, "
+            + f"Priority: {self._priority})"
+        )
+
+
+class ImplicitTreap(BinaryTree):
+    """
+    An implicit treap is a binary tree that stores a sequence of objects where
+    the position of each object is defined by the in-order traversal of the
+    tree. Each node has a random priority that must follow the rules of max
+    heap which keeps the tree balanced on average.
+    """
+
+    _basic_node = ImplicitTreapNode
+    __name__ = "extra.ImplicitTreap()"
+
+    def __init__(self, iterable=None, seed=None):
+        """
+        Initializes an `ImplicitTreap()` instance using an optional iterable
+        object in time-complexity of O(n) where **n** is the number of
+        elements inside the given `iterable`.
+
+        Parameters
+        ----------
+        iterable: iterable (default: None)
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+        seed: int or float (default: None)
+            A seed to generate consistent random numbers.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+        ValueError:
+            If one of the iterable elements is `None`.
+
+        Examples
+        --------
+        >>> itreap = ImplicitTreap(["a", "b", "c", "d", "e"], seed=7)
+        >>> itreap
+          __c__
+         /     \\
+        a       e
+         \\     /
+          b   d
+        >>> itreap.to_list()
+        ['a', 'b', 'c', 'd', 'e']
+
+        Using an iterable object with `None` as one of its elements will raise
+        `ValueError`
+
+        >>> ImplicitTreap([2, None])
+        ValueError: Can't use `None` as an element within \
+            `extra.ImplicitTreap()`!!
+
+        Using a non-iterable object will raise `TypeError`
+
+        >>> ImplicitTreap(2)
+        TypeError: The given object isn't iterable!!
+        """
+        random.seed(seed)
+        super().__init__()
+        if iterable is None:
+            pass
+        elif not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        else:
+            self._root = self._build_nodes(iterable)
+
+    def _empty_like(self):
+        """
+        Creates an empty `ImplicitTreap()` instance. Unlike the constructor,
+        it doesn't re-seed the random numbers generator.
+
+        Returns
+        -------
+        ImplicitTreap():
+            An empty `ImplicitTreap()` instance.
+        """
+        itreap = self.__class__.__new__(self.__class__)
+        super(ImplicitTreap, itreap).__init__()
+        return itreap
+
+    def _create_node(self, item):
+        """
+        Validates the given item and creates a new `ImplicitTreapNode()` with
+        a random priority.
+
+        Parameters
+        ----------
+        item: object
+            The object to be stored in the new node.
+
+        Returns
+        -------
+        ImplicitTreapNode():
+            The newly-created node.
+
+        Raises
+        ------
+        ValueError:
+            If the given item is `None`.
+        TypeError:
+            If the given item is an `Extra` object.
+        """
+        super()._validate_item(item)
+        return self._basic_node(item, random.random())
+
+    def _build_nodes(self, iterable):
+        """
+        Builds an implicit treap out of the items of the given iterable in
+        time-complexity of O(n) where **n** is the number of items. As items
+        are appended in order, only the right spine of the tree is kept in a
+        stack. Each new node pops the nodes with lower priorities which
+        become its left subtree. The subtree sizes of the popped nodes are
+        final, so they are computed once per node.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable object of the items to be stored.
+
+        Returns
+        -------
+        ImplicitTreapNode() or None:
+            The root of the built implicit treap.
+
+        Raises
+        ------
+        ValueError:
+            If one of the iterable elements is `None`.
+        TypeError:
+            If one of the elements in the iterable is an `Extra` object.
+        """
+        spine = []
+        for item in iterable:
+            node = self._create_node(item)
+            last_popped = None
+            while spine and spine[-1].get_priority() < node.get_priority():
+                last_popped = spine.pop()
+                last_popped._update_augmented_data()
+            node.set_left(last_popped)
+            if spine:
+                spine[-1].set_right(node)
+            spine.append(node)
+        root = spine[0] if spine else None
+        while spine:
+            spine.pop()._update_augmented_data()
+        if root is not None:
+            root.set_parent(None)
+        return root
+
+    def _split_nodes(self, start_node, idx):
+        """
+        Splits the subtree whose root is `start_node` into two subtrees; the
+        first one holds the first `idx` items of the subtree while the second
+        holds the rest. This is done by walking down the path to the given
+        position and distributing its nodes between the right spine of the
+        first subtree and the left spine of the second one.
+
+        Parameters
+        ----------
+        start_node: ImplicitTreapNode() or None
+            The root of the subtree to be split.
+        idx: int
+            The number of items to be kept in the first subtree.
+
+        Returns
+        -------
+        tuple:
+            A tuple of the roots of the two subtrees. Any of them could be
+            `None`.
+        """
+        assert start_node is None or isinstance(start_node, self._basic_node)
+        assert 0 <= idx <= (start_node.get_size() if start_node else 0)
+
+        left_path, right_path = [], []
+        node = start_node
+        while node is not None:
+            left_size = node.get_left().get_size() if node.get_left() else 0
+            if idx <= left_size:
+                # node & its right subtree go to the second part
+                if right_path:
+                    right_path[-1].set_left(node)
+                right_path.append(node)
+                node = node.get_left()
+            else:
+                # node & its left subtree go to the first part
+                if left_path:
+                    left_path[-1].set_right(node)
+                left_path.append(node)
+                idx -= left_size + 1
+                node = node.get_right()
+        if left_path:
+            left_path[-1].set_right(None)
+        if right_path:
+            right_path[-1].set_left(None)
+        # sizes along the two spines are fixed bottom-up
+        for node in reversed(left_path):
+            node._update_augmented_data()
+        for node in reversed(right_path):
+            node._update_augmented_data()
+        left = left_path[0] if left_path else None
+        right = right_path[0] if right_path else None
+        for node in (left, right):
+            if node is not None:
+                node.set_parent(None)
+        return left, right
+
+    # joining depends only on the priorities, not the values
+    _join_nodes = Treap._join_nodes
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `ImplicitTreap()` instance in time-complexity
+        of O(1) using the size of the root's subtree.
+
+        Returns
+        -------
+        int:
+            The length of the `ImplicitTreap()` instance. Length is the number
+            of tree nodes in the instance.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b", "c", "d", "e"], seed=7)
+        >>> len(itreap)
+        5
+        """
+        return self._root.get_size() if self._root is not None else 0
+
+    def is_empty(self):
+        """
+        Checks if the `ImplicitTreap()` instance is empty or not in constant
+        time.
+
+        Returns
+        -------
+        bool:
+            A boolean flag showing if the `ImplicitTreap()` instance is empty
+            or not. `True` shows that this instance is empty and `False` shows
+            it's not empty.
+
+        Example
+        --------
+        >>> itreap = ImplicitTreap()
+        >>> itreap.is_empty()
+        True
+        >>> itreap.add_end("a")
+        >>> itreap.is_empty()
+        False
+        """
+        return super().is_empty()
+
+    # =============================     ITER     ==============================
+    def __iter__(self):
+        """
+        Iterates over the `ImplicitTreap()` instance and returns a generator
+        of the stored items in the order of the sequence.
+
+        Yields
+        ------
+        object:
+            The item stored inside each node in the instance.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b", "c", "d", "e"], seed=7)
+        >>> for item in itreap:
+        ...     print(item, end=',')
+        a,b,c,d,e,
+        """
+        return self.iter_inorder()
+
+    def to_list(self):
+        """
+        Converts the `ImplicitTreap()` instance to a `list` where items keep
+        the order of the sequence.
+
+        Returns
+        -------
+        list:
+            A `list` object containing the same elements as the
+            `ImplicitTreap()` instance.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b", "c", "d", "e"], seed=7)
+        >>> itreap.to_list()
+        ['a', 'b', 'c', 'd', 'e']
+        """
+        return list(self.iter_inorder())
+
+    # =============================   INDEXING   ==============================
+    def _validate_index(self, idx, accept_negative=False, accept_slice=False):
+        """
+        Checks the validity of the given index. It raises the appropriate
+        error when the index isn't valid and it returns nothing if the index
+        is valid. The length of the instance is a valid index, so callers
+        which need an existing item have to check it.
+
+        Parameters
+        ----------
+        idx: int
+            The index value.
+        accept_negative: bool
+            A flag to enable accepting negative indices, default `False`.
+        accept_slice: bool
+            A flag to enable accepting `slice` objects, default `False`.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            This happens in one of the following cases:
+                1. if the given index is a `slice` object while `accept_slice`
+                flag is `False`.
+                2. If the given index is out of the `ImplicitTreap()`
+                boundaries.
+                3. If the given index is negative while `accept_negative` flag
+                is `False`.
+        """
+        if isinstance(idx, slice):
+            if not accept_slice:
+                raise IndexError(
+                    "Slice indexing isn't supported with this functinoality!!"
+                )
+        elif type(idx) != int:
+            raise TypeError("Given index must be an integer!!")
+        elif idx <= -1 and not accept_negative:
+            raise IndexError(
+                "Negative indexing isn't supported with this functinoality!!"
+            )
+        elif idx < -len(self) or idx > len(self):
+            raise IndexError("Given index is out of the boundaries!!")
+
+    def _normalize_index(self, idx):
+        """
+        Validates the given index of an existing item and converts it to a
+        non-negative one.
+
+        Parameters
+        ----------
+        idx: int
+            The index value which could be negative.
+
+        Returns
+        -------
+        int:
+            The equivalent non-negative index.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `ImplicitTreap()` boundaries.
+        """
+        self._validate_index(idx, accept_negative=True)
+        if idx == len(self):
+            raise IndexError("Given index is out of the boundaries!!")
+        return idx + len(self) if idx <= -1 else idx
+
+    def _get_node(self, idx):
+        """
+        Finds the node at the given position by using the subtree sizes to
+        decide which child to descend to.
+
+        Parameters
+        ----------
+        idx: int
+            A non-negative index of an existing item.
+
+        Returns
+        -------
+        ImplicitTreapNode():
+            The node at the given position.
+        """
+        assert 0 <= idx < len(self)
+
+        node = self._root
+        while True:
+            left_size = node.get_left().get_size() if node.get_left() else 0
+            if idx < left_size:
+                node = node.get_left()
+            elif idx == left_size:
+                return node
+            else:
+                idx -= left_size + 1
+                node = node.get_right()
+
+    def __getitem__(self, idx):
+        """
+        Retrieves the item at the given index. The given index could be a
+        zero-based `int` or a `slice` object and it supports negative
+        indexing as well. An item is retrieved in O(log(n)) where **n** is
+        the length of the instance. A contiguous slice is cut out in
+        O(log(n)), copied in O(k) where **k** is the length of the slice, and
+        put back in O(log(n)).
+
+        Parameters
+        ----------
+        idx: int or slice
+            The index (multiple indices) to be used to retrieve items from the
+            `ImplicitTreap()` instance.
+
+        Returns
+        -------
+        object or ImplicitTreap():
+            If the given index is an `int`, then it returns the item at that
+            index. If the given index is a `slice` object, then it returns an
+            `ImplicitTreap()` instance containing the desired items.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `ImplicitTreap()` boundaries.
+
+        Examples
+        --------
+        >>> itreap = ImplicitTreap(["a", "b", "c", "d", "e"], seed=7)
+        >>> itreap[0]
+        'a'
+        >>> itreap[-2]
+        'd'
+        >>> itreap[1:4].to_list()
+        ['b', 'c', 'd']
+        >>> itreap[::2].to_list()
+        ['a', 'c', 'e']
+        >>> itreap[10]
+        IndexError: Given index is out of the boundaries!!
+        """
+        if not isinstance(idx, slice):
+            return self._get_node(self._normalize_index(idx)).get_data()
+        out_itreap = self._empty_like()
+        start, stop, step = idx.indices(len(self))
+        if step == 1:
+            if start < stop:
+                left, rest = self._split_nodes(self._root, start)
+                middle, right = self._split_nodes(rest, stop - start)
+                nodes = self._iter_inorder_nodes(middle)
+                out_itreap._root = self._build_nodes(
+                    node.get_data() for node in nodes
+                )
+                self._root = self._join_nodes(
+                    self._join_nodes(left, middle), right
+                )
+        else:
+            out_itreap._root = self._build_nodes(
+                self._get_node(i).get_data() for i in range(start, stop, step)
+            )
+        return out_itreap
+
+    def __setitem__(self, idx, item):
+        """
+        Replaces the item at the given index in the `ImplicitTreap()` instance
+        with the given item in time-complexity of O(log(n)) where **n** is the
+        length of the instance.
+
+        Parameters
+        ----------
+        idx: int
+            An integer pointing to the index of the item to be replaced. It
+            could be negative.
+        item: object
+            The new object.
+
+        Raises
+        ------
+        IndexError:
+            If the given index is out of the boundaries.
+        ValueError:
+            If the given object is `None`.
+        TypeError:
+            This get raised in one of the following cases:
+                1. If the given index type is not `int`.
+                2. If the given object is an instance of `Extra`.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b", "c"], seed=7)
+        >>> itreap[0] = "x"
+        >>> itreap[-1] = "z"
+        >>> itreap.to_list()
+        ['x', 'b', 'z']
+        >>> itreap[3] = "w"
+        IndexError: Given index is out of the boundaries!!
+        """
+        node = self._get_node(self._normalize_index(idx))
+        super()._validate_item(item)
+        node._data = item
+        self._version += 1
+
+    # =============================    INSERT    ==============================
+    def insert(self, idx, item):
+        """
+        Inserts an item to the `ImplicitTreap()` instance at a position defined
+        by the given index. The instance is split at the given index, then the
+        new node is joined in between the two parts. So, the time-complexity
+        is O(log(n)) where **n** is the length of the instance.
+
+        Parameters
+        ----------
+        idx: int
+            An integer pointing to the index at which the given item should be
+            inserted.
+        item: object
+            An object to be inserted.
+
+        Raises
+        ------
+        IndexError:
+            This happens in one of the following cases:
+                1. If the given index is out of the `ImplicitTreap()`
+                boundaries.
+                2. If the given index is less than zero (-ve).
+        TypeError:
+            This happens in one of the following cases:
+                1. If the given index isn't integer.
+                2. If the given item is an instance of `Extra`.
+        ValueError:
+            If the given item is `None`.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b", "c"], seed=7)
+        >>> itreap.insert(1, "x")
+        >>> itreap.to_list()
+        ['a', 'x', 'b', 'c']
+        >>> itreap.insert(5, "y")
+        IndexError: Given index is out of the boundaries!!
+        >>> itreap.insert(-1, "y")
+        IndexError: Negative indexing isn't supported with this functinoality!!
+        """
+        self._validate_index(idx)
+        new_node = self._create_node(item)
+        left, right = self._split_nodes(self._root, idx)
+        self._root = self._join_nodes(
+            self._join_nodes(left, new_node), right
+        )
+        self._version += 1
+
+    def add_front(self, item):
+        """
+        Adds the given item at the head of the `ImplicitTreap()` instance in
+        time-complexity of O(log(n)) where **n** is the length of the
+        instance.
+
+        Parameters
+        ----------
+        item: object
+            An object to be added.
+
+        Raises
+        ------
+        TypeError:
+            If the given item is an instance of `Extra`.
+        ValueError:
+            If the given item is `None`.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b"], seed=7)
+        >>> itreap.add_front("x")
+        >>> itreap.to_list()
+        ['x', 'a', 'b']
+        """
+        self._root = self._join_nodes(self._create_node(item), self._root)
+        self._version += 1
+
+    def add_end(self, item):
+        """
+        Adds the given item at the tail of the `ImplicitTreap()` instance in
+        time-complexity of O(log(n)) where **n** is the length of the
+        instance.
+
+        Parameters
+        ----------
+        item: object
+            An object to be added.
+
+        Raises
+        ------
+        TypeError:
+            If the given item is an instance of `Extra`.
+        ValueError:
+            If the given item is `None`.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b"], seed=7)
+        >>> itreap.add_end("x")
+        >>> itreap.to_list()
+        ['a', 'b', 'x']
+        """
+        self._root = self._join_nodes(self._root, self._create_node(item))
+        self._version += 1
+
+    # =============================    REMOVE    ==============================
+    def __delitem__(self, idx):
+        """
+        Deletes the item at the given index, or the items of the given slice,
+        from the `ImplicitTreap()` instance. A single item or a contiguous
+        slice is cut out in O(log(n)) where **n** is the length of the
+        instance. Slices with other steps delete their items one by one in
+        O(k*log(n)) where **k** is the length of the slice.
+
+        Parameters
+        ----------
+        idx: int or slice
+            An integer pointing to the index of the item to be removed, or a
+            `slice` object of the items to be removed. Negative indices are
+            supported.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the boundaries.
+
+        Examples
+        --------
+        >>> itreap = ImplicitTreap(["a", "b", "c", "d", "e"], seed=7)
+        >>> del itreap[1]
+        >>> itreap.to_list()
+        ['a', 'c', 'd', 'e']
+        >>> del itreap[1:3]
+        >>> itreap.to_list()
+        ['a', 'e']
+        >>> del itreap[5]
+        IndexError: Given index is out of the boundaries!!
+        """
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            indices = range(start, stop, step)
+            if step != 1:
+                for i in sorted(indices, reverse=True):
+                    del self[i]
+                return
+        else:
+            start = self._normalize_index(idx)
+            stop = start + 1
+        if start < stop:
+            left, rest = self._split_nodes(self._root, start)
+            _, right = self._split_nodes(rest, stop - start)
+            self._root = self._join_nodes(left, right)
+            self._version += 1
+
+    def clear(self):
+        """
+        Removes all nodes within the `ImplicitTreap()` instance in constant
+        time.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b", "c"], seed=7)
+        >>> itreap.clear()
+        >>> itreap.is_empty()
+        True
+        """
+        self._root = None
+
+    # ============================= SPLIT/CONCAT ==============================
+    def split_at(self, idx):
+        """
+        Splits the `ImplicitTreap()` instance into two instances based on the
+        given index in time-complexity of O(log(n)) where **n** is the length
+        of the instance. We can consider `idx` as the start index of the
+        second instance after splitting. No node is created, so the current
+        instance becomes empty.
+
+        Parameters
+        ----------
+        idx: int
+            A positive integer pointing to the index at which the
+            `ImplicitTreap()` instance should be split.
+
+        Returns
+        -------
+        ImplicitTreap():
+            The left `ImplicitTreap()` instance returned after split.
+        ImplicitTreap():
+            The right `ImplicitTreap()` instance returned after split.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is either negative or out of the
+            `ImplicitTreap()` boundaries.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b", "c", "d", "e"], seed=7)
+        >>> left, right = itreap.split_at(2)
+        >>> left.to_list()
+        ['a', 'b']
+        >>> right.to_list()
+        ['c', 'd', 'e']
+        >>> itreap.is_empty()
+        True
+        """
+        self._validate_index(idx)
+        left, right = self._empty_like(), self._empty_like()
+        left._root, right._root = self._split_nodes(self._root, idx)
+        self._root = None
+        return left, right
+
+    def concat(self, other):
+        """
+        Appends the items of the given `ImplicitTreap()` instance to the end
+        of the current one in time-complexity of O(log(n+m)) where **n** and
+        **m** are the lengths of the two instances. No node is created, so
+        the other instance becomes empty.
+
+        Parameters
+        ----------
+        other: ImplicitTreap()
+            The `ImplicitTreap()` instance whose items will be appended.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't an `ImplicitTreap()` instance.
+        ValueError:
+            If the given object is the current instance.
+
+        Example
+        -------
+        >>> itreap = ImplicitTreap(["a", "b"], seed=7)
+        >>> other = ImplicitTreap(["c", "d"])
+        >>> itreap.concat(other)
+        >>> itreap.to_list()
+        ['a', 'b', 'c', 'd']
+        >>> other.is_empty()
+        True
+        >>> itreap.concat(["e"])
+        TypeError: Type Mismatch! Can't concat `extra.ImplicitTreap()` with
+        `<class 'list'>`!!
+        """
+        if not isinstance(other, ImplicitTreap):
+            raise TypeError(
+                "Type Mismatch! "
+                + f"Can't concat `{self.__name__}` with `{type(other)}`!!"
+            )
+        elif other is self:
+            raise ValueError(
+                f"Can't concat `{self.__name__}` with itself!!"
+            )
+        self._root = self._join_nodes(self._root, other._root)
+        other._root = None
+        self._version += 1
+        other._version += 1
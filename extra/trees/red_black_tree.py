@@ -56,7 +56,7 @@ class RedBlackNode(BSTNode):
 
     __name__ = "extra.RedBlackNode()"
 
-    def __init__(self, value, color=Color.RED):
+    def __init__(self, value, color=Color.RED, numeric_only=True):
         """
         Creates a `RedBlackNode()` object which is the basic unit for building
         `RedBlackTree()` objects!!
@@ -68,11 +68,14 @@ class RedBlackNode(BSTNode):
         color: Enum (default:Color.RED)
             The color of the node, it can be either `Color.RED` or
             `Color.BLACK`.
+        numeric_only: bool (default: True)
+            If `False`, the value can be any object accepted by `TreeNode()`.
 
         Raises
         ------
         TypeError:
-            If the given `value` isn't a number.
+            If the given `value` isn't a number while `numeric_only` is
+            `True`.
         ValueError:
             This can be raised in two cases:
                 1. If the given `value` is `None`.
@@ -80,7 +83,7 @@ class RedBlackNode(BSTNode):
         """
         if color not in {Color.RED, Color.BLACK}:
             raise ValueError(f"Invalid color for `{self.__name__}`!!")
-        super().__init__(value)
+        super().__init__(value, numeric_only)
         self._color = color
 
     def get_color(self):
@@ -216,7 +219,9 @@ class RedBlackTree(BST):
     _basic_node = RedBlackNode
     __name__ = "extra.RedBlackTree()"
 
-    def __init__(self, iterable=None):
+    def __init__(
+        self, iterable=None, aggregate=None, threaded=False, numeric_only=True
+    ):
         """
         A class method which creates a `RedBlackTree()` instance using an
         iterable in time-complexity of O(n) where **n** is the number of
@@ -227,14 +232,27 @@ class RedBlackTree(BST):
         iterable: iterable (default: None)
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        aggregate: str or tuple (default: None)
+            An associative aggregate cached on every subtree to answer
+            `aggregate()` queries. It's either one of "sum", "min", "max" and
+            "count"; or a `(function, identity)` pair.
+        threaded: bool (default: False)
+            If `True`, every node keeps links to its in-order predecessor and
+            successor, so in-order traversals walk them without any stack.
+        numeric_only: bool (default: True)
+            If `False`, any values that can be compared with each other are
+            accepted instead of numbers only, like the entries stored by
+            `extra.TreeMap()`.
 
         Raises
         ------
         TypeError:
-            It can be raised in three cases
+            It can be raised in four cases
                 1. In case the given object isn't iterable.
                 2. If one of the elements in the iterable is an `Extra` object.
                 3. If one of the elements in the iterable is NOT a number.
+                4. If the given `threaded` or `numeric_only` isn't a \
+                    boolean.
         ValueError:
             If one of the iterable elements is `None`.
 
@@ -269,7 +287,32 @@ class RedBlackTree(BST):
         TypeError: Can't create `extra.RedBlackTree()` using \
 `extra.RedBlackTree()`!!
         """
-        super().__init__(iterable)
+        super().__init__(iterable, aggregate, threaded, numeric_only)
+
+    def _build_balanced(self, values):
+        """
+        Builds the empty `RedBlackTree()` instance out of the given values as
+        a perfectly-balanced tree. Then, the nodes of the deepest level are
+        colored red if this level isn't full and all other nodes are colored
+        black. This way, every path from the root to a leaf has the same
+        number of black nodes.
+
+        Parameters
+        ----------
+        values: list
+            A list of valid numeric values sorted in strictly ascending order.
+        """
+        super()._build_balanced(values)
+        length = len(self)
+        # all levels but the deepest are full, so the deepest level starts
+        # right after the first `2^depth - 1` nodes in breadth-first order
+        if length & (length + 1):
+            first_red = (1 << (length.bit_length() - 1)) - 1
+        else:
+            first_red = length
+        nodes = self._iter_level_order_nodes(self._root)
+        for idx, node in enumerate(nodes):
+            node.set_color(Color.RED if idx >= first_red else Color.BLACK)
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -504,40 +547,38 @@ class RedBlackTree(BST):
         """
         assert isinstance(start_node, self._basic_node)
 
-        # get basic info
-        uncle = start_node.get_uncle()
-        parent = start_node.get_parent()
-        grandparent = parent.get_parent() if parent else None
-        # recolor when node has a grandparent
-        if parent is None or grandparent is None:
-            return parent if parent else start_node
-
-        # case I
-        if parent.get_color() == Color.BLACK:
-            # do nothing
-            # print("Case I")
-            return self._root
-        else:
+        node = start_node
+        while True:
+            # get basic info
+            parent = node.get_parent()
+            grandparent = parent.get_parent() if parent else None
+            # recolor when node has a grandparent
+            if parent is None or grandparent is None:
+                return parent if parent else node
+            # case I (a black node can't break the red-black rules)
+            if (parent.get_color() == Color.BLACK
+                    or node.get_color() == Color.BLACK):
+                # do nothing
+                return self._root
+            uncle = node.get_uncle()
             # case II
             if uncle and uncle.get_color() == Color.RED:
-                # print("Case II")
                 parent.set_color(Color.BLACK)
                 uncle.set_color(Color.BLACK)
                 grandparent.set_color(Color.RED)
             # case III
             else:
-                # print("Case III")
                 # get great grandparent
                 great_grandparent = grandparent.get_parent()
-                grandparent = self.__recolor_case3(start_node)
+                grandparent = self.__recolor_case3(node)
                 # set connection
                 if great_grandparent:
                     if great_grandparent.get_data() > grandparent.get_data():
                         great_grandparent.set_left(grandparent)
                     else:
                         great_grandparent.set_right(grandparent)
-            # recursively do the same over grandparent
-            return self.__recolor(grandparent)
+            # do the same over grandparent
+            node = grandparent
 
     # =============================    INSERT    ==============================
     def insert(self, value):
@@ -571,17 +612,30 @@ class RedBlackTree(BST):
         TypeError: `extra.RedBlackTree()` accepts only numbers!!
         """
         super()._validate_item(value)
+        self._version += 1
         if self.is_empty():
-            self._root = self._basic_node(value)
+            self._root = self._create_node(value)
             self._root.set_color(Color.BLACK)
             self._length += 1
         else:
             # insert new node
             new_node = super()._insert(value)
-            # recolor starting from new_node till root
-            self._root = self.__recolor(new_node)
-            # root is always black (isn't essential tho!!)
-            self._root.set_color(Color.BLACK)
+            self._insert_fixup(new_node)
+
+    def _insert_fixup(self, new_node):
+        """
+        Recolors the `RedBlackTree()` instance starting from the given new
+        node till the root, rotating when needed.
+
+        Parameters
+        ----------
+        new_node: RedBlackNode()
+            A reference to the newly-linked node.
+        """
+        # recolor starting from new_node till root
+        self._root = self.__recolor(new_node)
+        # root is always black (isn't essential tho!!)
+        self._root.set_color(Color.BLACK)
 
     # =============================    REMOVAL   ==============================
     def _find_replacement(self, node):
@@ -688,29 +742,26 @@ class RedBlackTree(BST):
 
         SRC: https://www.programiz.com/dsa/deletion-from-a-red-black-tree
         """
-        # TODO: should be refactored
         assert isinstance(parent, RedBlackNode)
         assert (
             double_black_node is None
             or isinstance(double_black_node, RedBlackNode)
         )
 
-        while double_black_node != self._root and (
-            not double_black_node
+        while double_black_node is not self._root and (
+            double_black_node is None
             or double_black_node.get_color() == Color.BLACK
         ):
             # double black node is the left-child
-            if double_black_node == parent.get_left():
+            if double_black_node is parent.get_left():
                 sibling = parent.get_right()
                 # Case IV
-                if sibling and sibling.get_color() == Color.RED:
+                if sibling.get_color() == Color.RED:
                     sibling.set_color(Color.BLACK)
                     parent.set_color(Color.RED)
                     grandparent = parent.get_parent()
-                    parent = super()._rotate_left(parent)
-                    super()._attach(grandparent, parent)
-                    # update parent and sibling
-                    parent = parent.get_left()
+                    super()._attach(grandparent, super()._rotate_left(parent))
+                    # update sibling
                     sibling = parent.get_right()
                 # check sibling children
                 s_left_child = sibling.get_left()
@@ -726,7 +777,9 @@ class RedBlackTree(BST):
                 if (s_left_color == Color.BLACK
                         and s_right_color == Color.BLACK):
                     sibling.set_color(Color.RED)
+                    # move the double black up
                     double_black_node = parent
+                    parent = parent.get_parent()
                 # Case II
                 else:
                     if s_right_color == Color.BLACK:
@@ -734,29 +787,23 @@ class RedBlackTree(BST):
                         sibling.set_color(Color.RED)
                         sibling = super()._rotate_right(sibling)
                         super()._attach(parent, sibling)
-                        sibling = parent.get_right()
-
                     sibling.set_color(parent.get_color())
                     parent.set_color(Color.BLACK)
-                    s_right_child = sibling.get_right()
-                    s_right_child.set_color(Color.BLACK)
+                    sibling.get_right().set_color(Color.BLACK)
                     grandparent = parent.get_parent()
-                    parent = super()._rotate_left(parent)
-                    super()._attach(grandparent, parent)
+                    super()._attach(grandparent, super()._rotate_left(parent))
                     double_black_node = self._root
             # ===== Mirror image of the previous if-condition =====
             # double black node is the right-child
             else:
                 sibling = parent.get_left()
                 # Case IV
-                if sibling and sibling.get_color() == Color.RED:
+                if sibling.get_color() == Color.RED:
                     sibling.set_color(Color.BLACK)
                     parent.set_color(Color.RED)
                     grandparent = parent.get_parent()
-                    parent = super()._rotate_right(parent)
-                    super()._attach(grandparent, parent)
-                    # update parent and sibling
-                    parent = parent.get_right()
+                    super()._attach(grandparent, super()._rotate_right(parent))
+                    # update sibling
                     sibling = parent.get_left()
                 # check sibling children
                 s_left_child = sibling.get_left()
@@ -769,10 +816,12 @@ class RedBlackTree(BST):
                     s_right_child.get_color() if s_right_child else Color.BLACK
                 )
                 # Case III
-                if (s_right_color == Color.BLACK
+                if (s_left_color == Color.BLACK
                         and s_right_color == Color.BLACK):
                     sibling.set_color(Color.RED)
+                    # move the double black up
                     double_black_node = parent
+                    parent = parent.get_parent()
                 # Case II
                 else:
                     if s_left_color == Color.BLACK:
@@ -780,30 +829,30 @@ class RedBlackTree(BST):
                         sibling.set_color(Color.RED)
                         sibling = super()._rotate_left(sibling)
                         super()._attach(parent, sibling)
-                        sibling = parent.get_left()
-
                     sibling.set_color(parent.get_color())
                     parent.set_color(Color.BLACK)
-                    s_left_child = sibling.get_left()
-                    s_left_child.set_color(Color.BLACK)
+                    sibling.get_left().set_color(Color.BLACK)
                     grandparent = parent.get_parent()
-                    parent = super()._rotate_right(parent)
-                    super()._attach(grandparent, parent)
+                    super()._attach(grandparent, super()._rotate_right(parent))
                     double_black_node = self._root
+        # a red node absorbs the extra black
+        if double_black_node is not None:
+            double_black_node.set_color(Color.BLACK)
         # make sure root is always black
         self._root.set_color(Color.BLACK)
 
     def remove(self, del_value):
         """
-        Removes the `del_value` from the `RedBlackTree()` instance which is one
-        of the following cases:
+        Removes the `del_value` from the `RedBlackTree()` instance. If the
+        removed node has two children, its value is exchanged with its
+        replacement first. Then, the node to be unlinked has one child at most
+        which leads to one of the following cases:
 
-        - Case I  : The removed node is 'red', and its replacement is either \
-            'red' or None.
-        - Case II : The removed node is 'red', and its replacement is 'black'.
-        - Case III: The removed node is 'black', and its replacement is \
-            either 'black' or None.
-        - Case IV : The removed node is 'black', and its replacement is 'red'.
+        - Case I  : The unlinked node is 'red'. It's simply unlinked.
+        - Case II : The unlinked node is 'black' and its child is 'red'. The \
+            child takes its place and gets colored 'black'.
+        - Case III: The unlinked node is a 'black' leaf. Unlinking it \
+            creates a double-black node which is handled iteratively.
 
         Parameters
         ----------
@@ -844,7 +893,7 @@ class RedBlackTree(BST):
         if self.is_empty():
             warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
             return
-        elif type(del_value) not in {int, float}:
+        elif not self._is_valid_value(del_value):
             warnings.warn(
                 f"Couldn't find `{del_value}` in `{self.__name__}`!!",
                 UserWarning
@@ -853,6 +902,7 @@ class RedBlackTree(BST):
         elif self._root.is_leaf() and del_value == self._root.get_data():
             self._root = None
             self._length -= 1
+            self._refresh_fingers()
             return
 
         # search for the del_value node
@@ -864,60 +914,49 @@ class RedBlackTree(BST):
                 UserWarning
             )
             return
-        # find replacement
-        replacement = self._find_replacement(removed_node)
-        # print("replacement:", replacement)
-
-        # Case I (replace red-node with red-node/None)
-        if removed_node.get_color() == Color.RED and (
-            replacement is None or replacement.get_color() == Color.RED
-        ):
-            # print("Case I (replace red-node with red-node/None)")
-            super()._transplant(removed_node, replacement)
-
-        # Case II (replace red-node with black-node)
-        elif (
-            removed_node.get_color() == Color.RED
-            and replacement.get_color() == Color.BLACK
-        ):
-            # print("Case II (replace red-node with black-node)")
-            raise ValueError("Debug this, this case shouldn't occur!!")
-
-        # Case III (replace black-node with black-node)
-        elif removed_node.get_color() == Color.BLACK and (
-            replacement is None or replacement.get_color() == Color.BLACK
-        ):
-            # print("Case III (double black-node)")
-            if replacement:
-                parent = replacement.get_parent()
+        self._version += 1
+        # a node with two children exchanges its value (not its color) with
+        # its replacement which has one child at most
+        if removed_node.get_left() and removed_node.get_right():
+            replacement = self._find_replacement(removed_node)
+            BSTNode.swap(removed_node, replacement)
+            removed_node = replacement
+        if self._threaded:
+            self._unthread_node(removed_node)
+        parent = removed_node.get_parent()
+        child = (
+            removed_node.get_left()
+            if removed_node.get_left()
+            else removed_node.get_right()
+        )
+        # NOTE: `is_left_child()` compares values which might be swapped
+        is_left_child = (
+            parent is not None and parent.get_left() is removed_node
+        )
+        # Case II (replace black-node with its red child)
+        if child is not None:
+            child.set_color(Color.BLACK)
+            if parent is None:
+                child.set_parent(None)
+                self._root = child
+            elif is_left_child:
+                parent.set_left(child)
             else:
-                parent = removed_node.get_parent()
-            # do the transplant
-            super()._transplant(removed_node, replacement)
-            # get double black node
-            if replacement is None:
-                if parent.get_left() is None:
-                    double_black_node = parent.get_left()
-                else:
-                    double_black_node = parent.get_right()
+                parent.set_right(child)
+            self._update_ancestors(parent)
+        else:
+            # unlink the leaf node
+            if is_left_child:
+                parent.set_left(None)
             else:
-                if replacement.get_data() < parent.get_data():
-                    double_black_node = parent.get_left()
-                else:
-                    double_black_node = parent.get_right()
-            # handle this double black
-            self.__handle_double_black(parent, double_black_node)
-
-        # Case IV (replace black-node with red-node/None)
-        elif (
-            removed_node.get_color() == Color.BLACK
-            and replacement.get_color() == Color.RED
-        ):
-            replacement.set_color(Color.BLACK)
-            # print("Case IV (replace black-node with red-node/None)")
-            super()._transplant(removed_node, replacement)
+                parent.set_right(None)
+            self._update_ancestors(parent)
+            # Case III (double black-node)
+            if removed_node.get_color() == Color.BLACK:
+                self.__handle_double_black(parent, None)
         # decrease the length
         self._length -= 1
+        self._refresh_fingers()
 
     def clear(self):
         """
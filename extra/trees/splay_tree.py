@@ -27,15 +27,20 @@ the following:
 
 .. code-block:: text
 
-        __4.5
-       /     \\
-      3       5
-     / \\       \\
-    2   4       6
+          4.5
+         /   \\
+        4     5
+       /       \\
+      3         6
+     /
+    2
 
 As we can see, the newly-inserted node has been moved to the root which makes
 it faster to be accessed for later usage. This happens with all searching,
-insertion and deletion.
+insertion and deletion. Splaying is done top-down while descending the tree,
+so each of these operations walks down the tree only once. For read-heavy
+workloads, the `splay_every` option lets only every k-th search restructure
+the tree.
 """
 import warnings
 from extra.trees.bst import BST
@@ -53,7 +58,9 @@ class SplayTree(BST):
 
     __name__ = "extra.SplayTree()"
 
-    def __init__(self, iterable=None):
+    def __init__(
+        self, iterable=None, aggregate=None, splay_every=1, numeric_only=True
+    ):
         """
         Initializes a `SplayTree()` instance using an optional iterable object
         in time-complexity of O(n) where **n** is the number of elements inside
@@ -64,16 +71,34 @@ class SplayTree(BST):
         iterable: iterable, optional
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        aggregate: str or tuple (default: None)
+            An associative aggregate cached on every subtree to answer
+            `aggregate()` queries. It's either one of "sum", "min", "max" and
+            "count"; or a `(function, identity)` pair.
+        splay_every: int (default: 1)
+            How often read-only accesses (searching and neighbor lookups)
+            restructure the tree. Only every `splay_every`-th access splays
+            the accessed node to the root while the others leave the tree
+            untouched which suits read-heavy workloads. Insertion and removal
+            always splay.
+        numeric_only: bool (default: True)
+            If `False`, any values that can be compared with each other are
+            accepted instead of numbers only, like the entries stored by
+            `extra.TreeMap()`.
 
         Raises
         ------
         TypeError:
-            It can be raised in two cases
+            It can be raised in five cases
                 1. In case the given object isn't iterable.
                 2. If one of the elements in the iterable is an `Extra` object.
                 3. If one of the elements in the iterable is NOT a number.
+                4. If the given `splay_every` isn't an integer.
+                5. If the given `numeric_only` isn't a boolean.
         ValueError:
-            If one of the iterable elements is `None`.
+            It can be raised in two cases
+                1. If one of the iterable elements is `None`.
+                2. If the given `splay_every` isn't positive.
 
         Examples
         --------
@@ -101,8 +126,36 @@ class SplayTree(BST):
         >>> stree_1 = SplayTree([1])
         >>> stree_2 = SplayTree([1, stree_1])
         TypeError: Can't create `extra.SplayTree()` using `extra.SplayTree()`!!
+
+        Using `splay_every=2` makes only every other search splay the tree
+
+        >>> stree = SplayTree([2, 5, 4, 6, 3], splay_every=2)
+        >>> 6 in stree
+        True
+        >>> stree
+          3__
+         /   \\
+        2     5
+             / \\
+            4   6
+        >>> 6 in stree
+        True
+        >>> stree
+                6
+               /
+            __5
+           /
+          3
+         / \\
+        2   4
         """
-        super().__init__(iterable)
+        if type(splay_every) != int:
+            raise TypeError("The splaying frequency must be an integer!!")
+        elif splay_every < 1:
+            raise ValueError("The splaying frequency must be positive!!")
+        self._splay_every = splay_every
+        self._access_count = 0
+        super().__init__(iterable, aggregate, numeric_only=numeric_only)
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -293,34 +346,29 @@ class SplayTree(BST):
     def __splaying(self, start_node):
         assert isinstance(start_node, self._basic_node)
         child = start_node
-        parent = child.get_parent()
-        if parent is None:
-            return start_node
-        grand_parent = child.get_grand_parent()
-        # get the operation type
-        if grand_parent is None:
-            if child.is_left_child():
-                root = self.__zig(child)
-            else:
-                root = self.__zag(child)
-        else:
+        # keep rotating until `child` becomes the root of the whole tree
+        while child.get_parent() is not None:
+            parent = child.get_parent()
+            grand_parent = child.get_grand_parent()
+            # get the operation type
+            if grand_parent is None:
+                if child.is_left_child():
+                    child = self.__zig(child)
+                else:
+                    child = self.__zag(child)
             # left -> left
-            if parent.is_left_child() and child.is_left_child():
-                grand_parent = self.__zig_zig(child)
+            elif parent.is_left_child() and child.is_left_child():
+                child = self.__zig_zig(child)
             # left -> right
             elif parent.is_left_child() and not child.is_left_child():
-                grand_parent = self.__zig_zag(child)
+                child = self.__zig_zag(child)
             # right -> left
             elif not parent.is_left_child() and child.is_left_child():
-                grand_parent = self.__zag_zig(child)
+                child = self.__zag_zig(child)
             # right -> right
             else:
-                grand_parent = self.__zag_zag(child)
-            if grand_parent.get_parent() is not None:
-                root = self.__splaying(grand_parent)
-            else:
-                root = grand_parent
-        return root
+                child = self.__zag_zag(child)
+        return child
 
     def _splay(self, start_node):
         """
@@ -334,6 +382,98 @@ class SplayTree(BST):
             A reference to the root of the subtree.
         """
         self._root = self.__splaying(start_node)
+        self._version += 1
+
+    def _splay_top_down(self, value, start_node):
+        """
+        Splays the node holding the given value to the root of the subtree
+        whose root is the given `start_node` in a single top-down pass. If
+        the value doesn't exist, the last accessed node is splayed instead.
+        While descending, the nodes that are less than the value are hung on
+        a left tree and the ones greater than the value are hung on a right
+        tree. Then, both trees become the children of the splayed node. So,
+        no recursion nor parent pointers are needed while descending.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be splayed.
+        start_node: BSTNode()
+            A reference to the root of the subtree.
+
+        Returns
+        -------
+        BSTNode():
+            The new root of the subtree.
+
+        Raises
+        ------
+        AssertionError:
+            If the given `start_node` isn't a `BSTNode()`.
+        """
+        assert isinstance(start_node, self._basic_node)
+
+        self._version += 1
+        # nodes hung on the left/right trees in the order they were visited
+        left_nodes, right_nodes = [], []
+        curr_node = start_node
+        while value != curr_node.get_data():
+            if value < curr_node.get_data():
+                child = curr_node.get_left()
+                if child is None:
+                    break
+                # left -> left: rotate right before hanging
+                if value < child.get_data():
+                    curr_node.set_left(child.get_right())
+                    child.set_right(curr_node)
+                    curr_node = child
+                    if curr_node.get_left() is None:
+                        break
+                right_nodes.append(curr_node)
+                curr_node = curr_node.get_left()
+            else:
+                child = curr_node.get_right()
+                if child is None:
+                    break
+                # right -> right: rotate left before hanging
+                if value > child.get_data():
+                    curr_node.set_right(child.get_left())
+                    child.set_left(curr_node)
+                    curr_node = child
+                    if curr_node.get_right() is None:
+                        break
+                left_nodes.append(curr_node)
+                curr_node = curr_node.get_right()
+        # assemble the left & right trees bottom-up to refresh their caches
+        subtree = curr_node.get_left()
+        for node in reversed(left_nodes):
+            node.set_right(subtree)
+            subtree = node
+        curr_node.set_left(subtree)
+        subtree = curr_node.get_right()
+        for node in reversed(right_nodes):
+            node.set_left(subtree)
+            subtree = node
+        curr_node.set_right(subtree)
+        curr_node.set_parent(None)
+        return curr_node
+
+    def _is_splay_turn(self):
+        """
+        Counts a read-only access to the `SplayTree()` instance and decides
+        whether this access should splay the tree or not.
+
+        Returns
+        -------
+        bool:
+            `True` if this is every `splay_every`-th access, and `False`
+            otherwise.
+        """
+        self._access_count += 1
+        if self._access_count < self._splay_every:
+            return False
+        self._access_count = 0
+        return True
 
     # =============================    SEARCH    ==============================
     def __contains__(self, find_val):
@@ -391,9 +531,216 @@ class SplayTree(BST):
         root.
         """
         super()._validate_item(find_val)
-        node = super()._search(find_val, self._root)
-        self._splay(node)
-        return node.get_data() == find_val
+        if self.is_empty():
+            return False
+        elif not self._is_splay_turn():
+            node = super()._search(find_val, self._root)
+            return node.get_data() == find_val
+        self._root = self._splay_top_down(find_val, self._root)
+        return self._root.get_data() == find_val
+
+    # =============================   NEIGHBORS  ==============================
+    def floor(self, value):
+        """
+        Gets the biggest value in the `SplayTree()` instance that is less than
+        or equal to the given value. The node holding that value is splayed to
+        the root.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be compared against.
+
+        Returns
+        -------
+        int or float:
+            The biggest value that is less than or equal to the given value,
+            or `None` if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree
+          3__
+         /   \\
+        2     5
+             / \\
+            4   6
+        >>> stree.floor(4.5)
+        4
+        >>> stree
+            4
+           / \\
+          3   5
+         /     \\
+        2       6
+        """
+        super()._validate_item(value)
+        node = super()._floor_node(value)
+        if node is None:
+            return None
+        elif self._is_splay_turn():
+            self._splay(node)
+        return node.get_data()
+
+    def ceiling(self, value):
+        """
+        Gets the smallest value in the `SplayTree()` instance that is greater
+        than or equal to the given value. The node holding that value is
+        splayed to the root.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be compared against.
+
+        Returns
+        -------
+        int or float:
+            The smallest value that is greater than or equal to the given
+            value, or `None` if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree
+          3__
+         /   \\
+        2     5
+             / \\
+            4   6
+        >>> stree.ceiling(2.5)
+        3
+        >>> stree
+          3__
+         /   \\
+        2     5
+             / \\
+            4   6
+        """
+        super()._validate_item(value)
+        node = super()._ceiling_node(value)
+        if node is None:
+            return None
+        elif self._is_splay_turn():
+            self._splay(node)
+        return node.get_data()
+
+    def predecessor(self, value):
+        """
+        Gets the biggest value in the `SplayTree()` instance that is strictly
+        less than the given value. The node holding that value is splayed to
+        the root.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be compared against.
+
+        Returns
+        -------
+        int or float:
+            The biggest value that is less than the given value, or `None` if
+            there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree
+          3__
+         /   \\
+        2     5
+             / \\
+            4   6
+        >>> stree.predecessor(5)
+        4
+        >>> stree
+            4
+           / \\
+          3   5
+         /     \\
+        2       6
+        """
+        super()._validate_item(value)
+        node = super()._floor_node(value, strict=True)
+        if node is None:
+            return None
+        elif self._is_splay_turn():
+            self._splay(node)
+        return node.get_data()
+
+    def successor(self, value):
+        """
+        Gets the smallest value in the `SplayTree()` instance that is strictly
+        greater than the given value. The node holding that value is splayed
+        to the root.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be compared against.
+
+        Returns
+        -------
+        int or float:
+            The smallest value that is greater than the given value, or `None`
+            if there weren't any.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value is not a number.
+
+        Example
+        -------
+        >>> stree = SplayTree([2, 5, 4, 6, 3])
+        >>> stree
+          3__
+         /   \\
+        2     5
+             / \\
+            4   6
+        >>> stree.successor(5)
+        6
+        >>> stree
+                6
+               /
+            __5
+           /
+          3
+         / \\
+        2   4
+        """
+        super()._validate_item(value)
+        node = super()._ceiling_node(value, strict=True)
+        if node is None:
+            return None
+        elif self._is_splay_turn():
+            self._splay(node)
+        return node.get_data()
 
     # =============================    INSERT    ==============================
     def insert(self, value):
@@ -433,21 +780,50 @@ class SplayTree(BST):
         5
         >>> stree.insert(8)
         >>> stree
-          8___
-         /    \\
-        5     _15
-             /
-            10
+          8
+         / \\
+        5   10
+              \\
+               15
         >>> stree.insert("2")
         TypeError: `extra.SplayTree()` accepts only numbers!!
         """
         super()._validate_item(value)
         if self.is_empty():
-            self._root = super()._basic_node(value)
+            self._root = self._create_node(value)
             self._length += 1
+            return
+        root = self._splay_top_down(value, self._root)
+        self._root = root
+        if value == root.get_data():
+            warnings.warn(
+                f"`{value}` already exists in `{self.__name__}`", UserWarning
+            )
+            return
+        # the new node becomes the root and splits the splayed one
+        new_node = self._create_node(value)
+        if value < root.get_data():
+            new_node.set_left(root.get_left())
+            root.set_left(None)
+            new_node.set_right(root)
         else:
-            new_node = super()._insert(value)
-            self._splay(new_node)
+            new_node.set_right(root.get_right())
+            root.set_right(None)
+            new_node.set_left(root)
+        self._root = new_node
+        self._length += 1
+        self._update_fingers(new_node)
+
+    def _insert_fixup(self, new_node):
+        """
+        Splays the given new node to the root of the `SplayTree()` instance.
+
+        Parameters
+        ----------
+        new_node: BSTNode()
+            A reference to the newly-linked node.
+        """
+        self._splay(new_node)
 
     # =============================    REMOVAL   ==============================
     def remove(self, del_value):
@@ -476,30 +852,43 @@ class SplayTree(BST):
             4   6
         >>> stree.remove(5)
         >>> stree
-            __6
-           /
-          3
-         / \\
-        2   4
+            4
+           / \\
+          3   6
+         /
+        2
         >>> stree.remove(50)
         UserWarning: Couldn't find `50` in `extra.SplayTree()`!!
         """
         if self.is_empty():
             warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
             return
-        elif type(del_value) not in {int, float}:
+        elif not self._is_valid_value(del_value):
             warnings.warn(
                 f"Couldn't find `{del_value}` in `{self.__name__}`!!",
                 UserWarning
             )
             return
-        # check if splay tree has only one item and it's the one to be deleted
-        elif self._root.is_leaf() and del_value == self._root.get_data():
-            self._root = None
-            self._length -= 1
+        root = self._splay_top_down(del_value, self._root)
+        self._root = root
+        if del_value != root.get_data():
+            warnings.warn(
+                f"Couldn't find `{del_value}` in `{self.__name__}`!!",
+                UserWarning
+            )
+            return
+        left, right = root.get_left(), root.get_right()
+        if left is None:
+            self._root = right
         else:
-            node = super()._remove(del_value, self._root)
-            self._splay(node)
+            # the biggest value on the left is splayed up, it has no right
+            left.set_parent(None)
+            self._root = self._splay_top_down(del_value, left)
+            self._root.set_right(right)
+        if self._root is not None:
+            self._root.set_parent(None)
+        self._length -= 1
+        self._refresh_fingers()
 
     def clear(self):
         """
@@ -520,7 +909,9 @@ class SplayTree(BST):
         >>> stree.is_empty()
         True
         """
+        splay_every = self._splay_every
         super().clear()
+        self._splay_every = splay_every
 
     # ============================= HEIGHT/DEPTH ==============================
     def get_height(self):
@@ -36,6 +36,7 @@ node in the `Treap()`, you can set the static variable `SHOW_PRIORITY` to
 """
 import random
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from extra.trees.bst import BSTNode, BST
 
 
@@ -48,7 +49,7 @@ class TreapNode(BSTNode):
 
     __name__ = "extra.TreapNode()"
 
-    def __init__(self, data, priority=None):
+    def __init__(self, data, priority=None, numeric_only=True):
         """
         Creates a `TreapNode()` object which is the basic unit for building
         `Treap()` objects!!
@@ -59,6 +60,8 @@ class TreapNode(BSTNode):
             The value to be saved within the `TreapNode()` instance
         priority: int or float (default: None)
             A numeric value indicating the priority of the `TreapNode()`.
+        numeric_only: bool (default: True)
+            If `False`, the data can be any object accepted by `TreeNode()`.
 
         Raises
         ------
@@ -66,12 +69,13 @@ class TreapNode(BSTNode):
             If the given data is `None`.
         TypeError:
             It can be raised in the following two cases:
-                1. If the given data isn't a number.
+                1. If the given data isn't a number while `numeric_only` \
+                    is `True`.
                 2. If the given priority isn't a number.
         """
         if priority is not None and type(priority) not in {int, float}:
             raise TypeError("Given priority has to be a number!!")
-        super().__init__(data)
+        super().__init__(data, numeric_only)
         self._priority = (
             random.randint(0, 100)
             if priority is None
@@ -171,8 +175,18 @@ class Treap(BST):
     SHOW_PRIORITY = False
     _basic_node = TreapNode
     __name__ = "extra.Treap()"
-
-    def __init__(self, iterable=None, seed=None):
+    _set_operations = {
+        "union", "intersection", "difference", "symmetric_difference"
+    }
+
+    def __init__(
+        self,
+        iterable=None,
+        seed=None,
+        aggregate=None,
+        threaded=False,
+        numeric_only=True,
+    ):
         """
         Initializes a `Treap()` instance using an optional iterable object in
         time-complexity of O(n) where **n** is the number of elements inside
@@ -185,14 +199,27 @@ class Treap(BST):
             For example, `list` and `tuple` are both iterables.
         seed: int or float (default: None)
             A seed to generate consistent random numbers.
+        aggregate: str or tuple (default: None)
+            An associative aggregate cached on every subtree to answer
+            `aggregate()` queries. It's either one of "sum", "min", "max" and
+            "count"; or a `(function, identity)` pair.
+        threaded: bool (default: False)
+            If `True`, every node keeps links to its in-order predecessor and
+            successor, so in-order traversals walk them without any stack.
+        numeric_only: bool (default: True)
+            If `False`, any values that can be compared with each other are
+            accepted instead of numbers only, like the entries stored by
+            `extra.TreeMap()`.
 
         Raises
         ------
         TypeError:
-            It can be raised in three cases
+            It can be raised in four cases
                 1. In case the given object isn't iterable.
                 2. If one of the elements in the iterable is an `Extra` object.
                 3. If one of the elements in the iterable is NOT a number.
+                4. If the given `threaded` or `numeric_only` isn't a \
+                    boolean.
         ValueError:
             If one of the iterable elements is `None`.
 
@@ -246,7 +273,123 @@ class Treap(BST):
         TypeError: Can't create `extra.Treap()` using `extra.Treap()`!!
         """
         random.seed(seed)
-        super().__init__(iterable)
+        super().__init__(iterable, aggregate, threaded, numeric_only)
+
+    @classmethod
+    def from_sorted(cls, iterable, seed=None, aggregate=None):
+        """
+        A class method which creates a perfectly-balanced `Treap()` instance
+        using a sorted iterable object in time-complexity of O(n) where **n**
+        is the number of elements inside the given `iterable`. Random
+        priorities are drawn for all nodes, then they are assigned level by
+        level in descending order to keep the max-heap property.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method
+            whose elements are sorted in ascending order. Repeated values are
+            stored only once.
+        seed: int or float (default: None)
+            A seed to generate consistent random numbers.
+        aggregate: str or tuple (default: None)
+            An associative aggregate cached on every subtree to answer
+            `aggregate()` queries.
+
+        Returns
+        -------
+        Treap():
+            It returns a `Treap()` instance with input values being inserted.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in three cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+                3. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            It can be raised in two cases
+                1. If one of the iterable elements is `None`.
+                2. If the given iterable isn't sorted.
+
+        Examples
+        --------
+        >>> treap = Treap.from_sorted([1, 2, 3, 4, 5, 6, 7], seed=123)
+        >>> treap
+            __4__
+           /     \\
+          2       6
+         / \\     / \\
+        1   3   5   7
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        treap = cls(seed=seed, aggregate=aggregate)
+        treap._build_sorted(iterable)
+        return treap
+
+    @classmethod
+    def from_iterable(cls, iterable, seed=None, aggregate=None):
+        """
+        A class method which creates a perfectly-balanced `Treap()` instance
+        using any iterable object by sorting its values first then building
+        the tree the same way as `from_sorted()` does. So, the time-complexity
+        is O(n*log(n)) where **n** is the number of elements inside the given
+        `iterable`. If the given iterable is an instance of the BST family,
+        its values are already sorted and the time-complexity is O(n).
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            Repeated values are stored only once.
+        seed: int or float (default: None)
+            A seed to generate consistent random numbers.
+        aggregate: str or tuple (default: None)
+            An associative aggregate cached on every subtree to answer
+            `aggregate()` queries.
+
+        Returns
+        -------
+        Treap():
+            It returns a `Treap()` instance with input values being inserted.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in three cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is an `Extra` object.
+                3. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        treap = cls(seed=seed, aggregate=aggregate)
+        treap._build_unsorted(iterable)
+        return treap
+
+    def _build_balanced(self, values):
+        """
+        Builds the empty `Treap()` instance out of the given values as a
+        perfectly-balanced tree. Then, random priorities are assigned in
+        descending order to the nodes in breadth-first order, so every node
+        has a priority higher than (or equal to) its children.
+
+        Parameters
+        ----------
+        values: list
+            A list of valid numeric values sorted in strictly ascending order.
+        """
+        super()._build_balanced(values)
+        priorities = sorted(
+            (random.randint(0, 100) for _ in range(len(self))), reverse=True
+        )
+        nodes = self._iter_level_order_nodes(self._root)
+        for node, priority in zip(nodes, priorities):
+            node.set_priority(priority)
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -469,28 +612,41 @@ class Treap(BST):
         # validate inserted value
         super()._validate_item(value)
         self.__validate_priority(priority)
+        self._version += 1
         if self.is_empty():
-            self._root = self._basic_node(value, priority)
+            self._root = self._create_node(value, priority)
             self._length += 1
         else:
             # perform standard BST-insert
             new_node = super()._insert_node(
-                self._root, self._basic_node(value, priority)
+                self._root, self._create_node(value, priority)
             )
-            # using rotations when necessary
-            parent = new_node.get_parent()
-            while parent is not None:
-                grandparent = parent.get_parent()
-                if parent.get_priority() > new_node.get_priority():
-                    break
+            self._insert_fixup(new_node)
+
+    def _insert_fixup(self, new_node):
+        """
+        Rotates the given new node up till its parent has a higher priority
+        to restore the max-heap property of the `Treap()` instance.
+
+        Parameters
+        ----------
+        new_node: TreapNode()
+            A reference to the newly-linked node.
+        """
+        # using rotations when necessary
+        parent = new_node.get_parent()
+        while parent is not None:
+            grandparent = parent.get_parent()
+            if parent.get_priority() > new_node.get_priority():
+                break
+            else:
+                if new_node.is_left_child():
+                    parent = super()._rotate_right(parent)
                 else:
-                    if new_node.is_left_child():
-                        parent = super()._rotate_right(parent)
-                    else:
-                        parent = super()._rotate_left(parent)
-                    super()._attach(grandparent, parent)
-                    new_node = parent
-                    parent = grandparent
+                    parent = super()._rotate_left(parent)
+                super()._attach(grandparent, parent)
+                new_node = parent
+                parent = grandparent
 
     # =============================    REMOVE    ==============================
     def remove(self, del_value):
@@ -533,7 +689,7 @@ class Treap(BST):
         if self.is_empty():
             warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
             return
-        elif type(del_value) not in {int, float}:
+        elif not self._is_valid_value(del_value):
             warnings.warn(
                 f"Couldn't find `{del_value}` in `{self.__name__}`!!",
                 UserWarning
@@ -543,6 +699,7 @@ class Treap(BST):
         elif self._root.is_leaf() and del_value == self._root.get_data():
             self._root = None
             self._length -= 1
+            self._refresh_fingers()
         else:
             # search for the del_value node
             removed_node = super()._search(del_value, self._root)
@@ -553,6 +710,7 @@ class Treap(BST):
                     UserWarning
                 )
                 return
+            self._version += 1
             # rotate till removed_node is leaf
             parent = removed_node.get_parent()
             while not removed_node.is_leaf():
@@ -577,12 +735,16 @@ class Treap(BST):
                     parent = removed_node
                     removed_node = parent.get_left()
             # perform the removal
+            if self._threaded:
+                self._unthread_node(removed_node)
             if removed_node.is_left_child():
                 parent.set_left(None)
             else:
                 parent.set_right(None)
+            self._update_ancestors(parent)
             # decrement treap length
             self._length -= 1
+            self._refresh_fingers()
 
     def clear(self):
         """
@@ -607,6 +769,757 @@ class Treap(BST):
         """
         super().clear()
 
+    # =============================  SPLIT/JOIN  ==============================
+    def _empty_like(self):
+        """
+        Creates an empty `Treap()` instance that caches the same aggregate,
+        keeps the same threading and accepts the same values as the current
+        one. Unlike the constructor, it doesn't re-seed the random numbers
+        generator.
+
+        Returns
+        -------
+        Treap():
+            An empty `Treap()` instance.
+        """
+        treap = self.__class__.__new__(self.__class__)
+        super(Treap, treap).__init__(
+            threaded=self._threaded, numeric_only=self._numeric_only
+        )
+        treap._monoid = self._monoid
+        return treap
+
+    def _split_nodes(self, start_node, key):
+        """
+        Splits the subtree whose root is `start_node` into two subtrees; one
+        with values less than the given key and the other with values greater
+        than the given key. The node holding the key, if found, is returned
+        separately with its children removed. This is done by walking down
+        the path of the key and distributing its nodes between the right
+        spine of the left subtree and the left spine of the right subtree.
+
+        Parameters
+        ----------
+        start_node: TreapNode() or None
+            The root of the subtree to be split.
+        key: int or float
+            The value to split the subtree at.
+
+        Returns
+        -------
+        tuple:
+            A tuple of three items `(left, mid, right)` where `left` & `right`
+            are the roots of the two subtrees and `mid` is the node holding
+            the given key or `None` if it wasn't found. Any of them could be
+            `None`.
+        """
+        assert start_node is None or isinstance(start_node, self._basic_node)
+
+        left_path, right_path = [], []
+        mid = None
+        node = start_node
+        while node is not None:
+            if node.get_data() < key:
+                # node & its left subtree go to the left part
+                if left_path:
+                    left_path[-1].set_right(node)
+                left_path.append(node)
+                node = node.get_right()
+            elif node.get_data() > key:
+                # node & its right subtree go to the right part
+                if right_path:
+                    right_path[-1].set_left(node)
+                right_path.append(node)
+                node = node.get_left()
+            else:
+                mid = node
+                break
+        left_rest = mid.get_left() if mid is not None else None
+        right_rest = mid.get_right() if mid is not None else None
+        if left_path:
+            left_path[-1].set_right(left_rest)
+        if right_path:
+            right_path[-1].set_left(right_rest)
+        if mid is not None:
+            mid.set_left(None)
+            mid.set_right(None)
+        # sizes & aggregates along the two spines are fixed bottom-up
+        for node in reversed(left_path):
+            node._update_augmented_data()
+        for node in reversed(right_path):
+            node._update_augmented_data()
+        left = left_path[0] if left_path else left_rest
+        right = right_path[0] if right_path else right_rest
+        for node in (left, mid, right):
+            if node is not None:
+                node.set_parent(None)
+        return left, mid, right
+
+    def _join_nodes(self, left_node, right_node):
+        """
+        Joins the two given subtrees into one subtree assuming that all values
+        in the `left_node` subtree are less than all values in the
+        `right_node` subtree. This is done by merging the right spine of the
+        left subtree with the left spine of the right subtree according to
+        the priorities of their nodes.
+
+        Parameters
+        ----------
+        left_node: TreapNode() or None
+            The root of the subtree holding the smaller values.
+        right_node: TreapNode() or None
+            The root of the subtree holding the greater values.
+
+        Returns
+        -------
+        TreapNode() or None:
+            The root of the joined subtree.
+        """
+        assert left_node is None or isinstance(left_node, self._basic_node)
+        assert right_node is None or isinstance(right_node, self._basic_node)
+
+        root = None
+        path = []
+        # the side of the last node in path where the next node is attached
+        attach_right = True
+        while left_node is not None and right_node is not None:
+            if left_node.get_priority() >= right_node.get_priority():
+                node = left_node
+                left_node = left_node.get_right()
+                next_attach_right = True
+            else:
+                node = right_node
+                right_node = right_node.get_left()
+                next_attach_right = False
+            if not path:
+                root = node
+            elif attach_right:
+                path[-1].set_right(node)
+            else:
+                path[-1].set_left(node)
+            path.append(node)
+            attach_right = next_attach_right
+        rest = left_node if left_node is not None else right_node
+        if not path:
+            root = rest
+        elif attach_right:
+            path[-1].set_right(rest)
+        else:
+            path[-1].set_left(rest)
+        for node in reversed(path):
+            node._update_augmented_data()
+        if root is not None:
+            root.set_parent(None)
+        return root
+
+    def split(self, key):
+        """
+        Splits the `Treap()` instance into two `Treap()` instances; the first
+        has all values less than the given key while the second has all
+        values greater than or equal to the given key. No node is created or
+        rotated, so the time-complexity is O(h) where **h** is the height of
+        the instance. After splitting, the current instance becomes empty.
+
+        Parameters
+        ----------
+        key: int or float
+            The value to split the `Treap()` instance at.
+
+        Returns
+        -------
+        tuple:
+            A tuple of two `Treap()` instances.
+
+        Raises
+        ------
+        TypeError:
+            If the given key isn't a number.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+        >>> left, right = treap.split(4)
+        >>> left.to_list()
+        [2, 1, 3, 0]
+        >>> right.to_list()
+        [4, 9, 7]
+        >>> treap.is_empty()
+        True
+        """
+        super()._validate_item(key)
+        left, mid, right = self._split_nodes(self._root, key)
+        right = self._join_nodes(mid, right)
+        left_treap, right_treap = self._empty_like(), self._empty_like()
+        for treap, root in ((left_treap, left), (right_treap, right)):
+            treap._root = root
+            treap._length = root.get_size() if root is not None else 0
+            treap._refresh_fingers()
+        if self._threaded and left is not None and right is not None:
+            # cut the in-order link crossing the split point
+            self._link_threads(left_treap._max_node, None)
+            self._link_threads(None, right_treap._min_node)
+        self._root = None
+        self._length = 0
+        self._refresh_fingers()
+        self._version += 1
+        return left_treap, right_treap
+
+    def join(self, other):
+        """
+        Moves all values of the given `Treap()` to the current one, given
+        that all values of the current instance are less than all values of
+        the other one. No node is created, so the time-complexity is O(h)
+        where **h** is the height of the taller instance. After joining, the
+        other instance becomes empty.
+
+        Parameters
+        ----------
+        other: Treap()
+            A `Treap()` instance whose values are greater than all values of
+            the current instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given object isn't a `Treap()` instance.
+        ValueError:
+            If the two instances have overlapping values.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.join(Treap([9, 7, 3]))
+        ValueError: Can't join `extra.Treap()` with overlapping values!!
+        >>> treap.join(Treap([9, 7, 5]))
+        >>> treap.inorder_traverse()
+        [0, 1, 2, 4, 5, 7, 9]
+        """
+        if not isinstance(other, Treap):
+            raise TypeError(
+                f"Can't join `{self.__name__}` with `{type(other)}`!!"
+            )
+        elif other is self or other.is_empty():
+            return
+        elif not self.is_empty() and self.get_max() >= other.get_min():
+            raise ValueError(
+                f"Can't join `{self.__name__}` with overlapping values!!"
+            )
+        if other._monoid != self._monoid:
+            # recompute the aggregates of the moved nodes bottom-up
+            for node in other._iter_postorder_nodes(other._root):
+                node._monoid = self._monoid
+                node._update_augmented_data()
+        if self._threaded:
+            if not other._threaded:
+                # the moved nodes have no in-order links yet
+                self._thread_nodes(other._iter_inorder_nodes(other._root))
+            if not self.is_empty():
+                # both were found while checking the overlap above
+                self._link_threads(self._max_node, other._min_node)
+        self._root = self._join_nodes(self._root, other._root)
+        self._length += other._length
+        self._refresh_fingers()
+        other._root = None
+        other._length = 0
+        other._refresh_fingers()
+        self._version += 1
+        other._version += 1
+
+    # ============================= SET OPERATIONS ============================
+    def _combine_nodes(self, operation, first_node, second_node):
+        """
+        Combines the two given subtrees according to the given set operation
+        using the divide-and-conquer algorithm described in "Fast Set
+        Operations Using Treaps" by Blelloch and Reid-Miller. The root with
+        the higher priority is kept while the other subtree is split at its
+        value, then the two halves are combined independently. An explicit
+        stack is used instead of recursion, so deep subtrees can't exceed the
+        recursion limit. The time-complexity is O(m*log(n/m + 1)) where **m**
+        is the size of the smaller subtree and **n** is the size of the
+        bigger one.
+
+        Parameters
+        ----------
+        operation: str
+            One of "union", "intersection", "difference" and
+            "symmetric_difference".
+        first_node: TreapNode() or None
+            The root of the first subtree.
+        second_node: TreapNode() or None
+            The root of the second subtree.
+
+        Returns
+        -------
+        TreapNode() or None:
+            The root of the combined subtree. Both given subtrees are consumed
+            in the process.
+        """
+        assert operation in self._set_operations
+
+        results = []
+        stack = [(first_node, second_node)]
+        while stack:
+            item = stack.pop()
+            if len(item) == 3:
+                # both halves are done, link them back
+                root, keep_root = item[1:]
+                right = results.pop()
+                left = results.pop()
+                if keep_root:
+                    root.set_left(left)
+                    root.set_right(right)
+                    results.append(root)
+                else:
+                    results.append(self._join_nodes(left, right))
+                continue
+            first, second = item
+            if first is None or second is None:
+                if operation == "intersection":
+                    results.append(None)
+                elif operation == "difference":
+                    results.append(first if second is None else None)
+                else:
+                    results.append(first if second is None else second)
+                continue
+            if operation == "difference":
+                # the second subtree is subtracted from the first one
+                left, _, right = self._split_nodes(first, second.get_data())
+                root, keep_root = second, False
+                halves = (left, second.get_left()), (right, second.get_right())
+            else:
+                if first.get_priority() < second.get_priority():
+                    first, second = second, first
+                left, mid, right = self._split_nodes(second, first.get_data())
+                root = first
+                if operation == "union":
+                    keep_root = True
+                elif operation == "intersection":
+                    keep_root = mid is not None
+                else:
+                    keep_root = mid is None
+                halves = (first.get_left(), left), (first.get_right(), right)
+            stack.append((None, root, keep_root))
+            stack.append(halves[1])
+            stack.append(halves[0])
+        root = results.pop()
+        assert not results
+        if root is not None:
+            root.set_parent(None)
+        return root
+
+    def _partition_nodes(self, start_node, pivots):
+        """
+        Splits the subtree whose root is `start_node` at the given sorted
+        pivots into `len(pivots) + 1` subtrees.
+
+        Parameters
+        ----------
+        start_node: TreapNode() or None
+            The root of the subtree to be partitioned.
+        pivots: list
+            A sorted list of numeric values.
+
+        Returns
+        -------
+        list:
+            A list of subtree roots where the i-th subtree has all values
+            greater than or equal to the (i-1)-th pivot and less than the
+            i-th pivot.
+        """
+        parts = []
+        for pivot in pivots:
+            left, mid, start_node = self._split_nodes(start_node, pivot)
+            start_node = self._join_nodes(mid, start_node)
+            parts.append(left)
+        parts.append(start_node)
+        return parts
+
+    def _apply_set_operation(self, operation, other, workers):
+        """
+        Applies the given set operation between the current `Treap()` and the
+        values of the given iterable in place. When `workers` is more than
+        one, both sides are partitioned at the same pivots and the resulting
+        independent pairs are combined by a pool of threads before being
+        joined back.
+
+        Parameters
+        ----------
+        operation: str
+            One of "union", "intersection", "difference" and
+            "symmetric_difference".
+        other: iterable
+            An iterable object of numeric values.
+        workers: int or None
+            The number of threads to use.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+        """
+        if not hasattr(other, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        elif workers is not None and (type(workers) != int or workers < 1):
+            raise TypeError("`workers` has to be a positive integer!!")
+        # the other values are put in a temporary treap that gets consumed
+        other_treap = self._empty_like()
+        other_treap._build_unsorted(other)
+        first_node, second_node = self._root, other_treap._root
+
+        workers = min(workers or 1, len(self))
+        if workers <= 1:
+            root = self._combine_nodes(operation, first_node, second_node)
+        else:
+            pivots = [
+                self._select_node(idx * len(self) // workers).get_data()
+                for idx in range(1, workers)
+            ]
+            first_parts = self._partition_nodes(first_node, pivots)
+            second_parts = self._partition_nodes(second_node, pivots)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parts = executor.map(
+                    self._combine_nodes,
+                    [operation] * workers,
+                    first_parts,
+                    second_parts,
+                )
+                root = None
+                for part in parts:
+                    root = self._join_nodes(root, part)
+        self._root = root
+        self._length = root.get_size() if root is not None else 0
+        self._refresh_fingers()
+        # nodes are moved between subtrees, so the in-order links are rebuilt
+        self._rethread()
+        self._version += 1
+
+    def _copy(self):
+        """
+        Creates a copy of the `Treap()` instance in O(n) time-complexity where
+        **n** is the length of the instance.
+
+        Returns
+        -------
+        Treap():
+            A new `Treap()` instance holding the same values.
+        """
+        treap = self._empty_like()
+        treap._build_unsorted(self)
+        return treap
+
+    def update(self, other, workers=None):
+        """
+        Inserts all values of the given iterable into the `Treap()` instance
+        in place. If the given iterable is an instance of the BST family, the
+        time-complexity is O(m*log(n/m + 1)) where **m** is the number of
+        the given values and **n** is the length of the instance. This is
+        much faster than inserting the values one by one. When the instance
+        is threaded (`threaded=True`), its in-order links are rebuilt
+        afterwards, which adds O(n) to the time-complexity.
+
+        Parameters
+        ----------
+        other: iterable
+            An iterable object of numeric values, usually another `Treap()`.
+            It remains unchanged.
+        workers: int (default: None)
+            The number of threads to divide the work between. The values are
+            partitioned into independent ranges, so threads never share
+            nodes.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.update(Treap([4, 9, 7, 3]))
+        >>> treap.inorder_traverse()
+        [0, 1, 2, 3, 4, 7, 9]
+        """
+        self._apply_set_operation("union", other, workers)
+
+    def intersection_update(self, other, workers=None):
+        """
+        Keeps only the values of the `Treap()` instance that are found in the
+        given iterable. If the given iterable is an instance of the BST
+        family, the time-complexity is O(m*log(n/m + 1)) where **m** is the
+        number of the given values and **n** is the length of the instance.
+        When the instance is threaded (`threaded=True`), its in-order links
+        are rebuilt afterwards, which adds O(n) to the time-complexity.
+
+        Parameters
+        ----------
+        other: iterable
+            An iterable object of numeric values, usually another `Treap()`.
+            It remains unchanged.
+        workers: int (default: None)
+            The number of threads to divide the work between.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.intersection_update(Treap([4, 9, 1, 3]))
+        >>> treap.inorder_traverse()
+        [1, 4]
+        """
+        self._apply_set_operation("intersection", other, workers)
+
+    def difference_update(self, other, workers=None):
+        """
+        Removes all values of the given iterable from the `Treap()` instance.
+        If the given iterable is an instance of the BST family, the
+        time-complexity is O(m*log(n/m + 1)) where **m** is the number of the
+        given values and **n** is the length of the instance. When the
+        instance is threaded (`threaded=True`), its in-order links are rebuilt
+        afterwards, which adds O(n) to the time-complexity.
+
+        Parameters
+        ----------
+        other: iterable
+            An iterable object of numeric values, usually another `Treap()`.
+            It remains unchanged.
+        workers: int (default: None)
+            The number of threads to divide the work between.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.difference_update(Treap([4, 9, 1, 3]))
+        >>> treap.inorder_traverse()
+        [0, 2]
+        """
+        self._apply_set_operation("difference", other, workers)
+
+    def symmetric_difference_update(self, other, workers=None):
+        """
+        Keeps only the values found in either the `Treap()` instance or the
+        given iterable but not in both. If the given iterable is an instance
+        of the BST family, the time-complexity is O(m*log(n/m + 1)) where
+        **m** is the number of the given values and **n** is the length of
+        the instance. When the instance is threaded (`threaded=True`), its
+        in-order links are rebuilt afterwards, which adds O(n) to the
+        time-complexity.
+
+        Parameters
+        ----------
+        other: iterable
+            An iterable object of numeric values, usually another `Treap()`.
+            It remains unchanged.
+        workers: int (default: None)
+            The number of threads to divide the work between.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.symmetric_difference_update(Treap([4, 9, 1, 3]))
+        >>> treap.inorder_traverse()
+        [0, 2, 3, 9]
+        """
+        self._apply_set_operation("symmetric_difference", other, workers)
+
+    def union(self, other, workers=None):
+        """
+        Creates a new `Treap()` instance holding the values found in either
+        the current instance or the given iterable. The current instance is
+        copied first in O(n), then `update()` is applied to the copy. Use
+        `update()` directly to avoid copying.
+
+        Parameters
+        ----------
+        other: iterable
+            An iterable object of numeric values, usually another `Treap()`.
+        workers: int (default: None)
+            The number of threads to divide the work between.
+
+        Returns
+        -------
+        Treap():
+            A new `Treap()` instance. Both the current instance and the given
+            iterable remain unchanged.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.union(Treap([4, 9, 1, 3])).inorder_traverse()
+        [0, 1, 2, 3, 4, 9]
+        """
+        treap = self._copy()
+        treap.update(other, workers)
+        return treap
+
+    def intersection(self, other, workers=None):
+        """
+        Creates a new `Treap()` instance holding the values found in both the
+        current instance and the given iterable. The current instance is
+        copied first in O(n), then `intersection_update()` is applied to the
+        copy.
+
+        Parameters
+        ----------
+        other: iterable
+            An iterable object of numeric values, usually another `Treap()`.
+        workers: int (default: None)
+            The number of threads to divide the work between.
+
+        Returns
+        -------
+        Treap():
+            A new `Treap()` instance. Both the current instance and the given
+            iterable remain unchanged.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.intersection(Treap([4, 9, 1, 3])).inorder_traverse()
+        [1, 4]
+        """
+        treap = self._copy()
+        treap.intersection_update(other, workers)
+        return treap
+
+    def difference(self, other, workers=None):
+        """
+        Creates a new `Treap()` instance holding the values found in the
+        current instance but not in the given iterable. The current instance
+        is copied first in O(n), then `difference_update()` is applied to the
+        copy.
+
+        Parameters
+        ----------
+        other: iterable
+            An iterable object of numeric values, usually another `Treap()`.
+        workers: int (default: None)
+            The number of threads to divide the work between.
+
+        Returns
+        -------
+        Treap():
+            A new `Treap()` instance. Both the current instance and the given
+            iterable remain unchanged.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.difference(Treap([4, 9, 1, 3])).inorder_traverse()
+        [0, 2]
+        """
+        treap = self._copy()
+        treap.difference_update(other, workers)
+        return treap
+
+    def symmetric_difference(self, other, workers=None):
+        """
+        Creates a new `Treap()` instance holding the values found in either
+        the current instance or the given iterable but not in both. The
+        current instance is copied first in O(n), then
+        `symmetric_difference_update()` is applied to the copy.
+
+        Parameters
+        ----------
+        other: iterable
+            An iterable object of numeric values, usually another `Treap()`.
+        workers: int (default: None)
+            The number of threads to divide the work between.
+
+        Returns
+        -------
+        Treap():
+            A new `Treap()` instance. Both the current instance and the given
+            iterable remain unchanged.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in the following cases:
+                1. If the given object isn't iterable.
+                2. If one of the given values isn't a number.
+                3. If the given workers isn't a positive integer.
+        ValueError:
+            If one of the given values is `None`.
+
+        Example
+        -------
+        >>> treap = Treap([0, 2, 1, 4], seed=123)
+        >>> treap.symmetric_difference(Treap([4, 9, 1, 3])).inorder_traverse()
+        [0, 2, 3, 9]
+        """
+        treap = self._copy()
+        treap.symmetric_difference_update(other, workers)
+        return treap
+
     # ============================= HEIGHT/DEPTH ==============================
     def get_height(self):
         """
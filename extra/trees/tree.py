@@ -47,6 +47,10 @@ Now, let's try to use the previous tree to explain a few terms:
     tree node and the root. So, the depth of the tree's root is always 0.
 """
 import os
+import heapq
+import fnmatch
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from extra.interface import Extra
 
 
@@ -94,6 +98,12 @@ class TreeNode(Extra):
             value = value.replace("\n", "\\n")
         self._data = value
         self._children = []
+        self._parent = None
+        # the number of nodes in the subtree rooted at this node
+        self._size = 1
+        # bumped while this node is a root each time its subtree changes, so
+        # the metrics cached for the subtree can tell whether they are stale
+        self._mutations = 0
 
     def get_data(self):
         """
@@ -133,9 +143,99 @@ class TreeNode(Extra):
         """
         return self._children
 
+    def get_parent(self):
+        """
+        Returns the parent of the current `TreeNode()` instance.
+
+        Returns
+        -------
+        TreeNode() or None:
+            A reference to the parent of the current `TreeNode()`, or `None`
+            if it hasn't been set as a child of any node.
+
+        Example
+        -------
+        >>> x = TreeNode(2021)
+        >>> y = TreeNode("hello")
+        >>> x.set_child(y)
+        >>> y.get_parent()
+        TreeNode(2021)
+        """
+        return self._parent
+
+    def get_size(self):
+        """
+        Returns the number of nodes in the subtree whose root is the current
+        `TreeNode()` instance including the node itself in constant time.
+
+        Returns
+        -------
+        int:
+            The size of the subtree rooted at the current `TreeNode()`.
+
+        Example
+        -------
+        >>> x = TreeNode(2021)
+        >>> y = TreeNode("hello")
+        >>> y.set_child(TreeNode("world"))
+        >>> x.set_child(y)
+        >>> x.get_size(), y.get_size()
+        (3, 2)
+        """
+        return self._size
+
+    def _resize(self, delta):
+        """
+        Adds the given delta to the size of the current `TreeNode()` and all
+        its ancestors in time-complexity of O(d) where **d** is the depth of
+        the node. Then, it counts a mutation on the reached root.
+
+        Parameters
+        ----------
+        delta: int
+            The change in the number of nodes of the subtree.
+        """
+        node = self
+        node._size += delta
+        while node._parent is not None:
+            node = node._parent
+            node._size += delta
+        node._mutations += 1
+
+    def _adopt(self, child):
+        """
+        Makes the current `TreeNode()` the parent of the given child and adds
+        the size of the child's subtree to all ancestors. A node that is set
+        as a child of several nodes is counted under each one of them, but
+        only its last parent is linked to it.
+
+        Parameters
+        ----------
+        child: TreeNode()
+            A reference to the new child.
+        """
+        child._parent = self
+        self._resize(child._size)
+
+    def _disown(self, child):
+        """
+        Subtracts the size of the given child's subtree from the current
+        `TreeNode()` and all its ancestors after removing the child from it.
+
+        Parameters
+        ----------
+        child: TreeNode()
+            A reference to the removed child.
+        """
+        if child._parent is self:
+            child._parent = None
+        self._resize(-child._size)
+
     def set_child(self, child):
         """
         Sets the given `TreeNode()` as a child for the current `TreeNode()`.
+        The subtree sizes of all ancestors are updated in time-complexity of
+        O(d) where **d** is the depth of the current node.
 
         Parameters
         ----------
@@ -164,11 +264,14 @@ class TreeNode(Extra):
                 f"You can't set a child unless it's an `{self.__name__}` "
                 + "object!!"
             )
+        self._adopt(child)
         self._children.append(child)
 
     def set_children(self, lst):
         """
-        Sets multiple `TreeNode()` instances as children for the current one.
+        Sets multiple `TreeNode()` instances as children for the current one
+        replacing the old children, if any. The subtree sizes of all ancestors
+        are updated accordingly.
 
         Parameters
         ----------
@@ -205,7 +308,12 @@ class TreeNode(Extra):
                     + "object!!"
                 )
             children.append(item)
-        self._children = children
+        for child in self._children:
+            self._disown(child)
+        self._children = []
+        for child in children:
+            self._adopt(child)
+            self._children.append(child)
 
     def is_leaf(self):
         """
@@ -307,6 +415,63 @@ class TreeNode(Extra):
         node1._data, node2._data = node2._data, node1._data
 
 
+class _PathNode(TreeNode):
+    """
+    A `TreeNode()` created by `Tree.from_path()` to represent a file or a
+    directory. It remembers its path, so a directory that hasn't been read
+    yet loads its content the first time its children are requested.
+    """
+
+    def __init__(self, name, abs_path, depth, dir_id=None, options=None):
+        """
+        Creates a `_PathNode()` object for the given file or directory.
+
+        Parameters
+        ----------
+        name: str
+            The name of the file or the directory.
+        abs_path: str
+            The absolute path of the file or the directory.
+        depth: int
+            The depth of the node where the scanned path is at depth 0.
+        dir_id: bool or tuple (default: None)
+            `None` for files. For directories, it's `True` or a
+            `(device, inode)` pair when following symbolic links.
+        options: dict (default: None)
+            The scanning options shared by all nodes of the same tree, or
+            `None` if the node can't be expanded like files.
+        """
+        super().__init__(name)
+        self._path = abs_path
+        self._depth = depth
+        self._dir_id = dir_id
+        self._options = options
+        self._loaded = options is None
+        # the `(device, inode, mtime)` of the directory when it was read
+        self._stamp = None
+
+    def get_children(self):
+        """
+        Returns a list of all the children of the `_PathNode()` instance. If
+        it's a directory that hasn't been read yet, its content is loaded
+        first without going any deeper.
+
+        Returns
+        -------
+        list:
+            A list of all the children of the `_PathNode()` instance.
+
+        Raises
+        ------
+        OSError:
+            If the directory can't be read and the tree was created with
+            `on_error="raise"`. The directory is read again on the next call.
+        """
+        if not self._loaded:
+            Tree._expand_directories([self], self._depth + 1)
+        return self._children
+
+
 class Tree(Extra):
     """
     A tree is a non-linear data structure that can be defined recursively using
@@ -328,52 +493,356 @@ class Tree(Extra):
         """
         self._root = None
 
+    # the ways `from_path()` handles directories that can't be read
+    _path_error_handlers = {"raise", "warn", "ignore"}
+
     @staticmethod
-    def __form_tree_from_path(parent_abs_path, curr_folder):
+    def _parse_patterns(patterns, name):
         """
-        Creates a `Tree()` instance of the content of a given directory. Each
-        path/file in each sub-directory will be represented as a `TreeNode()`
-        instance.
+        Checks the given glob patterns used to filter the scanned entries.
 
         Parameters
         ----------
-        parent_abs_path: str
-            The absolute path of the parent of the current directory.
-        curr_folder: str
-            The name of the current directory
+        patterns: str or iterable or None
+            Either one glob pattern, an iterable of glob patterns or `None`.
+        name: str
+            The name of the parameter holding the patterns.
 
         Returns
         -------
-        TreeNode()
-            A tree node representing the root of the hierarchy of the
-            `curr_folder` directory.
+        tuple:
+            A tuple of the glob patterns, empty if `patterns` is `None`.
 
         Raises
         ------
-        AssertionError:
-            This can be raised if either of the two parameters weren't string.
+        TypeError:
+            If the given object is neither a `str` nor an iterable of `str`.
         """
-        assert type(parent_abs_path) == str
-        assert type(curr_folder) == str
+        if patterns is None:
+            return ()
+        elif type(patterns) == str:
+            return (patterns,)
+        elif hasattr(patterns, "__iter__"):
+            patterns = tuple(patterns)
+            if all(type(pattern) == str for pattern in patterns):
+                return patterns
+        raise TypeError(
+            f"`{name}` has to be a glob pattern or an iterable of them!!"
+        )
 
-        node = TreeNode(curr_folder)
-        abs_path = os.path.join(parent_abs_path, curr_folder)
-        if os.path.isdir(abs_path):
-            for child in sorted(os.listdir(abs_path)):
-                node.set_child(Tree.__form_tree_from_path(abs_path, child))
-        return node
+    @staticmethod
+    def _scan_directory(abs_path, options):
+        """
+        Lists the entries of the given directory using one `os.scandir()`
+        call, so the type of each entry comes with the listing without an
+        extra `stat` call on most platforms. It runs in worker threads, so it
+        doesn't touch any node.
+
+        Parameters
+        ----------
+        abs_path: str
+            The absolute path of the directory.
+        options: dict
+            The scanning options of the tree which define whether symbolic
+            links are followed and which entries are included or excluded.
+
+        Returns
+        -------
+        tuple:
+            The stamp of the directory returned by `_stamp()` taken before
+            listing it, and a list of `(name, path, dir_id)` tuples sorted by
+            name where `dir_id` is `None` for files. For directories, it's
+            `True` or a `(device, inode)` pair when following symbolic links.
+
+        Raises
+        ------
+        OSError:
+            If the directory can't be read.
+        """
+        follow_symlinks = options["follow_symlinks"]
+        include, exclude = options["include"], options["exclude"]
+        stamp = Tree._stamp(abs_path)
+        entries = []
+        with os.scandir(abs_path) as iterator:
+            for entry in iterator:
+                name = entry.name
+                if any(fnmatch.fnmatch(name, pattern) for pattern in exclude):
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dir_id = True
+                    if follow_symlinks:
+                        # identifies directories reachable through many links
+                        stat = entry.stat()
+                        dir_id = (stat.st_dev, stat.st_ino)
+                elif include and not any(
+                    fnmatch.fnmatch(name, pattern) for pattern in include
+                ):
+                    continue
+                else:
+                    dir_id = None
+                entries.append((name, entry.path, dir_id))
+        entries.sort(key=lambda item: item[0])
+        return stamp, entries
+
+    @staticmethod
+    def _stamp(abs_path):
+        """
+        Reads the metadata of the given directory that changes whenever an
+        entry is added to it, removed from it or renamed inside it, or when
+        the directory itself is replaced.
+
+        Parameters
+        ----------
+        abs_path: str
+            The absolute path of the directory.
+
+        Returns
+        -------
+        tuple or None:
+            The `(device, inode, mtime)` of the directory where the mtime is
+            in nanoseconds, or `None` if it can't be read.
+        """
+        try:
+            stat = os.stat(abs_path)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+
+    @staticmethod
+    def _new_child(node, name, child_path, dir_id):
+        """
+        Creates a `_PathNode()` for an entry of the given directory node and
+        links it to the node without updating any size. The child can be
+        expanded only if it's a directory above the maximum depth that hasn't
+        been expanded elsewhere through a symbolic link.
+
+        Parameters
+        ----------
+        node: _PathNode()
+            The parent directory node.
+        name: str
+            The name of the entry.
+        child_path: str
+            The absolute path of the entry.
+        dir_id: bool or tuple or None
+            The `dir_id` of the entry returned by `_scan_directory()`.
+
+        Returns
+        -------
+        _PathNode():
+            The created child node.
+        """
+        options = node._options
+        max_depth = options["max_depth"]
+        depth = node._depth + 1
+        child_options = None
+        if (
+            dir_id is not None
+            and dir_id not in options["visited"]
+            and (max_depth is None or depth < max_depth)
+        ):
+            if dir_id is not True:
+                options["visited"].add(dir_id)
+            child_options = options
+        child = _PathNode(name, child_path, depth, dir_id, child_options)
+        child._parent = node
+        return child
+
+    @staticmethod
+    def _load_directory(node, scanned, until):
+        """
+        Creates the children of the given directory node from its scanned
+        entries and links them directly to it.
+
+        Parameters
+        ----------
+        node: _PathNode()
+            The directory node being loaded.
+        scanned: tuple
+            The stamp & the entries returned by `_scan_directory()`.
+        until: int or None
+            Directories at this depth or deeper are left to be loaded later.
+            `None` means no limit.
+
+        Returns
+        -------
+        list:
+            The child directories that have to be loaded as well.
+        """
+        node._stamp, entries = scanned
+        children, expand = [], []
+        for name, child_path, dir_id in entries:
+            child = Tree._new_child(node, name, child_path, dir_id)
+            children.append(child)
+            if child._options is not None and (
+                until is None or child._depth < until
+            ):
+                expand.append(child)
+        node._children = children
+        node._loaded = True
+        return expand
 
     @staticmethod
-    def from_path(path):
+    def _handle_scan_error(node, error):
+        """
+        Handles a directory that couldn't be read according to the
+        `on_error` option of the tree. Unless the error is raised, the
+        directory is considered loaded without any children.
+
+        Parameters
+        ----------
+        node: _PathNode()
+            The directory node that couldn't be read.
+        error: OSError
+            The error raised while reading the directory.
+
+        Raises
+        ------
+        OSError:
+            The given error if `on_error` is "raise".
+        """
+        on_error = node._options["on_error"]
+        if on_error == "raise":
+            raise error
+        elif on_error == "warn":
+            warnings.warn(
+                f"Couldn't read `{node._path}`: {error}!!", UserWarning
+            )
+        node._loaded = True
+
+    @staticmethod
+    def _expand_directories(jobs, until=None):
+        """
+        Loads the content of the given directory nodes and all directories
+        below them down to the given depth. Instead of recursion, a work queue
+        of directories is consumed by a pool of threads that read directories
+        concurrently while the calling thread creates & links the nodes, so no
+        lock is needed. The listings are handled in the order of their depth
+        & path regardless of which thread finishes first, so a directory
+        reached through many symbolic links is always expanded at the same
+        place. A single directory is read without any thread.
+
+        Parameters
+        ----------
+        jobs: list
+            The `_PathNode()` objects of the directories to be loaded. They
+            have to be unloaded, so none of them is a descendant of another.
+        until: int or None
+            Directories at this depth or deeper aren't loaded. `None` means no
+            limit.
+
+        Raises
+        ------
+        OSError:
+            If a directory can't be read and `on_error` is "raise". Nodes
+            loaded so far are kept.
+        """
+        options = jobs[0]._options
+        loaded = []
+        old_sizes = [node._size for node in jobs]
+        try:
+            if len(jobs) == 1 and until is not None and (
+                jobs[0]._depth + 1 >= until
+            ):
+                node = jobs[0]
+                try:
+                    scanned = Tree._scan_directory(node._path, options)
+                except OSError as error:
+                    Tree._handle_scan_error(node, error)
+                else:
+                    Tree._load_directory(node, scanned, until)
+                    loaded.append(node)
+                return
+            with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+                # (depth, path, id, future, node) of the submitted listings
+                pending = []
+
+                def submit(node):
+                    future = pool.submit(
+                        Tree._scan_directory, node._path, options
+                    )
+                    heapq.heappush(
+                        pending,
+                        (node._depth, node._path, id(node), future, node),
+                    )
+
+                for node in jobs:
+                    submit(node)
+                while pending:
+                    _, _, _, future, node = heapq.heappop(pending)
+                    try:
+                        scanned = future.result()
+                    except OSError as error:
+                        try:
+                            Tree._handle_scan_error(node, error)
+                        except OSError:
+                            for item in pending:
+                                item[3].cancel()
+                            raise
+                        continue
+                    for child in Tree._load_directory(node, scanned, until):
+                        submit(child)
+                    loaded.append(node)
+        finally:
+            # nodes were linked directly, so the sizes are computed once
+            # bottom-up as every node comes after its parent
+            for node in reversed(loaded):
+                node._size = 1 + sum(child._size for child in node._children)
+            for node, old_size in zip(jobs, old_sizes):
+                if node._parent is not None and node._size != old_size:
+                    node._parent._resize(node._size - old_size)
+
+    @staticmethod
+    def from_path(
+        path,
+        max_depth=None,
+        follow_symlinks=False,
+        include=None,
+        exclude=None,
+        on_error="raise",
+        workers=None,
+        lazy=False,
+    ):
         """
         Creates a `Tree()` instance of the hierarchy of a given directory/path.
         Each file in each sub-directory will be represented as a `TreeNode()`
-        instance.
+        instance. Directories are listed using `os.scandir()` by a pool of
+        threads consuming a work queue, so there is no recursion involved and
+        the children of every node are sorted by name.
 
         Parameters
         ----------
         path: str
             The path which will be the root of the returned `Tree()` object.
+        max_depth: int (default: None)
+            The depth after which directories aren't expanded, where the
+            depth of the given path is 0. `None` means no limit.
+        follow_symlinks: bool (default: False)
+            If `True`, symbolic links to directories are expanded as well.
+            Each directory is expanded once, so cyclic links are safe.
+        include: str or iterable (default: None)
+            One or more glob patterns. If given, only files whose names match
+            one of them are included. Directories aren't filtered by them.
+        exclude: str or iterable (default: None)
+            One or more glob patterns of the names of files and directories
+            to be skipped along with their content.
+        on_error: str (default: "raise")
+            What to do when a directory can't be read. It's either "raise" to
+            raise the error, "warn" to issue a `UserWarning` or "ignore". The
+            unreadable directory is kept without children in the last two.
+        workers: int (default: None)
+            The maximum number of threads reading directories. `None` uses
+            the default of `ThreadPoolExecutor`.
+        lazy: bool (default: False)
+            If `True`, nothing is read in advance and each directory loads
+            its content the first time its children are requested, which
+            happens when iterating over the tree, searching it or printing it.
+            Use `prefetch()` to load many levels at once. The length of a lazy
+            tree counts only the loaded nodes.
 
         Returns
         ------
@@ -383,9 +852,19 @@ class Tree(Extra):
         Raises
         ------
         TypeError:
-            If the given path's type wasn't a string.
+            It can be raised in the following cases:
+                1. If the given path's type wasn't a string.
+                2. If `max_depth` or `workers` isn't an integer.
+                3. If `follow_symlinks` or `lazy` isn't a boolean.
+                4. If `include` or `exclude` isn't a glob pattern or an \
+                    iterable of them.
         ValueError:
-            If the given path doesn't exist.
+            It can be raised in the following cases:
+                1. If the given path doesn't exist.
+                2. If `max_depth` is negative or `workers` isn't positive.
+                3. If `on_error` isn't one of the supported values.
+        OSError:
+            If a directory can't be read and `on_error` is "raise".
 
         Example
         -------
@@ -399,51 +878,313 @@ class Tree(Extra):
         │ └── file3.txt
         ├── script2.py
         └── script3.py
+        >>> Tree.from_path("example", max_depth=1, exclude="script*")
+        trees
+        └── folder
+        >>> t = Tree.from_path("example", lazy=True)
+        >>> len(t)
+        1
+        >>> "file.txt" in t
+        True
+        >>> len(t)
+        8
         """
         if type(path) != str:
             raise TypeError("Invalid path was given!!")
         elif not os.path.exists(path):
             raise ValueError("Invalid path was given!!")
+        elif max_depth is not None and type(max_depth) != int:
+            raise TypeError("`max_depth` has to be an integer!!")
+        elif max_depth is not None and max_depth < 0:
+            raise ValueError("`max_depth` can't be negative!!")
+        elif type(follow_symlinks) != bool:
+            raise TypeError("`follow_symlinks` has to be a boolean value!!")
+        elif on_error not in Tree._path_error_handlers:
+            raise ValueError(
+                "`on_error` has to be one of "
+                + f"{sorted(Tree._path_error_handlers)}!!"
+            )
+        elif workers is not None and type(workers) != int:
+            raise TypeError("`workers` has to be an integer!!")
+        elif workers is not None and workers < 1:
+            raise ValueError("`workers` has to be positive!!")
+        elif type(lazy) != bool:
+            raise TypeError("`lazy` has to be a boolean value!!")
+        options = {
+            "max_depth": max_depth,
+            "follow_symlinks": follow_symlinks,
+            "include": Tree._parse_patterns(include, "include"),
+            "exclude": Tree._parse_patterns(exclude, "exclude"),
+            "on_error": on_error,
+            "workers": workers,
+            "lazy": lazy,
+            # directories already expanded, so links can't form cycles
+            "visited": set(),
+        }
+
         t = Tree()
         abs_path = os.path.abspath(path)
-        parent, folder = os.path.split(abs_path)
-        t._root = Tree.__form_tree_from_path(parent, folder)
+        dir_id = None
+        if os.path.isdir(abs_path):
+            dir_id = True
+            if follow_symlinks:
+                stat = os.stat(abs_path)
+                dir_id = (stat.st_dev, stat.st_ino)
+                options["visited"].add(dir_id)
+        is_expandable = dir_id is not None and max_depth != 0
+        t._root = _PathNode(
+            os.path.basename(abs_path),
+            abs_path,
+            0,
+            dir_id,
+            options if is_expandable else None,
+        )
+        if is_expandable and not lazy:
+            Tree._expand_directories([t._root], max_depth)
         return t
 
-    # =============================    LENGTH    ==============================
-    def __count_nodes(self, start_node):
+    def prefetch(self, depth=None):
         """
-        Recurrsively, cunts the number of `TreeNode()` instances found in the
-        `Tree()` object.
+        Loads the directories of a `Tree()` created lazily by `from_path()`
+        down to the given depth at once, using the same pool of threads used
+        by `from_path()`. Directories that have been loaded already aren't
+        read again. It does nothing for other trees.
 
         Parameters
         ----------
-        start_node: TreeNode()
-            The `TreeNode()` instance at which we are going to start counting
-            the tree nodes. At the beginning, this will be the root of the
-            `Tree()` instance.
+        depth: int (default: None)
+            The depth of the deepest nodes to be loaded, where the root is at
+            depth 0. `None` loads everything.
+
+        Raises
+        ------
+        TypeError:
+            If `depth` isn't an integer.
+        ValueError:
+            If `depth` is negative.
+        OSError:
+            If a directory can't be read and the tree was created with
+            `on_error="raise"`.
+
+        Example
+        -------
+        >>> # this can't be reproduced and it's for the sake of explanation.
+        >>> t = Tree.from_path("example", lazy=True)
+        >>> t.prefetch(1)
+        >>> len(t)
+        5
+        >>> t.prefetch()
+        >>> len(t)
+        8
+        """
+        if depth is not None and type(depth) != int:
+            raise TypeError("`depth` has to be an integer!!")
+        elif depth is not None and depth < 0:
+            raise ValueError("`depth` can't be negative!!")
+        jobs = []
+        nodes = [self._root] if isinstance(self._root, _PathNode) else []
+        while nodes:
+            node = nodes.pop()
+            if not isinstance(node, _PathNode) or (
+                depth is not None and node._depth >= depth
+            ):
+                continue
+            elif node._loaded:
+                nodes.extend(node._children)
+            else:
+                jobs.append(node)
+        if jobs:
+            Tree._expand_directories(jobs, depth)
+
+    @staticmethod
+    def _collect_subtree(start_node):
+        """
+        Lists the nodes of the subtree rooted at the given node that have
+        been loaded without loading any more of them.
+
+        Parameters
+        ----------
+        start_node: _PathNode()
+            The root of the subtree.
 
         Returns
         -------
-        int:
-            The number of `TreeNode()` objects found in the `Tree()` instance.
+        list:
+            The nodes of the subtree where every node comes after its parent.
+        """
+        nodes = [start_node]
+        for node in nodes:
+            nodes.extend(node._children)
+        return nodes
+
+    @staticmethod
+    def _update_directory(node, stamp, entries, added, removed, gone):
+        """
+        Updates the children of a loaded directory node to match its new
+        entries. Children whose entries are still there are kept while the
+        others are detached with their subtrees, and new entries get new
+        nodes. The sizes of the node & its ancestors are updated once.
+
+        Parameters
+        ----------
+        node: _PathNode()
+            The directory node being updated.
+        stamp: tuple or None
+            The new stamp of the directory.
+        entries: list
+            The new entries of the directory returned by `_scan_directory()`.
+        added: list
+            The list to which the new nodes are appended.
+        removed: list
+            The list to which the nodes of the removed subtrees are appended.
+        gone: set
+            The ids of the removed nodes, which get the ids of the newly
+            removed ones.
+
+        Returns
+        -------
+        list:
+            The new child directories that have to be read when the tree
+            isn't lazy.
+        """
+        options = node._options
+        current = {child_path: dir_id for _, child_path, dir_id in entries}
+        kept = {}
+        delta = 0
+        for child in node._children:
+            if current.get(child._path, False) == child._dir_id:
+                kept[child._path] = child
+                continue
+            # removed, or replaced by an entry of another kind
+            subtree = Tree._collect_subtree(child)
+            for old_node in subtree:
+                gone.add(id(old_node))
+                if type(old_node._dir_id) == tuple:
+                    options["visited"].discard(old_node._dir_id)
+            child._parent = None
+            removed.extend(subtree)
+            delta -= child._size
+        children, expand = [], []
+        for name, child_path, dir_id in entries:
+            child = kept.get(child_path)
+            if child is None:
+                child = Tree._new_child(node, name, child_path, dir_id)
+                added.append(child)
+                delta += 1
+                if child._options is not None and not options["lazy"]:
+                    expand.append(child)
+            children.append(child)
+        node._children = children
+        node._stamp = stamp
+        node._resize(delta)
+        return expand
+
+    def refresh(self):
+        """
+        Updates a `Tree()` created by `from_path()` to match the file system.
+        The `(device, inode, mtime)` of every directory is recorded when it's
+        read, so only the directories whose metadata changed since then are
+        listed again, concurrently, while the unchanged ones cost one `stat`
+        call each. Entries that are still there keep their nodes along with
+        everything loaded below them. New directories are read right away
+        unless the tree is lazy, and directories that haven't been loaded
+        yet are left untouched. It does nothing for other trees.
+
+        Returns
+        -------
+        tuple:
+            Two lists of the added nodes and the removed nodes. Each list has
+            the nodes of the whole added or removed subtrees with every node
+            coming after its parent. An entry that turned from a file into a
+            directory or vice-versa appears in both.
 
         Raises
         ------
-        AssertionError:
-            If the given `start_node` isn't an `TreeNode()` object.
-        """
-        assert isinstance(start_node, TreeNode)
+        OSError:
+            If a changed directory can't be read and the tree was created
+            with `on_error="raise"`. Otherwise, the directory keeps its
+            children and it's checked again by the next `refresh()`.
 
-        total_nodes = 1
-        for child in start_node.get_children():
-            total_nodes += self.__count_nodes(child)
-        return total_nodes
+        Note
+        ----
+        Changes to the content of files don't change the mtime of their
+        directories, so they aren't detected. Also, changes made within the
+        mtime resolution of the file system right after a directory is read
+        might go unnoticed.
+
+        Example
+        -------
+        >>> # this can't be reproduced and it's for the sake of explanation.
+        >>> t = Tree.from_path("example")
+        >>> t
+        example
+        ├── script.py
+        └─┬ folder
+          └── file.txt
+        >>> # after removing "file.txt" and creating "new.txt" in "folder"
+        >>> added, removed = t.refresh()
+        >>> added, removed
+        ([TreeNode(new.txt)], [TreeNode(file.txt)])
+        >>> t
+        example
+        ├── script.py
+        └─┬ folder
+          └── new.txt
+        """
+        added, removed = [], []
+        if not isinstance(self._root, _PathNode):
+            return added, removed
+        changed = []
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node._options is not None and node._loaded:
+                nodes.extend(node._children)
+                if Tree._stamp(node._path) != node._stamp:
+                    changed.append(node)
+        if not changed:
+            return added, removed
+        options = self._root._options
+        # parents are updated first, so descendants of removed directories
+        # are skipped
+        changed.sort(key=lambda node: node._depth)
+        with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+            futures = [
+                pool.submit(Tree._scan_directory, node._path, options)
+                for node in changed
+            ]
+            expand = []
+            gone = set()
+            for node, future in zip(changed, futures):
+                if id(node) in gone:
+                    continue
+                try:
+                    stamp, entries = future.result()
+                except OSError as error:
+                    try:
+                        Tree._handle_scan_error(node, error)
+                    except OSError:
+                        for other in futures:
+                            other.cancel()
+                        raise
+                    # the failure might be temporary, so the old children
+                    # & stamp are kept to check the directory again later
+                    continue
+                expand += Tree._update_directory(
+                    node, stamp, entries, added, removed, gone
+                )
+        if expand:
+            Tree._expand_directories(expand, options["max_depth"])
+            for node in expand:
+                added.extend(Tree._collect_subtree(node)[1:])
+        return added, removed
 
+    # =============================    LENGTH    ==============================
     def __len__(self):
         """
-        Gets the length of the `Tree()` instance. Length is the number of nodes
-        in the instance.
+        Gets the length of the `Tree()` instance in constant time as every
+        node keeps the size of its subtree. Length is the number of nodes in
+        the instance.
 
         Returns
         -------
@@ -470,7 +1211,7 @@ class Tree(Extra):
         """
         if self.is_empty():
             return 0
-        return self.__count_nodes(self._root)
+        return self._root.get_size()
 
     def is_empty(self):
         """
@@ -0,0 +1,752 @@
+"""
+A tree map is a mapping that keeps its keys sorted in ascending order. Each
+key is associated with a value and the keys can be any objects that can be
+compared with each other such as numbers, strings and tuples. The tree map is
+built on top of one of the BST family; `RedBlackTree()` by default. Each node
+of the underlying tree holds a key along with its value. So, getting, setting
+and removing keys are done in time-complexity of **O(h)** where **h** is the
+height of the tree, and iterating over the keys always follows their order.
+
+The following is a simple tree map mapping a few fruits to their prices:
+
+.. code-block:: text
+
+          ____banana:1|B___
+         /                 \\
+    apple:3|R            kiwi:5|R
+
+Similar to `SortedDict()`, the order of the keys can be customized using a
+`key` function which is called on every key to get the value by which the key
+is sorted.
+"""
+from extra.interface import Extra
+from extra.trees.bst import BST
+from extra.trees.red_black_tree import RedBlackTree
+
+# the default of `pop()` telling that no default value was given
+_MISSING = object()
+
+
+class TreeMapEntry:
+    """
+    A tree map entry is the object stored inside each node of the tree that
+    holds a `TreeMap()`. It holds the key, the value by which this key is
+    sorted and the value associated with the key. Entries are compared only
+    by their sort keys, so they can be compared with bare sort keys as well.
+    """
+
+    def __init__(self, key, sort_key, value):
+        """
+        Creates a `TreeMapEntry()` object used mainly with TreeMap() objects!!
+
+        Parameters
+        ----------
+        key: object
+            The key of the entry.
+        sort_key: object
+            The value by which the key is sorted.
+        value: object
+            The value associated with the given key.
+        """
+        self._key = key
+        self._sort_key = sort_key
+        self._value = value
+
+    def get_key(self):
+        """
+        Returns the key of the `TreeMapEntry()` instance.
+
+        Returns
+        -------
+        object:
+            The key of the entry.
+        """
+        return self._key
+
+    def get_value(self):
+        """
+        Returns the value associated with the key of the `TreeMapEntry()`.
+
+        Returns
+        -------
+        object:
+            The value of the entry.
+        """
+        return self._value
+
+    def set_value(self, value):
+        """
+        Replaces the value associated with the key of the `TreeMapEntry()`.
+
+        Parameters
+        ----------
+        value: object
+            The new value of the entry.
+        """
+        self._value = value
+
+    @staticmethod
+    def _get_sort_key(other):
+        """
+        Returns the sort key of the given object which is either another
+        `TreeMapEntry()` or a bare sort key.
+
+        Parameters
+        ----------
+        other: object
+            The object to be compared with an entry.
+
+        Returns
+        -------
+        object:
+            The value by which the given object is compared.
+        """
+        return other._sort_key if isinstance(other, TreeMapEntry) else other
+
+    def __eq__(self, other):
+        return self._sort_key == self._get_sort_key(other)
+
+    def __lt__(self, other):
+        return self._sort_key < self._get_sort_key(other)
+
+    def __le__(self, other):
+        return self._sort_key <= self._get_sort_key(other)
+
+    def __gt__(self, other):
+        return self._sort_key > self._get_sort_key(other)
+
+    def __ge__(self, other):
+        return self._sort_key >= self._get_sort_key(other)
+
+    # entries are mutable, so they can't be hashed
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        Represents the `TreeMapEntry()` object as a string.
+
+        Returns
+        -------
+        str:
+            A string in the form of `key:value`.
+
+        Example
+        -------
+        >>> x = TreeMapEntry("apple", "apple", 3)
+        >>> x
+        apple:3
+        """
+        return f"{self._key}:{self._value}"
+
+
+class TreeMap(Extra):
+    """
+    A tree map is a mapping that keeps its keys sorted in ascending order.
+    Each key is associated with a value and the keys can be any objects that
+    can be compared with each other such as numbers, strings and tuples.
+    Getting, setting and removing keys are done in time-complexity of
+    **O(h)** where **h** is the height of the underlying tree, and iterating
+    over the keys always follows their order.
+    """
+
+    __name__ = "extra.TreeMap()"
+
+    def __init__(self, iterable=None, key=None, tree=RedBlackTree):
+        """
+        Initializes a `TreeMap()` instance using an optional mapping or
+        iterable of key-value pairs in time-complexity of O(n*h) where **n**
+        is the number of pairs inside the given `iterable` and **h** is the
+        height of the underlying tree.
+
+        Parameters
+        ----------
+        iterable: dict or iterable, optional
+            A python `dict` or an iterable of `(key, value)` pairs.
+        key: callable, optional
+            A function of one argument that is used to extract the value by
+            which each key is sorted. If `None`, the keys are compared
+            directly, default `None`.
+        tree: type, optional
+            The class of the underlying tree which could be any of the BST
+            family: `BST`, `AVL`, `RedBlackTree`, `SplayTree` or `Treap`,
+            default `RedBlackTree`.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in five cases
+                1. In case the given object isn't iterable.
+                2. If one of the keys or values is an `Extra` object.
+                3. If the keys can't be compared with each other.
+                4. If the given `key` isn't callable.
+                5. If the given `tree` isn't one of the BST family.
+        ValueError:
+            If one of the keys or values is `None`.
+
+        Examples
+        --------
+        >>> tm = TreeMap({"kiwi": 5, "apple": 3, "banana": 1})
+        >>> tm
+              ____banana:1|B___
+             /                 \\
+        apple:3|R            kiwi:5|R
+
+        The underlying tree can be any tree of the BST family.
+
+        >>> from extra import AVL
+        >>> tm = TreeMap({"kiwi": 5, "apple": 3, "banana": 1}, tree=AVL)
+        >>> tm
+             ___banana:1__
+            /             \\
+        apple:3          kiwi:5
+
+        Using a non-iterable object will raise `TypeError`
+
+        >>> tm = TreeMap(2)
+        TypeError: The given object isn't iterable!!
+        """
+        if key is not None and not callable(key):
+            raise TypeError("The given key must be callable!!")
+        elif not (isinstance(tree, type) and issubclass(tree, BST)):
+            raise TypeError(
+                f"Can't build `{self.__name__}` using `{tree}`!! "
+                + "The tree has to be one of the BST family."
+            )
+        self._key = key
+        self._container = tree(numeric_only=False)
+        if iterable is None:
+            return
+        elif isinstance(iterable, dict):
+            iterable = iterable.items()
+        elif not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        for item, value in iterable:
+            self[item] = value
+
+    # =============================    PRINT     ==============================
+    def __repr__(self):
+        """
+        Represents the `TreeMap()` instance as a string.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `TreeMap()` instance.
+
+        Example
+        -------
+        >>> tm = TreeMap()
+        >>> tm["b"] = 2
+        >>> tm["a"] = 1
+        >>> tm
+            __b:2|B
+           /
+        a:1|R
+        """
+        return repr(self._container)
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `TreeMap()` in constant time.
+
+        Returns
+        -------
+        int:
+            The number of keys inside the `TreeMap()` instance.
+
+        Example
+        -------
+        >>> tm = TreeMap({"a": 1, "b": 2})
+        >>> len(tm)
+        2
+        """
+        return len(self._container)
+
+    def is_empty(self):
+        """
+        Checks if the `TreeMap()` instance is empty or not in constant time.
+
+        Returns
+        -------
+        bool:
+            A boolean flag showing if the `TreeMap()` instance is empty or
+            not. `True` shows that this instance is empty and `False` shows
+            it's not empty.
+
+        Example
+        --------
+        >>> tm = TreeMap()
+        >>> tm.is_empty()
+        True
+        >>> tm["a"] = 1
+        >>> tm.is_empty()
+        False
+        """
+        return self._container.is_empty()
+
+    # =============================   ITERATOR   ==============================
+    def _iter_entries(self):
+        """
+        Iterates over the entries of the `TreeMap()` instance in ascending
+        order of their keys.
+
+        Returns
+        -------
+        generator:
+            The `TreeMapEntry()` objects of the instance.
+        """
+        return self._container.iter_inorder()
+
+    def __iter__(self):
+        """
+        Iterates over the keys of the `TreeMap()` instance in ascending order
+        in time-complexity of O(n) where **n** is the number of keys in the
+        `TreeMap()` instance.
+
+        Returns
+        -------
+        generator:
+            The keys of the instance in ascending order.
+
+        Examples
+        --------
+        >>> tm = TreeMap({"b": 2, "a": 1})
+        >>> for key in tm:
+        ...     print(key)
+        a
+        b
+        """
+        return self.keys()
+
+    def keys(self):
+        """
+        Iterates over the keys of the `TreeMap()` instance in ascending order
+        in time-complexity of O(n) where **n** is the number of keys.
+
+        Returns
+        -------
+        generator:
+            The keys of the instance in ascending order.
+
+        Example
+        -------
+        >>> tm = TreeMap({"b": 2, "a": 1})
+        >>> list(tm.keys())
+        ['a', 'b']
+        """
+        return (entry.get_key() for entry in self._iter_entries())
+
+    def values(self):
+        """
+        Iterates over the values of the `TreeMap()` instance following the
+        order of their keys in time-complexity of O(n) where **n** is the
+        number of keys.
+
+        Returns
+        -------
+        generator:
+            The values of the instance ordered by their keys.
+
+        Example
+        -------
+        >>> tm = TreeMap({"b": 2, "a": 1})
+        >>> list(tm.values())
+        [1, 2]
+        """
+        return (entry.get_value() for entry in self._iter_entries())
+
+    def items(self):
+        """
+        Iterates over the `(key, value)` pairs of the `TreeMap()` instance in
+        ascending order of the keys in time-complexity of O(n) where **n** is
+        the number of keys.
+
+        Returns
+        -------
+        generator:
+            The `(key, value)` pairs of the instance ordered by their keys.
+
+        Example
+        -------
+        >>> tm = TreeMap({"b": 2, "a": 1})
+        >>> list(tm.items())
+        [('a', 1), ('b', 2)]
+        """
+        return (
+            (entry.get_key(), entry.get_value())
+            for entry in self._iter_entries()
+        )
+
+    # =============================    SEARCH    ==============================
+    def _get_sort_key(self, key):
+        """
+        Returns the value by which the given key is sorted inside the
+        `TreeMap()` instance.
+
+        Parameters
+        ----------
+        key: object
+            The key whose sort key is needed.
+
+        Returns
+        -------
+        object:
+            The result of calling the `key` function on the given key or the
+            key itself if no `key` function was given.
+        """
+        return key if self._key is None else self._key(key)
+
+    def _search(self, key):
+        """
+        Searches the underlying tree for the given key.
+
+        Parameters
+        ----------
+        key: object
+            The key to be searched for.
+
+        Returns
+        -------
+        object:
+            The sort key of the given key.
+        BSTNode() or None:
+            The last accessed node while searching. It's `None` only if the
+            `TreeMap()` instance is empty.
+        TreeMapEntry() or None:
+            The entry of the given key or `None` if the key doesn't exist.
+
+        Raises
+        ------
+        ValueError:
+            If the given key is `None`.
+        TypeError:
+            It can be raised in two cases
+                1. If the given key is an `Extra` object.
+                2. If the given key can't be compared with the stored keys.
+        """
+        self._validate_item(key)
+        sort_key = self._get_sort_key(key)
+        container = self._container
+        if container.is_empty():
+            return sort_key, None, None
+        last_node = container._search(sort_key, container._root)
+        entry = last_node.get_data()
+        return sort_key, last_node, entry if entry == sort_key else None
+
+    def __contains__(self, key):
+        """
+        Checks if the given key exists in the `TreeMap()` instance in time-
+        complexity of O(h) where **h** is the height of the underlying tree.
+
+        Parameters
+        ----------
+        key: object
+            The key to be searched for in the `TreeMap()` instance.
+
+        Returns
+        -------
+        bool
+            `True` if the given key exists in the `TreeMap()` instance, and
+            `False` otherwise.
+
+        Examples
+        --------
+        >>> tm = TreeMap({"a": 1, "b": 2})
+        >>> "a" in tm
+        True
+        >>> "c" in tm
+        False
+        >>> 1 in tm
+        False
+        """
+        try:
+            _, _, entry = self._search(key)
+        except (TypeError, ValueError):
+            return False
+        return entry is not None
+
+    def __getitem__(self, key):
+        """
+        Retrieves the value associated with the given key in time-complexity
+        of O(h) where **h** is the height of the underlying tree.
+
+        Parameters
+        ----------
+        key: object
+            The key whose value is retrieved.
+
+        Returns
+        -------
+        object:
+            The value associated with the given key.
+
+        Raises
+        ------
+        KeyError:
+            If the given key doesn't exist in the `TreeMap()` instance.
+
+        Examples
+        --------
+        >>> tm = TreeMap({"a": 1, "b": 2})
+        >>> tm["a"]
+        1
+        >>> tm["c"]
+        KeyError: "Can't find `c` in the `extra.TreeMap()`!!"
+        """
+        _, _, entry = self._search(key)
+        if entry is None:
+            raise KeyError(f"Can't find `{key}` in the `{self.__name__}`!!")
+        return entry.get_value()
+
+    def get(self, key, default=None):
+        """
+        Retrieves the value associated with the given key in time-complexity
+        of O(h) where **h** is the height of the underlying tree. If the key
+        doesn't exist, the given default is returned.
+
+        Parameters
+        ----------
+        key: object
+            The key whose value is retrieved.
+        default: object, optional
+            The value to be returned if the key doesn't exist, default `None`.
+
+        Returns
+        -------
+        object:
+            The value associated with the given key or `default` if the key
+            doesn't exist.
+
+        Examples
+        --------
+        >>> tm = TreeMap({"a": 1, "b": 2})
+        >>> tm.get("a")
+        1
+        >>> tm.get("c", 0)
+        0
+        """
+        _, _, entry = self._search(key)
+        return default if entry is None else entry.get_value()
+
+    # =============================    INSERT    ==============================
+    def _link_entry(self, last_node, entry):
+        """
+        Links a new node holding the given entry to the underlying tree under
+        the given last accessed node, then lets the tree restore its rules.
+        This way, inserting a key costs only one search.
+
+        Parameters
+        ----------
+        last_node: BSTNode() or None
+            The last accessed node while searching for the entry's key, or
+            `None` if the tree is empty.
+        entry: TreeMapEntry()
+            The entry to be stored in the new node.
+        """
+        container = self._container
+        new_node = container._create_node(entry)
+        if last_node is None:
+            container._root = new_node
+            container._length = 1
+        else:
+            container._insert_node(last_node, new_node)
+        container._insert_fixup(new_node)
+
+    def __setitem__(self, key, value):
+        """
+        Associates the given value with the given key in time-complexity of
+        O(h) where **h** is the height of the underlying tree. If the key
+        already exists, its value is replaced.
+
+        Parameters
+        ----------
+        key: object
+            The key to be set.
+        value: object
+            The value to be associated with the given key.
+
+        Raises
+        ------
+        ValueError:
+            If the given key or value is `None`.
+        TypeError:
+            It can be raised in two cases
+                1. If the given key or value is an `Extra` object.
+                2. If the given key can't be compared with the stored keys.
+
+        Examples
+        --------
+        >>> tm = TreeMap()
+        >>> tm["b"] = 2
+        >>> tm["a"] = 1
+        >>> tm["b"] = 20
+        >>> list(tm.items())
+        [('a', 1), ('b', 20)]
+        """
+        self._validate_item(value)
+        sort_key, last_node, entry = self._search(key)
+        if entry is not None:
+            entry.set_value(value)
+        else:
+            self._link_entry(last_node, TreeMapEntry(key, sort_key, value))
+
+    def setdefault(self, key, default):
+        """
+        Retrieves the value associated with the given key. If the key doesn't
+        exist, the given default is associated with it and returned. It does
+        that in time-complexity of O(h) where **h** is the height of the
+        underlying tree using only one search.
+
+        Parameters
+        ----------
+        key: object
+            The key whose value is retrieved.
+        default: object
+            The value to be associated with the key if it doesn't exist.
+
+        Returns
+        -------
+        object:
+            The value associated with the given key.
+
+        Raises
+        ------
+        ValueError:
+            If the given key or default is `None`.
+        TypeError:
+            It can be raised in two cases
+                1. If the given key or default is an `Extra` object.
+                2. If the given key can't be compared with the stored keys.
+
+        Examples
+        --------
+        >>> tm = TreeMap({"a": 1})
+        >>> tm.setdefault("a", 10)
+        1
+        >>> tm.setdefault("b", 20)
+        20
+        >>> list(tm.items())
+        [('a', 1), ('b', 20)]
+        """
+        sort_key, last_node, entry = self._search(key)
+        if entry is not None:
+            return entry.get_value()
+        self._validate_item(default)
+        self._link_entry(last_node, TreeMapEntry(key, sort_key, default))
+        return default
+
+    # =============================    REMOVE    ==============================
+    def __delitem__(self, key):
+        """
+        Removes the given key along with its value from the `TreeMap()`
+        instance in time-complexity of O(h) where **h** is the height of the
+        underlying tree.
+
+        Parameters
+        ----------
+        key: object
+            The key to be removed.
+
+        Raises
+        ------
+        KeyError:
+            If the given key doesn't exist in the `TreeMap()` instance.
+
+        Examples
+        --------
+        >>> tm = TreeMap({"a": 1, "b": 2})
+        >>> del tm["a"]
+        >>> list(tm.items())
+        [('b', 2)]
+        >>> del tm["a"]
+        KeyError: "Can't find `a` in the `extra.TreeMap()`!!"
+        """
+        sort_key, _, entry = self._search(key)
+        if entry is None:
+            raise KeyError(f"Can't find `{key}` in the `{self.__name__}`!!")
+        self._container.remove(sort_key)
+
+    def pop(self, key, default=_MISSING):
+        """
+        Removes the given key from the `TreeMap()` instance and returns its
+        value in time-complexity of O(h) where **h** is the height of the
+        underlying tree.
+
+        Parameters
+        ----------
+        key: object
+            The key to be removed.
+        default: object, optional
+            The value to be returned if the key doesn't exist. If not given,
+            a `KeyError` is raised instead.
+
+        Returns
+        -------
+        object:
+            The value associated with the removed key or `default` if the key
+            doesn't exist.
+
+        Raises
+        ------
+        KeyError:
+            If the given key doesn't exist in the `TreeMap()` instance and no
+            `default` is given.
+
+        Examples
+        --------
+        >>> tm = TreeMap({"a": 1, "b": 2})
+        >>> tm.pop("a")
+        1
+        >>> tm.pop("a", 0)
+        0
+        >>> tm.pop("a")
+        KeyError: "Can't find `a` in the `extra.TreeMap()`!!"
+        >>> list(tm.items())
+        [('b', 2)]
+        """
+        sort_key, _, entry = self._search(key)
+        if entry is None:
+            if default is _MISSING:
+                raise KeyError(
+                    f"Can't find `{key}` in the `{self.__name__}`!!"
+                )
+            return default
+        self._container.remove(sort_key)
+        return entry.get_value()
+
+    def clear(self):
+        """
+        Removes all keys within the `TreeMap()` in constant time.
+
+        Example
+        -------
+        >>> tm = TreeMap({"a": 1, "b": 2})
+        >>> tm.clear()
+        >>> tm.is_empty()
+        True
+        """
+        self._container._root = None
+        self._container._length = 0
+        self._container._refresh_fingers()
+
+    # =============================     MISC     ==============================
+    def to_dict(self):
+        """
+        Converts the `TreeMap()` instance to a python `dict` in
+        time-complexity of O(n) where **n** is the number of keys in the
+        instance. The returned `dict` preserves the order of the keys.
+
+        Returns
+        -------
+        dict:
+            A `dict` object containing the same key-value pairs as the
+            `TreeMap()` instance.
+
+        Example
+        -------
+        >>> tm = TreeMap([("b", 2), ("a", 1)])
+        >>> tm.to_dict()
+        {'a': 1, 'b': 2}
+        """
+        return dict(self.items())
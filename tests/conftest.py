@@ -128,23 +128,155 @@ class Helper:
         )
 
     @staticmethod
-    def verify_skiplist(skiplist):
+    def verify_subtree_sizes(start_node):
+        """
+        Checks that every node in the BST stores the right size of the subtree
+        rooted at it. It returns the size of the whole subtree or `-1` if any
+        stored size is wrong.
+        """
+        if start_node is None:
+            return 0
+        left_size = Helper.verify_subtree_sizes(start_node.get_left())
+        right_size = Helper.verify_subtree_sizes(start_node.get_right())
+        if left_size == -1 or right_size == -1:
+            return -1
+        size = 1 + left_size + right_size
+        return size if start_node.get_size() == size else -1
+
+    @staticmethod
+    def check_order_statistics(tree_class):
+        """
+        Checks the order statistics of the given BST class against a set of
+        values while inserting and removing random values.
+        """
+        rng = random.Random(4)
+        tree = tree_class()
+        values = set()
+        for _ in range(300):
+            value = rng.randrange(100)
+            if value not in values:
+                tree.insert(value)
+                values.add(value)
+            elif rng.random() < 0.4:
+                tree.remove(value)
+                values.discard(value)
+            assert Helper.verify_subtree_sizes(tree._root) == len(values)
+        expected = sorted(values)
+        assert [tree.select(i) for i in range(len(tree))] == expected
+        assert [tree[-i] for i in range(1, len(tree) + 1)] == expected[::-1]
+        assert [tree.rank(value) for value in expected] == list(
+            range(len(tree))
+        )
+        middle = len(expected) // 2
+        assert tree.median() == (
+            expected[middle]
+            if len(expected) % 2
+            else (expected[middle - 1] + expected[middle]) / 2
+        )
+
+    @staticmethod
+    def check_aggregate(tree_class):
+        """
+        Checks the range aggregates of the given BST class against a set of
+        values while inserting and removing random values.
+        """
+        rng = random.Random(6)
+        sum_tree = tree_class(aggregate="sum")
+        max_tree = tree_class(aggregate="max")
+        values = set()
+        for _ in range(300):
+            value = rng.randrange(100)
+            if value not in values:
+                sum_tree.insert(value)
+                max_tree.insert(value)
+                values.add(value)
+            elif rng.random() < 0.4:
+                sum_tree.remove(value)
+                max_tree.remove(value)
+                values.discard(value)
+            lo, hi = sorted(rng.sample(range(-5, 105), 2))
+            in_range = [v for v in values if lo <= v <= hi]
+            assert sum_tree.aggregate(lo, hi) == sum(in_range)
+            assert max_tree.aggregate(lo, hi) == max(
+                in_range, default=float("-inf")
+            )
+        # clearing keeps the aggregate
+        sum_tree.clear()
+        sum_tree.insert(5)
+        assert sum_tree.aggregate() == 5
+
+    @staticmethod
+    def check_insert_many_remove_many(tree_class, verify):
+        """
+        Checks inserting & removing batches of random values into the given
+        BST class where `verify` returns a truthy value if the tree passed
+        to it keeps the class's own rules.
+        """
+        rng = random.Random(7)
+        tree = tree_class.from_sorted(range(0, 1000, 3))
+        values = set(range(0, 1000, 3))
+        for batch_size in [1, 3, 10, 100, 300, 2]:
+            batch = [rng.randrange(1000) for _ in range(batch_size)]
+            tree.insert_many(batch)
+            values |= set(batch)
+            assert verify(tree)
+            batch = [rng.randrange(1000) for _ in range(batch_size)]
+            tree.remove_many(batch)
+            values -= set(batch)
+            assert verify(tree)
+            assert Helper.verify_bst_rules(tree._root)
+            assert Helper.verify_subtree_sizes(tree._root) == len(values)
+            assert tree.inorder_traverse() == sorted(values)
+
+    @staticmethod
+    def verify_skiplist(skiplist, check_widths=True):
+        head = skiplist._head
+        if head.get_data() != float("-inf"):
+            return False
+        if head.get_height() != skiplist.get_height():
+            return False
+        # the position of each node in the lowest level
+        positions = {}
+        curr_node, position = head, 0
+        while curr_node is not None:
+            positions[id(curr_node)] = position
+            curr_node, position = curr_node.get_next(), position + 1
         for level in range(skiplist.get_height()):
-            curr_node = skiplist._level_lists[level]._head
-            if curr_node.get_data() != float("-inf"):
-                return False
-            while curr_node.get_next() is not None:
-                next_node = curr_node.get_next()
-                if curr_node.get_data() >= next_node.get_data():
+            curr_node = head
+            while curr_node.get_next(level) is not None:
+                next_node = curr_node.get_next(level)
+                # NOTE: nodes are ordered by the keys stored in `_data`
+                if curr_node is not head and (
+                    curr_node._data >= next_node._data
+                ):
+                    return False
+                if next_node.get_height() <= level:
                     return False
-                if not (
-                    curr_node.get_down() is None
-                    or curr_node.get_down().get_data() == curr_node.get_data()
+                if check_widths and (
+                    curr_node._widths[level]
+                    != positions[id(next_node)] - positions[id(curr_node)]
                 ):
                     return False
                 curr_node = next_node
+            if check_widths and (
+                curr_node._widths[level] != position - positions[id(curr_node)]
+            ):
+                return False
         return True
 
+    @staticmethod
+    def count_skiplist_level(skiplist, level):
+        """
+        Counts the nodes at the given level of the skiplist including the -inf
+        sentinel node.
+        """
+        count = 0
+        curr_node = skiplist._head
+        while curr_node is not None:
+            count += 1
+            curr_node = curr_node.get_next(level)
+        return count
+
 
 @pytest.fixture
 def helper():
@@ -0,0 +1,140 @@
+import pytest
+import threading
+from extra.lists.concurrent_skip_list import (
+    ConcurrentSkipNode,
+    ConcurrentSkipList,
+)
+
+
+def test_concurrent_skip_node(helper):
+    with pytest.raises(ValueError):
+        ConcurrentSkipNode(None)
+    with pytest.raises(TypeError):
+        ConcurrentSkipNode(helper.get_string())
+    val = helper.get_float()
+    node = ConcurrentSkipNode(val, height=2)
+    assert node.get_data() == val
+    assert node.get_height() == 2
+    assert node.is_alive()
+    node = ConcurrentSkipNode(val, fully_linked=False)
+    assert not node.is_alive()
+
+
+def test_empty_concurrent_skiplist(helper):
+    with pytest.raises(TypeError):
+        ConcurrentSkipList(num_locks=helper.get_float())
+    with pytest.raises(ValueError):
+        ConcurrentSkipList(num_locks=0)
+    csl = ConcurrentSkipList()
+    assert csl.is_empty()
+    assert len(csl) == 0
+    assert csl.to_list() == [_ for _ in csl] == []
+    assert helper.get_int() not in csl
+    assert helper.get_string() not in csl
+    assert csl.floor(helper.get_int()) is None
+    assert csl.ceiling(helper.get_int()) is None
+    assert list(csl.irange()) == []
+    with pytest.raises(IndexError):
+        csl[0]
+    # doesn't raise error
+    csl.remove(helper.get_value())
+    csl.clear()
+    assert csl.is_empty()
+
+
+def test_concurrent_skiplist_with_random_numbers(helper):
+    lst = [helper.get_int() for _ in range(helper.get_pos_int())]
+    expected = sorted(set(lst))
+    csl = ConcurrentSkipList(lst)
+    assert len(csl) == len(expected)
+    assert csl.to_list() == [_ for _ in csl] == expected
+    assert helper.verify_skiplist(csl, check_widths=False)
+    for i, item in enumerate(expected):
+        assert item in csl
+        assert csl[i] == item
+        assert csl.floor(item) == csl.ceiling(item) == item
+        assert csl.bisect_left(item) == i
+        assert csl.bisect_right(item) == i + 1
+    lo, hi = sorted([helper.get_int(), helper.get_int()])
+    assert list(csl.irange(lo, hi)) == [x for x in expected if lo <= x <= hi]
+    assert list(csl.irange(lo, hi, inclusive=(False, False))) == [
+        x for x in expected if lo < x < hi
+    ]
+    for item in expected[::2]:
+        csl.remove(item)
+    assert csl.to_list() == expected[1::2]
+    assert len(csl) == len(expected[1::2])
+    csl.clear()
+    assert csl.is_empty()
+    assert csl.get_height() == 1
+    # from_sorted
+    csl = ConcurrentSkipList.from_sorted(expected)
+    assert isinstance(csl, ConcurrentSkipList)
+    assert csl.to_list() == expected
+    for item in expected:
+        csl.remove(item)
+    assert csl.is_empty()
+
+
+def test_concurrent_skiplist_with_multiple_threads(helper):
+    num_threads = 8
+    chunk = 300
+    csl = ConcurrentSkipList(range(0, num_threads * chunk, 2), num_locks=4)
+    # failures inside threads don't fail the test, so they are collected
+    # and checked after joining the threads
+    errors = []
+    snapshots = []
+
+    def start_thread(target, *args):
+        def run():
+            try:
+                target(*args)
+            except Exception as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def writer(tid):
+        start = tid * chunk
+        for i in range(start, start + chunk):
+            if i % 2:
+                csl.insert(i)
+            else:
+                csl.remove(i)
+
+    def reader():
+        for _ in range(20):
+            snapshots.append(csl.to_list())
+
+    threads = [start_thread(writer, tid) for tid in range(num_threads)]
+    threads += [start_thread(reader) for _ in range(2)]
+    for t in threads:
+        t.join()
+    assert errors == [] and len(snapshots) == 40
+    for values in snapshots:
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+    expected = list(range(1, num_threads * chunk, 2))
+    assert csl.to_list() == expected
+    assert len(csl) == len(expected)
+    assert helper.verify_skiplist(csl, check_widths=False)
+    # all threads insert and remove the same values
+    csl = ConcurrentSkipList()
+    values = list(range(200))
+
+    def same_values_writer():
+        for val in values:
+            csl.insert(val)
+        for val in values[::2]:
+            csl.remove(val)
+
+    threads = [
+        start_thread(same_values_writer) for _ in range(num_threads)
+    ]
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert csl.to_list() == values[1::2]
+    assert len(csl) == len(values[1::2])
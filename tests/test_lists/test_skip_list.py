@@ -1,5 +1,4 @@
 import pytest
-import random
 from extra.lists.skip_list import SkipNode, SkipList
 
 
@@ -17,18 +16,29 @@ def test_skip_node(helper):
     val = helper.get_float()
     node = SkipNode(val)
     assert node.get_data() == node._data == val
-    assert node.get_next() == node._next is None
-    assert node.get_down() == node._down is None
+    assert node.get_next() is None
+    assert node.get_height() == 1
+    # test SkipNode with multiple levels
+    node = SkipNode(val, height=3)
+    assert node.get_height() == 3
+    for level in range(3):
+        assert node.get_next(level) is None
+    other_node = SkipNode(val + 1)
+    node.set_next(other_node, level=2)
+    assert node.get_next(2) == other_node
+    assert node.get_next() is None
+    with pytest.raises(TypeError):
+        node.set_next(helper.get_value())
 
 
 def test_empty_skiplist(helper):
     sl = SkipList()
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
-    assert isinstance(sl._level_lists[0]._head, SkipNode)
-    assert sl._level_lists[0]._head.get_data() == float("-inf")
+    assert sl.get_height() == sl._head.get_height() == 1
+    assert helper.count_skiplist_level(sl, 0) == 1
+    assert isinstance(sl._head, SkipNode)
+    assert sl._head.get_data() == float("-inf")
     assert helper.get_value() not in sl
     assert helper.get_string() not in sl
     assert helper.get_list() not in sl
@@ -61,8 +71,8 @@ def test_skiplist_with_one_element(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == sl._head.get_height() == 1
+    assert helper.count_skiplist_level(sl, 0) == 1
 
 
 def test_skiplist_with_same_value(helper):
@@ -81,8 +91,8 @@ def test_skiplist_with_same_value(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == sl._head.get_height() == 1
+    assert helper.count_skiplist_level(sl, 0) == 1
     # ========== using from_iterable ==========
     val = helper.get_float()
     sl = SkipList([val for _ in range(helper.get_pos_int())])
@@ -96,13 +106,12 @@ def test_skiplist_with_same_value(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == sl._head.get_height() == 1
+    assert helper.count_skiplist_level(sl, 0) == 1
 
 
 def test_skiplist_with_known_values(helper):
-    random.seed(1)
-    sl = SkipList()
+    sl = SkipList(seed=74)
     sl.insert(2)
     sl.insert(2)  # do nothing
     sl.insert(0)
@@ -120,9 +129,9 @@ def test_skiplist_with_known_values(helper):
     assert sl.get_height() == 3
     assert sl.to_list() == [0, 2, 10, 50, 100]
     # check the structure
-    assert len(sl._level_lists[0]) == 6
-    assert len(sl._level_lists[1]) == 3
-    assert len(sl._level_lists[2]) == 2
+    assert helper.count_skiplist_level(sl, 0) == 6
+    assert helper.count_skiplist_level(sl, 1) == 3
+    assert helper.count_skiplist_level(sl, 2) == 2
     assert helper.verify_skiplist(sl)
     # remove an item
     sl.remove(2)
@@ -136,8 +145,8 @@ def test_skiplist_with_known_values(helper):
     assert 20 not in sl
     assert sl.to_list() == [0, 10, 50, 100]
     # check the structure
-    assert len(sl._level_lists[0]) == 5
-    assert len(sl._level_lists[1]) == 2
+    assert helper.count_skiplist_level(sl, 0) == 5
+    assert helper.count_skiplist_level(sl, 1) == 2
     assert helper.verify_skiplist(sl)
     # clear
     sl.clear()
@@ -156,7 +165,7 @@ def test_skiplist_with_random_numbers(helper):
     assert len(sl) == length
     assert not sl.is_empty()
     assert sl.to_list() == [i for i in range(length)]
-    assert sl.get_height() == len(sl._level_lists)
+    assert sl.get_height() == sl._head.get_height()
     # search
     for i in range(length):
         assert sl[i] == i
@@ -175,7 +184,7 @@ def test_skiplist_with_random_numbers(helper):
     assert len(sl) == length
     assert not sl.is_empty()
     assert sl.to_list() == [i for i in range(length)]
-    assert sl.get_height() == len(sl._level_lists)
+    assert sl.get_height() == sl._head.get_height()
     # search
     for i in range(length):
         assert sl[i] == i
@@ -195,7 +204,7 @@ def test_skiplist_with_from_iterable(helper):
     assert len(sl) == len(_set)
     assert not sl.is_empty()
     assert sl.to_list() == sorted(_set)
-    assert sl.get_height() == len(sl._level_lists)
+    assert sl.get_height() == sl._head.get_height()
     # search
     for i in _set:
         assert i in sl
@@ -206,3 +215,154 @@ def test_skiplist_with_from_iterable(helper):
     assert len(sl) == 0
     assert sl.get_height() == 1
     assert sl.to_list() == []
+
+
+def test_skiplist_from_sorted(helper):
+    with pytest.raises(TypeError):
+        SkipList.from_sorted(helper.get_int())
+    with pytest.raises(ValueError):
+        SkipList.from_sorted([1, 3, 2])
+    with pytest.raises(ValueError):
+        SkipList.from_sorted([1, None])
+    with pytest.raises(TypeError):
+        SkipList.from_sorted([1, helper.get_string()])
+    # empty iterable
+    sl = SkipList.from_sorted([])
+    assert sl.is_empty()
+    assert sl.get_height() == 1
+    # known values
+    sl = SkipList.from_sorted([1, 2, 2, 3, 4, 5, 6])
+    assert sl.to_list() == [1, 2, 3, 4, 5, 6]
+    assert len(sl) == 6
+    assert sl.get_height() == 3
+    assert helper.count_skiplist_level(sl, 0) == 7
+    assert helper.count_skiplist_level(sl, 1) == 4
+    assert helper.count_skiplist_level(sl, 2) == 2
+    assert helper.verify_skiplist(sl)
+    # a large p links the values as if it were 0.5
+    sl = SkipList.from_sorted([1, 2, 3, 4, 5, 6], p=0.9)
+    assert sl.get_height() == 3
+    assert helper.count_skiplist_level(sl, 1) == 4
+    assert helper.verify_skiplist(sl)
+    # random values
+    lst = sorted(helper.get_float() for _ in range(helper.get_pos_int()))
+    sl = SkipList.from_sorted(lst)
+    assert sl.to_list() == [_ for _ in sl] == sorted(set(lst))
+    assert len(sl) == len(set(lst))
+    assert helper.verify_skiplist(sl)
+    for item in lst:
+        assert item in sl
+    # it behaves like any other skiplist afterwards
+    val = helper.get_float()
+    sl.insert(val)
+    assert val in sl
+    assert helper.verify_skiplist(sl)
+    for item in set(lst) | {val}:
+        sl.remove(item)
+    assert sl.is_empty()
+    assert sl.get_height() == 1
+
+
+def test_skiplist_neighbors_and_bisect(helper):
+    sl = SkipList()
+    val = helper.get_float()
+    assert sl.floor(val) is None
+    assert sl.ceiling(val) is None
+    assert sl.bisect_left(val) == sl.bisect_right(val) == 0
+    assert list(sl.irange()) == list(sl.irange(val, val + 1)) == []
+    with pytest.raises(TypeError):
+        sl.floor(helper.get_string())
+    with pytest.raises(TypeError):
+        sl.ceiling(helper.get_list())
+    with pytest.raises(ValueError):
+        sl.bisect_left(None)
+    with pytest.raises(TypeError):
+        list(sl.irange(helper.get_string()))
+    # known values
+    sl = SkipList([1, 3, 5, 7, 9])
+    assert sl.floor(5) == sl.ceiling(5) == 5
+    assert sl.floor(6) == 5
+    assert sl.ceiling(6) == 7
+    assert sl.floor(0) is None
+    assert sl.ceiling(10) is None
+    assert sl.bisect_left(5) == 2
+    assert sl.bisect_right(5) == 3
+    assert sl.bisect_left(0) == sl.bisect_right(0) == 0
+    assert sl.bisect_left(10) == sl.bisect_right(10) == 5
+    assert list(sl.irange()) == [1, 3, 5, 7, 9]
+    assert list(sl.irange(3, 7)) == [3, 5, 7]
+    assert list(sl.irange(3, 7, inclusive=(False, False))) == [5]
+    assert list(sl.irange(2, 8, inclusive=(False, False))) == [3, 5, 7]
+    assert list(sl.irange(lo=7)) == [7, 9]
+    assert list(sl.irange(hi=3, inclusive=(True, False))) == [1]
+    assert list(sl.irange(7, 3)) == []
+
+
+def test_skiplist_positions_with_random_numbers(helper):
+    lst = [helper.get_int() for _ in range(helper.get_pos_int())]
+    sl = SkipList(lst)
+    expected = sorted(set(lst))
+    assert helper.verify_skiplist(sl)
+    for i, item in enumerate(expected):
+        assert sl[i] == item
+        assert sl.bisect_left(item) == i
+        assert sl.bisect_right(item) == i + 1
+    lo, hi = sorted([helper.get_int(), helper.get_int()])
+    assert list(sl.irange(lo, hi)) == [x for x in expected if lo <= x <= hi]
+    # remove random items by index and value
+    for _ in range(len(expected) // 2):
+        idx = helper.get_int(0, len(expected) - 1)
+        assert sl[idx] == expected[idx]
+        del sl[idx]
+        del expected[idx]
+        assert helper.verify_skiplist(sl)
+    assert sl.to_list() == expected
+    for item in expected:
+        assert sl.floor(item) == sl.ceiling(item) == item
+        sl.remove(item)
+    assert sl.is_empty()
+    assert helper.verify_skiplist(sl)
+
+
+def test_skiplist_level_parameters(helper):
+    # invalid parameters
+    with pytest.raises(TypeError):
+        SkipList(p=helper.get_string())
+    with pytest.raises(ValueError):
+        SkipList(p=0)
+    with pytest.raises(ValueError):
+        SkipList(p=1)
+    with pytest.raises(ValueError):
+        SkipList(p=helper.get_pos_float(1.1))
+    with pytest.raises(TypeError):
+        SkipList(max_level=helper.get_float())
+    with pytest.raises(ValueError):
+        SkipList(max_level=0)
+    with pytest.raises(ValueError):
+        SkipList.from_sorted([1, 2], p=-0.5)
+    # same seed means same structure
+    lst = [helper.get_int() for _ in range(helper.get_pos_int())]
+    seed = helper.get_int()
+    assert repr(SkipList(lst, seed=seed)) == repr(SkipList(lst, seed=seed))
+    # bounded height
+    max_level = helper.get_pos_int(b=5)
+    sl = SkipList(range(1000), p=0.9, max_level=max_level)
+    assert sl.get_height() <= max_level
+    assert helper.verify_skiplist(sl)
+    sl.clear()
+    for i in range(1000):
+        sl.insert(i)
+    assert sl.get_height() <= max_level
+    assert helper.verify_skiplist(sl)
+    sl = SkipList.from_sorted(range(1000), max_level=max_level)
+    assert sl.get_height() <= max_level
+    assert helper.verify_skiplist(sl)
+    # a smaller probability means fewer levels
+    sl = SkipList.from_sorted(range(1, 1001), p=0.1)
+    assert sl.get_height() == 4
+    assert helper.count_skiplist_level(sl, 1) == 101
+    assert helper.count_skiplist_level(sl, 3) == 2
+    assert helper.verify_skiplist(sl)
+    sl = SkipList(lst, p=0.25)
+    assert sl.to_list() == sorted(set(lst))
+    assert helper.verify_skiplist(sl)
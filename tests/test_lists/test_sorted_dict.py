@@ -0,0 +1,87 @@
+import pytest
+from extra.lists.sorted_dict import SortedDictNode, SortedDict
+
+
+def test_sorted_dict_node(helper):
+    with pytest.raises(ValueError):
+        SortedDictNode(helper.get_string(), None)
+    with pytest.raises(ValueError):
+        SortedDictNode(None, helper.get_value())
+    key, val = helper.get_string(), helper.get_value()
+    node = SortedDictNode(key, val)
+    assert node.get_data() == key
+    assert node.get_value() == val
+    node.set_value(key)
+    assert node.get_value() == key
+    with pytest.raises(TypeError):
+        node.set_value(SortedDict())
+
+
+def test_empty_sorted_dict(helper):
+    sd = SortedDict()
+    assert sd.is_empty()
+    assert len(sd) == 0
+    assert list(sd) == list(sd.items()) == list(sd.values()) == []
+    assert sd.to_dict() == {}
+    assert helper.get_value() not in sd
+    assert sd.get(helper.get_string()) is None
+    assert sd.pop(helper.get_string(), 0) == 0
+    assert sd.pop(helper.get_string(), None) is None
+    with pytest.raises(KeyError):
+        sd.pop(helper.get_string())
+    with pytest.raises(KeyError):
+        sd[helper.get_string()]
+    with pytest.raises(KeyError):
+        del sd[helper.get_string()]
+    with pytest.raises(ValueError):
+        sd[None] = helper.get_value()
+    with pytest.raises(ValueError):
+        sd[helper.get_string()] = None
+    with pytest.raises(TypeError):
+        SortedDict(helper.get_int())
+    with pytest.raises(TypeError):
+        SortedDict(key=helper.get_int())
+    sd.clear()
+
+
+def test_sorted_dict_with_random_items(helper):
+    d = {helper.get_string(): helper.get_int() for _ in range(200)}
+    sd = SortedDict(d)
+    assert helper.verify_skiplist(sd._container)
+    assert len(sd) == len(d)
+    assert list(sd) == list(sd.keys()) == sorted(d)
+    assert list(sd.items()) == sorted(d.items())
+    assert list(sd.values()) == [d[k] for k in sorted(d)]
+    assert sd.to_dict() == d
+    for key, value in d.items():
+        assert key in sd
+        assert sd[key] == sd.get(key) == value
+    assert helper.get_int() not in sd
+    # range views
+    lo, hi = sorted(d)[10], sorted(d)[50]
+    expected = [k for k in sorted(d) if lo < k <= hi]
+    assert list(sd.irange(lo, hi, inclusive=(False, True))) == expected
+    assert list(sd.irange_items(lo, hi, (False, True))) == [
+        (k, d[k]) for k in expected
+    ]
+    # update values
+    for key in d:
+        sd[key] = -d[key]
+    assert len(sd) == len(d)
+    assert all(sd[key] == -value for key, value in d.items())
+    # remove keys
+    keys = list(d)
+    for key in keys[::2]:
+        assert sd.pop(key) == -d[key]
+    for key in keys[1::2]:
+        del sd[key]
+    assert sd.is_empty()
+    assert helper.verify_skiplist(sd._container)
+
+
+def test_sorted_dict_with_key(helper):
+    sd = SortedDict([(3, "c"), (1, "a"), (2, "b")], key=lambda x: -x)
+    assert list(sd) == [3, 2, 1]
+    assert list(sd.irange(3, 2)) == [3, 2]
+    sd[0] = "z"
+    assert list(sd.items()) == [(3, "c"), (2, "b"), (1, "a"), (0, "z")]
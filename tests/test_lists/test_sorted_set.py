@@ -0,0 +1,86 @@
+import pytest
+from extra.lists.sorted_set import SortedNode, SortedSet
+
+
+def test_sorted_node(helper):
+    with pytest.raises(ValueError):
+        SortedNode(None)
+    with pytest.raises(TypeError):
+        SortedNode(SortedNode(10))
+    val = helper.get_string()
+    node = SortedNode(val, height=2)
+    assert node.get_data() == node.get_key() == val
+    assert node.get_height() == 2
+    node = SortedNode(val, key=len(val))
+    assert node.get_data() == val
+    assert node.get_key() == node._data == len(val)
+    assert node._represent() == val
+
+
+def test_empty_sorted_set(helper):
+    ss = SortedSet()
+    assert ss.is_empty()
+    assert ss.to_list() == [_ for _ in ss] == []
+    assert helper.get_string() not in ss
+    assert helper.get_value() not in ss
+    assert None not in ss
+    assert list(ss.irange()) == []
+    assert ss.floor(helper.get_string()) is None
+    with pytest.raises(IndexError):
+        ss[0]
+    with pytest.raises(TypeError):
+        SortedSet(key=helper.get_int())
+    with pytest.raises(TypeError):
+        SortedSet(helper.get_int())
+    with pytest.raises(ValueError):
+        SortedSet([helper.get_string(), None])
+    # doesn't raise error
+    ss.remove(helper.get_value())
+    ss.remove(None)
+    ss.clear()
+
+
+def test_sorted_set_with_strings(helper):
+    lst = list({helper.get_string() for _ in range(200)})
+    ss = SortedSet(lst)
+    assert helper.verify_skiplist(ss)
+    assert len(ss) == len(lst)
+    assert ss.to_list() == sorted(lst)
+    assert ss.to_list() == SortedSet.from_sorted(sorted(lst)).to_list()
+    assert helper.get_int() not in ss
+    for idx, item in enumerate(sorted(lst)):
+        assert item in ss
+        assert ss[idx] == item
+        assert ss.bisect_left(item) == idx
+        assert ss.bisect_right(item) == idx + 1
+    lo, hi = sorted(lst[:2])
+    assert list(ss.irange(lo, hi)) == [x for x in sorted(lst) if lo <= x <= hi]
+    # inserting existing items does nothing
+    for item in lst:
+        ss.insert(item)
+    assert len(ss) == len(lst)
+    with pytest.raises(TypeError):
+        ss.insert(helper.get_int())
+    # remove items
+    for item in lst[::2]:
+        ss.remove(item)
+        assert item not in ss
+    assert helper.verify_skiplist(ss)
+    assert ss.to_list() == sorted(lst[1::2])
+
+
+def test_sorted_set_with_key(helper):
+    lst = [helper.get_int() for _ in range(200)]
+    ss = SortedSet(lst, key=lambda x: -x)
+    assert helper.verify_skiplist(ss)
+    assert ss.to_list() == sorted(set(lst), reverse=True)
+    assert ss.floor(min(lst) - 1) == min(lst)
+    assert ss.ceiling(max(lst) + 1) == max(lst)
+    # items with equal keys are considered the same
+    ss = SortedSet(["one", "two", "three"], key=len)
+    assert ss.to_list() == ["one", "three"]
+    assert "six" in ss
+    ss.remove("six")
+    assert ss.to_list() == ["three"]
+    with pytest.raises(ValueError):
+        SortedSet.from_sorted(["aa", "b"], key=len)
@@ -23,6 +23,7 @@ def test_avl_node(helper):
         assert node.get_children() == []
         assert node._height == 0
         assert node.get_children_heights() == [0, 0]
+        assert node.get_balance() == 0
         assert node.is_balanced()
         with pytest.raises(TypeError):
             node.set_height(helper.get_string())
@@ -501,3 +502,67 @@ def test_random_avl(helper):
     for num in lst:
         avl.remove(num)
         assert avl.is_balanced()
+
+
+def test_order_statistics(helper):
+    helper.check_order_statistics(AVL)
+
+
+def test_aggregate(helper):
+    helper.check_aggregate(AVL)
+
+
+def test_from_sorted(helper):
+    for length in range(1, 70):
+        avl = AVL.from_sorted(range(length))
+        assert avl.is_balanced()
+        assert avl._root.get_height() == length.bit_length() - 1
+        assert helper.verify_subtree_sizes(avl._root) == length
+    avl.insert(100)
+    avl.remove(10)
+    assert avl.is_balanced()
+    avl = AVL.from_iterable([7, 1, 6, 2, 5, 3, 4])
+    assert avl.to_list() == [4, 2, 6, 1, 3, 5, 7]
+
+
+def test_insert_many_remove_many(helper):
+    helper.check_insert_many_remove_many(AVL, AVL.is_balanced)
+
+
+def verify_balance_factors(start_node):
+    # returns the height of the subtree after checking the cached heights
+    if start_node is None:
+        return -1
+    left_height = verify_balance_factors(start_node.get_left())
+    right_height = verify_balance_factors(start_node.get_right())
+    assert start_node.get_height() == max(left_height, right_height) + 1
+    assert start_node.get_balance() == right_height - left_height
+    assert start_node.get_balance() in {-1, 0, 1}
+    return start_node.get_height()
+
+
+def test_early_exit_retracing(helper):
+    avl = AVL()
+    values = set()
+    for _ in range(2000):
+        value = helper.get_int(0, 300)
+        if random.random() < 0.55:
+            avl.insert(value)
+            values.add(value)
+        else:
+            avl.remove(value)
+            values.discard(value)
+        assert len(avl) == len(values)
+    verify_balance_factors(avl._root)
+    assert helper.verify_bst_rules(avl._root)
+    assert helper.verify_subtree_sizes(avl._root) == len(values)
+    assert avl.inorder_traverse() == sorted(values)
+    # insertion needs one rotation at most
+    rotations = []
+    rebalance = avl._rebalance
+    avl._rebalance = lambda node: rotations.append(node) or rebalance(node)
+    for value in range(1000, 1500):
+        rotations.clear()
+        avl.insert(value)
+        assert len(rotations) <= 1
+    verify_balance_factors(avl._root)
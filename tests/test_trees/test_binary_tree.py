@@ -1,5 +1,13 @@
+import random
 import pytest
 
+from extra.trees.tree import Tree
+from extra.trees.bst import BST
+from extra.trees.avl import AVL
+from extra.trees.red_black_tree import RedBlackTree
+from extra.trees.splay_tree import SplayTree
+from extra.trees.treap import Treap
+from extra.trees.implicit_treap import ImplicitTreap
 from extra.trees.binary_tree import BinaryTreeNode, BinaryTree
 
 
@@ -193,3 +201,215 @@ def test_parse(helper):
     # clear this binary tree
     btree.clear()
     test_empty_binary_tree(helper, btree)
+
+
+def test_lazy_traversals():
+    btree = BinaryTree.parse([1, [2, 4, 5], [3, 6, 7]])
+    assert list(btree.iter_preorder()) == [1, 2, 4, 5, 3, 6, 7]
+    assert list(btree.iter_preorder(reverse=True)) == [1, 3, 7, 6, 2, 5, 4]
+    assert list(btree.iter_inorder()) == [4, 2, 5, 1, 6, 3, 7]
+    assert list(btree.iter_inorder(reverse=True)) == [7, 3, 6, 1, 5, 2, 4]
+    assert list(btree.iter_postorder()) == [4, 5, 2, 6, 7, 3, 1]
+    assert list(btree.iter_postorder(reverse=True)) == [7, 6, 3, 5, 4, 2, 1]
+    assert list(btree.iter_level_order()) == [1, 2, 3, 4, 5, 6, 7]
+    assert list(btree.iter_level_order(reverse=True)) == [
+        1, 3, 2, 7, 6, 5, 4
+    ]
+    # generators can be stopped early
+    gen = btree.iter_inorder()
+    assert next(gen) == 4
+    assert next(gen) == 2
+    # empty tree
+    empty = BinaryTree()
+    assert list(empty.iter_preorder()) == []
+    assert list(empty.iter_inorder()) == []
+    assert list(empty.iter_postorder()) == []
+    assert list(empty.iter_level_order()) == []
+    with pytest.raises(TypeError):
+        btree.iter_inorder(reverse=1)
+    with pytest.raises(TypeError):
+        btree.iter_level_order(reverse="yes")
+
+
+def test_lazy_traversals_of_skewed_tree():
+    # deeper than the recursion limit
+    btree = BinaryTree()
+    btree._root = node = BinaryTreeNode(4999)
+    for value in range(4998, -1, -1):
+        node.set_left(BinaryTreeNode(value))
+        node = node.get_left()
+    assert list(btree.iter_inorder()) == list(range(5000))
+    assert btree.postorder_traverse() == list(range(5000))
+    assert btree.preorder_traverse() == list(range(4999, -1, -1))
+
+
+def random_binary_tree(size):
+    btree = BinaryTree()
+    nodes = [BinaryTreeNode(0)]
+    btree._root = nodes[0]
+    for value in range(1, size):
+        parent = random.choice(nodes)
+        while parent.get_left() is not None and parent.get_right() is not None:
+            parent = random.choice(nodes)
+        node = BinaryTreeNode(value)
+        if parent.get_left() is None and random.random() < 0.5:
+            parent.set_left(node)
+        elif parent.get_right() is None:
+            parent.set_right(node)
+        else:
+            parent.set_left(node)
+        nodes.append(node)
+    return btree
+
+
+def test_stats_match_recursive_metrics():
+    for _ in range(50):
+        btree = random_binary_tree(random.randint(1, 40))
+        stats = btree.stats()
+        assert stats["length"] == Tree.__len__(btree)
+        assert stats["height"] == btree.get_height()
+        assert btree.get_height() == Tree.get_height(btree)
+        assert btree.get_depth() == Tree.get_depth(btree) == 0
+        assert btree.count_leaf_nodes() == Tree.count_leaf_nodes(btree)
+        assert btree.get_nodes_per_level() == Tree.get_nodes_per_level(btree)
+        root = btree._root
+        assert btree.is_strict() == all(
+            (node.get_left() is None) == (node.get_right() is None)
+            for node in btree._iter_preorder_nodes(root)
+        )
+        assert btree.is_perfect() == (
+            len(btree) == 2 ** (btree.get_height() + 1) - 1
+        )
+        # each side's depth as measured by the recursive implementation
+        left_depth, right_depth = (
+            0 if child is None else 1 + btree._get_depth(child)
+            for child in (root.get_left(), root.get_right())
+        )
+        assert btree.is_balanced() == (abs(left_depth - right_depth) <= 1)
+    assert BinaryTree().stats() == {
+        "length": 0,
+        "height": 0,
+        "depth": 0,
+        "leaf_nodes": 0,
+        "nodes_per_level": (),
+        "is_balanced": True,
+        "is_perfect": True,
+        "is_strict": True,
+    }
+
+
+def test_stats_cache():
+    btree = BinaryTree.parse([1, [2, 4, 5], [3, 6, 7]])
+    stats = btree.stats()
+    assert stats["is_perfect"] and stats["height"] == 2
+    cached = btree._stats
+    btree.get_height()
+    btree.get_nodes_per_level()[0].append(100)
+    assert btree._stats is cached
+    assert btree.get_nodes_per_level() == [[1], [2, 3], [4, 5, 6, 7]]
+    # editing nodes directly refreshes the cache as well
+    btree._root.get_left().get_left().set_left(BinaryTreeNode(8))
+    assert btree.get_height() == 3
+    assert not btree.is_perfect() and not btree.is_strict()
+    assert btree._stats is not cached
+    assert btree.count_leaf_nodes() == 4 and len(btree) == 8
+    cached = btree._stats
+    # replacing a node keeps the size, but not the metrics
+    btree._root.get_right().set_right(BinaryTreeNode(9))
+    assert btree.get_nodes_per_level() == [[1], [2, 3], [4, 5, 6, 9], [8]]
+    assert btree._stats is not cached
+    # and so does invalidating it explicitly
+    cached = btree._stats
+    btree.invalidate()
+    assert btree.get_height() == 3 and btree._stats is not cached
+    # so does replacing the root
+    btree._root = BinaryTreeNode(0)
+    assert btree.get_height() == 0
+    assert btree.get_nodes_per_level() == [[0]]
+    btree.clear()
+    assert btree.stats()["length"] == 0
+
+
+def test_stats_of_skewed_tree():
+    # deeper than the recursion limit
+    btree = BinaryTree()
+    btree._root = node = BinaryTreeNode(0)
+    for value in range(1, 5000):
+        node.set_right(BinaryTreeNode(value))
+        node = node.get_right()
+    assert btree.get_height() == 4999
+    assert btree.count_leaf_nodes() == 1
+    assert not btree.is_strict()
+    assert not btree.is_balanced()
+    assert btree.stats()["length"] == 5000
+
+
+def test_maintained_sizes():
+    btree = BinaryTree.parse([1, [2, 4, 5], [3, 6, 7]])
+    assert len(btree) == 7
+    left = btree._root.get_left()
+    assert left.get_size() == 3 and left.get_parent() is btree._root
+    # replacing a child unlinks the old one
+    old_node = left.get_left()
+    left.set_left(BinaryTree.parse([8, 9, 10])._root)
+    assert old_node.get_parent() is None
+    assert left.get_size() == 5 and len(btree) == 9
+    left.get_left().get_left().set_right(BinaryTreeNode(11))
+    assert len(btree) == 10
+    assert len(btree) == btree.stats()["length"]
+    # setting the same child again changes nothing
+    right = btree._root.get_right()
+    btree._root.set_right(right)
+    assert len(btree) == 10 and right.get_parent() is btree._root
+    assert len(random_binary_tree(100)) == 100
+
+
+def test_stats_cache_per_tree():
+    quiet = BinaryTree.parse([1, [2], [3]])
+    quiet.stats()
+    cached = quiet._stats
+    rng = random.Random(8)
+    for tree_class in [BST, AVL, RedBlackTree, SplayTree, Treap]:
+        tree = tree_class()
+        for _ in range(100):
+            value = rng.randrange(50)
+            if value in tree:
+                tree.remove(value)
+            else:
+                tree.insert(value)
+            assert tree.stats() == tree._compute_stats()
+        operations = [
+            lambda: tree.insert_many(range(100, 200)),
+            lambda: tree.remove_many(range(150, 200)),
+            lambda: tree.pop_min(),
+            lambda: tree.remove_range(10, 20),
+            # searching a splay tree moves nodes around
+            lambda: tree.floor(25),
+            lambda: tree.successor(10),
+            lambda: 30 in tree,
+        ]
+        if tree_class is Treap:
+            operations += [
+                lambda: tree.update(range(0, 60, 3)),
+                lambda: tree.symmetric_difference_update(range(0, 30, 5)),
+                lambda: tree.join(Treap(range(300, 310))),
+            ]
+        for operation in operations:
+            operation()
+            assert tree.stats() == tree._compute_stats()
+    itreap = ImplicitTreap(range(20))
+    operations = [
+        lambda: itreap.insert(3, 100),
+        lambda: itreap.__setitem__(0, -1),
+        lambda: itreap.__delitem__(slice(3, 10)),
+        lambda: itreap.__delitem__(2),
+        lambda: itreap.add_front(100),
+        lambda: itreap.add_end(200),
+        lambda: itreap.concat(ImplicitTreap([5, 6])),
+    ]
+    for operation in operations:
+        operation()
+        assert itreap.stats() == itreap._compute_stats()
+    # other trees don't invalidate the cache of a quiet tree
+    quiet.stats()
+    assert quiet._stats is cached
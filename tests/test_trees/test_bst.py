@@ -1,6 +1,11 @@
+import random
 import pytest
 
 from extra.trees.bst import BSTNode, BST
+from extra.trees.avl import AVL
+from extra.trees.red_black_tree import RedBlackTree
+from extra.trees.splay_tree import SplayTree
+from extra.trees.treap import Treap
 
 
 def test_bst_node(helper):
@@ -14,6 +19,11 @@ def test_bst_node(helper):
         BSTNode(helper.get_string())
     with pytest.raises(TypeError):
         BSTNode(helper.get_list())
+    with pytest.raises(ValueError):
+        BSTNode(None, numeric_only=False)
+    with pytest.raises(TypeError):
+        BSTNode(BST(), numeric_only=False)
+    assert BSTNode("  ", numeric_only=False).get_data() == "  "
     # these shouldn't raise any erros
     for val in [helper.get_int(), helper.get_float()]:
         node = BSTNode(val)
@@ -244,3 +254,391 @@ def test_bst_big_example(helper):
     test_empty_bst(bst)
     # validate
     test_search_insert_remove_input(helper, bst)
+
+
+def test_bst_deeper_than_recursion_limit():
+    # sorted input degenerates the BST into a linked list whose depth exceeds
+    # Python's default recursion limit
+    n = 5000
+    bst = BST(range(n))
+    assert len(bst) == n
+    assert bst.get_min() == 0
+    assert bst.get_max() == n - 1
+    assert 0 in bst and n - 1 in bst and n not in bst
+    bst.insert(n)
+    assert bst.get_max() == n
+    bst.remove(n // 2)
+    bst.remove(n)
+    bst.remove(0)
+    assert n // 2 not in bst
+    assert len(bst) == n - 2
+    assert bst.get_min() == 1
+    assert bst.get_max() == n - 1
+
+
+def test_bst_random_removals(helper):
+    rng = random.Random(0)
+    for _ in range(50):
+        values = rng.sample(range(500), 100)
+        bst = BST(values)
+        removed = rng.sample(values, 60)
+        for value in removed:
+            bst.remove(value)
+            assert helper.verify_bst_rules(bst._root)
+        assert len(bst) == 40
+        assert bst.inorder_traverse() == sorted(set(values) - set(removed))
+
+
+def test_bst_neighbors(helper):
+    bst = BST([8, 5, 2, 7, 15, 10, 3])
+    assert bst.floor(7) == 7
+    assert bst.floor(9) == 8
+    assert bst.floor(1) is None
+    assert bst.ceiling(7) == 7
+    assert bst.ceiling(9) == 10
+    assert bst.ceiling(20) is None
+    assert bst.predecessor(7) == 5
+    assert bst.predecessor(2) is None
+    assert bst.successor(7) == 8
+    assert bst.successor(15) is None
+    assert BST().floor(1) is None
+    assert BST().successor(1) is None
+    with pytest.raises(ValueError):
+        bst.floor(None)
+    with pytest.raises(TypeError):
+        bst.ceiling(helper.get_string())
+    # compare against brute force
+    rng = random.Random(1)
+    values = rng.sample(range(1000), 200)
+    bst = BST(values)
+    for query in range(-5, 1005, 7):
+        less = [v for v in values if v < query]
+        greater = [v for v in values if v > query]
+        floor = [v for v in values if v <= query]
+        ceiling = [v for v in values if v >= query]
+        assert bst.floor(query) == (max(floor) if floor else None)
+        assert bst.ceiling(query) == (min(ceiling) if ceiling else None)
+        assert bst.predecessor(query) == (max(less) if less else None)
+        assert bst.successor(query) == (min(greater) if greater else None)
+
+
+def test_bst_irange_and_remove_range():
+    bst = BST([8, 5, 2, 7, 15, 10, 3])
+    assert list(bst.irange()) == [2, 3, 5, 7, 8, 10, 15]
+    assert list(bst.irange(3, 8)) == [3, 5, 7, 8]
+    assert list(bst.irange(3, 8, inclusive=(False, False))) == [5, 7]
+    assert list(bst.irange(lo=9)) == [10, 15]
+    assert list(bst.irange(hi=5)) == [2, 3, 5]
+    assert list(bst.irange(11, 14)) == []
+    assert list(bst.irange(20, 10)) == []
+    assert list(BST().irange(1, 2)) == []
+    with pytest.raises(TypeError):
+        list(bst.irange("1", 2))
+    # lazy
+    gen = bst.irange(4)
+    assert next(gen) == 5
+    assert next(gen) == 7
+    # remove_range
+    assert bst.remove_range(3, 7) == 3
+    assert bst.inorder_traverse() == [2, 8, 10, 15]
+    assert len(bst) == 4
+    assert bst.remove_range(11, 14) == 0
+    assert bst.remove_range() == 4
+    assert bst.is_empty()
+    # compare against brute force
+    rng = random.Random(2)
+    values = rng.sample(range(1000), 200)
+    bst = BST(values)
+    expected = sorted(values)
+    for _ in range(20):
+        lo = rng.randrange(1000)
+        hi = lo + rng.randrange(100)
+        assert list(bst.irange(lo, hi)) == [
+            v for v in expected if lo <= v <= hi
+        ]
+        bst.remove_range(lo, hi, inclusive=(True, False))
+        expected = [v for v in expected if not lo <= v < hi]
+        assert bst.inorder_traverse() == expected
+
+
+def test_bst_order_statistics(helper):
+    bst = BST([8, 5, 2, 7, 15, 10, 3])
+    assert helper.verify_subtree_sizes(bst._root) == 7
+    assert [bst.select(i) for i in range(7)] == [2, 3, 5, 7, 8, 10, 15]
+    assert [bst[i] for i in range(-7, 0)] == [2, 3, 5, 7, 8, 10, 15]
+    assert bst.rank(2) == 0
+    assert bst.rank(7) == 3
+    assert bst.rank(9) == 5
+    assert bst.rank(100) == 7
+    assert bst.median() == 7
+    bst.insert(20)
+    assert bst.median() == 7.5
+    with pytest.raises(IndexError):
+        bst.select(8)
+    with pytest.raises(IndexError):
+        bst.select(-1)
+    with pytest.raises(IndexError):
+        bst[-9]
+    with pytest.raises(IndexError):
+        bst[1:3]
+    with pytest.raises(TypeError):
+        bst["1"]
+    with pytest.raises(TypeError):
+        bst.rank(helper.get_string())
+    with pytest.raises(IndexError):
+        BST().median()
+    with pytest.raises(IndexError):
+        BST()[0]
+    # sizes are kept up-to-date while inserting and removing
+    rng = random.Random(3)
+    for _ in range(300):
+        value = rng.randrange(100)
+        if value not in bst:
+            bst.insert(value)
+        elif rng.random() < 0.4:
+            bst.remove(value)
+        assert helper.verify_subtree_sizes(bst._root) == len(bst)
+    expected = bst.inorder_traverse()
+    assert [bst[i] for i in range(len(bst))] == expected
+    assert [bst.rank(value) for value in expected] == list(range(len(bst)))
+
+
+def test_bst_aggregate(helper):
+    bst = BST([8, 5, 2, 7, 15, 10, 3], aggregate="sum")
+    assert bst.aggregate() == 50
+    assert bst.aggregate(3, 8) == 23
+    assert bst.aggregate(3, 8, inclusive=(False, False)) == 12
+    assert bst.aggregate(11, 14) == 0
+    assert BST([8, 5, 2], aggregate="count").aggregate(hi=5) == 2
+    assert BST([8, 5, 2], aggregate="min").aggregate(lo=3) == 5
+    assert BST([8, 5, 2], aggregate="max").aggregate(hi=7) == 5
+    assert BST(aggregate="max").aggregate() == float("-inf")
+    with pytest.raises(ValueError):
+        BST([1, 2]).aggregate()
+    with pytest.raises(ValueError):
+        BST(aggregate="mean")
+    with pytest.raises(TypeError):
+        BST(aggregate=sum)
+    with pytest.raises(TypeError):
+        bst.aggregate(helper.get_string())
+    # custom non-commutative aggregate keeps the ascending order
+    first = (lambda a, b: b if a is None else a, None)
+    bst = BST([8, 5, 2, 7, 15, 10, 3], aggregate=first)
+    assert bst.aggregate() == 2
+    assert bst.aggregate(lo=6) == 7
+    assert bst.aggregate(lo=16) is None
+    # cached aggregates are kept up-to-date while inserting and removing
+    rng = random.Random(5)
+    bst = BST(aggregate="sum")
+    for _ in range(300):
+        value = rng.randrange(100)
+        if value not in bst:
+            bst.insert(value)
+        elif rng.random() < 0.4:
+            bst.remove(value)
+        lo, hi = sorted(rng.sample(range(-5, 105), 2))
+        expected = sum(bst.irange(lo, hi))
+        assert bst.aggregate(lo, hi) == expected
+    # clearing keeps the aggregate
+    bst.clear()
+    bst.insert(5)
+    assert bst.aggregate() == 5
+
+
+def test_bst_from_sorted(helper):
+    bst = BST.from_sorted([1, 2, 3, 4, 5, 6, 7])
+    assert bst._root.get_data() == 4
+    assert bst.is_perfect()
+    assert len(bst) == 7
+    assert bst.to_list() == [4, 2, 6, 1, 3, 5, 7]
+    # sorted input doesn't degenerate the tree
+    bst = BST.from_sorted(range(1000), aggregate="count")
+    assert bst.get_height() == 9
+    assert bst.is_balanced()
+    assert helper.verify_bst_rules(bst._root)
+    assert helper.verify_subtree_sizes(bst._root) == 1000
+    assert bst.aggregate(10, 19) == 10
+    assert bst.inorder_traverse() == list(range(1000))
+    # repeated values are stored once
+    assert BST.from_sorted([1, 1, 2, 2, 2]).inorder_traverse() == [1, 2]
+    assert BST.from_sorted([]).is_empty()
+    with pytest.raises(ValueError):
+        BST.from_sorted([2, 1])
+    with pytest.raises(ValueError):
+        BST.from_sorted([1, None])
+    with pytest.raises(TypeError):
+        BST.from_sorted([1, helper.get_string()])
+    with pytest.raises(TypeError):
+        BST.from_sorted(2)
+
+
+def test_bst_from_iterable_builder(helper):
+    bst = BST.from_iterable([7, 1, 6, 2, 5, 3, 4, 4])
+    assert bst.to_list() == [4, 2, 6, 1, 3, 5, 7]
+    other = BST.from_iterable(BST([3, 2, 1]))
+    assert other.to_list() == [2, 1, 3]
+    with pytest.raises(ValueError):
+        BST.from_iterable([1, None])
+    with pytest.raises(TypeError):
+        BST.from_iterable([1, helper.get_string()])
+    with pytest.raises(TypeError):
+        BST.from_iterable(2)
+
+
+def test_bst_insert_many_remove_many(helper, recwarn):
+    rng = random.Random(7)
+    for batch_size in [1, 5, 40, 400]:
+        values = set(rng.sample(range(1000), 200))
+        bst = BST.from_iterable(values, aggregate="sum")
+        batch = [rng.randrange(1000) for _ in range(batch_size)]
+        assert bst.insert_many(batch) == len(set(batch) - values)
+        values |= set(batch)
+        assert bst.inorder_traverse() == sorted(values)
+        assert helper.verify_bst_rules(bst._root)
+        assert helper.verify_subtree_sizes(bst._root) == len(values)
+        assert bst.aggregate() == sum(values)
+        batch = [rng.randrange(1000) for _ in range(batch_size)]
+        assert bst.remove_many(batch + ["a", None]) == len(values & set(batch))
+        values -= set(batch)
+        assert bst.inorder_traverse() == sorted(values)
+        assert helper.verify_subtree_sizes(bst._root) == len(values)
+        assert bst.aggregate() == sum(values)
+    # duplicates & missing values don't raise warnings
+    assert len(recwarn) == 0
+    bst = BST()
+    assert bst.insert_many([3, 1, 2, 3]) == 3
+    assert bst.to_list() == [2, 1, 3]
+    assert BST().remove_many([1, 2]) == 0
+    with pytest.raises(ValueError):
+        bst.insert_many([4, None])
+    with pytest.raises(TypeError):
+        bst.insert_many([4, helper.get_string()])
+    with pytest.raises(TypeError):
+        bst.insert_many(4)
+    with pytest.raises(TypeError):
+        bst.remove_many(4)
+    assert bst.to_list() == [2, 1, 3]
+
+
+def test_min_max_fingers_and_pops(helper):
+    for tree_class in [BST, AVL, RedBlackTree, SplayTree, Treap]:
+        tree = tree_class()
+        with pytest.warns(UserWarning):
+            assert tree.pop_min() is None
+        with pytest.warns(UserWarning):
+            assert tree.pop_max() is None
+        values = set()
+        for _ in range(500):
+            value = helper.get_int(-100, 100)
+            op = random.random()
+            if op < 0.5:
+                tree.insert(value)
+                values.add(value)
+            elif op < 0.7 and values:
+                assert tree.pop_min() == min(values)
+                values.remove(min(values))
+            elif op < 0.9 and values:
+                assert tree.pop_max() == max(values)
+                values.remove(max(values))
+            elif value in values:
+                tree.remove(value)
+                values.remove(value)
+            if values:
+                assert tree.get_min() == min(values)
+                assert tree.get_max() == max(values)
+                # the cached nodes are linked to the tree
+                assert tree._min_node.get_left() is None
+                assert tree._max_node.get_right() is None
+            assert len(tree) == len(values)
+        assert tree.inorder_traverse() == sorted(values)
+        # bulk operations keep the fingers
+        tree.insert_many(range(200, 300))
+        assert tree.get_max() == 299
+        tree.remove_many(range(250, 300))
+        assert tree.get_max() == 249
+        tree.remove_range(hi=0)
+        assert tree.get_min() == min([v for v in values if v > 0] + [200])
+
+
+def verify_threads(tree):
+    # the in-order links have to match the stack-based in-order traversal
+    nodes = list(super(BST, tree)._iter_inorder_nodes(tree._root))
+    for pred, succ in zip([None] + nodes, nodes + [None]):
+        if pred is not None:
+            assert pred._succ is succ
+        if succ is not None:
+            assert succ._pred is pred
+    values = [node.get_data() for node in nodes]
+    assert list(tree.iter_inorder()) == values
+    assert list(tree.iter_inorder(reverse=True)) == values[::-1]
+    assert tree.inorder_traverse() == values
+
+
+def test_threaded_trees(helper):
+    with pytest.raises(TypeError):
+        BST(threaded=1)
+    for tree_class in [BST, AVL, RedBlackTree, Treap]:
+        assert not tree_class()._threaded
+        tree = tree_class(threaded=True)
+        values = set()
+        for _ in range(500):
+            value = helper.get_int(-100, 100)
+            op = random.random()
+            if op < 0.5:
+                tree.insert(value)
+                values.add(value)
+            elif op < 0.6 and values:
+                values.remove(tree.pop_min())
+            elif op < 0.7 and values:
+                values.remove(tree.pop_max())
+            elif value in values:
+                tree.remove(value)
+                values.remove(value)
+            verify_threads(tree)
+        assert tree.inorder_traverse() == sorted(values)
+        # subtrees stop at their own boundaries
+        subtree = tree._root.get_left()
+        if subtree is not None:
+            assert [
+                node.get_data() for node in tree._iter_inorder_nodes(subtree)
+            ] == sorted(v for v in values if v < tree._root.get_data())
+        # ranges in both directions
+        for _ in range(20):
+            lo = helper.get_int(-120, 120)
+            hi = lo + random.randint(0, 50)
+            inclusive = (random.random() < 0.5, random.random() < 0.5)
+            expected = list(BST(values).irange(lo, hi, inclusive))
+            assert list(tree.irange(lo, hi, inclusive)) == expected
+            assert list(tree.irange(lo, hi, inclusive, True)) == expected[::-1]
+        assert list(tree.irange(hi=0, reverse=True)) == sorted(
+            (v for v in values if v <= 0), reverse=True
+        )
+        # bulk updates
+        tree.insert_many(range(200, 210))
+        verify_threads(tree)
+        tree.insert_many(range(-1000, 1000, 3))
+        verify_threads(tree)
+        tree.remove_many(range(-1000, 0))
+        verify_threads(tree)
+        tree.remove_range(0, 500)
+        verify_threads(tree)
+        tree.clear()
+        assert tree._threaded
+        tree.insert(1)
+        tree.insert(0)
+        verify_threads(tree)
+        assert tree_class.from_sorted([1, 2])._threaded is False
+
+
+def test_irange_reverse():
+    bst = BST([8, 5, 2, 7, 15, 10, 3])
+    assert list(bst.irange(reverse=True)) == [15, 10, 8, 7, 5, 3, 2]
+    assert list(bst.irange(3, 8, reverse=True)) == [8, 7, 5, 3]
+    assert list(bst.irange(3, 8, (False, False), True)) == [7, 5]
+    assert list(bst.irange(hi=9, reverse=True)) == [8, 7, 5, 3, 2]
+    assert list(bst.irange(lo=9, reverse=True)) == [15, 10]
+    assert list(bst.irange(11, 14, reverse=True)) == []
+    assert list(BST().irange(reverse=True)) == []
+    assert list(BST(threaded=True).irange(reverse=True)) == []
+    with pytest.raises(TypeError):
+        list(bst.irange(reverse=1))
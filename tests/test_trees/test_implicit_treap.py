@@ -0,0 +1,137 @@
+import random
+import pytest
+from extra.trees.implicit_treap import ImplicitTreapNode, ImplicitTreap
+
+
+def verify_implicit_treap(itreap, lst, helper):
+    assert itreap.to_list() == lst
+    assert list(itreap) == lst
+    assert len(itreap) == len(lst)
+    assert itreap.is_empty() == (len(lst) == 0)
+    if not itreap.is_empty():
+        assert itreap._root.get_parent() is None
+        assert helper.verify_treap_priority(itreap._root)
+        assert helper.verify_subtree_sizes(itreap._root) == len(lst)
+
+
+def test_implicit_treap_node(helper):
+    with pytest.raises(ValueError):
+        ImplicitTreapNode(None)
+    with pytest.raises(TypeError):
+        ImplicitTreapNode(ImplicitTreap())
+    with pytest.raises(TypeError):
+        ImplicitTreapNode(1, priority=helper.get_string())
+    # any object can be stored
+    for val in ["a", 2.5, (1, 2), helper.get_string()]:
+        node = ImplicitTreapNode(val, priority=0.5)
+        assert node.get_data() == val
+        assert node.get_priority() == 0.5
+        assert node.get_size() == 1
+
+
+def test_empty_implicit_treap(helper):
+    itreap = ImplicitTreap()
+    verify_implicit_treap(itreap, [], helper)
+    assert itreap[:].is_empty()
+    with pytest.raises(IndexError):
+        itreap[0]
+    with pytest.raises(IndexError):
+        del itreap[0]
+    with pytest.raises(IndexError):
+        itreap.insert(1, "a")
+    left, right = itreap.split_at(0)
+    assert left.is_empty() and right.is_empty()
+    itreap.insert(0, "a")
+    verify_implicit_treap(itreap, ["a"], helper)
+    with pytest.raises(TypeError):
+        ImplicitTreap(2)
+    with pytest.raises(ValueError):
+        ImplicitTreap([1, None])
+    with pytest.raises(TypeError):
+        ImplicitTreap([1, ImplicitTreap()])
+
+
+def test_implicit_treap_indexing(helper):
+    lst = [helper.get_value() for _ in range(100)]
+    itreap = ImplicitTreap(lst)
+    verify_implicit_treap(itreap, lst, helper)
+    for idx in range(-100, 100):
+        assert itreap[idx] == lst[idx]
+    for s in [slice(10, 20), slice(None, 5), slice(-5, None), slice(3, 1),
+              slice(None, None, 3), slice(None, None, -1), slice(90, 10, -7)]:
+        assert itreap[s].to_list() == lst[s]
+    # slicing doesn't change the instance
+    verify_implicit_treap(itreap, lst, helper)
+    itreap[5] = "x"
+    itreap[-1] = "y"
+    lst[5], lst[-1] = "x", "y"
+    verify_implicit_treap(itreap, lst, helper)
+    with pytest.raises(IndexError):
+        itreap[100]
+    with pytest.raises(IndexError):
+        itreap[-101] = 1
+    with pytest.raises(TypeError):
+        itreap["1"]
+    with pytest.raises(ValueError):
+        itreap[0] = None
+
+
+def test_implicit_treap_random_operations(helper):
+    rng = random.Random(3)
+    itreap, lst = ImplicitTreap(), []
+    for _ in range(1500):
+        operation = rng.randrange(6)
+        length = len(lst)
+        if operation == 0:
+            idx, value = rng.randint(0, length), rng.randrange(100)
+            itreap.insert(idx, value)
+            lst.insert(idx, value)
+        elif operation == 1 and length:
+            idx = rng.randint(-length, length - 1)
+            del itreap[idx]
+            del lst[idx]
+        elif operation == 2:
+            s = slice(
+                rng.randint(-length, length),
+                rng.randint(-length, length),
+                rng.choice([None, 2, -1]),
+            )
+            del itreap[s]
+            del lst[s]
+        elif operation == 3:
+            idx = rng.randint(0, length)
+            left, right = itreap.split_at(idx)
+            assert itreap.is_empty()
+            verify_implicit_treap(left, lst[:idx], helper)
+            verify_implicit_treap(right, lst[idx:], helper)
+            left.concat(right)
+            assert right.is_empty()
+            itreap = left
+        elif operation == 4:
+            itreap.add_front(-1)
+            itreap.add_end(-2)
+            lst = [-1] + lst + [-2]
+        else:
+            values = [rng.randrange(100) for _ in range(rng.randrange(10))]
+            itreap.concat(ImplicitTreap(values))
+            lst += values
+        verify_implicit_treap(itreap, lst, helper)
+
+
+def test_implicit_treap_split_concat(helper):
+    itreap = ImplicitTreap(range(10))
+    with pytest.raises(IndexError):
+        itreap.split_at(11)
+    with pytest.raises(IndexError):
+        itreap.split_at(-1)
+    left, right = itreap.split_at(4)
+    verify_implicit_treap(left, [0, 1, 2, 3], helper)
+    verify_implicit_treap(right, [4, 5, 6, 7, 8, 9], helper)
+    right.concat(left)
+    verify_implicit_treap(right, [4, 5, 6, 7, 8, 9, 0, 1, 2, 3], helper)
+    with pytest.raises(TypeError):
+        right.concat([1, 2])
+    with pytest.raises(ValueError):
+        right.concat(right)
+    right.clear()
+    verify_implicit_treap(right, [], helper)
@@ -1,3 +1,4 @@
+import random
 import pytest
 
 from extra.trees.red_black_tree import Color, RedBlackNode, RedBlackTree
@@ -602,3 +603,87 @@ def test_double_black_right_right_case(helper):
     assert rbtree._root.get_right().get_color() == Color.BLACK
     assert rbtree._root.get_right().get_left() is None
     assert rbtree._root.get_right().get_left() is None
+
+
+def verify_red_black_rules(rbtree):
+    # returns the black-height of the tree, or raises AssertionError
+    def black_height(node, parent):
+        if node is None:
+            return 1
+        assert node.get_parent() is parent
+        if node.get_color() == Color.RED:
+            for child in (node.get_left(), node.get_right()):
+                assert child is None or child.get_color() == Color.BLACK
+        left = black_height(node.get_left(), node)
+        right = black_height(node.get_right(), node)
+        assert left == right
+        return left + (node.get_color() == Color.BLACK)
+
+    assert rbtree._root is None or rbtree._root.get_color() == Color.BLACK
+    return black_height(rbtree._root, None)
+
+
+def test_random_insertions_and_removals(helper):
+    rng = random.Random(0)
+    for _ in range(50):
+        values = rng.sample(range(500), 100)
+        rbtree = RedBlackTree()
+        for value in values:
+            rbtree.insert(value)
+            verify_red_black_rules(rbtree)
+        assert helper.verify_bst_rules(rbtree._root)
+        removed = rng.sample(values, 60)
+        for value in removed:
+            rbtree.remove(value)
+            verify_red_black_rules(rbtree)
+        assert helper.verify_bst_rules(rbtree._root)
+        assert len(rbtree) == 40
+        assert rbtree.inorder_traverse() == sorted(set(values) - set(removed))
+
+
+def test_range_queries(helper):
+    rng = random.Random(1)
+    values = rng.sample(range(1000), 200)
+    rbtree = RedBlackTree(values)
+    assert rbtree.floor(values[0]) == values[0]
+    assert rbtree.successor(max(values)) is None
+    assert list(rbtree.irange(100, 300)) == sorted(
+        v for v in values if 100 <= v <= 300
+    )
+    removed = rbtree.remove_range(100, 300)
+    assert removed == len([v for v in values if 100 <= v <= 300])
+    verify_red_black_rules(rbtree)
+    assert helper.verify_bst_rules(rbtree._root)
+    assert rbtree.inorder_traverse() == sorted(
+        v for v in values if not 100 <= v <= 300
+    )
+
+
+def test_order_statistics(helper):
+    helper.check_order_statistics(RedBlackTree)
+
+
+def test_aggregate(helper):
+    helper.check_aggregate(RedBlackTree)
+
+
+def test_from_sorted(helper):
+    for length in range(70):
+        rbtree = RedBlackTree.from_sorted(range(length))
+        verify_red_black_rules(rbtree)
+        assert helper.verify_subtree_sizes(rbtree._root) == length
+        assert rbtree.inorder_traverse() == list(range(length))
+    # the tree keeps working after being built
+    rbtree.insert(100)
+    rbtree.remove(10)
+    verify_red_black_rules(rbtree)
+    # converting from another tree
+    rbtree = RedBlackTree.from_iterable(RedBlackTree([5, 3, 9, 1]))
+    verify_red_black_rules(rbtree)
+    assert rbtree.inorder_traverse() == [1, 3, 5, 9]
+
+
+def test_insert_many_remove_many(helper):
+    helper.check_insert_many_remove_many(
+        RedBlackTree, verify_red_black_rules
+    )
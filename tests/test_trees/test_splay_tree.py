@@ -1,4 +1,5 @@
-# import pytest
+import pytest
+import random
 
 from extra.trees.bst import BSTNode
 from extra.trees.splay_tree import SplayTree
@@ -55,9 +56,10 @@ def test_splay_tree_example1(helper):
     assert stree.is_balanced()
     assert not stree.is_perfect()
     assert not stree.is_strict()
-    # find 2
+    # find 5.5
     assert 5.5 not in stree
-    assert stree._root.get_data() == 5
+    # 6 is the last node on the search path, so it becomes the root
+    assert stree._root.get_data() == 6
     assert helper.verify_bst_rules(stree._root)
     assert stree.get_max() == 17
     assert stree.get_min() == 3
@@ -117,3 +119,89 @@ def test_splay_tree_example3(helper):
     stree.remove(30)
     assert stree._root.get_data() in {28, 35}
     assert helper.verify_bst_rules(stree._root)
+
+
+def test_splay_tree_neighbors():
+    stree = SplayTree([2, 5, 4, 6, 3])
+    assert stree.floor(4.5) == 4
+    assert stree._root.get_data() == 4
+    assert stree.successor(5) == 6
+    assert stree._root.get_data() == 6
+    assert stree.ceiling(2.5) == 3
+    assert stree._root.get_data() == 3
+    assert stree.predecessor(3) == 2
+    assert stree._root.get_data() == 2
+    # nothing is splayed when there is no answer
+    assert stree.predecessor(2) is None
+    assert stree.successor(6) is None
+    assert stree.floor(1) is None
+    assert stree.ceiling(7) is None
+    assert stree.inorder_traverse() == [2, 3, 4, 5, 6]
+    assert list(stree.irange(3, 5)) == [3, 4, 5]
+    assert stree.remove_range(3, 5) == 3
+    assert stree.inorder_traverse() == [2, 6]
+
+
+def test_order_statistics(helper):
+    helper.check_order_statistics(SplayTree)
+
+
+def test_aggregate(helper):
+    helper.check_aggregate(SplayTree)
+
+
+def test_insert_many_remove_many(helper):
+    helper.check_insert_many_remove_many(
+        SplayTree, lambda stree: helper.verify_bst_rules(stree._root)
+    )
+
+
+def test_splay_every(helper):
+    with pytest.raises(TypeError):
+        SplayTree(splay_every=1.5)
+    with pytest.raises(ValueError):
+        SplayTree(splay_every=0)
+    stree = SplayTree([2, 5, 4, 6, 3], splay_every=3)
+    # only every third lookup restructures the tree
+    assert 6 in stree
+    assert stree.floor(4.5) == 4
+    assert stree._root.get_data() == 3
+    assert stree.successor(5) == 6
+    assert stree._root.get_data() == 6
+    # insertion and removal always splay
+    stree.insert(1)
+    assert stree._root.get_data() == 1
+    stree.remove(4)
+    assert stree._root.get_data() == 3
+    stree.clear()
+    assert stree._splay_every == 3
+
+
+def test_top_down_splaying(helper):
+    stree = SplayTree(aggregate="sum")
+    values = set()
+    for _ in range(1000):
+        value = helper.get_int(-100, 100)
+        if random.random() < 0.6:
+            stree.insert(value)
+            values.add(value)
+            assert stree._root.get_data() == value
+        else:
+            stree.remove(value)
+            values.discard(value)
+        assert stree._root is None or stree._root.get_parent() is None
+        assert len(stree) == len(values)
+    assert helper.verify_bst_rules(stree._root)
+    assert helper.verify_subtree_sizes(stree._root) == len(values)
+    assert stree.inorder_traverse() == sorted(values)
+    assert stree.aggregate() == sum(values)
+    # deep trees don't overflow the stack
+    stree = SplayTree()
+    for i in range(5000):
+        stree.insert(i)
+    assert stree._root.get_left().get_size() == 4999
+    assert 0 in stree
+    assert stree._root.get_data() == 0
+    assert stree._root.get_right().get_size() == 4999
+    stree.remove(0)
+    assert 0 not in stree and len(stree) == 4999
@@ -1,4 +1,5 @@
 import pytest
+import random
 
 from extra.trees.treap import TreapNode, Treap
 
@@ -204,3 +205,119 @@ def test_treap_with_random_numbers(helper):
         assert item not in treap
     assert len(treap) == 1
     treap.remove(treap._root.get_data())
+
+
+def test_order_statistics(helper):
+    helper.check_order_statistics(Treap)
+
+
+def test_aggregate(helper):
+    helper.check_aggregate(Treap)
+
+
+def test_from_sorted(helper):
+    treap = Treap.from_sorted(range(100), seed=1)
+    assert treap.is_balanced()
+    assert helper.verify_bst_rules(treap._root)
+    assert helper.verify_treap_priority(treap._root)
+    assert helper.verify_subtree_sizes(treap._root) == 100
+    treap.insert(200)
+    treap.remove(50)
+    assert helper.verify_treap_priority(treap._root)
+    treap = Treap.from_iterable([7, 1, 6, 2, 5, 3, 4], seed=1)
+    assert treap.to_list() == [4, 2, 6, 1, 3, 5, 7]
+    assert helper.verify_treap_priority(treap._root)
+
+
+def test_insert_many_remove_many(helper):
+    helper.check_insert_many_remove_many(
+        Treap, lambda treap: helper.verify_treap_priority(treap._root)
+    )
+
+
+def test_split_join(helper):
+    treap = Treap([0, 2, 1, 4, 9, 7, 3], seed=123)
+    left, right = treap.split(4)
+    assert treap.is_empty()
+    assert left.inorder_traverse() == [0, 1, 2, 3]
+    assert right.inorder_traverse() == [4, 7, 9]
+    assert helper.verify_treap_priority(left._root)
+    assert helper.verify_treap_priority(right._root)
+    assert helper.verify_subtree_sizes(right._root) == len(right) == 3
+    with pytest.raises(ValueError):
+        right.join(left)
+    left.join(right)
+    assert right.is_empty()
+    assert left.inorder_traverse() == [0, 1, 2, 3, 4, 7, 9]
+    assert helper.verify_treap_priority(left._root)
+    assert helper.verify_subtree_sizes(left._root) == len(left) == 7
+    with pytest.raises(TypeError):
+        left.join([10, 11])
+    with pytest.raises(TypeError):
+        left.split(helper.get_string())
+
+
+def test_set_operations(helper):
+    rng = random.Random(9)
+    expected = {
+        "union": set.union,
+        "intersection": set.intersection,
+        "difference": set.difference,
+        "symmetric_difference": set.symmetric_difference,
+    }
+    for _ in range(20):
+        first = set(rng.sample(range(500), rng.randint(0, 100)))
+        second = set(rng.sample(range(500), rng.randint(0, 100)))
+        treap = Treap(list(first), aggregate="sum")
+        other = Treap(list(second))
+        for name, operation in expected.items():
+            for workers in [None, 3]:
+                result = getattr(treap, name)(other, workers=workers)
+                values = operation(first, second)
+                assert result.inorder_traverse() == sorted(values)
+                assert len(result) == len(values)
+                assert result.aggregate() == sum(values)
+                assert helper.verify_treap_priority(result._root)
+                assert helper.verify_subtree_sizes(result._root) == len(values)
+        # inputs are unchanged
+        assert treap.inorder_traverse() == sorted(first)
+        assert other.inorder_traverse() == sorted(second)
+        treap.difference_update(second)
+        assert treap.inorder_traverse() == sorted(first - second)
+    with pytest.raises(TypeError):
+        treap.union(2)
+    with pytest.raises(TypeError):
+        treap.union([helper.get_string()])
+    with pytest.raises(ValueError):
+        treap.update([None])
+    with pytest.raises(TypeError):
+        treap.update([1], workers=0)
+
+
+def test_threaded_split_join_and_set_operations():
+    def verify_threads(treap, values):
+        values = sorted(values)
+        assert list(treap.iter_inorder()) == values
+        assert list(treap.iter_inorder(reverse=True)) == values[::-1]
+        nodes = list(treap._iter_inorder_nodes(treap._root))
+        if nodes:
+            assert nodes[0]._pred is None and nodes[-1]._succ is None
+
+    rng = random.Random(3)
+    for _ in range(20):
+        values = set(rng.sample(range(500), rng.randint(0, 100)))
+        key = rng.randrange(500)
+        treap = Treap(values, threaded=True)
+        left, right = treap.split(key)
+        assert left._threaded and right._threaded
+        verify_threads(left, {v for v in values if v < key})
+        verify_threads(right, {v for v in values if v >= key})
+        # joining an instance that isn't threaded links its nodes
+        other = Treap(range(500, 520))
+        right.join(other)
+        left.join(right)
+        verify_threads(left, values | set(range(500, 520)))
+        second = set(rng.sample(range(600), rng.randint(0, 100)))
+        for name in ["union", "intersection", "difference"]:
+            result = getattr(left, name)(second, workers=2)
+            verify_threads(result, getattr(set(left), name)(second))
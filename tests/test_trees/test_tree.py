@@ -1,3 +1,5 @@
+import os
+import time
 import pytest
 from extra.trees.tree import TreeNode, Tree
 
@@ -109,3 +111,390 @@ def test_invalid_path(helper):
     val = helper.get_string()
     with pytest.raises(ValueError):
         Tree.from_path(val)
+
+
+def test_maintained_sizes():
+    root = TreeNode(0)
+    child = TreeNode(1)
+    grandchild = TreeNode(2)
+    root.set_child(child)
+    assert root.get_size() == 2 and child.get_parent() is root
+    # sizes are updated all the way up to the root
+    child.set_child(grandchild)
+    grandchild.set_children([TreeNode(3), TreeNode(4)])
+    assert [root.get_size(), child.get_size(), grandchild.get_size()] == [
+        5, 4, 3
+    ]
+    t = Tree()
+    t._root = root
+    assert len(t) == 5
+    # replacing children drops the old ones
+    old_children = grandchild.get_children()
+    grandchild.set_children([TreeNode(5)])
+    assert len(t) == 4 and grandchild.get_size() == 2
+    assert all(node.get_parent() is None for node in old_children)
+    child.set_children([])
+    assert len(t) == 2 and grandchild.get_parent() is None
+    t._root = child
+    assert len(t) == 1
+
+
+def make_directory(root, structure):
+    for name, content in structure.items():
+        if isinstance(content, dict):
+            (root / name).mkdir()
+            make_directory(root / name, content)
+        else:
+            (root / name).write_text(content)
+
+
+def as_nested(node):
+    return {
+        child.get_data(): as_nested(child) for child in node.get_children()
+    }
+
+
+def test_from_path(tmp_path):
+    make_directory(
+        tmp_path,
+        {
+            "b.py": "",
+            "a.txt": "",
+            "src": {"z.py": "", "m.txt": "", "lib": {"x.py": ""}},
+            "build": {"out.o": ""},
+        },
+    )
+    t = Tree.from_path(str(tmp_path))
+    assert t._root.get_data() == tmp_path.name
+    # children are sorted by name
+    assert [node.get_data() for node in t._root.get_children()] == [
+        "a.txt", "b.py", "build", "src"
+    ]
+    assert as_nested(t._root)["src"] == {
+        "lib": {"x.py": {}}, "m.txt": {}, "z.py": {}
+    }
+    assert len(t) == 10 and t._root.get_size() == 10
+    assert all(
+        child.get_parent() is t._root for child in t._root.get_children()
+    )
+    # max_depth
+    assert len(Tree.from_path(str(tmp_path), max_depth=0)) == 1
+    assert as_nested(Tree.from_path(str(tmp_path), max_depth=1)._root) == {
+        "a.txt": {}, "b.py": {}, "build": {}, "src": {}
+    }
+    assert len(Tree.from_path(str(tmp_path), max_depth=2)) == 9
+    # include filters files only while exclude prunes directories as well
+    t = Tree.from_path(str(tmp_path), include="*.py", exclude=["build"])
+    assert as_nested(t._root) == {
+        "b.py": {}, "src": {"lib": {"x.py": {}}, "z.py": {}}
+    }
+    # a single file
+    t = Tree.from_path(str(tmp_path / "a.txt"))
+    assert len(t) == 1 and t._root.get_data() == "a.txt"
+    # same result with one worker
+    assert as_nested(Tree.from_path(str(tmp_path), workers=1)._root) == (
+        as_nested(Tree.from_path(str(tmp_path))._root)
+    )
+
+
+def test_from_path_invalid_options(tmp_path):
+    with pytest.raises(TypeError):
+        Tree.from_path(str(tmp_path), max_depth=1.5)
+    with pytest.raises(ValueError):
+        Tree.from_path(str(tmp_path), max_depth=-1)
+    with pytest.raises(TypeError):
+        Tree.from_path(str(tmp_path), follow_symlinks=1)
+    with pytest.raises(TypeError):
+        Tree.from_path(str(tmp_path), include=5)
+    with pytest.raises(TypeError):
+        Tree.from_path(str(tmp_path), exclude=["*.py", 5])
+    with pytest.raises(ValueError):
+        Tree.from_path(str(tmp_path), on_error="skip")
+    with pytest.raises(TypeError):
+        Tree.from_path(str(tmp_path), workers="2")
+    with pytest.raises(ValueError):
+        Tree.from_path(str(tmp_path), workers=0)
+
+
+def test_from_path_deep(tmp_path):
+    # no recursion is involved, so deep hierarchies are fine
+    folders = [tmp_path]
+    for i in range(1200):
+        folders.append(folders[-1] / "d")
+        folders[-1].mkdir()
+    try:
+        assert len(Tree.from_path(str(tmp_path))) == 1201
+        t = Tree.from_path(str(tmp_path), lazy=True)
+        t.prefetch()
+        assert len(t) == 1201
+    finally:
+        # removed here as removing them recursively would overflow
+        for folder in reversed(folders[1:]):
+            folder.rmdir()
+
+
+def test_from_path_symlinks(tmp_path):
+    make_directory(tmp_path, {"d": {"e": {}}, "other": {"file": ""}})
+    other = tmp_path / "other"
+    try:
+        os.symlink(str(tmp_path), str(other / "loop"))
+    except (OSError, NotImplementedError):
+        pytest.skip("symbolic links aren't supported")
+    t = Tree.from_path(str(other))
+    assert as_nested(t._root) == {"file": {}, "loop": {}}
+    # cyclic links are expanded only once when followed
+    t = Tree.from_path(str(other), follow_symlinks=True)
+    assert as_nested(t._root) == {
+        "file": {}, "loop": {"d": {"e": {}}, "other": {}}
+    }
+    t = Tree.from_path(str(other), follow_symlinks=True, lazy=True)
+    assert as_nested(t._root) == {
+        "file": {}, "loop": {"d": {"e": {}}, "other": {}}
+    }
+
+
+def test_from_path_symlinks_order(tmp_path, monkeypatch):
+    make_directory(tmp_path, {"root": {"a": {}, "b": {}}, "target": {"x": ""}})
+    root = tmp_path / "root"
+    try:
+        for name in ["a", "b"]:
+            os.symlink(str(tmp_path / "target"), str(root / name / "link"))
+    except (OSError, NotImplementedError):
+        pytest.skip("symbolic links aren't supported")
+    real_scandir = os.scandir
+
+    def scandir(path):
+        # the first link is listed last
+        if os.path.basename(path) == "a":
+            time.sleep(0.05)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    expected = {"a": {"link": {"x": {}}}, "b": {"link": {}}}
+    t = Tree.from_path(str(root), follow_symlinks=True, workers=4)
+    assert as_nested(t._root) == expected
+    # the same as loading the tree lazily
+    t = Tree.from_path(str(root), follow_symlinks=True, lazy=True)
+    assert as_nested(t._root) == expected
+    t = Tree.from_path(str(root), follow_symlinks=True, lazy=True)
+    t.prefetch()
+    assert as_nested(t._root) == expected
+
+
+@pytest.fixture
+def unreadable(tmp_path, monkeypatch):
+    # creates "locked" & "open" directories and makes os.scandir() fail for
+    # the directory names in the returned set, which the tests can edit
+    make_directory(tmp_path, {"locked": {"file": ""}, "open": {"file": ""}})
+    real_scandir = os.scandir
+    names = {"locked"}
+
+    def scandir(path):
+        if os.path.basename(path) in names:
+            raise PermissionError("permission denied")
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    return names
+
+
+def test_from_path_errors(tmp_path, unreadable):
+    with pytest.raises(PermissionError):
+        Tree.from_path(str(tmp_path))
+    with pytest.warns(UserWarning):
+        t = Tree.from_path(str(tmp_path), on_error="warn")
+    assert as_nested(t._root) == {"locked": {}, "open": {"file": {}}}
+    t = Tree.from_path(str(tmp_path), on_error="ignore")
+    assert len(t) == 4
+
+
+def test_lazy_from_path(tmp_path):
+    make_directory(
+        tmp_path,
+        {
+            "a.txt": "",
+            "src": {"z.py": "", "lib": {"x.py": "", "y.py": ""}},
+            "docs": {"index.md": ""},
+        },
+    )
+    t = Tree.from_path(str(tmp_path), lazy=True)
+    assert len(t) == 1 and t._root._children == []
+    # only the requested directory is read
+    assert [node.get_data() for node in t._root.get_children()] == [
+        "a.txt", "docs", "src"
+    ]
+    assert len(t) == 4
+    src = t._root.get_children()[2]
+    assert src._children == [] and not src._loaded
+    assert [node.get_data() for node in src.get_children()] == ["lib", "z.py"]
+    assert len(t) == 6 and t._root.get_size() == 6 and src.get_size() == 3
+    # searching loads directories on demand
+    assert "x.py" in t
+    assert len(t) == 8 and src.get_size() == 5
+    # iterating loads the rest
+    eager = Tree.from_path(str(tmp_path))
+    assert t.to_list() == eager.to_list() and len(t) == len(eager) == 9
+    assert as_nested(t._root) == as_nested(eager._root)
+    # options are applied to lazy loads as well
+    t = Tree.from_path(str(tmp_path), lazy=True, max_depth=2, exclude="*.md")
+    assert as_nested(t._root) == {
+        "a.txt": {}, "docs": {}, "src": {"lib": {}, "z.py": {}}
+    }
+    assert len(Tree.from_path(str(tmp_path / "a.txt"), lazy=True)) == 1
+    with pytest.raises(TypeError):
+        Tree.from_path(str(tmp_path), lazy=1)
+
+
+def test_prefetch(tmp_path):
+    make_directory(
+        tmp_path,
+        {"a": {"b": {"c": {"file": ""}}, "d": {}}, "e": {"f": ""}},
+    )
+    t = Tree.from_path(str(tmp_path), lazy=True)
+    t.prefetch(0)
+    assert len(t) == 1
+    t.prefetch(2)
+    assert len(t) == 6
+    assert t.get_nodes_per_level()[:3] == [
+        [tmp_path.name], ["a", "e"], ["b", "d", "f"]
+    ]
+    t.prefetch()
+    assert len(t) == 8 and t._root.get_size() == 8
+    assert as_nested(t._root) == as_nested(
+        Tree.from_path(str(tmp_path))._root
+    )
+    # loaded subtrees are prefetched below them as well
+    t = Tree.from_path(str(tmp_path), lazy=True)
+    t._root.get_children()[0].get_children()
+    t.prefetch()
+    assert len(t) == 8
+    # non-lazy trees are left as they are
+    root = TreeNode(1)
+    root.set_child(TreeNode(2))
+    t = Tree()
+    t._root = root
+    t.prefetch()
+    assert len(t) == 2
+    Tree().prefetch(3)
+    with pytest.raises(TypeError):
+        t.prefetch("2")
+    with pytest.raises(ValueError):
+        t.prefetch(-1)
+
+
+def test_lazy_from_path_errors(tmp_path, unreadable):
+    t = Tree.from_path(str(tmp_path), lazy=True)
+    node = t._root.get_children()[0]
+    with pytest.raises(PermissionError):
+        node.get_children()
+    # the directory is read again on the next access
+    unreadable.clear()
+    assert [child.get_data() for child in node.get_children()] == ["file"]
+    assert len(t) == 4
+    unreadable.add("locked")
+    t = Tree.from_path(str(tmp_path), lazy=True, on_error="ignore")
+    t.prefetch()
+    assert as_nested(t._root) == {"locked": {}, "open": {"file": {}}}
+
+
+def touch_later(*paths):
+    # moves the mtime forward as changes made right after reading a
+    # directory might get the same mtime on coarse file systems
+    for path in paths:
+        mtime = os.stat(str(path)).st_mtime_ns + 10**9
+        os.utime(str(path), ns=(mtime, mtime))
+
+
+def test_refresh(tmp_path):
+    make_directory(
+        tmp_path,
+        {
+            "a.txt": "",
+            "src": {"z.py": "", "lib": {"x.py": ""}},
+            "docs": {"index.md": ""},
+            "same": {"keep": ""},
+        },
+    )
+    t = Tree.from_path(str(tmp_path))
+    assert t.refresh() == ([], [])
+    same = t._root.get_children()[3]
+    keep = same.get_children()[0]
+    # add, remove & replace entries in different directories
+    (tmp_path / "b.txt").write_text("")
+    (tmp_path / "a.txt").unlink()
+    (tmp_path / "src" / "lib" / "x.py").unlink()
+    (tmp_path / "src" / "lib" / "y.py").write_text("")
+    (tmp_path / "docs" / "index.md").unlink()
+    (tmp_path / "docs" / "index.md").mkdir()
+    (tmp_path / "new").mkdir()
+    (tmp_path / "new" / "deep").mkdir()
+    (tmp_path / "new" / "deep" / "file").write_text("")
+    touch_later(tmp_path, tmp_path / "src" / "lib", tmp_path / "docs")
+    added, removed = t.refresh()
+    assert sorted(node.get_data() for node in added) == [
+        "b.txt", "deep", "file", "index.md", "new", "y.py"
+    ]
+    assert sorted(node.get_data() for node in removed) == [
+        "a.txt", "index.md", "x.py"
+    ]
+    assert all(node.get_parent() is None for node in removed)
+    eager = Tree.from_path(str(tmp_path))
+    assert as_nested(t._root) == as_nested(eager._root)
+    assert len(t) == len(eager) == 13
+    assert t._root.get_size() == 13
+    # unchanged directories keep their nodes
+    assert t._root.get_children()[-1] is same
+    assert same.get_children()[0] is keep
+    assert t.refresh() == ([], [])
+    # removing a directory removes its whole subtree only once
+    for path in ["new/deep/file", "new/deep", "new"]:
+        path = tmp_path / path
+        path.unlink() if path.is_file() else path.rmdir()
+    touch_later(tmp_path)
+    added, removed = t.refresh()
+    assert added == []
+    assert [node.get_data() for node in removed] == ["new", "deep", "file"]
+    assert len(t) == 10
+    # other trees aren't affected
+    assert Tree().refresh() == ([], [])
+
+
+def test_refresh_lazy(tmp_path):
+    make_directory(tmp_path, {"a": {"b": {"file": ""}}, "c": {"d": ""}})
+    t = Tree.from_path(str(tmp_path), lazy=True)
+    t._root.get_children()
+    (tmp_path / "a" / "b" / "other").write_text("")
+    (tmp_path / "e").mkdir()
+    (tmp_path / "e" / "f").write_text("")
+    touch_later(tmp_path, tmp_path / "a" / "b")
+    # directories that haven't been loaded are read on demand later
+    added, removed = t.refresh()
+    assert [node.get_data() for node in added] == ["e"] and removed == []
+    assert len(t) == 4
+    t.prefetch()
+    assert len(t) == 9
+    assert as_nested(t._root) == as_nested(
+        Tree.from_path(str(tmp_path))._root
+    )
+
+
+def test_refresh_errors(tmp_path, unreadable):
+    unreadable.clear()
+    t = Tree.from_path(str(tmp_path), on_error="warn")
+    unreadable.add("locked")
+    (tmp_path / "locked" / "other").write_text("")
+    touch_later(tmp_path / "locked")
+    # a directory that can't be read keeps its children
+    with pytest.warns(UserWarning):
+        assert t.refresh() == ([], [])
+    assert len(t) == 5
+    # and it's checked again by the next refresh
+    unreadable.clear()
+    added, removed = t.refresh()
+    assert [node.get_data() for node in added] == ["other"] and removed == []
+    assert len(t) == 6
+    # the scanned directory itself is gone
+    t = Tree.from_path(str(tmp_path / "open"))
+    (tmp_path / "open").rename(tmp_path / "moved")
+    with pytest.raises(OSError):
+        t.refresh()
@@ -0,0 +1,176 @@
+import random
+import pytest
+from extra.trees.bst import BST
+from extra.trees.avl import AVL
+from extra.trees.red_black_tree import RedBlackTree
+from extra.trees.splay_tree import SplayTree
+from extra.trees.treap import Treap
+from extra.trees.tree_map import TreeMapEntry, TreeMap
+
+
+TREES = [BST, AVL, RedBlackTree, SplayTree, Treap]
+
+
+def verify_tree_map(tm, d, helper):
+    items = sorted(d.items(), key=lambda x: x[0])
+    assert list(tm.items()) == items
+    assert list(tm) == [k for k, _ in items]
+    assert list(tm.keys()) == [k for k, _ in items]
+    assert list(tm.values()) == [v for _, v in items]
+    assert tm.to_dict() == dict(items)
+    assert len(tm) == len(d)
+    assert tm.is_empty() == (len(d) == 0)
+    assert helper.verify_bst_rules(tm._container._root)
+    if not tm.is_empty():
+        assert tm._container._root.get_parent() is None
+        assert helper.verify_subtree_sizes(tm._container._root) == len(d)
+
+
+def test_tree_map_entry():
+    entry = TreeMapEntry("a", "a", 1)
+    assert entry.get_key() == "a"
+    assert entry.get_value() == 1
+    entry.set_value(2)
+    assert entry.get_value() == 2
+    assert entry == "a" and entry < "b" and entry > "A"
+    assert entry <= TreeMapEntry("a", "a", 5)
+    assert "b" > entry and "A" < entry
+    assert repr(entry) == "a:2"
+    with pytest.raises(TypeError):
+        hash(entry)
+
+
+def test_empty_tree_map(helper):
+    tm = TreeMap()
+    verify_tree_map(tm, {}, helper)
+    assert "a" not in tm
+    assert None not in tm
+    assert tm.get("a") is None
+    assert tm.get("a", 5) == 5
+    assert tm.pop("a", None) is None
+    assert tm.pop("a", 5) == 5
+    with pytest.raises(KeyError):
+        tm.pop("a")
+    with pytest.raises(KeyError):
+        tm["a"]
+    with pytest.raises(KeyError):
+        del tm["a"]
+    with pytest.raises(ValueError):
+        tm[None] = 1
+    with pytest.raises(ValueError):
+        tm["a"] = None
+    with pytest.raises(TypeError):
+        tm[TreeMap()] = 1
+    with pytest.raises(TypeError):
+        tm["a"] = TreeMap()
+    verify_tree_map(tm, {}, helper)
+
+
+def test_tree_map_creation(helper):
+    with pytest.raises(TypeError):
+        TreeMap(2)
+    with pytest.raises(TypeError):
+        TreeMap(key=2)
+    with pytest.raises(TypeError):
+        TreeMap(tree=list)
+    with pytest.raises(TypeError):
+        TreeMap(tree=RedBlackTree())
+    with pytest.raises(ValueError):
+        TreeMap([("a", None)])
+    with pytest.raises(TypeError):
+        TreeMap([("a", 1), (2, 2)])
+    d = {helper.get_string(): helper.get_value() for _ in range(50)}
+    for tree in TREES:
+        verify_tree_map(TreeMap(d, tree=tree), d, helper)
+        verify_tree_map(TreeMap(d.items(), tree=tree), d, helper)
+        assert isinstance(TreeMap(tree=tree)._container, tree)
+
+
+@pytest.mark.parametrize("tree", TREES)
+def test_tree_map_random_operations(tree, helper):
+    tm = TreeMap(tree=tree)
+    d = {}
+    for i in range(1000):
+        key = helper.get_string(random.randint(1, 3))
+        op = random.random()
+        if op < 0.4:
+            tm[key] = i
+            d[key] = i
+        elif op < 0.6:
+            assert tm.setdefault(key, i) == d.setdefault(key, i)
+        elif op < 0.8:
+            assert tm.pop(key, -1) == d.pop(key, -1)
+        elif key in d:
+            del tm[key]
+            del d[key]
+        else:
+            with pytest.raises(KeyError):
+                del tm[key]
+        assert (key in tm) == (key in d)
+        assert tm.get(key) == d.get(key)
+    verify_tree_map(tm, d, helper)
+    for key in list(d):
+        assert tm[key] == d.pop(key)
+        del tm[key]
+    verify_tree_map(tm, d, helper)
+
+
+def test_tree_map_balanced_backends(helper):
+    # inserting sorted keys must keep the self-balancing trees balanced
+    keys = [(i, helper.get_string()) for i in range(500)]
+    for tree in [AVL, RedBlackTree]:
+        tm = TreeMap(tree=tree)
+        for key in keys:
+            tm[key] = key[1]
+        # both trees keep their height within 2*log2(n+1)
+        assert tm._container.get_height() <= 18
+        for key in keys[::2]:
+            del tm[key]
+        assert tm._container.get_height() <= 16
+        verify_tree_map(tm, {k: k[1] for k in keys[1::2]}, helper)
+    tm = TreeMap(zip(keys, range(500)), tree=Treap)
+    assert helper.verify_treap_priority(tm._container._root)
+
+
+def test_tree_map_with_key_function(helper):
+    tm = TreeMap([("B", 1), ("a", 2), ("C", 3)], key=str.lower)
+    assert list(tm.items()) == [("a", 2), ("B", 1), ("C", 3)]
+    assert tm["b"] == 1 and "A" in tm and "c" in tm
+    assert 1 not in tm
+    # keys with the same sort key are the same key
+    tm["A"] = 20
+    assert len(tm) == 3 and tm["a"] == 20
+    assert list(tm.keys()) == ["a", "B", "C"]
+    assert tm.pop("c") == 3
+    assert list(tm.keys()) == ["a", "B"]
+    # reversing the order
+    tm = TreeMap({i: str(i) for i in range(20)}, key=lambda x: -x)
+    assert list(tm.keys()) == list(range(19, -1, -1))
+
+
+def test_tree_map_clear(helper):
+    tm = TreeMap({helper.get_string(): helper.get_value() for _ in range(10)})
+    tm.clear()
+    verify_tree_map(tm, {}, helper)
+    tm["a"] = 1
+    verify_tree_map(tm, {"a": 1}, helper)
+
+
+def test_bst_family_keeps_numeric_only():
+    # TreeMap mode is per instance, plain trees still accept numbers only
+    TreeMap({"a": 1})
+    for tree in TREES:
+        with pytest.raises(TypeError):
+            tree().insert("a")
+        with pytest.raises(TypeError):
+            tree(numeric_only=None)
+        # the nodes are validated on creation as well
+        container = tree(numeric_only=False)
+        for value in ["b", "a", "c"]:
+            container.insert(value)
+        assert list(container.iter_inorder()) == ["a", "b", "c"]
+        with pytest.raises(ValueError):
+            container._create_node(None)
+        container.clear()
+        container.insert("z")
+        assert container.to_list() == ["z"]